@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Performans Ölçüm Aracı
+Turkey's Geographic Center - Benchmark Harness
+
+geographic_center ve data_processor sıcak yollarını sentetik verilerle ölçer:
+- Türkiye sınır kutusunda rastgele noktalar, M köşeli poligonlar
+- Verim (öğe/sn), en yüksek RSS ve (isteğe bağlı) tracemalloc tepe değeri
+- Sonuçları JSON'a yazma ve kayıtlı temel ölçümle (baseline) karşılaştırma
+
+Times the hot paths of geographic_center and data_processor on
+synthetic data, records throughput, peak RSS and optionally tracemalloc
+peaks to a JSON file, and flags regressions against a stored baseline.
+Every case runs in a fresh child process so RSS figures do not leak
+between cases.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+from data_processor import DataProcessor
+from geographic_center import GeographicCenter, polygon_centroid
+from instrumentation import _peak_rss_mb
+from tiler import build_tile_pyramid
+
+# Türkiye sınır kutusu / Turkey bounding box
+TURKEY_BBOX = (25.6, 35.8, 44.8, 42.1)  # (min_lon, min_lat, max_lon, max_lat)
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def random_points(n: int, seed: int = 42) -> Tuple[List[float], List[float]]:
+    """
+    Türkiye sınır kutusunda n rastgele nokta üret
+    Generate n random points inside Turkey's bounding box
+
+    Returns:
+        Tuple: (enlemler, boylamlar) / (latitudes, longitudes)
+    """
+    rng = random.Random(seed)
+    min_lon, min_lat, max_lon, max_lat = TURKEY_BBOX
+    lats = [rng.uniform(min_lat, max_lat) for _ in range(n)]
+    lons = [rng.uniform(min_lon, max_lon) for _ in range(n)]
+    return lats, lons
+
+
+def random_polygon(m: int, seed: int = 42) -> Dict:
+    """
+    Türkiye merkezli, m köşeli, pürüzlü bir Polygon geometrisi üret
+    Generate a jagged m-vertex Polygon geometry centred on Turkey
+    """
+    rng = random.Random(seed)
+    ring = []
+    for i in range(m):
+        angle = 2 * math.pi * i / m
+        radius = 1 + 0.1 * rng.random()
+        ring.append([35.2 + 9 * radius * math.cos(angle), 39.0 + 3 * radius * math.sin(angle)])
+    ring.append(ring[0])
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
+def write_points_csv(path: str, n: int) -> None:
+    """n noktalı sentetik CSV yaz / Write a synthetic CSV with n points"""
+    lats, lons = random_points(n)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('name,latitude,longitude,type\n')
+        for i, (lat, lon) in enumerate(zip(lats, lons)):
+            f.write(f'p{i},{lat},{lon},ping\n')
+
+
+def write_points_geojson(path: str, n: int) -> None:
+    """n noktalı sentetik GeoJSON yaz / Write a synthetic GeoJSON with n points"""
+    lats, lons = random_points(n)
+    features = ({"type": "Feature", "properties": {"name": f"p{i}", "type": "ping"},
+                 "geometry": {"type": "Point", "coordinates": [lon, lat]}}
+                for i, (lat, lon) in enumerate(zip(lats, lons)))
+    DataProcessor.write_geojson_stream(features, path, compact=True)
+
+
+# Her durum: (hazırlık, ölçülen çağrı) üretir; çağrı işlenen öğe sayısını döndürür
+# Each case builds (setup, timed call); the call returns the items processed
+def _case_calculate_distance(n: int, workdir: str) -> Callable[[], int]:
+    center = GeographicCenter()
+    lats, lons = random_points(n)
+
+    def run() -> int:
+        for lat, lon in zip(lats, lons):
+            center.calculate_distance(center.center_lat, center.center_lon, lat, lon)
+        return n
+    return run
+
+
+def _case_calculate_distances(n: int, workdir: str) -> Callable[[], int]:
+    center = GeographicCenter()
+    lats, lons = random_points(n)
+    return lambda: len(center.calculate_distances(lats, lons))
+
+
+def _case_distances_from_center(n: int, workdir: str) -> Callable[[], int]:
+    center = GeographicCenter()
+
+    def run() -> int:
+        for _ in range(n):
+            center.calculate_distances_from_center()
+        return n
+    return run
+
+
+def _case_polygon_centroid(n: int, workdir: str) -> Callable[[], int]:
+    polygon = random_polygon(n)
+    return lambda: polygon_centroid(polygon) and n
+
+
+def _case_load_csv(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.csv')
+    write_points_csv(path, n)
+    return lambda: len(DataProcessor().load_csv(path))
+
+
+def _case_load_geojson(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.geojson')
+    write_points_geojson(path, n)
+    return lambda: len(DataProcessor().load_geojson(path)['features'])
+
+
+def _case_csv_to_geojson(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.csv')
+    write_points_csv(path, n)
+    out = os.path.join(workdir, 'out.geojson')
+    return lambda: len(DataProcessor().csv_to_geojson(path, out)['features'])
+
+
+def _case_csv_to_geojson_point(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.csv')
+    write_points_csv(path, n)
+    out = os.path.join(workdir, 'out.geojson')
+    return lambda: len(DataProcessor('point', 6).csv_to_geojson(path, out)['features'])
+
+
+def _case_csv_to_geojson_stream(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.csv')
+    write_points_csv(path, n)
+    out = os.path.join(workdir, 'out.geojson')
+    return lambda: DataProcessor().csv_to_geojson_stream(path, out)['rows']
+
+
+def _case_geojson_to_csv(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.geojson')
+    write_points_geojson(path, n)
+    out = os.path.join(workdir, 'out.csv')
+    return lambda: DataProcessor().geojson_to_csv(path, out) and n
+
+
+def _case_geojson_to_csv_stream(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.geojson')
+    write_points_geojson(path, n)
+    out = os.path.join(workdir, 'out.csv')
+    return lambda: DataProcessor().geojson_to_csv_stream(path, out)['features']
+
+
+def _case_validate_geojson(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.geojson')
+    write_points_geojson(path, n)
+    return lambda: DataProcessor().validate_geojson(path)[0] and n
+
+
+def _case_to_geopackage(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.csv')
+    write_points_csv(path, n)
+    out = os.path.join(workdir, 'points.gpkg')
+    return lambda: len(DataProcessor().to_geopackage(path, out))
+
+
+def _case_reproject_utm(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.csv')
+    write_points_csv(path, n)
+    out = os.path.join(workdir, 'points_utm.csv')
+    return lambda: DataProcessor().reproject(path, out, 'utm36')['points']
+
+
+def _case_annotate_distances(n: int, workdir: str) -> Callable[[], int]:
+    path = os.path.join(workdir, 'points.csv')
+    write_points_csv(path, n)
+    refs = os.path.join(workdir, 'refs.csv')
+    lats, lons = random_points(81, seed=81)
+    with open(refs, 'w', encoding='utf-8') as f:
+        f.write('name,latitude,longitude\n')
+        f.writelines(f'r{i},{lat},{lon}\n' for i, (lat, lon) in enumerate(zip(lats, lons)))
+    out = os.path.join(workdir, 'points_dist.csv')
+    return lambda: DataProcessor().annotate_distances(path, out, refs)['points']
+
+
+def _case_tile_pyramid(n: int, workdir: str) -> Callable[[], int]:
+    features = [{"type": "Feature", "properties": {}, "geometry": random_polygon(n)}]
+    out = os.path.join(workdir, 'tiles')
+    return lambda: build_tile_pyramid(features, out, 4, 8, workers=1)['vertices']
+
+
+CASES = {
+    "calculate_distance": _case_calculate_distance,
+    "calculate_distances": _case_calculate_distances,
+    "calculate_distances_from_center": _case_distances_from_center,
+    "polygon_centroid": _case_polygon_centroid,
+    "load_csv": _case_load_csv,
+    "load_geojson": _case_load_geojson,
+    "csv_to_geojson": _case_csv_to_geojson,
+    "csv_to_geojson_point": _case_csv_to_geojson_point,
+    "csv_to_geojson_stream": _case_csv_to_geojson_stream,
+    "geojson_to_csv": _case_geojson_to_csv,
+    "geojson_to_csv_stream": _case_geojson_to_csv_stream,
+    "validate_geojson": _case_validate_geojson,
+    "to_geopackage": _case_to_geopackage,
+    "reproject_utm": _case_reproject_utm,
+    "annotate_distances": _case_annotate_distances,
+    "tile_pyramid": _case_tile_pyramid,
+}
+
+
+def run_case(name: str, size: int, repeat: int, trace_alloc: bool) -> Dict:
+    """
+    Tek bir durumu çalıştır (alt süreçte çağrılır)
+    Run a single case (called in a child process)
+
+    Returns:
+        Dict: Ölçüm kaydı / Measurement record
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            run = CASES[name](size, workdir)
+            rss_before = _peak_rss_mb()
+            timings = []
+            items = 0
+            for _ in range(repeat):
+                started = time.perf_counter()
+                items = run()
+                timings.append(time.perf_counter() - started)
+            rss_after = _peak_rss_mb()
+            alloc_peak = None
+            if trace_alloc:
+                tracemalloc.start()
+                run()
+                alloc_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+    best = min(timings)
+    return {
+        "case": name,
+        "size": size,
+        "items": items,
+        "best_seconds": round(best, 6),
+        "mean_seconds": round(sum(timings) / len(timings), 6),
+        "items_per_sec": round(items / best, 1) if best > 0 else None,
+        "peak_rss_mb": round(rss_after, 1),
+        "rss_growth_mb": round(rss_after - rss_before, 1),
+        "alloc_peak_mb": round(alloc_peak / 1e6, 2) if alloc_peak is not None else None
+    }
+
+
+def compare(results: List[Dict], baseline: List[Dict], threshold: float) -> List[Dict]:
+    """
+    Sonuçları temel ölçümle karşılaştır, yavaşlayanları döndür
+    Compare results with a baseline and return the regressions
+
+    Args:
+        threshold (float): İzin verilen verim düşüşü oranı / Allowed throughput drop (0.1 = 10%)
+    """
+    reference = {(r["case"], r["size"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        base = reference.get((result["case"], result["size"]))
+        if not base or not base.get("items_per_sec") or not result.get("items_per_sec"):
+            continue
+        ratio = result["items_per_sec"] / base["items_per_sec"]
+        result["vs_baseline"] = round(ratio, 3)
+        if ratio < 1 - threshold:
+            regressions.append(result)
+    return regressions
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description='Türkiye\'nin Tam Ortası - Performans Ölçüm Aracı\nTurkey\'s Geographic Center - Benchmark Harness',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Örnekler / Examples:
+  # Varsayılan boyutlarla tüm durumlar
+  python benchmark.py --output bench.json
+
+  # 1e3..1e7 arası, yalnızca dönüştürmeler, temel ölçümle karşılaştırma
+  python benchmark.py --sizes 1e3 1e4 1e5 1e6 1e7 --cases csv_to_geojson geojson_to_csv --baseline base.json
+        '''
+    )
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=sorted(CASES),
+                        help='Çalıştırılacak durumlar / Cases to run (default: all)')
+    parser.add_argument('--sizes', nargs='+', type=lambda v: int(float(v)), default=DEFAULT_SIZES,
+                        help='Girdi boyutları / Input sizes (e.g. 1e3 1e5)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Tekrar sayısı (en iyisi alınır) / Repetitions, best is kept (default: 3)')
+    parser.add_argument('--trace-alloc', action='store_true',
+                        help='tracemalloc ile ek bir çalıştırmada bellek tepe değeri / Extra tracemalloc run')
+    parser.add_argument('--output', '-o', default='benchmark_results.json',
+                        help='Sonuç JSON dosyası / Results JSON file')
+    parser.add_argument('--baseline', help='Karşılaştırılacak temel sonuç dosyası / Baseline results file')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Gerileme eşiği / Regression threshold (default: 0.10)')
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'DURUM / CASE':<34}{'BOYUT':>10}{'SANİYE':>12}{'ÖĞE/SN':>14}{'RSS MB':>10}")
+    print("-" * 80)
+    for name in args.cases:
+        for size in args.sizes:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                result = pool.submit(run_case, name, size, args.repeat, args.trace_alloc).result()
+            results.append(result)
+            print(f"{name:<34}{size:>10}{result['best_seconds']:>12.4f}"
+                  f"{result['items_per_sec'] or 0:>14.0f}{result['peak_rss_mb']:>10.1f}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f)["results"], args.threshold)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "results": results,
+        "regressions": [(r["case"], r["size"]) for r in regressions]
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ Sonuçlar kaydedildi / Results saved: {args.output}")
+
+    if regressions:
+        print(f"\n❌ GERİLEMELER / REGRESSIONS (>{args.threshold:.0%} yavaş / slower)")
+        for r in regressions:
+            print(f"  {r['case']} n={r['size']}: {r['vs_baseline']:.2f}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Merkez Yöntemleri Karşılaştırması
+Turkey's Geographic Center - Center Method Comparison
+
+Bir sınır poligonundan farklı "merkez" tanımlarını hesaplar:
+- Sınır kutusu orta noktası (bbox midpoint)
+- Alan-ağırlıklı centroid
+- Geometrik medyan (toplam mesafeyi en aza indiren nokta, Weiszfeld)
+- Erişilmezlik kutbu (sınıra en uzak iç nokta, polylabel dörtlü ağacı)
+- Nüfus-ağırlıklı merkez (nüfus noktası katmanı verilirse)
+
+Yöntemler süreç havuzunda eşzamanlı çalışır ve süreleriyle birlikte tek
+bir karşılaştırma tablosu üretilir. Düzlemsel hesaplar Türkiye merkezli
+LAEA projeksiyonunda yapılır.
+
+Computes several definitions of "center" from a boundary polygon,
+running them concurrently in a process pool and producing one
+comparison table with per-method timings. Planar work is done in the
+Turkey-centred LAEA projection.
+"""
+
+import heapq
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from geographic_center import (haversine_many, iter_polygons, laea_forward,
+                               laea_inverse, polygon_centroid)
+
+Ring = List[Tuple[float, float]]
+
+
+def project_rings(geometry: Dict) -> List[Ring]:
+    """
+    Tüm halkaları LAEA düzlemine (km) projeksiyonla
+    Project every ring of a (Multi)Polygon into the LAEA plane (km)
+    """
+    rings = []
+    for polygon in iter_polygons(geometry):
+        for ring in polygon:
+            if len(ring) < 3:
+                continue
+            xs, ys = laea_forward([c[0] for c in ring], [c[1] for c in ring])
+            rings.append([(x / 1000.0, y / 1000.0) for x, y in zip(xs, ys)])
+    return rings
+
+
+def _to_latlon(x_km: float, y_km: float) -> Tuple[float, float]:
+    """LAEA km koordinatını enlem/boylama çevir / LAEA km coordinate to lat/lon"""
+    lat, lon = laea_inverse(x_km * 1000.0, y_km * 1000.0)
+    return round(lat, 6), round(lon, 6)
+
+
+def bbox_midpoint(geometry: Dict) -> Tuple[float, float]:
+    """
+    Sınır kutusunun orta noktası
+    Midpoint of the bounding box
+    """
+    lons = []
+    lats = []
+    for polygon in iter_polygons(geometry):
+        for ring in polygon:
+            lons.extend(c[0] for c in ring)
+            lats.extend(c[1] for c in ring)
+    return round((min(lats) + max(lats)) / 2, 6), round((min(lons) + max(lons)) / 2, 6)
+
+
+def area_weighted_centroid(geometry: Dict) -> Tuple[float, float]:
+    """
+    LAEA'da alan-ağırlıklı centroid
+    Area-weighted centroid in LAEA
+
+    Raises:
+        ValueError: Geometrinin alanı yok / The geometry has no area
+    """
+    result = polygon_centroid(geometry)
+    if result is None:
+        raise ValueError("Geometry has no area")
+    return result["lat"], result["lon"]
+
+
+def _scanline_intervals(rings: List[Ring], y: float) -> List[Tuple[float, float]]:
+    """
+    y yatay doğrusunun poligon içindeki aralıkları (çift-tek kuralı)
+    Inside intervals of the horizontal line at y (even-odd rule)
+    """
+    xs = []
+    for ring in rings:
+        prev = ring[-1]
+        for point in ring:
+            (x1, y1), (x2, y2) = prev, point
+            if (y1 > y) != (y2 > y):
+                xs.append(x1 + (y - y1) * (x2 - x1) / (y2 - y1))
+            prev = point
+    xs.sort()
+    return list(zip(xs[0::2], xs[1::2]))
+
+
+def sample_interior(rings: List[Ring], target: int = 4000) -> List[Tuple[float, float]]:
+    """
+    Poligon içini düzenli ızgarayla örnekle (satır başına tarama çizgisi)
+    Sample the polygon interior on a regular grid (one scanline per row)
+
+    Her örnek eşit alanı temsil eder, bu yüzden örnekler alan ağırlıklıdır.
+    Each sample stands for an equal area, so samples are area-weighted.
+    """
+    min_x = min(x for ring in rings for x, _ in ring)
+    max_x = max(x for ring in rings for x, _ in ring)
+    min_y = min(y for ring in rings for _, y in ring)
+    max_y = max(y for ring in rings for _, y in ring)
+    step = math.sqrt((max_x - min_x) * (max_y - min_y) / target) or 1.0
+    samples = []
+    y = min_y + step / 2
+    while y < max_y:
+        for start, end in _scanline_intervals(rings, y):
+            x = min_x + (math.floor((start - min_x) / step) + 0.5) * step
+            while x < end:
+                if x >= start:
+                    samples.append((x, y))
+                x += step
+        y += step
+    return samples
+
+
+def geometric_median(geometry: Dict, samples: int = 4000, tol_km: float = 0.01,
+                     max_iter: int = 500) -> Tuple[float, float]:
+    """
+    Alan üzerindeki toplam mesafeyi en aza indiren nokta (Weiszfeld)
+    Point minimising total distance over the area (Weiszfeld iteration)
+
+    Izgaraya hiç örnek düşmeyecek kadar ince şeritlerde alan-ağırlıklı
+    centroid döndürülür.
+    Slivers too thin for any grid sample fall back to the area-weighted
+    centroid.
+    """
+    points = sample_interior(project_rings(geometry), samples)
+    if not points:
+        return area_weighted_centroid(geometry)
+    x = sum(p[0] for p in points) / len(points)
+    y = sum(p[1] for p in points) / len(points)
+    for _ in range(max_iter):
+        num_x = num_y = denom = 0.0
+        for px, py in points:
+            d = math.hypot(px - x, py - y)
+            if d < 1e-9:
+                continue
+            w = 1.0 / d
+            num_x += px * w
+            num_y += py * w
+            denom += w
+        new_x, new_y = num_x / denom, num_y / denom
+        moved = math.hypot(new_x - x, new_y - y)
+        x, y = new_x, new_y
+        if moved < tol_km:
+            break
+    return _to_latlon(x, y)
+
+
+def _signed_distance(x: float, y: float, rings: List[Ring]) -> float:
+    """
+    Noktadan sınıra işaretli mesafe (içeride pozitif)
+    Signed distance from a point to the boundary (positive inside)
+    """
+    inside = False
+    best = math.inf
+    for ring in rings:
+        prev = ring[-1]
+        for point in ring:
+            (ax, ay), (bx, by) = prev, point
+            if (ay > y) != (by > y) and x < (bx - ax) * (y - ay) / (by - ay) + ax:
+                inside = not inside
+            dx, dy = bx - ax, by - ay
+            if dx or dy:
+                t = ((x - ax) * dx + (y - ay) * dy) / (dx * dx + dy * dy)
+                t = 0.0 if t < 0 else 1.0 if t > 1 else t
+                ex, ey = ax + t * dx - x, ay + t * dy - y
+            else:
+                ex, ey = ax - x, ay - y
+            d = ex * ex + ey * ey
+            if d < best:
+                best = d
+            prev = point
+    return math.sqrt(best) * (1 if inside else -1)
+
+
+class BoundaryIndex:
+    """
+    Sınır kenarları üzerinde işaretli mesafe indeksi
+    Signed-distance index over boundary edges
+
+    En yakın kenar, kenar kutuları üzerinde STR-paketli R-ağacında en iyi-önce
+    aramayla bulunur; içerde/dışarda testi yalnızca noktanın yatay şeridindeki
+    kenarları sayar. Kurulum O(V log V), sorgu V köşe için kabaca O(log V + √V)
+    olur; _signed_distance ise her sorguda tüm kenarları tarar.
+    The nearest edge comes from a best-first search of an STR-packed R-tree
+    over edge boxes; the inside test only counts the edges of the point's
+    horizontal band. Building is O(V log V) and a query is roughly
+    O(log V + √V) for V vertices, where _signed_distance scans every edge.
+
+    Attributes:
+        edges (List[Tuple]): (ax, ay, bx, by) kenarları / Edges
+        levels (List[List[list]]): Yapraktan köke düğümler; her düğüm
+            [min_x, min_y, max_x, max_y, çocuk indeksleri]
+            Nodes from leaves to root, each [min_x, min_y, max_x, max_y, children]
+    """
+
+    def __init__(self, rings: List[Ring], node_capacity: int = 16):
+        self.edges = []
+        for ring in rings:
+            prev = ring[-1]
+            for point in ring:
+                self.edges.append((prev[0], prev[1], point[0], point[1]))
+                prev = point
+        boxes = [(min(ax, bx), min(ay, by), max(ax, bx), max(ay, by))
+                 for ax, ay, bx, by in self.edges]
+        self.node_capacity = node_capacity
+        self.levels = []
+        while boxes:
+            nodes = self._pack(boxes)
+            self.levels.append(nodes)
+            if len(nodes) == 1:
+                break
+            boxes = [tuple(node[:4]) for node in nodes]
+
+        # Yatay şeritler / Horizontal bands
+        count = max(1, int(math.sqrt(len(self.edges))))
+        self.band_y0 = min((e[1] for e in self.edges), default=0.0)
+        top = max((max(e[1], e[3]) for e in self.edges), default=0.0)
+        self.band_height = (top - self.band_y0) / count or 1.0
+        self.bands = [[] for _ in range(count)]
+        for edge in self.edges:
+            ay, by = edge[1], edge[3]
+            for band in range(self._band(min(ay, by)), self._band(max(ay, by)) + 1):
+                self.bands[band].append(edge)
+
+    def _pack(self, boxes: List[Tuple[float, float, float, float]]) -> List[list]:
+        """
+        Kutuları STR ile bir üst seviyeye paketle (bkz. SpatialIndex._pack)
+        Pack boxes into the next level up with STR (see SpatialIndex._pack)
+        """
+        cap = self.node_capacity
+        order = sorted(range(len(boxes)), key=lambda i: boxes[i][0] + boxes[i][2])
+        node_count = math.ceil(len(boxes) / cap)
+        slab_size = cap * math.ceil(math.sqrt(node_count))
+        nodes = []
+        for start in range(0, len(order), slab_size):
+            slab = sorted(order[start:start + slab_size],
+                          key=lambda i: boxes[i][1] + boxes[i][3])
+            for node_start in range(0, len(slab), cap):
+                children = slab[node_start:node_start + cap]
+                nodes.append([
+                    min(boxes[i][0] for i in children),
+                    min(boxes[i][1] for i in children),
+                    max(boxes[i][2] for i in children),
+                    max(boxes[i][3] for i in children),
+                    children
+                ])
+        return nodes
+
+    def _band(self, y: float) -> int:
+        """y'nin şerit numarası (sınırlara kırpılmış) / Band of y (clamped)"""
+        band = int((y - self.band_y0) / self.band_height)
+        return 0 if band < 0 else min(band, len(self.bands) - 1)
+
+    def inside(self, x: float, y: float) -> bool:
+        """Çift-tek kuralıyla içeride mi / Inside by the even-odd rule"""
+        inside = False
+        for ax, ay, bx, by in self.bands[self._band(y)]:
+            if (ay > y) != (by > y) and x < (bx - ax) * (y - ay) / (by - ay) + ax:
+                inside = not inside
+        return inside
+
+    def distance(self, x: float, y: float) -> float:
+        """En yakın kenara mesafe / Distance to the nearest edge"""
+        if not self.levels:
+            return math.inf
+        best = math.inf
+        heap = [(0.0, len(self.levels) - 1, 0)]
+        while heap:
+            d2, depth, index = heapq.heappop(heap)
+            if d2 >= best:
+                break  # Kalan kutular daha yakın kenar içeremez / No closer edge remains
+            node = self.levels[depth][index]
+            if depth == 0:
+                for item in node[4]:
+                    ax, ay, bx, by = self.edges[item]
+                    dx, dy = bx - ax, by - ay
+                    if dx or dy:
+                        t = ((x - ax) * dx + (y - ay) * dy) / (dx * dx + dy * dy)
+                        t = 0.0 if t < 0 else 1.0 if t > 1 else t
+                        ex, ey = ax + t * dx - x, ay + t * dy - y
+                    else:
+                        ex, ey = ax - x, ay - y
+                    d = ex * ex + ey * ey
+                    if d < best:
+                        best = d
+                continue
+            for child in node[4]:
+                box = self.levels[depth - 1][child]
+                ex = box[0] - x if x < box[0] else x - box[2] if x > box[2] else 0.0
+                ey = box[1] - y if y < box[1] else y - box[3] if y > box[3] else 0.0
+                d = ex * ex + ey * ey
+                if d < best:
+                    heapq.heappush(heap, (d, depth - 1, child))
+        return math.sqrt(best)
+
+    def signed_distance(self, x: float, y: float) -> float:
+        """
+        Sınıra işaretli mesafe (içeride pozitif), _signed_distance ile aynı
+        Signed distance to the boundary (positive inside), same as _signed_distance
+        """
+        d = self.distance(x, y)
+        return d if self.inside(x, y) else -d
+
+
+def pole_of_inaccessibility(geometry: Dict, precision_km: float = 1.0) -> Tuple[float, float]:
+    """
+    Sınıra en uzak iç nokta (polylabel dörtlü ağaç araması)
+    Interior point farthest from the boundary (polylabel quadtree search)
+
+    Her hücre yoklaması BoundaryIndex üzerinden yapılır; böylece maliyet
+    köşe sayısıyla doğrusal değil, kabaca O(log V + √V) büyür.
+    Every cell probe goes through a BoundaryIndex, so its cost grows
+    roughly as O(log V + √V) instead of linearly in the vertex count.
+
+    Raises:
+        ValueError: Sınır kutusunun genişliği ya da yüksekliği sıfır
+            The bounding box has zero width or height
+    """
+    rings = project_rings(geometry)
+    index = BoundaryIndex(rings)
+    min_x = min(x for ring in rings for x, _ in ring)
+    max_x = max(x for ring in rings for x, _ in ring)
+    min_y = min(y for ring in rings for _, y in ring)
+    max_y = max(y for ring in rings for _, y in ring)
+    cell = min(max_x - min_x, max_y - min_y)
+    if not cell > 0:
+        raise ValueError("Geometry has no interior (zero-width bounding box)")
+    half = cell / 2
+    sqrt2 = math.sqrt(2)
+
+    def make(cx, cy, h):
+        d = index.signed_distance(cx, cy)
+        return (-(d + h * sqrt2), d, cx, cy, h)
+
+    heap = []
+    x = min_x
+    while x < max_x:
+        y = min_y
+        while y < max_y:
+            heapq.heappush(heap, make(x + half, y + half, half))
+            y += cell
+        x += cell
+
+    # Başlangıç: centroid / Seed with the centroid
+    seed = polygon_centroid(geometry)
+    sx, sy = laea_forward([seed["lon"]], [seed["lat"]])
+    best = make(sx[0] / 1000.0, sy[0] / 1000.0, 0)
+
+    while heap:
+        candidate = heapq.heappop(heap)
+        if candidate[1] > best[1]:
+            best = candidate
+        if -candidate[0] - best[1] <= precision_km:
+            break  # Kalan hücreler daha iyisini veremez / No remaining cell can do better
+        h = candidate[4] / 2
+        for dx in (-h, h):
+            for dy in (-h, h):
+                heapq.heappush(heap, make(candidate[2] + dx, candidate[3] + dy, h))
+    return _to_latlon(best[2], best[3])
+
+
+def population_weighted_center(points: Sequence[Tuple[float, float, float]]) -> Tuple[float, float]:
+    """
+    Nüfus-ağırlıklı merkez (birim küre vektörlerinin ağırlıklı ortalaması)
+    Population-weighted center (weighted mean of unit-sphere vectors)
+
+    Args:
+        points: (enlem, boylam, nüfus) üçlüleri / (lat, lon, population) triples
+    """
+    sx = sy = sz = 0.0
+    for lat, lon, weight in points:
+        phi, lam = math.radians(lat), math.radians(lon)
+        sx += weight * math.cos(phi) * math.cos(lam)
+        sy += weight * math.cos(phi) * math.sin(lam)
+        sz += weight * math.sin(phi)
+    lat = math.degrees(math.atan2(sz, math.hypot(sx, sy)))
+    lon = math.degrees(math.atan2(sy, sx))
+    return round(lat, 6), round(lon, 6)
+
+
+def load_population(file_path: str, weight_property: str = 'population') -> List[Tuple[float, float, float]]:
+    """
+    Nüfus noktası katmanını (Point GeoJSON) akış halinde oku
+    Stream a population point layer (Point GeoJSON)
+    """
+    from data_processor import iter_geojson_features
+
+    points = []
+    for feature in iter_geojson_features(file_path):
+        geometry = feature.get('geometry') or {}
+        if geometry.get('type') != 'Point':
+            continue
+        try:
+            weight = float((feature.get('properties') or {}).get(weight_property) or 0)
+        except (TypeError, ValueError):
+            continue
+        if weight > 0:
+            lon, lat = geometry['coordinates'][:2]
+            points.append((lat, lon, weight))
+    return points
+
+
+METHODS = {
+    "bbox_midpoint": ("Sınır kutusu orta noktası / Bounding-box midpoint", bbox_midpoint),
+    "area_weighted_centroid": ("Alan-ağırlıklı centroid / Area-weighted centroid", area_weighted_centroid),
+    "geometric_median": ("Geometrik medyan / Geometric median", geometric_median),
+    "pole_of_inaccessibility": ("Erişilmezlik kutbu / Pole of inaccessibility", pole_of_inaccessibility),
+    "population_weighted": ("Nüfus-ağırlıklı merkez / Population-weighted center", population_weighted_center),
+}
+
+
+def _timed(name: str, arg) -> Tuple[str, Tuple[float, float], float]:
+    """Yöntemi çalıştır ve süresini ölç (işçi süreçte) / Run and time a method (in a worker)"""
+    started = time.perf_counter()
+    lat_lon = METHODS[name][1](arg)
+    return name, lat_lon, time.perf_counter() - started
+
+
+def compare_methods(geometry: Dict, population: Optional[Sequence[Tuple[float, float, float]]] = None,
+                    reference: Optional[Tuple[float, float]] = None,
+                    workers: Optional[int] = None) -> List[Dict]:
+    """
+    Tüm merkez yöntemlerini süreç havuzunda eşzamanlı çalıştır
+    Run every center method concurrently in a process pool
+
+    Args:
+        geometry (Dict): Sınır Polygon/MultiPolygon (ya da GeometryCollection)
+        population: (enlem, boylam, nüfus) noktaları (opsiyonel)
+        reference: Mesafelerin ölçüleceği (enlem, boylam) / Reference (lat, lon)
+        workers (int): İşçi süreç sayısı / Worker processes
+
+    Returns:
+        List[Dict]: Her yöntem için method, label, lat, lon, distance_km, seconds,
+            error; başarısız yöntemde lat/lon/seconds None, error mesajdır
+            Per method; a failed method has None lat/lon/seconds and an error message
+    """
+    tasks = [(name, geometry) for name in METHODS if name != "population_weighted"]
+    if population:
+        tasks.append(("population_weighted", population))
+
+    with ProcessPoolExecutor(max_workers=workers or len(tasks)) as pool:
+        futures = [pool.submit(_timed, name, arg) for name, arg in tasks]
+
+    rows = []
+    for (name, _), future in zip(tasks, futures):
+        row = {"method": name, "label": METHODS[name][0], "lat": None, "lon": None,
+               "seconds": None, "distance_km": None, "error": None}
+        try:
+            _, (lat, lon), seconds = future.result()
+        except Exception as e:
+            # Bir yöntemin hatası diğerlerinin sonuçlarını düşürmez
+            # One failing method does not drop the others' results
+            row["error"] = f"{type(e).__name__}: {e}"
+            rows.append(row)
+            continue
+        row.update(lat=lat, lon=lon, seconds=round(seconds, 4))
+        if reference:
+            row["distance_km"] = round(haversine_many(reference[0], reference[1], [lat], [lon])[0], 2)
+        rows.append(row)
+    return rows
+
+
+def format_table(rows: List[Dict]) -> str:
+    """Karşılaştırma tablosunu metne çevir / Render the comparison table as text"""
+    lines = [f"{'YÖNTEM / METHOD':<28}{'ENLEM':>12}{'BOYLAM':>12}{'FARK KM':>10}{'SÜRE S':>10}",
+             "-" * 72]
+    for row in rows:
+        if row.get("error"):
+            lines.append(f"{row['method']:<28}❌ {row['error']}")
+            continue
+        distance = '' if row["distance_km"] is None else f"{row['distance_km']:.2f}"
+        lines.append(f"{row['method']:<28}{row['lat']:>12.6f}{row['lon']:>12.6f}"
+                     f"{distance:>10}{row['seconds']:>10.3f}")
+    return '\n'.join(lines)
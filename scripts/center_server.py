@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Merkez/Mesafe HTTP Servisi
+Turkey's Geographic Center - Center/Distance HTTP Service
+
+geographic_center.py'yi her çağrıda yeniden başlatmak yerine uzun ömürlü
+bir asyncio HTTP servisi:
+- Sabit yanıtlar açılışta bir kez hazırlanır ve hazır bayt tamponlarından,
+  ETag ile sunulur (If-None-Match -> 304)
+- Toplu mesafe uç noktası (GET tek nokta, POST nokta dizileri)
+- SO_REUSEPORT ile birden çok işçi sürece yük dağıtımı
+
+Long-running asyncio HTTP service replacing per-call interpreter starts.
+Static responses are serialized once into ready-to-send byte buffers
+with ETags, batch distances are served over POST, and load is spread
+across worker processes sharing the port via SO_REUSEPORT.
+
+Uç noktalar / Endpoints:
+    GET  /center?lang=tr|en   get_center_info
+    GET  /geojson             export_to_geojson
+    GET  /csv                 export_to_csv
+    GET  /extremes            get_extreme_points
+    GET  /distances           calculate_distances_from_center
+    GET  /distance?lat=&lon=[&method=]
+    POST /distance            {"lats": [...], "lons": [...], "method": "haversine"}
+                              (en çok / at most MAX_BATCH_POINTS[method] nokta / points)
+    GET  /health
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import socket
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from geographic_center import GeographicCenter
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# İstek başına nokta sınırı; bir parti olay döngüsünü ~0.2 s'den uzun tutmaz
+# Points per request; one batch holds the event loop for no more than ~0.2 s
+MAX_BATCH_POINTS = {"haversine": 200_000, "vincenty": 20_000}
+
+_REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+
+def _response(status: int, body: bytes, content_type: str = 'application/json; charset=utf-8',
+              etag: Optional[str] = None, keep_alive: bool = True) -> bytes:
+    """Tam HTTP/1.1 yanıtını bayt olarak oluştur / Build a full HTTP/1.1 response"""
+    headers = [
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if etag:
+        headers.append(f"ETag: {etag}")
+        headers.append("Cache-Control: public, max-age=3600")
+    return ('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1') + body
+
+
+def _json_bytes(obj) -> bytes:
+    """Kompakt UTF-8 JSON / Compact UTF-8 JSON"""
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _error(status: int, message: str, keep_alive: bool = True) -> bytes:
+    return _response(status, _json_bytes({"error": message}), keep_alive=keep_alive)
+
+
+class _StaticResource:
+    """
+    Önceden serileştirilmiş sabit yanıt (200, 304 ve kapanışlı sürümleri)
+    A pre-serialized static response (200, 304 and connection-close variants)
+    """
+
+    __slots__ = ('etag', 'ok', 'ok_close', 'not_modified', 'not_modified_close')
+
+    def __init__(self, body: bytes, content_type: str):
+        self.etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+        self.ok = _response(200, body, content_type, self.etag)
+        self.ok_close = _response(200, body, content_type, self.etag, keep_alive=False)
+        self.not_modified = _response(304, b'', content_type, self.etag)
+        self.not_modified_close = _response(304, b'', content_type, self.etag, keep_alive=False)
+
+    def render(self, if_none_match: Optional[str], keep_alive: bool) -> bytes:
+        if if_none_match and self.etag in if_none_match:
+            return self.not_modified if keep_alive else self.not_modified_close
+        return self.ok if keep_alive else self.ok_close
+
+
+class CenterService:
+    """
+    HTTP isteklerini GeographicCenter'a yönlendiren servis
+    Service routing HTTP requests to a GeographicCenter
+
+    Attributes:
+        center (GeographicCenter): Yanıtların kaynağı / Source of responses
+        static (Dict): Yol -> hazır yanıt / Path -> prepared response
+    """
+
+    def __init__(self, center: Optional[GeographicCenter] = None):
+        self.center = center or GeographicCenter()
+        self.static = self._build_static()
+
+    def _build_static(self) -> Dict[Tuple[str, str], _StaticResource]:
+        """Sabit yanıtları bir kez serileştir / Serialize static responses once"""
+        center = self.center
+        json_type = 'application/json; charset=utf-8'
+        return {
+            ('/center', 'tr'): _StaticResource(center.export_bytes('center_info', 'tr'), json_type),
+            ('/center', 'en'): _StaticResource(center.export_bytes('center_info', 'en'), json_type),
+            ('/geojson', ''): _StaticResource(center.export_bytes('geojson'),
+                                              'application/geo+json; charset=utf-8'),
+            ('/csv', ''): _StaticResource(center.export_bytes('csv'), 'text/csv; charset=utf-8'),
+            ('/extremes', ''): _StaticResource(center.export_bytes('extreme_points'), json_type),
+            ('/distances', ''): _StaticResource(_json_bytes(center.calculate_distances_from_center()),
+                                                json_type),
+            ('/health', ''): _StaticResource(b'{"status":"ok"}', json_type),
+        }
+
+    def handle(self, method: str, target: str, headers: Dict[str, str],
+               body: bytes, keep_alive: bool) -> bytes:
+        """
+        Tek isteği işle ve yanıt baytlarını döndür
+        Handle one request and return the response bytes
+        """
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+
+        if path == '/distance':
+            return self._distance(method, url.query, body, keep_alive)
+        if method not in ('GET', 'HEAD'):
+            return _error(405, "Method not allowed", keep_alive)
+
+        key = (path, '')
+        if path == '/center':
+            lang = parse_qs(url.query).get('lang', ['tr'])[0]
+            key = (path, 'en' if lang == 'en' else 'tr')
+        resource = self.static.get(key)
+        if resource is None:
+            return _error(404, "Not found", keep_alive)
+        response = resource.render(headers.get('if-none-match'), keep_alive)
+        if method == 'HEAD':
+            return response.split(b'\r\n\r\n', 1)[0] + b'\r\n\r\n'
+        return response
+
+    def _distance(self, method: str, query: str, body: bytes, keep_alive: bool) -> bytes:
+        """Tekil veya toplu mesafe uç noktası / Single or batch distance endpoint"""
+        try:
+            if method == 'GET':
+                params = parse_qs(query)
+                lats = [float(params['lat'][0])]
+                lons = [float(params['lon'][0])]
+                distance_method = params.get('method', ['haversine'])[0]
+            elif method == 'POST':
+                payload = json.loads(body or b'{}')
+                lats = [float(v) for v in payload['lats']]
+                lons = [float(v) for v in payload['lons']]
+                distance_method = payload.get('method', 'haversine')
+            else:
+                return _error(405, "Method not allowed", keep_alive)
+            if len(lats) != len(lons):
+                raise ValueError("lats and lons must have the same length")
+            if not all(map(math.isfinite, lats)) or not all(map(math.isfinite, lons)):
+                raise ValueError("coordinates must be finite numbers")
+            limit = MAX_BATCH_POINTS.get(distance_method)
+            if limit is not None and len(lats) > limit:
+                return _error(413, f"At most {limit} points per request for {distance_method}",
+                              keep_alive)
+            distances = self.center.calculate_distances(lats, lons, distance_method)
+        except (KeyError, TypeError, ValueError) as e:
+            return _error(400, f"Bad request: {e}", keep_alive)
+        return _response(200, _json_bytes({"unit": "km", "distances": distances.tolist()}),
+                         keep_alive=keep_alive)
+
+    async def serve_connection(self, reader: asyncio.StreamReader,
+                               writer: asyncio.StreamWriter) -> None:
+        """
+        Bir bağlantıdaki (keep-alive, ardışık) istekleri işle
+        Serve the (keep-alive, pipelined) requests of one connection
+        """
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_error(400, "Header too large", keep_alive=False))
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    writer.write(_error(400, "Malformed request line", keep_alive=False))
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                connection = headers.get('connection', '').lower()
+                keep_alive = (connection != 'close' if version == 'HTTP/1.1'
+                              else connection == 'keep-alive')
+
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    writer.write(_error(400, "Invalid Content-Length", keep_alive=False))
+                    break
+                if length < 0 or length > MAX_BODY_BYTES:
+                    writer.write(_error(413, "Payload too large", keep_alive=False))
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                writer.write(self.handle(method, target, headers, body, keep_alive))
+                if not keep_alive:
+                    break
+                if writer.transport.get_write_buffer_size() > 1 << 20:
+                    await writer.drain()
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _serve(host: str, port: int, reuse_port: bool) -> None:
+    service = CenterService()
+    server = await asyncio.start_server(service.serve_connection, host, port,
+                                        reuse_port=reuse_port, limit=MAX_HEADER_BYTES,
+                                        backlog=1024)
+    async with server:
+        await server.serve_forever()
+
+
+def _run_worker(host: str, port: int, reuse_port: bool) -> None:
+    """İşçi süreç giriş noktası / Worker process entry point"""
+    try:
+        asyncio.run(_serve(host, port, reuse_port))
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description='Türkiye\'nin Tam Ortası - Merkez/Mesafe HTTP Servisi\nTurkey\'s Geographic Center - Center/Distance HTTP Service',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Örnekler / Examples:
+  python center_server.py --port 8080 --workers 4
+  curl http://127.0.0.1:8080/center?lang=en
+  curl -X POST -d '{"lats":[41.0],"lons":[29.0]}' http://127.0.0.1:8080/distance
+        '''
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Dinlenecek adres / Bind address')
+    parser.add_argument('--port', '-p', type=int, default=8080, help='Port (default: 8080)')
+    parser.add_argument('--workers', '-w', type=int, default=os.cpu_count() or 1,
+                        help='İşçi süreç sayısı / Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    reuse_port = args.workers > 1 and hasattr(socket, 'SO_REUSEPORT')
+    workers = args.workers if reuse_port else 1
+    if args.workers > 1 and not reuse_port:
+        print("⚠️  SO_REUSEPORT yok, tek süreç kullanılıyor / SO_REUSEPORT unavailable, using one process")
+
+    print(f"🌐 http://{args.host}:{args.port}/ ({workers} işçi / workers)")
+    if workers == 1:
+        _run_worker(args.host, args.port, False)
+        return
+
+    processes = [multiprocessing.Process(target=_run_worker, args=(args.host, args.port, True),
+                                         daemon=True) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Merkez Belirsizliği (Monte Carlo)
+Turkey's Geographic Center - Center Uncertainty (Monte Carlo)
+
+Sınır poligonunun köşeleri Gauss gürültüsüyle kaydırılır ve çözünürlüğü
+(her k'inci köşe) rastgele düşürülür; her deneme için alan-ağırlıklı
+centroid yeniden hesaplanır. Sonuç bir güven elipsi ve metre cinsinden
+gerçek bir doğruluk değeridir.
+
+İki motor vardır:
+- moment (varsayılan): Centroid yalnızca halka momentlerine (2A, 6A·Cx,
+  6A·Cy) bağlıdır. Bağımsız köşe gürültüsü altında bu momentlerin
+  pertürbasyonu, ikinci dereceye kadar kesin hesaplanan 3x3 kovaryanslı
+  çok değişkenli normal dağılımdır (Isserlis). Kovaryans her çözünürlük
+  varyantı için O(V) sürede bir kez hesaplanır, her deneme O(1)'dir; böylece
+  denemeler köşe sayısından bağımsız olarak vektörleşir.
+- vertex: Her denemede tüm köşeler gerçekten kaydırılır (doğrulama için).
+
+Denemeler sabit boyutlu parçalara bölünür ve her parça (seed, parça no)
+ile tohumlanır; sonuç işçi sayısından bağımsız olarak belirlenimcidir.
+
+Perturbs a boundary polygon's vertices with Gaussian noise and randomly
+coarsens its resolution (every k-th vertex), recomputing the area-weighted
+centroid per trial to produce a confidence ellipse and a real accuracy
+figure. The default moment engine samples the ring moments directly from
+their second-order-exact Gaussian distribution, so each trial is O(1); the
+vertex engine perturbs every vertex and serves as a cross-check. Trials
+are split into fixed chunks seeded by (seed, chunk), so results do not
+depend on the worker count.
+"""
+
+import math
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from geographic_center import _ring_moments, iter_polygons, laea_forward, laea_inverse
+
+# 1:250 000 ölçekte 0.5 mm sayısallaştırma hatası / 0.5 mm digitising error at 1:250 000
+DEFAULT_SIGMA_M = 125.0
+DEFAULT_TRIALS = 10000
+DEFAULT_MAX_STRIDE = 4
+DEFAULT_CONFIDENCE = 0.95
+CHUNK_TRIALS = 500
+METHODS = ('moment', 'vertex')
+
+# (xs, ys, işaret) — LAEA metre, kapanış köşesi olmadan / LAEA metres, without the closing vertex
+Ring = Tuple[array, array, float]
+Moments = Tuple[float, float, float]
+Covariance = Tuple[Tuple[float, float, float], ...]
+
+
+def prepare_rings(geometry: Dict) -> Tuple[List[Ring], Tuple[float, float]]:
+    """
+    Halkaları LAEA düzlemine taşı ve nominal centroide ötele
+    Project the rings into the LAEA plane and shift them to the nominal centroid
+
+    Ötelenmiş koordinatlar momentlerdeki sayısal iptali azaltır.
+    Shifted coordinates keep cancellation out of the moments.
+
+    Returns:
+        Tuple: (halkalar, (cx, cy) nominal centroid, LAEA metre)
+            (rings, nominal (cx, cy) centroid in LAEA metres)
+    """
+    rings = []
+    total = [0.0, 0.0, 0.0]
+    for polygon in iter_polygons(geometry):
+        for ring_index, ring in enumerate(polygon):
+            if len(ring) < 3:
+                continue
+            if ring[0] == ring[-1]:
+                ring = ring[:-1]
+            xs, ys = laea_forward([c[0] for c in ring], [c[1] for c in ring])
+            a2, mx, my = _ring_moments(xs, ys)
+            sign = 1.0 if a2 >= 0 else -1.0
+            if ring_index > 0:
+                sign = -sign  # Delik / Hole
+            rings.append((xs, ys, sign))
+            total[0] += sign * a2
+            total[1] += sign * mx
+            total[2] += sign * my
+    if total[0] == 0:
+        raise ValueError("Poligon geometrisi yok / No polygon geometry")
+    cx = total[1] / (3.0 * total[0])
+    cy = total[2] / (3.0 * total[0])
+    shifted = [(array('d', [x - cx for x in xs]), array('d', [y - cy for y in ys]), sign)
+               for xs, ys, sign in rings]
+    return shifted, (cx, cy)
+
+
+def resolution_variants(max_stride: int) -> List[Tuple[int, int]]:
+    """
+    Çözünürlük varyantları: her k'inci köşe, tüm başlangıç kaymalarıyla
+    Resolution variants: every k-th vertex, with every starting offset
+    """
+    return [(stride, offset) for stride in range(1, max_stride + 1) for offset in range(stride)]
+
+
+def decimate(rings: Sequence[Ring], stride: int, offset: int) -> List[Ring]:
+    """
+    Halkaları seyrelt; 3'ten az köşe kalan halka olduğu gibi bırakılır
+    Decimate the rings; a ring that would keep fewer than 3 vertices stays intact
+    """
+    if stride == 1:
+        return list(rings)
+    result = []
+    for xs, ys, sign in rings:
+        kept_x = xs[offset::stride]
+        if len(kept_x) < 3:
+            result.append((xs, ys, sign))
+        else:
+            result.append((kept_x, ys[offset::stride], sign))
+    return result
+
+
+def moment_statistics(rings: Sequence[Ring]) -> Tuple[Moments, Covariance, Covariance]:
+    """
+    Toplam momentler ve köşe gürültüsüne göre birinci/ikinci derece kovaryansları
+    Total moments and their first/second-order covariance under vertex noise
+
+    σ gürültüsünde moment kovaryansı σ²·K1 + 2σ⁴·K2'dir. K1 köşe
+    gradyanlarından, K2 kenar başına kuadratik formların iz çarpımlarından
+    (Isserlis) gelir; yalnızca komşu kenarlar ilişkilidir.
+    With noise σ the moment covariance is σ²·K1 + 2σ⁴·K2. K1 comes from
+    the per-vertex gradients, K2 from trace products of the per-edge
+    quadratic forms (Isserlis); only adjacent edges are correlated.
+
+    Returns:
+        Tuple: ((2A, Mx, My), K1, K2); K1/K2 sırası (A, Mx, My) / ordered (A, Mx, My)
+    """
+    t_a = t_x = t_y = 0.0
+    k1 = [0.0] * 6  # aa, ax, ay, xx, xy, yy
+    k2 = [0.0] * 6
+    for xs, ys, sign in rings:
+        a2, mx, my = _ring_moments(xs, ys)
+        t_a += sign * a2
+        t_x += sign * mx
+        t_y += sign * my
+        n = len(xs)
+        aa = ax = ay = xx = xy = yy = 0.0
+        qa = qax = qay = qxx = qxy = qyy = 0.0
+        px, py = xs[n - 2], ys[n - 2]
+        qx, qy = xs[n - 1], ys[n - 1]
+        for i in range(n):
+            rx, ry = xs[i], ys[i]
+            # Q köşesinin gradyanı: (P,Q) ve (Q,R) kenarları
+            # Gradient at vertex Q from edges (P,Q) and (Q,R)
+            c1 = px * qy - py * qx
+            c2 = qx * ry - qy * rx
+            sx1, sy1 = px + qx, py + qy
+            sx2, sy2 = qx + rx, qy + ry
+            ga_x, ga_y = ry - py, px - rx
+            gx_x = sx2 * ry - sx1 * py + c1 + c2
+            gx_y = sx1 * px - sx2 * rx
+            gy_x = sy2 * ry - sy1 * py
+            gy_y = sy1 * px - sy2 * rx + c1 + c2
+            aa += ga_x * ga_x + ga_y * ga_y
+            ax += ga_x * gx_x + ga_y * gx_y
+            ay += ga_x * gy_x + ga_y * gy_y
+            xx += gx_x * gx_x + gx_y * gx_y
+            xy += gx_x * gy_x + gx_y * gy_y
+            yy += gy_x * gy_x + gy_y * gy_y
+            # (Q,R) kenarının kendi ikinci derece terimi
+            # Second-order term of edge (Q,R) itself
+            dx, dy = rx - qx, ry - qy
+            ll = qx * qx + qy * qy + rx * rx + ry * ry
+            qa += 1.0
+            qax += 1.5 * sx2
+            qay += 1.5 * sy2
+            qxx += 2 * sx2 * sx2 + ll + 0.5 * dy * dy
+            qyy += 2 * sy2 * sy2 + ll + 0.5 * dx * dx
+            qxy += 2 * sx2 * sy2 - 0.5 * dx * dy
+            # Q'yu paylaşan (P,Q)-(Q,R) kenar çifti
+            # Edge pair (P,Q)-(Q,R) sharing Q
+            pr = px * rx + py * ry
+            qxx -= pr + py * ry
+            qyy -= pr + px * rx
+            qxy += 0.5 * (px * ry + py * rx)
+            px, py, qx, qy = qx, qy, rx, ry
+        for total, part in ((k1, (aa, ax, ay, xx, xy, yy)), (k2, (qa, qax, qay, qxx, qxy, qyy))):
+            for j, value in enumerate(part):
+                total[j] += value
+
+    def matrix(k: List[float]) -> Covariance:
+        return ((k[0], k[1], k[2]), (k[1], k[3], k[4]), (k[2], k[4], k[5]))
+
+    return (t_a, t_x, t_y), matrix(k1), matrix(k2)
+
+
+def _cholesky3(cov: Covariance) -> Tuple[float, ...]:
+    """
+    3x3 pozitif yarı tanımlı matrisin alt üçgen Cholesky çarpanı
+    Lower-triangular Cholesky factor of a 3x3 positive semi-definite matrix
+
+    Returns:
+        Tuple: (l00, l10, l11, l20, l21, l22)
+    """
+    l00 = math.sqrt(max(cov[0][0], 0.0))
+    l10 = cov[1][0] / l00 if l00 > 0 else 0.0
+    l20 = cov[2][0] / l00 if l00 > 0 else 0.0
+    l11 = math.sqrt(max(cov[1][1] - l10 * l10, 0.0))
+    l21 = (cov[2][1] - l20 * l10) / l11 if l11 > 0 else 0.0
+    l22 = math.sqrt(max(cov[2][2] - l20 * l20 - l21 * l21, 0.0))
+    return l00, l10, l11, l20, l21, l22
+
+
+# İşçi süreçlerde paylaşılan varyant halkaları / Variant rings shared in worker processes
+_VARIANTS: List[List[Ring]] = []
+
+
+def _init_worker(variants: List[List[Ring]]) -> None:
+    global _VARIANTS
+    _VARIANTS = variants
+
+
+def _variant_statistics(index: int) -> Tuple[Moments, Covariance, Covariance]:
+    return moment_statistics(_VARIANTS[index])
+
+
+def _vertex_chunk(seed: int, chunk: int, trials: int,
+                  sigma_m: float) -> Tuple[array, array]:
+    """
+    Köşe motoru: her denemede tüm köşeleri kaydır (işçi süreçte)
+    Vertex engine: perturb every vertex in each trial (in a worker)
+    """
+    rng = random.Random(f'{seed}:{chunk}')
+    gauss = rng.gauss
+    out_x, out_y = array('d'), array('d')
+    for _ in range(trials):
+        rings = _VARIANTS[rng.randrange(len(_VARIANTS))]
+        t_a = t_x = t_y = 0.0
+        for xs, ys, sign in rings:
+            a2, mx, my = _ring_moments([x + gauss(0.0, sigma_m) for x in xs],
+                                      [y + gauss(0.0, sigma_m) for y in ys])
+            t_a += sign * a2
+            t_x += sign * mx
+            t_y += sign * my
+        out_x.append(t_x / (3.0 * t_a))
+        out_y.append(t_y / (3.0 * t_a))
+    return out_x, out_y
+
+
+def _moment_chunk(seed: int, chunk: int, trials: int,
+                  samplers: Sequence[Tuple[Moments, Tuple[float, ...]]]) -> Tuple[array, array]:
+    """
+    Moment motoru: momentleri çok değişkenli normalden çek
+    Moment engine: draw the moments from their multivariate normal
+    """
+    rng = random.Random(f'{seed}:{chunk}')
+    gauss, pick = rng.gauss, rng.randrange
+    count = len(samplers)
+    out_x, out_y = array('d'), array('d')
+    for _ in range(trials):
+        (t_a, t_x, t_y), (l00, l10, l11, l20, l21, l22) = samplers[pick(count)]
+        z0, z1, z2 = gauss(0.0, 1.0), gauss(0.0, 1.0), gauss(0.0, 1.0)
+        a2 = t_a + l00 * z0
+        out_x.append((t_x + l10 * z0 + l11 * z1) / (3.0 * a2))
+        out_y.append((t_y + l20 * z0 + l21 * z1 + l22 * z2) / (3.0 * a2))
+    return out_x, out_y
+
+
+def confidence_ellipse(xs: Sequence[float], ys: Sequence[float],
+                       confidence: float = DEFAULT_CONFIDENCE) -> Dict[str, float]:
+    """
+    Örnek kovaryansından iki boyutlu güven elipsi
+    Two-dimensional confidence ellipse from the sample covariance
+
+    Yarı eksenler χ²(2) ölçeğiyle (√(-2 ln(1-p))) büyütülür; azimut kuzeyden
+    saat yönünde büyük eksenin yönüdür.
+    Semi-axes are scaled by the χ²(2) factor √(-2 ln(1-p)); the azimuth is
+    the major-axis bearing, clockwise from north.
+
+    Returns:
+        Dict: mean_x, mean_y, semi_major_m, semi_minor_m, azimuth_deg, confidence
+    """
+    n = len(xs)
+    mean_x = math.fsum(xs) / n
+    mean_y = math.fsum(ys) / n
+    sxx = math.fsum((x - mean_x) ** 2 for x in xs) / (n - 1)
+    syy = math.fsum((y - mean_y) ** 2 for y in ys) / (n - 1)
+    sxy = math.fsum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / (n - 1)
+    half_trace = (sxx + syy) / 2
+    root = math.sqrt(max(half_trace * half_trace - (sxx * syy - sxy * sxy), 0.0))
+    scale = math.sqrt(-2.0 * math.log(1.0 - confidence))
+    theta = 0.5 * math.atan2(2 * sxy, sxx - syy)
+    return {
+        "mean_x": mean_x,
+        "mean_y": mean_y,
+        "semi_major_m": scale * math.sqrt(half_trace + root),
+        "semi_minor_m": scale * math.sqrt(max(half_trace - root, 0.0)),
+        "azimuth_deg": (90.0 - math.degrees(theta)) % 180.0,
+        "confidence": confidence,
+    }
+
+
+def ellipse_polygon(center_x: float, center_y: float, ellipse: Dict[str, float],
+                    points: int = 72) -> Dict:
+    """
+    LAEA düzlemindeki elipsi GeoJSON Polygon (WGS84) olarak döndür
+    Return the LAEA-plane ellipse as a GeoJSON Polygon (WGS84)
+    """
+    a, b = ellipse["semi_major_m"], ellipse["semi_minor_m"]
+    theta = math.radians(90.0 - ellipse["azimuth_deg"])
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    ring = []
+    for i in range(points):
+        t = 2 * math.pi * i / points
+        u, v = a * math.cos(t), b * math.sin(t)
+        lat, lon = laea_inverse(center_x + u * cos_t - v * sin_t,
+                                center_y + u * sin_t + v * cos_t)
+        ring.append([round(lon, 7), round(lat, 7)])
+    ring.append(ring[0])
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
+def monte_carlo_centroid(geometry: Dict, trials: int = DEFAULT_TRIALS,
+                         sigma_m: float = DEFAULT_SIGMA_M,
+                         max_stride: int = DEFAULT_MAX_STRIDE, seed: int = 0,
+                         method: str = 'moment', workers: Optional[int] = None,
+                         confidence: float = DEFAULT_CONFIDENCE) -> Dict:
+    """
+    Alan-ağırlıklı centroidin sınır pertürbasyonuna duyarlılığı
+    Sensitivity of the area-weighted centroid to boundary perturbation
+
+    Args:
+        geometry (Dict): Sınır Polygon/MultiPolygon (ya da GeometryCollection)
+        trials (int): Deneme sayısı / Number of trials
+        sigma_m (float): Köşe konum hatası (metre, eksen başına) / Vertex error per axis (m)
+        max_stride (int): En kaba çözünürlük (her k'inci köşe) / Coarsest resolution
+        seed (int): Tohum / Seed
+        method (str): "moment" veya "vertex" / Engine
+        workers (int): İşçi süreç sayısı (varsayılan: CPU sayısı) / Worker processes
+        confidence (float): Güven düzeyi / Confidence level
+
+    Returns:
+        Dict: nominal ve ortalama merkez, güven elipsi (+GeoJSON), empirik
+            yarıçap ve accuracy_km / nominal and mean center, confidence
+            ellipse (+GeoJSON), empirical radius and accuracy_km
+
+    Raises:
+        ValueError: Geçersiz yöntem ya da poligon yok / Invalid method or no polygon
+    """
+    if method not in METHODS:
+        raise ValueError(f"Bilinmeyen yöntem / Unknown method: {method} ({', '.join(METHODS)})")
+    if trials < 2:
+        raise ValueError("En az 2 deneme gerekir / At least 2 trials are required")
+    started = time.perf_counter()
+    rings, (cx, cy) = prepare_rings(geometry)
+    variants = [decimate(rings, stride, offset)
+                for stride, offset in resolution_variants(max_stride)]
+    workers = workers or os.cpu_count() or 1
+    chunks = [(index, min(CHUNK_TRIALS, trials - start))
+              for index, start in enumerate(range(0, trials, CHUNK_TRIALS))]
+
+    pool = (ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(variants,)) if workers > 1 else None)
+    try:
+        if pool is None:
+            _init_worker(variants)
+        run = pool.map if pool is not None else map
+        if method == 'moment':
+            samplers = []
+            for total, k1, k2 in run(_variant_statistics, range(len(variants))):
+                cov = tuple(tuple(sigma_m ** 2 * a + 2 * sigma_m ** 4 * b
+                                  for a, b in zip(row1, row2))
+                            for row1, row2 in zip(k1, k2))
+                samplers.append((total, _cholesky3(cov)))
+            parts = list(run(_moment_chunk, [seed] * len(chunks), [i for i, _ in chunks],
+                             [size for _, size in chunks], [samplers] * len(chunks)))
+        else:
+            parts = list(run(_vertex_chunk, [seed] * len(chunks), [i for i, _ in chunks],
+                             [size for _, size in chunks], [sigma_m] * len(chunks)))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    xs, ys = array('d'), array('d')
+    for part_x, part_y in parts:
+        xs.extend(part_x)
+        ys.extend(part_y)
+    ellipse = confidence_ellipse(xs, ys, confidence)
+    radii = sorted(math.hypot(x, y) for x, y in zip(xs, ys))
+    radius = radii[min(len(radii) - 1, int(math.ceil(confidence * len(radii))) - 1)]
+
+    lat, lon = laea_inverse(cx, cy)
+    mean_lat, mean_lon = laea_inverse(cx + ellipse["mean_x"], cy + ellipse["mean_y"])
+    return {
+        "method": method,
+        "trials": trials,
+        "sigma_m": sigma_m,
+        "max_stride": max_stride,
+        "seed": seed,
+        "vertices": sum(len(xs) for xs, _, _ in rings),
+        "center": {"lat": round(lat, 6), "lon": round(lon, 6)},
+        "mean": {"lat": round(mean_lat, 6), "lon": round(mean_lon, 6)},
+        "bias_m": round(math.hypot(ellipse["mean_x"], ellipse["mean_y"]), 3),
+        "ellipse": {
+            "confidence": confidence,
+            "semi_major_m": round(ellipse["semi_major_m"], 3),
+            "semi_minor_m": round(ellipse["semi_minor_m"], 3),
+            "azimuth_deg": round(ellipse["azimuth_deg"], 2),
+            "geometry": ellipse_polygon(cx + ellipse["mean_x"], cy + ellipse["mean_y"], ellipse),
+        },
+        "radius_m": round(radius, 3),
+        "accuracy_km": round(radius / 1000.0, 3),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
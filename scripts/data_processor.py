@@ -10,9 +10,267 @@ Process and convert CSV, GeoJSON and JSON files.
 import json
 import csv
 import argparse
+import atexit
+import contextlib
+import glob
+import io
+import os
 import sys
-from pathlib import Path
-from typing import Dict, List, Tuple
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from geojson_writer import (BACKENDS as JSON_BACKENDS, ChunkedWriter, collection_layout,
+                            encoder, resolve_backend)
+from instrumentation import PROFILER, count, span, timed_call, timed_iter
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _JsonStream:
+    """
+    Parça parça okunan JSON metni için küçük tampon yardımcısı
+    Small buffer helper for JSON text that is read in chunks
+    """
+    
+    def __init__(self, f, chunk_size: int = 1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+    
+    def _fill(self, size: int) -> bool:
+        """Tampona veri ekle / Append more data to the buffer"""
+        if self.eof:
+            return False
+        chunk = self.f.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Boşlukları atlayıp sıradaki karakteri döndür / Next non-whitespace char"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill(self.chunk_size):
+                return ''
+    
+    def expect(self, char: str) -> None:
+        """Beklenen karakteri tüket / Consume an expected character"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found!r} in GeoJSON stream")
+        self.pos += 1
+    
+    def value(self):
+        """
+        Sıradaki JSON değerini çöz; gerekirse tamponu büyüt
+        Decode the next JSON value, growing the buffer as needed
+        """
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill(size):
+                    raise
+                size *= 2  # Büyük değerlerde ikinci dereceden yeniden denemeyi önle
+                continue
+            if end == len(self.buf) and not self.eof and isinstance(obj, (int, float)):
+                # Sayı parça sınırında kesilmiş olabilir / Number may be cut at a chunk boundary
+                if self._fill(size):
+                    continue
+            self.pos = end
+            return obj
+    
+    def separator(self, close: str) -> bool:
+        """
+        Değerden sonra ',' veya kapanışı tüket; kapanışta True döndür
+        Consume ',' or the closing char after a value; True on the closing char
+        """
+        found = self.peek()
+        if found == close:
+            self.pos += 1
+            return True
+        if found != ',':
+            raise ValueError(f"Expected ',' or {close!r} but found {found!r} in GeoJSON stream")
+        self.pos += 1
+        if self.peek() in (close, ''):
+            raise ValueError(f"Expected a value after ',' but found {self.peek()!r} in GeoJSON stream")
+        return False
+    
+    def expect_end(self) -> None:
+        """Kök değerden sonra yalnızca boşluk olmalı / Only whitespace may follow the root value"""
+        found = self.peek()
+        if found:
+            raise ValueError(f"Extra data {found!r} after the GeoJSON root value")
+
+
+def iter_geojson_features(file_path: str, chunk_size: int = 1 << 16,
+                          root: Optional[Dict] = None) -> Iterator[Dict]:
+    """
+    GeoJSON dosyasındaki feature'ları artımlı ayrıştırıcı ile tek tek üret
+    Yield the features of a GeoJSON file one at a time with an incremental parser
+    
+    Yalnızca "features" dizisi akış halinde okunur; diğer üst düzey alanlar
+    tek tek çözülüp atılır. Tek bir Feature nesnesi de desteklenir.
+    Only the "features" array is streamed; other top-level members are
+    decoded individually and discarded. A bare Feature object is also
+    supported.
+    
+    Args:
+        file_path (str): GeoJSON dosyasının yolu
+        chunk_size (int): Okuma parçası boyutu (karakter) / Read chunk size (characters)
+        root (Dict): Verilirse, sonunda üst düzey alanlarla doldurulur; "features"
+            akışla okunan feature sayısını tutar
+            If given, filled with the top-level members at the end; "features"
+            holds the number of streamed features
+    
+    Yields:
+        Dict: GeoJSON Feature
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        stream = _JsonStream(f, chunk_size)
+        stream.expect('{')
+        members = {}
+        streamed = None
+        closed = stream.peek() == '}'
+        if closed:
+            stream.pos += 1
+        while not closed:
+            if stream.peek() != '"':
+                raise ValueError(f"Expected a member name but found {stream.peek()!r} in GeoJSON stream")
+            key = stream.value()
+            stream.expect(':')
+            if key == 'features':
+                if stream.peek() != '[':
+                    raise ValueError("GeoJSON 'features' must be an array")
+                stream.pos += 1
+                streamed = 0
+                done = stream.peek() == ']'
+                if done:
+                    stream.pos += 1
+                while not done:
+                    if stream.peek() == '':
+                        raise ValueError("Unexpected end of GeoJSON 'features' array")
+                    streamed += 1
+                    yield stream.value()
+                    done = stream.separator(']')
+            else:
+                members[key] = stream.value()
+            closed = stream.separator('}')
+        stream.expect_end()
+        
+        if root is not None:
+            root.update(members)
+            if streamed is not None:
+                root['features'] = streamed
+        if members.get('type') == 'Feature':
+            yield members
+
+
+# Dönüştürme hedefine göre kabul edilen giriş uzantıları
+# Input extensions accepted for each conversion target
+SOURCE_EXTENSIONS = {
+    'geojson': ('.csv',),
+    'csv': ('.geojson', '.json'),
+}
+
+GEOPACKAGE_EXTENSIONS = ('.gpkg', '.sqlite', '.sqlite3', '.db')
+
+
+def _ends_with_newline(file_path: str, size: int) -> bool:
+    """Dosyanın ilk size baytı satır sonuyla mı bitiyor / Does the prefix end a line"""
+    if size <= 0:
+        return False
+    with open(file_path, 'rb') as f:
+        f.seek(size - 1)
+        return f.read(1) == b'\n'
+
+
+def _convert_file_job(input_path: str, output_path: str, target: str,
+                      compact: bool, previous: Optional[Dict] = None,
+                      track: bool = False, json_backend: str = 'stdlib',
+                      precision: Optional[int] = None) -> Dict:
+    """
+    Toplu mod işçisi: tek bir dosyayı akış halinde dönüştür
+    Batch-mode worker: stream-convert a single file
+
+    İşçi süreçlerinde çalışır; hata fırlatmak yerine sonucu döndürür.
+    track ise girdinin özeti alınıp manifesto kaydı döndürülür; önceki kayıt
+    (previous) verilirse içeriği aynı dosya atlanır ve yalnızca sonuna satır
+    eklenmiş CSV'nin yeni satırları mevcut GeoJSON'a eklenir.
+    Runs in worker processes; returns the outcome instead of raising.
+    With track the input is hashed and a manifest entry is returned; given
+    the previous entry, identical content is skipped and a CSV that only
+    grew at the end has just its new rows appended to the existing GeoJSON.
+    """
+    started = time.perf_counter()
+    started_epoch = time.time()
+    processor = DataProcessor(json_backend, precision)
+    if not track:
+        previous = None
+    try:
+        entry = None
+        action = "converted"
+        if track:
+            from manifest import file_digests
+            stat = os.stat(input_path)
+            digest, prefix = file_digests(input_path, previous["size"] if previous else None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            if previous is not None and digest == previous["sha256"]:
+                action = "unchanged"
+                rows, total_rows, features = 0, previous["rows"], previous["features"]
+            else:
+                rows = None
+                if (previous is not None and target == 'geojson' and previous["features"]
+                        and prefix == previous["sha256"]
+                        and _ends_with_newline(input_path, previous["size"])):
+                    try:
+                        stats = processor.csv_append_geojson(input_path, output_path,
+                                                             previous["size"], compact)
+                        action = "appended"
+                        rows = stats['rows']
+                        total_rows = previous["rows"] + rows
+                        features = previous["features"] + stats['features']
+                    except ValueError:
+                        pass  # Çıktı beklenen biçimde değil: baştan yaz / Rewrite in full
+                if rows is None and target == 'geojson':
+                    stats = processor.csv_to_geojson_stream(input_path, output_path, compact=compact)
+                    rows = total_rows = stats['rows']
+                    features = stats['features']
+                elif rows is None:
+                    stats = processor.geojson_to_csv_stream(input_path, output_path)
+                    rows = total_rows = features = stats['features']
+        if track:
+            entry = {
+                "output": os.path.abspath(output_path),
+                "options": processor.output_options(target, compact),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+                "rows": total_rows,
+                "features": features,
+                "output_size": os.path.getsize(output_path),
+            }
+        return {"input": input_path, "output": output_path, "ok": True, "rows": rows,
+                "bytes": os.path.getsize(input_path) if action == "converted" else 0,
+                "seconds": time.perf_counter() - started, "error": None,
+                "action": action, "entry": entry, "started": started_epoch, "pid": os.getpid()}
+    except Exception as e:
+        return {"input": input_path, "output": output_path, "ok": False, "rows": 0,
+                "bytes": 0, "seconds": time.perf_counter() - started,
+                "error": f"{type(e).__name__}: {e}", "action": "failed", "entry": None,
+                "started": started_epoch, "pid": os.getpid()}
 
 
 class DataProcessor:
@@ -21,10 +279,28 @@ class DataProcessor:
     Geographic data processing class
     """
     
-    def __init__(self):
-        """Initialize the data processor"""
+    def __init__(self, json_backend: str = 'stdlib', precision: Optional[int] = None):
+        """
+        Initialize the data processor
+        
+        Args:
+            json_backend (str): GeoJSON serileştirme arka ucu (geojson_writer.BACKENDS)
+                GeoJSON serialization backend
+            precision (int): Koordinat ondalık sayısı; None ise tam hassasiyet
+                Coordinate decimals; None keeps full precision
+        """
         self.data = None
         self.file_path = None
+        self.json_backend = json_backend
+        self.precision = precision
+    
+    def output_options(self, target: str, compact: bool) -> Dict:
+        """
+        Çıktı baytlarını belirleyen seçenekler (manifesto karşılaştırması için)
+        Options that determine the output bytes (for manifest comparison)
+        """
+        return {"target": target, "compact": compact,
+                "json_backend": self.json_backend, "precision": self.precision}
     
     def load_csv(self, file_path: str) -> List[Dict]:
         """
@@ -38,11 +314,14 @@ class DataProcessor:
             List[Dict]: CSV verisi
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with span('load_csv', 'load', file=file_path), \
+                    open(file_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 data = list(reader)
                 self.data = data
                 self.file_path = file_path
+                count('rows', len(data))
+                count('bytes_read', f.tell())
                 return data
         except Exception as e:
             print(f"❌ CSV yükleme hatası / CSV loading error: {e}")
@@ -60,8 +339,12 @@ class DataProcessor:
             Dict: GeoJSON verisi
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with span('load_geojson', 'load', file=file_path):
+                with span('read', 'io'), open(file_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                with span('parse', 'parse'):
+                    data = json.loads(text)
+                count('bytes_read', len(text))
                 self.data = data
                 self.file_path = file_path
                 return data
@@ -81,8 +364,12 @@ class DataProcessor:
             Dict: JSON verisi
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with span('load_json', 'load', file=file_path):
+                with span('read', 'io'), open(file_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                with span('parse', 'parse'):
+                    data = json.loads(text)
+                count('bytes_read', len(text))
                 self.data = data
                 self.file_path = file_path
                 return data
@@ -90,7 +377,10 @@ class DataProcessor:
             print(f"❌ JSON yükleme hatası / JSON loading error: {e}")
             return {}
     
-    def csv_to_geojson(self, csv_file: str, output_file: str = None) -> Dict:
+    def csv_to_geojson(self, csv_file: str, output_file: str = None,
+                       classifier: 'PolygonClassifier' = None,
+                       region_property: str = 'region', compact: bool = False,
+                       geocoder: 'Geocoder' = None, workers: Optional[int] = 1) -> Dict:
         """
         CSV dosyasını GeoJSON'a dönüştür
         Convert CSV file to GeoJSON
@@ -98,49 +388,347 @@ class DataProcessor:
         Args:
             csv_file (str): Giriş CSV dosyası
             output_file (str): Çıkış dosyası (opsiyonel)
+            classifier (PolygonClassifier): Verilirse her noktanın birimi eklenir
+                If given, each point's administrative unit is attached
+            region_property (str): Birim adının yazılacağı özellik / Property for the unit name
+            compact (bool): Girintisiz çıktı / Write without indentation
+            geocoder (Geocoder): Verilirse koordinatı eksik satırlar adresinden kodlanır
+                If given, rows missing coordinates are geocoded from their address
+            workers (int): Sınıflandırma süreç sayısı / Classification worker processes
         
         Returns:
             Dict: GeoJSON FeatureCollection
         """
-        csv_data = self.load_csv(csv_file)
+        with span('csv_to_geojson', file=csv_file):
+            csv_data = self.load_csv(csv_file)
+            
+            if not csv_data:
+                return {}
+            
+            if geocoder is not None:
+                with span('geocode', 'transform'):
+                    csv_data = list(geocoder.enrich(csv_data))
+            
+            with span('transform', 'transform'):
+                features = [
+                    feature for feature in map(self._row_to_feature, csv_data)
+                    if feature is not None
+                ]
+            if classifier is not None:
+                with span('classify', 'transform'):
+                    features = list(self.classify_features(features, classifier, region_property,
+                                                           workers=workers))
+            
+            geojson = {
+                "type": "FeatureCollection",
+                "features": features
+            }
+            
+            # Dosyaya kaydet
+            if output_file:
+                self.save_geojson(geojson, output_file, compact)
+            
+            return geojson
+    
+    def load_classifier(self, boundary_file: str, name_property: str = 'name',
+                        cell_size: float = 0.1) -> 'PolygonClassifier':
+        """
+        İl/ilçe sınır GeoJSON'undan nokta-poligon sınıflandırıcı kur
+        Build a point-in-polygon classifier from province/district boundaries
         
-        if not csv_data:
-            return {}
+        Args:
+            boundary_file (str): Sınır GeoJSON dosyası / Boundary GeoJSON file
+            name_property (str): Birim adını taşıyan özellik / Property holding the unit name
+            cell_size (float): Izgara hücre boyu (derece) / Grid cell size (degrees)
         
-        features = []
+        Returns:
+            PolygonClassifier: Sınıflandırıcı / Classifier
+        """
+        from point_in_polygon import PolygonClassifier
         
-        for row in csv_data:
-            try:
-                # Koordinatları al
-                lat = float(row.get('latitude', 0))
-                lon = float(row.get('longitude', 0))
-                
-                feature = {
-                    "type": "Feature",
-                    "properties": {
-                        key: value for key, value in row.items()
-                        if key not in ['latitude', 'longitude']
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [lon, lat]
-                    }
-                }
-                features.append(feature)
-            except ValueError as e:
-                print(f"⚠️  Koordinat hata / Coordinate error in row {row}: {e}")
-                continue
+        return PolygonClassifier(iter_geojson_features(boundary_file), name_property, cell_size)
+    
+    def load_geocoder(self, url: str, address_columns: Sequence[str] = ('address',),
+                      cache_file: Optional[str] = '', concurrency: int = 8,
+                      retries: int = 4) -> 'Geocoder':
+        """
+        Koordinatı eksik satırlar için geocoding istemcisi kur
+        Build the geocoding client for rows missing coordinates
+        
+        Args:
+            url (str): Geocoding uç noktası / Geocoding endpoint URL
+            address_columns (Sequence[str]): Adresi oluşturan sütunlar / Columns forming the address
+            cache_file (str): JSON Lines önbelleği ('' uç noktaya özgü varsayılan)
+                JSON Lines cache ('' picks the per-endpoint default)
+            concurrency (int): Eşzamanlı istek / Concurrent requests
+            retries (int): İstek başına yeniden deneme / Retries per request
+        
+        Returns:
+            Geocoder: Kapatılması gereken istemci / Client that must be closed
+        """
+        from geocoder import Geocoder
+        
+        return Geocoder(url, cache_file, address_columns, concurrency=concurrency, retries=retries)
+    
+    @staticmethod
+    def classify_features(features: Iterable[Optional[Dict]], classifier: 'PolygonClassifier',
+                          region_property: str = 'region', batch_size: int = 10000,
+                          workers: int = 1) -> Iterator[Optional[Dict]]:
+        """
+        Point feature'larına parti halinde birim adını ekle
+        Attach the administrative unit to Point features in batches
+        
+        Args:
+            features (Iterable[Dict]): Feature akışı (None öğeler aynen geçer)
+            classifier (PolygonClassifier): Sınıflandırıcı / Classifier
+            region_property (str): Birim adının yazılacağı özellik / Property for the unit name
+            batch_size (int): Parti başına nokta / Points per batch
+            workers (int): Süreç sayısı; None ise CPU sayısı / Worker processes (None: CPU count)
+        
+        Yields:
+            Dict: Birim özelliği eklenmiş feature / Feature with the unit property
+        """
+        # Paralelde her boşaltma işçi başına bir parti taşır; havuz kurulumu büyük
+        # partilere yayılır / In parallel every flush carries one batch per worker,
+        # spreading the pool start-up over large batches
+        worker_count = workers or os.cpu_count() or 1
+        per_worker = batch_size
+        if worker_count > 1:
+            per_worker = max(batch_size, 50000)
+            batch_size = per_worker * worker_count
+        
+        def flush(batch: List[Dict]) -> List[Dict]:
+            points = [f for f in batch if f is not None and
+                      (f.get('geometry') or {}).get('type') == 'Point']
+            regions = classifier.classify_many(
+                [f['geometry']['coordinates'][1] for f in points],
+                [f['geometry']['coordinates'][0] for f in points],
+                workers=workers, batch_size=per_worker
+            )
+            for feature, region in zip(points, regions):
+                feature.setdefault('properties', {})[region_property] = region
+            return batch
+        
+        batch = []
+        for feature in features:
+            batch.append(feature)
+            if len(batch) >= batch_size:
+                yield from flush(batch)
+                batch = []
+        if batch:
+            yield from flush(batch)
+    
+    def iter_csv(self, file_path: str) -> Iterator[Dict]:
+        """
+        CSV satırlarını tek tek üret (dosyayı belleğe almadan)
+        Yield CSV rows one at a time without loading the whole file
+        
+        Args:
+            file_path (str): CSV dosyasının yolu
+        
+        Yields:
+            Dict: CSV satırı / CSV row
+        """
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+    
+    @staticmethod
+    def _row_to_feature(row: Dict) -> Optional[Dict]:
+        """
+        CSV satırını Point feature'ına dönüştür
+        Convert a CSV row to a Point feature
+        
+        Returns:
+            Dict: GeoJSON Feature veya koordinat hatasında None
+        """
+        try:
+            # Koordinatları al
+            lat = float(row.get('latitude', 0))
+            lon = float(row.get('longitude', 0))
+        except (TypeError, ValueError) as e:
+            print(f"⚠️  Koordinat hata / Coordinate error in row {row}: {e}")
+            return None
         
-        geojson = {
-            "type": "FeatureCollection",
-            "features": features
+        return {
+            "type": "Feature",
+            "properties": {
+                key: value for key, value in row.items()
+                if key not in ['latitude', 'longitude']
+            },
+            "geometry": {
+                "type": "Point",
+                "coordinates": [lon, lat]
+            }
         }
+    
+    @staticmethod
+    def write_geojson_stream(features: Iterable[Optional[Dict]], output_file: str,
+                             compact: bool = False, json_backend: str = 'stdlib',
+                             precision: Optional[int] = None, crs: Optional[str] = None) -> int:
+        """
+        Feature akışını doğrudan dosyaya FeatureCollection olarak yaz
+        Write a stream of features straight to a FeatureCollection file
+        
+        Girintili çıktı save_geojson ile bayt bayt aynıdır; None öğeler atlanır.
+        Çıktı 1 MiB'lık parçalar halinde yazılır.
+        Indented output is byte-identical to save_geojson; None items are
+        skipped. Output is written in 1 MiB chunks.
+        
+        Args:
+            features (Iterable[Dict]): Feature akışı / Feature stream
+            output_file (str): Çıkış GeoJSON dosyası
+            compact (bool): Girintisiz çıktı / Write without indentation
+            json_backend (str): Serileştirme arka ucu / Serialization backend
+            precision (int): Koordinat ondalık sayısı / Coordinate decimals
+            crs (str): WGS84 dışı koordinatlar için "crs" üyesi adı
+                Name for the "crs" member of non-WGS84 coordinates
+        
+        Returns:
+            int: Yazılan feature sayısı / Number of features written
+        """
+        layout = collection_layout(json_backend, compact, precision, crs)
+        dumps = timed_call('serialize', layout.dumps)
+        sep = layout.sep
+        written = 0
+        with open(output_file, 'wb') as f:
+            out = ChunkedWriter(timed_call('write', f.write), layout.binary)
+            write = out.write
+            write(layout.head)
+            for feature in timed_iter('parse+transform', features):
+                if feature is None:
+                    continue
+                if written:
+                    write(sep)
+                write(dumps(feature))
+                written += 1
+            write(layout.tail if written or compact else layout.empty)
+            out.flush()
+            count('features', written)
+            count('bytes_written', out.written)
+        return written
+    
+    def csv_to_geojson_stream(self, csv_file: str, output_file: str,
+                              compact: bool = False,
+                              classifier: 'PolygonClassifier' = None,
+                              region_property: str = 'region',
+                              geocoder: 'Geocoder' = None,
+                              workers: Optional[int] = 1) -> Dict[str, float]:
+        """
+        CSV'yi sabit bellekle akış halinde GeoJSON'a dönüştür
+        Stream a CSV into a GeoJSON FeatureCollection with constant memory
+        
+        Satırlar üreteçle okunur ve her feature doğrudan dosyaya yazılır.
+        Rows are read through a generator and each feature is written
+        straight to the output file.
+        
+        Args:
+            csv_file (str): Giriş CSV dosyası
+            output_file (str): Çıkış GeoJSON dosyası
+            compact (bool): Girintisiz çıktı / Write without indentation
+            classifier (PolygonClassifier): Verilirse her noktanın birimi eklenir
+                If given, each point's administrative unit is attached
+            region_property (str): Birim adının yazılacağı özellik / Property for the unit name
+            geocoder (Geocoder): Verilirse koordinatı eksik satırlar parti halinde kodlanır
+                If given, rows missing coordinates are geocoded in batches
+            workers (int): Sınıflandırma süreç sayısı / Classification worker processes
+        
+        Returns:
+            Dict: İstatistikler (rows, features, skipped, seconds, rows_per_sec)
+        """
+        started = time.perf_counter()
+        rows = 0
+        
+        def iter_features() -> Iterator[Optional[Dict]]:
+            nonlocal rows
+            source = self.iter_csv(csv_file)
+            if geocoder is not None:
+                source = geocoder.enrich(source)
+            for row in source:
+                rows += 1
+                yield self._row_to_feature(row)
+        
+        with span('csv_to_geojson_stream', file=csv_file):
+            stream = iter_features()
+            if classifier is not None:
+                stream = self.classify_features(stream, classifier, region_property,
+                                                workers=workers)
+            features = self.write_geojson_stream(stream, output_file, compact,
+                                                 self.json_backend, self.precision)
+            count('rows', rows)
+        
+        self.file_path = csv_file
+        elapsed = time.perf_counter() - started
+        stats = {
+            "rows": rows,
+            "features": features,
+            "skipped": rows - features,
+            "seconds": round(elapsed, 3),
+            "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else 0.0
+        }
+        print(f"✅ GeoJSON dosyası kaydedildi / GeoJSON file saved: {output_file}")
+        print(f"   {rows} satır / rows, {stats['rows_per_sec']} satır/sn / rows/sec")
+        return stats
+    
+    def csv_append_geojson(self, csv_file: str, output_file: str, offset: int,
+                           compact: bool = False) -> Dict[str, int]:
+        """
+        CSV'nin offset baytından sonraki satırlarını mevcut GeoJSON'un sonuna ekle
+        Append the CSV rows after byte offset to an existing GeoJSON output
         
-        # Dosyaya kaydet
-        if output_file:
-            self.save_geojson(geojson, output_file)
+        Çıktı write_geojson_stream ile (aynı compact, arka uç ve hassasiyetle) yazılmış ve en az
+        bir feature içermelidir; kapanış baytları beklenenden farklıysa dosyaya
+        dokunulmadan ValueError fırlatılır.
+        The output must have been written by write_geojson_stream (with the
+        same compact, backend and precision settings) and hold at least one feature; if its closing
+        bytes differ from the expected layout, ValueError is raised before
+        anything is written.
         
-        return geojson
+        Args:
+            csv_file (str): Büyümüş CSV dosyası / The grown CSV file
+            output_file (str): Önceki GeoJSON çıktısı / Previous GeoJSON output
+            offset (int): Önceden dönüştürülen bayt sayısı / Bytes already converted
+            compact (bool): Çıktının girintisiz olup olmadığı / Whether the output is compact
+        
+        Returns:
+            Dict: rows, features (yalnızca eklenenler / appended only)
+        """
+        layout = collection_layout(self.json_backend, compact, self.precision)
+        dumps, sep = layout.dumps, layout.sep
+        tail_bytes = layout.tail if layout.binary else layout.tail.encode('utf-8')
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            fieldnames = next(csv.reader(f))
+        
+        with span('csv_append_geojson', file=csv_file, offset=offset):
+            rows = features = 0
+            with open(output_file, 'r+b') as out:
+                out.seek(0, os.SEEK_END)
+                end = out.tell()
+                if end < len(tail_bytes):
+                    raise ValueError(f"Unexpected GeoJSON layout: {output_file}")
+                out.seek(end - len(tail_bytes))
+                if out.read() != tail_bytes:
+                    raise ValueError(f"Unexpected GeoJSON layout: {output_file}")
+                out.seek(end - len(tail_bytes))
+                out.truncate()
+                writer = ChunkedWriter(out.write, layout.binary)
+                with open(csv_file, 'rb') as raw:
+                    raw.seek(offset)
+                    text = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+                    for row in csv.DictReader(text, fieldnames=fieldnames):
+                        rows += 1
+                        feature = self._row_to_feature(row)
+                        if feature is None:
+                            continue
+                        writer.write(sep)
+                        writer.write(dumps(feature))
+                        features += 1
+                writer.write(layout.tail)
+                writer.flush()
+            count('rows', rows)
+            count('features', features)
+        print(f"✅ GeoJSON dosyasına eklendi / Appended to GeoJSON: {output_file} "
+              f"(+{features} feature)")
+        return {"rows": rows, "features": features}
     
     def geojson_to_csv(self, geojson_file: str, output_file: str = None) -> str:
         """
@@ -154,48 +742,314 @@ class DataProcessor:
         Returns:
             str: CSV metni
         """
-        geojson_data = self.load_geojson(geojson_file)
+        with span('geojson_to_csv', file=geojson_file):
+            geojson_data = self.load_geojson(geojson_file)
+            
+            if not geojson_data.get('features'):
+                return ""
+            
+            features = geojson_data['features']
+            
+            with span('transform', 'transform'):
+                # Tüm özellikleri topla
+                all_keys = set()
+                for feature in features:
+                    all_keys.update(feature.get('properties', {}).keys())
+                    all_keys.add('latitude')
+                    all_keys.add('longitude')
+                
+                # CSV yazma
+                csv_lines = []
+                csv_lines.append(','.join(sorted(all_keys)))
+                
+                for feature in features:
+                    props = feature.get('properties', {})
+                    coords = feature.get('geometry', {}).get('coordinates', [0, 0])
+                    
+                    row = {}
+                    for key in all_keys:
+                        if key == 'longitude':
+                            row[key] = str(coords[0])
+                        elif key == 'latitude':
+                            row[key] = str(coords[1])
+                        else:
+                            row[key] = props.get(key, '')
+                    
+                    csv_lines.append(','.join(f'"{row[k]}"' for k in sorted(all_keys)))
+                
+                csv_text = '\n'.join(csv_lines)
+            count('features', len(features))
+            
+            # Dosyaya kaydet
+            if output_file:
+                with span('write', 'io'), open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(csv_text)
+                    count('bytes_written', f.tell())
+                print(f"✅ CSV dosyası kaydedildi / CSV file saved: {output_file}")
         
-        if not geojson_data.get('features'):
-            return ""
+        return csv_text
+    
+    def iter_geojson(self, file_path: str) -> Iterator[Dict]:
+        """
+        GeoJSON feature'larını belleğe almadan tek tek üret
+        Yield GeoJSON features one at a time without loading the file
         
-        features = geojson_data['features']
+        Args:
+            file_path (str): GeoJSON dosyasının yolu
         
-        # Tüm özellikleri topla
-        all_keys = set()
-        for feature in features:
-            all_keys.update(feature.get('properties', {}).keys())
-            all_keys.add('latitude')
-            all_keys.add('longitude')
+        Yields:
+            Dict: GeoJSON Feature
+        """
+        self.file_path = file_path
+        yield from iter_geojson_features(file_path)
+    
+    def scan_geojson_columns(self, geojson_file: str, limit: int = 1000) -> List[str]:
+        """
+        İlk `limit` feature'dan CSV sütunlarını belirle
+        Derive the CSV column set from the first `limit` features
         
-        # CSV yazma
-        csv_lines = []
-        csv_lines.append(','.join(sorted(all_keys)))
+        Args:
+            geojson_file (str): GeoJSON dosyasının yolu
+            limit (int): Taranacak en fazla feature / Maximum features to scan
         
-        for feature in features:
-            props = feature.get('properties', {})
-            coords = feature.get('geometry', {}).get('coordinates', [0, 0])
-            
-            row = {}
-            for key in all_keys:
-                if key == 'longitude':
-                    row[key] = str(coords[0])
-                elif key == 'latitude':
-                    row[key] = str(coords[1])
-                else:
-                    row[key] = props.get(key, '')
-            
-            csv_lines.append(','.join(f'"{row[k]}"' for k in sorted(all_keys)))
+        Returns:
+            List[str]: Sıralı sütun adları / Sorted column names
+        """
+        keys = {'latitude', 'longitude'}
+        for feature in islice(self.iter_geojson(geojson_file), limit):
+            keys.update((feature.get('properties') or {}).keys())
+        return sorted(keys)
+    
+    def geojson_to_csv_stream(self, geojson_file: str, output_file: str,
+                              columns: Optional[Sequence[str]] = None,
+                              scan_limit: int = 1000) -> Dict[str, float]:
+        """
+        GeoJSON'u akış halinde CSV'ye dönüştür
+        Stream a GeoJSON file into CSV
         
-        csv_text = '\n'.join(csv_lines)
+        Sütunlar verilen şemadan ya da sınırlı bir ön taramadan gelir; şemada
+        olmayan özellikler yazılmaz. Satırlar csv.writer ile doğru tırnaklanır.
+        Columns come from the given schema or a bounded pre-scan; properties
+        outside the schema are dropped. Rows are quoted by csv.writer.
         
-        # Dosyaya kaydet
-        if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(csv_text)
-            print(f"✅ CSV dosyası kaydedildi / CSV file saved: {output_file}")
+        Args:
+            geojson_file (str): Giriş GeoJSON dosyası
+            output_file (str): Çıkış CSV dosyası
+            columns (Sequence[str]): Sütun şeması (opsiyonel) / Column schema (optional)
+            scan_limit (int): Ön tarama feature sayısı / Features to pre-scan
         
-        return csv_text
+        Returns:
+            Dict: İstatistikler (features, dropped_keys, seconds, rows_per_sec)
+        """
+        started = time.perf_counter()
+        columns = list(columns) if columns else self.scan_geojson_columns(geojson_file, scan_limit)
+        known = set(columns)
+        dropped = set()
+        rows = 0
+        
+        try:
+            with span('geojson_to_csv_stream', file=geojson_file), \
+                    open(output_file, 'w', encoding='utf-8', newline='') as out:
+                writer = csv.writer(out)
+                writerow = timed_call('serialize+write', writer.writerow)
+                writerow(columns)
+                for feature in timed_iter('parse', self.iter_geojson(geojson_file)):
+                    props = feature.get('properties') or {}
+                    geometry = feature.get('geometry') or {}
+                    row = dict(props)
+                    if geometry.get('type') == 'Point':
+                        coords = geometry.get('coordinates') or ['', '']
+                        row['longitude'], row['latitude'] = coords[0], coords[1]
+                    else:
+                        row['longitude'] = row['latitude'] = ''
+                    if len(dropped) < 100:
+                        dropped.update(k for k in props if k not in known)
+                    writerow([row.get(key, '') for key in columns])
+                    rows += 1
+                count('features', rows)
+                count('bytes_written', out.tell())
+        except ValueError:
+            # Bozuk girdiden yarım CSV bırakma / Leave no partial CSV behind for malformed input
+            os.remove(output_file)
+            raise
+        
+        elapsed = time.perf_counter() - started
+        if dropped:
+            print(f"⚠️  Şemada olmayan sütunlar atlandı / Columns outside schema dropped: {sorted(dropped)}")
+        print(f"✅ CSV dosyası kaydedildi / CSV file saved: {output_file}")
+        return {
+            "features": rows,
+            "dropped_keys": sorted(dropped),
+            "seconds": round(elapsed, 3),
+            "rows_per_sec": round(rows / elapsed, 1) if elapsed > 0 else 0.0
+        }
+    
+    @staticmethod
+    def expand_inputs(patterns: Sequence[str], extensions: Sequence[str]) -> List[str]:
+        """
+        Dizin ve glob desenlerini dosya listesine aç
+        Expand directories and glob patterns into a sorted file list
+        
+        Args:
+            patterns (Sequence[str]): Dosya, dizin veya glob desenleri
+            extensions (Sequence[str]): Kabul edilen uzantılar / Accepted extensions
+        
+        Returns:
+            List[str]: Tekrarsız, sıralı dosya yolları / Unique, sorted file paths
+        """
+        files = set()
+        for pattern in patterns:
+            if os.path.isdir(pattern):
+                for root, _, names in os.walk(pattern):
+                    files.update(os.path.join(root, name) for name in names)
+            else:
+                files.update(glob.glob(pattern, recursive=True))
+        return sorted(f for f in files
+                      if os.path.isfile(f) and os.path.splitext(f)[1].lower() in extensions)
+    
+    def batch_convert(self, patterns: Sequence[str], target: str,
+                      output_dir: Optional[str] = None, workers: Optional[int] = None,
+                      compact: bool = False, manifest_path: Optional[str] = None) -> Dict:
+        """
+        Çok sayıda dosyayı süreç havuzunda paralel dönüştür
+        Convert many files in parallel across a process pool
+        
+        Hatalar toplanır, çalışma durdurulmaz; sonunda verim özeti yazılır.
+        Manifesto verilirse değişmemiş girdiler atlanır, sonuna satır eklenmiş
+        CSV'lerde yalnızca yeni satırlar dönüştürülür.
+        Errors are collected without aborting the run, and a throughput
+        summary is printed at the end. With a manifest, unchanged inputs are
+        skipped and CSVs that only grew have just their new rows converted.
+        
+        Args:
+            patterns (Sequence[str]): Dosya, dizin veya glob desenleri
+            target (str): "geojson" veya "csv"
+            output_dir (str): Çıkış dizini; yoksa girişin yanına yazılır
+            workers (int): İşçi süreç sayısı / Worker process count
+            compact (bool): Girintisiz GeoJSON / Compact GeoJSON output
+            manifest_path (str): Artımlı mod manifestosu (JSON) / Incremental-mode manifest
+        
+        Returns:
+            Dict: Özet (files, failed, rows, seconds, errors, actions)
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        if target not in SOURCE_EXTENSIONS:
+            raise ValueError(f"Unsupported batch target: {target}")
+        inputs = self.expand_inputs(patterns, SOURCE_EXTENSIONS[target])
+        suffix = '.geojson' if target == 'geojson' else '.csv'
+        jobs = []
+        for input_path in inputs:
+            out_name = os.path.splitext(os.path.basename(input_path))[0] + suffix
+            out_dir = output_dir or os.path.dirname(input_path)
+            jobs.append((input_path, os.path.join(out_dir, out_name)))
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        started = time.perf_counter()
+        manifest = None
+        fresh = []
+        pending = []
+        if manifest_path:
+            from manifest import ConversionManifest
+            manifest = ConversionManifest(manifest_path)
+        options = self.output_options(target, compact)
+        for inp, out in jobs:
+            previous = None
+            if manifest is not None:
+                state, previous = manifest.lookup(inp, out, options)
+                if state == "fresh":
+                    fresh.append(inp)
+                    continue
+            pending.append((inp, out, previous))
+        
+        print(f"📦 {len(jobs)} dosya / files, {len(fresh)} değişmemiş / unchanged, "
+              f"{workers or os.cpu_count()} işçi / workers")
+        results = []
+        marks = {"converted": "✅", "appended": "➕", "unchanged": "⏭️ ", "failed": "❌"}
+        with span('batch_convert', target=target, files=len(pending)), \
+                ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_convert_file_job, inp, out, target, compact,
+                                   previous, manifest is not None,
+                                   self.json_backend, self.precision)
+                       for inp, out, previous in pending]
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results.append(result)
+                if PROFILER.enabled:
+                    PROFILER.add_span('convert_file', 'worker', result["started"],
+                                      result["seconds"], result["pid"], file=result["input"],
+                                      action=result["action"], rows=result["rows"])
+                if manifest is not None and result["entry"] is not None:
+                    manifest.record(result["input"], result["entry"])
+                detail = f"{result['rows']} satır / rows" if result["ok"] else result["error"]
+                print(f"  [{done}/{len(pending)}] {marks[result['action']]} {result['input']} "
+                      f"({result['seconds']:.2f}s) {detail}")
+        if manifest is not None:
+            manifest.save()
+        
+        elapsed = time.perf_counter() - started
+        errors = [r for r in results if not r["ok"]]
+        rows = sum(r["rows"] for r in results)
+        mbytes = sum(r["bytes"] for r in results) / 1e6
+        count('rows', rows)
+        count('bytes_read', int(mbytes * 1e6))
+        print("\n📊 TOPLU DÖNÜŞTÜRME ÖZETİ / BATCH CONVERSION SUMMARY")
+        print("-" * 70)
+        print(f"Dosya / Files: {len(results) + len(fresh) - len(errors)} başarılı / ok, {len(errors)} hatalı / failed")
+        print(f"Satır / Rows: {rows}  Süre / Time: {elapsed:.2f}s")
+        if elapsed > 0:
+            print(f"Verim / Throughput: {len(results) / elapsed:.1f} dosya/sn / files/sec, "
+                  f"{rows / elapsed:.0f} satır/sn / rows/sec, {mbytes / elapsed:.1f} MB/s")
+        actions = {"fresh": len(fresh)}
+        for r in results:
+            actions[r["action"]] = actions.get(r["action"], 0) + 1
+        if manifest is not None:
+            print(f"Artımlı / Incremental: {actions}")
+        for r in errors:
+            print(f"  ❌ {r['input']}: {r['error']}")
+        return {"files": len(results) + len(fresh), "failed": len(errors), "rows": rows,
+                "seconds": round(elapsed, 3), "errors": errors, "actions": actions}
+    
+    def convert_incremental(self, input_file: str, output_file: str, target: str,
+                            manifest_path: str, compact: bool = False) -> Dict:
+        """
+        Tek dosyayı manifestoya göre artımlı dönüştür
+        Incrementally convert a single file against a manifest
+        
+        Args:
+            input_file (str): Giriş CSV/GeoJSON dosyası
+            output_file (str): Çıkış dosyası
+            target (str): "geojson" veya "csv"
+            manifest_path (str): Manifesto (JSON) dosyası / Manifest file
+            compact (bool): Girintisiz GeoJSON / Compact GeoJSON output
+        
+        Returns:
+            Dict: Sonuç (action: fresh/unchanged/appended/converted/failed, rows, ...)
+        """
+        from manifest import ConversionManifest
+        
+        manifest = ConversionManifest(manifest_path)
+        state, previous = manifest.lookup(input_file, output_file,
+                                          self.output_options(target, compact))
+        if state == "fresh":
+            print(f"⏭️  Değişmemiş, atlandı / Unchanged, skipped: {input_file}")
+            return {"input": input_file, "output": output_file, "ok": True, "rows": 0,
+                    "action": "fresh", "entry": previous}
+        result = _convert_file_job(input_file, output_file, target, compact, previous, True,
+                                   self.json_backend, self.precision)
+        if result["ok"]:
+            manifest.record(input_file, result["entry"])
+            manifest.save()
+            messages = {
+                "unchanged": "İçerik aynı, atlandı / Content identical, skipped",
+                "appended": f"{result['rows']} yeni satır eklendi / new rows appended",
+                "converted": f"Yeniden dönüştürüldü / Fully converted ({result['rows']} satır / rows)",
+            }
+            print(f"✅ {messages[result['action']]}: {output_file}")
+        else:
+            print(f"❌ Dönüştürme hatası / Conversion error: {result['error']}")
+        return result
     
     def validate_geojson(self, geojson_file: str) -> Tuple[bool, List[str]]:
         """
@@ -208,68 +1062,78 @@ class DataProcessor:
         Returns:
             Tuple: (Geçerli mi?, Hata listesi)
         """
-        errors = []
+        report = self.validate_geojson_report(geojson_file)
         
-        geojson_data = self.load_geojson(geojson_file)
+        if not report["valid"]:
+            return False, [self._format_issue(issue) for issue in report["errors"]]
+        else:
+            return True, ["✅ GeoJSON is valid / GeoJSON geçerli"]
+    
+    def validate_geojson_report(self, geojson_file: str, max_errors: int = 100,
+                                workers: Optional[int] = 1,
+                                chunk_size: int = 5000) -> Dict:
+        """
+        GeoJSON'u akış halinde RFC 7946'ya göre doğrula
+        Stream-validate a GeoJSON file against RFC 7946
         
-        # Temel yapı kontrolü
-        if not isinstance(geojson_data, dict):
-            errors.append("GeoJSON root must be an object")
-            return False, errors
+        Args:
+            geojson_file (str): GeoJSON dosyasının yolu
+            max_errors (int): Rapordaki en fazla hata / Maximum errors listed
+            workers (int): İşçi süreç sayısı / Worker processes (1 = in-process)
+            chunk_size (int): Parça başına feature / Features per chunk
         
-        if geojson_data.get('type') not in ['FeatureCollection', 'Feature']:
-            errors.append(f"Invalid GeoJSON type: {geojson_data.get('type')}")
-            return False, errors
+        Returns:
+            Dict: Yapılandırılmış rapor (bkz. geojson_validator.validate_file)
+        """
+        from geojson_validator import validate_file
         
-        # Features kontrolü
-        if geojson_data.get('type') == 'FeatureCollection':
-            if 'features' not in geojson_data:
-                errors.append("FeatureCollection must have 'features' property")
-                return False, errors
-            
-            for i, feature in enumerate(geojson_data['features']):
-                if feature.get('type') != 'Feature':
-                    errors.append(f"Feature {i}: Invalid feature type")
-                
-                geometry = feature.get('geometry')
-                if geometry:
-                    if geometry.get('type') not in ['Point', 'LineString', 'Polygon', 'MultiPoint']:
-                        errors.append(f"Feature {i}: Invalid geometry type {geometry.get('type')}")
-                    
-                    coords = geometry.get('coordinates')
-                    if geometry.get('type') == 'Point':
-                        if not isinstance(coords, list) or len(coords) != 2:
-                            errors.append(f"Feature {i}: Point coordinates must be [lon, lat]")
-                        else:
-                            try:
-                                lon, lat = float(coords[0]), float(coords[1])
-                                if not (-180 <= lon <= 180):
-                                    errors.append(f"Feature {i}: Longitude {lon} out of range")
-                                if not (-90 <= lat <= 90):
-                                    errors.append(f"Feature {i}: Latitude {lat} out of range")
-                            except (TypeError, ValueError):
-                                errors.append(f"Feature {i}: Coordinates must be numbers")
-        
-        if errors:
-            return False, errors
-        else:
-            return True, ["✅ GeoJSON is valid / GeoJSON geçerli"]
+        self.file_path = geojson_file
+        with span('validate_geojson', 'validate', file=geojson_file):
+            report = validate_file(geojson_file, max_errors, workers, chunk_size)
+            count('features', report['features'])
+        return report
     
-    def save_geojson(self, geojson: Dict, file_path: str) -> bool:
+    @staticmethod
+    def _format_issue(issue: Dict) -> str:
+        """Rapor kaydını tek satıra çevir / Format a report entry as one line"""
+        if issue["feature"] is None:
+            return issue["message"]
+        return f"Feature {issue['feature']}: {issue['message']}"
+    
+    def save_geojson(self, geojson: Dict, file_path: str, compact: bool = False) -> bool:
         """
         GeoJSON'u dosyaya kaydet
         Save GeoJSON to file
         
+        Yalnızca type ve features içeren FeatureCollection'lar feature feature
+        seçili arka uçla akışla yazılır; diğer nesneler tek seferde kodlanır.
+        FeatureCollections holding only type and features are streamed
+        feature by feature through the selected backend; other objects are
+        encoded in one go.
+        
         Args:
             geojson (Dict): GeoJSON verisi
             file_path (str): Çıkış dosyası yolu
+            compact (bool): Girintisiz çıktı / Write without indentation
         
         Returns:
             bool: Başarılı mı?
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(geojson, f, ensure_ascii=False, indent=2)
+            with span('save_geojson', file=file_path):
+                if (tuple(geojson) == ('type', 'features') and geojson['features']
+                        and geojson['type'] == 'FeatureCollection'):
+                    self.write_geojson_stream(geojson['features'], file_path, compact,
+                                              self.json_backend, self.precision)
+                else:
+                    dumps, binary = encoder(self.json_backend, compact, self.precision)
+                    with span('serialize', 'serialize'):
+                        data = dumps(geojson)
+                        if not binary:
+                            data = data.encode('utf-8')
+                    with span('write', 'io'), open(file_path, 'wb') as f:
+                        f.write(data)
+                    count('bytes_written', len(data))
             print(f"✅ GeoJSON dosyası kaydedildi / GeoJSON file saved: {file_path}")
             return True
         except Exception as e:
@@ -289,14 +1153,617 @@ class DataProcessor:
             bool: Başarılı mı?
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with span('save_csv', file=file_path), open(file_path, 'w', encoding='utf-8') as f:
                 f.write(csv_text)
+                count('bytes_written', f.tell())
             print(f"✅ CSV dosyası kaydedildi / CSV file saved: {file_path}")
             return True
         except Exception as e:
             print(f"❌ CSV kaydedilme hatası / Save error: {e}")
             return False
     
+    def build_spatial_index(self, index_file: Optional[str] = None,
+                            source_path: Optional[str] = None) -> 'SpatialIndex':
+        """
+        Yüklü FeatureCollection için mekansal indeks kur veya yükle
+        Build (or load) a spatial index for the loaded FeatureCollection
+        
+        Kayıtlı indeks yalnızca kaynak dosyayla eşleşiyorsa kullanılır; aksi
+        halde yeniden kurulup üzerine yazılır. GeoJSON henüz yüklenmemişse
+        yalnızca yeniden kurmak gerektiğinde okunur.
+        A saved index is used only if it matches the source file; otherwise
+        it is rebuilt and overwritten. If the GeoJSON is not loaded yet it is
+        read only when a rebuild is needed.
+        
+        Args:
+            index_file (str): İndeks dosyası; varsa yüklenir, yoksa kurulup kaydedilir
+                Index file; loaded if it exists, otherwise built and saved
+            source_path (str): Kaynak GeoJSON (varsayılan: yüklü dosya)
+                Source GeoJSON (default: the loaded file)
+        
+        Returns:
+            SpatialIndex: Sorgulanabilir indeks / Queryable index
+        """
+        from spatial_index import SpatialIndex
+        
+        source_path = source_path or self.file_path
+        if index_file and os.path.exists(index_file):
+            if source_path and SpatialIndex.matches_source(index_file, source_path):
+                return SpatialIndex.load(index_file)
+            print("♻️  İndeks dosyası girdiyle eşleşmiyor, yeniden kuruluyor / "
+                  "Index file does not match the input, rebuilding")
+        if not isinstance(self.data, dict) and source_path:
+            self.load_geojson(source_path)
+        if not isinstance(self.data, dict):
+            raise ValueError("A GeoJSON FeatureCollection must be loaded first")
+        with span('build_spatial_index', 'index'):
+            index = SpatialIndex.from_geojson(self.data)
+        if index_file:
+            index.save(index_file, source_path)
+        return index
+    
+    def build_tiles(self, geojson_file: str, output_dir: str, min_zoom: int = 4,
+                    max_zoom: int = 10, method: str = 'dp', tile_format: str = 'geojson',
+                    workers: Optional[int] = None) -> Dict:
+        """
+        Sınır GeoJSON'undan zoom başına sadeleştirilmiş karo piramidi yaz
+        Write a per-zoom simplified tile pyramid from a boundary GeoJSON
+        
+        Args:
+            geojson_file (str): Polygon/MultiPolygon feature'ları / Boundary features
+            output_dir (str): {z}/{x}/{y} karolarının kök dizini / Tile root directory
+            min_zoom, max_zoom (int): Zoom aralığı / Zoom range
+            method (str): "dp" (Douglas-Peucker) veya "vw" (Visvalingam-Whyatt)
+            tile_format (str): "geojson" veya "topojson"
+            workers (int): İşçi süreç sayısı / Worker process count
+        
+        Returns:
+            Dict: Özet (tiles, bytes, features, arcs, vertices, zooms, seconds)
+        """
+        from tiler import build_tile_pyramid
+        
+        with span('build_tiles', file=geojson_file):
+            summary = build_tile_pyramid(self.iter_geojson(geojson_file), output_dir, min_zoom,
+                                         max_zoom, method, tile_format, workers=workers)
+            count('bytes_written', summary['bytes'])
+        print(f"✅ Karo piramidi yazıldı / Tile pyramid written: {output_dir} "
+              f"({summary['tiles']} karo / tiles, {summary['bytes'] / 1e3:.1f} kB, "
+              f"{summary['seconds']:.2f}s)")
+        print(f"   {summary['vertices']} köşe / vertices, {summary['arcs']} ortak arc / shared arcs")
+        for zoom, counts in summary["zooms"].items():
+            average = counts["bytes"] / counts["tiles"] / 1e3 if counts["tiles"] else 0.0
+            print(f"   z{zoom}: {counts['tiles']} karo / tiles, ort. / avg {average:.1f} kB")
+        return summary
+    
+    def load_points(self, file_path: str) -> 'PointStore':
+        """
+        Sütunlu .pts nokta deposunu mmap ile aç
+        Open a columnar .pts point store through mmap
+        
+        Args:
+            file_path (str): .pts dosyasının yolu
+        
+        Returns:
+            PointStore: Sütunlu nokta deposu / Columnar point store
+        """
+        from point_store import PointStore
+        
+        with span('load_points', 'io', file=file_path):
+            store = PointStore.open(file_path)
+        self.data = store
+        self.file_path = file_path
+        return store
+    
+    def to_point_store(self, input_file: str, output_file: str) -> 'PointStore':
+        """
+        CSV veya GeoJSON noktalarını akış halinde .pts deposuna dönüştür
+        Stream CSV or GeoJSON points into a .pts store
+        
+        Args:
+            input_file (str): Giriş CSV/GeoJSON dosyası
+            output_file (str): Çıkış .pts dosyası
+        
+        Returns:
+            PointStore: Oluşturulan depo / The built store
+        """
+        from point_store import PointStore
+        
+        with span('to_point_store', file=input_file):
+            if os.path.splitext(input_file)[1].lower() == '.csv':
+                store = PointStore.from_rows(self.iter_csv(input_file))
+            else:
+                store = PointStore.from_features(self.iter_geojson(input_file))
+            with span('write', 'io'):
+                store.save(output_file)
+            count('rows', len(store))
+        print(f"✅ Nokta deposu kaydedildi / Point store saved: {output_file} ({len(store)} nokta / points)")
+        return store
+    
+    def points_to_geojson(self, store: 'PointStore', output_file: str,
+                          compact: bool = False) -> int:
+        """
+        Nokta deposunu GeoJSON'a yaz
+        Write a point store out as GeoJSON
+        
+        Returns:
+            int: Yazılan feature sayısı / Number of features written
+        """
+        written = self.write_geojson_stream(store.iter_features(), output_file, compact,
+                                            self.json_backend, self.precision)
+        print(f"✅ GeoJSON dosyası kaydedildi / GeoJSON file saved: {output_file}")
+        return written
+    
+    def points_to_csv(self, store: 'PointStore', output_file: str) -> int:
+        """
+        Nokta deposunu CSV'ye yaz
+        Write a point store out as CSV
+        
+        Returns:
+            int: Yazılan satır sayısı / Number of rows written
+        """
+        columns = list(store.columns) + ['latitude', 'longitude']
+        written = 0
+        with span('points_to_csv', file=output_file), \
+                open(output_file, 'w', encoding='utf-8', newline='') as out:
+            writer = csv.DictWriter(out, fieldnames=columns)
+            writer.writeheader()
+            for row in store.iter_rows():
+                writer.writerow(row)
+                written += 1
+            count('rows', written)
+        print(f"✅ CSV dosyası kaydedildi / CSV file saved: {output_file}")
+        return written
+    
+    def load_geopackage(self, file_path: str, table: Optional[str] = None) -> 'GeoPackage':
+        """
+        GeoPackage/SQLite nokta tablosunu aç (R-ağacı sorguları için)
+        Open a GeoPackage/SQLite point table (for R-tree queries)
+        
+        Args:
+            file_path (str): .gpkg/.sqlite dosyası
+            table (str): Tablo adı; yoksa ilk feature tablosu / Table, default the first one
+        
+        Returns:
+            GeoPackage: Açık nokta tablosu / Open point table
+        """
+        from geopackage import GeoPackage
+        
+        with span('load_geopackage', 'io', file=file_path):
+            package = GeoPackage(file_path, table)
+        self.data = package
+        self.file_path = file_path
+        return package
+    
+    def to_geopackage(self, input_file: str, output_file: str,
+                      table: Optional[str] = None) -> 'GeoPackage':
+        """
+        CSV veya GeoJSON noktalarını akış halinde GeoPackage'a toplu yükle
+        Stream CSV or GeoJSON points into a GeoPackage in one bulk load
+        
+        Args:
+            input_file (str): Giriş CSV/GeoJSON dosyası
+            output_file (str): Çıkış .gpkg/.sqlite dosyası
+            table (str): Tablo adı; yoksa giriş dosyasının adı / Table, default the input name
+        
+        Returns:
+            GeoPackage: Oluşturulan paket / The built package
+        """
+        from geopackage import GeoPackage, table_name_for
+        
+        table = table or table_name_for(input_file)
+        with span('to_geopackage', file=input_file):
+            if os.path.splitext(input_file)[1].lower() == '.csv':
+                package = GeoPackage.from_rows(output_file, self.iter_csv(input_file), table)
+            else:
+                package = GeoPackage.from_features(output_file, self.iter_geojson(input_file), table)
+            count('rows', len(package))
+        print(f"✅ GeoPackage kaydedildi / GeoPackage saved: {output_file} "
+              f"({table}: {len(package)} nokta / points)")
+        return package
+    
+    def reproject(self, input_file: str, output_file: str, target: str,
+                  source: str = 'wgs84', compact: bool = False,
+                  chunk_size: int = 1 << 16) -> Dict[str, float]:
+        """
+        CSV/GeoJSON dosyasını akış halinde başka koordinat sistemine dönüştür
+        Stream a CSV/GeoJSON file into another coordinate system
+        
+        Girdi chunk_size'lık gruplar halinde okunur ve her grubun koordinatları
+        tek toplu dönüşümle çevrilir. CSV'de coğrafi sistemler longitude/latitude,
+        projeksiyonlu sistemler x/y sütunlarını kullanır; eksik hedef sütunlar
+        eklenir. GeoJSON'da tüm geometri türleri dönüştürülür ve hedef WGS84
+        değilse "crs" üyesi yazılır.
+        Input is read in groups of chunk_size and each group's coordinates go
+        through one bulk transform. CSV files use longitude/latitude for
+        geographic systems and x/y for projected ones; missing target columns
+        are appended. GeoJSON geometries of every type are transformed and a
+        "crs" member is written when the target is not WGS84.
+        
+        Args:
+            input_file (str): Giriş CSV/GeoJSON dosyası
+            output_file (str): Çıkış dosyası (girişle aynı biçim) / Output file (same format)
+            target (str): Hedef sistem (projections.PROJECTIONS, ör. utm36, EPSG:3857)
+                Target system
+            source (str): Kaynak sistem / Source system (default: wgs84)
+            compact (bool): Girintisiz GeoJSON / Compact GeoJSON
+            chunk_size (int): Toplu dönüşüm grubu / Rows per bulk transform
+        
+        Returns:
+            Dict: İstatistikler (rows, points, skipped, seconds, points_per_sec)
+        
+        Raises:
+            ValueError: Bilinmeyen sistem, aynı kaynak/hedef ya da eksik sütun
+                Unknown system, identical source/target or missing columns
+        """
+        from projections import get_projection, reproject_geometries, transform
+        
+        src, dst = get_projection(source), get_projection(target)
+        if src is dst:
+            raise ValueError(f"Kaynak ve hedef aynı / Source and target are the same: {src.name}")
+        started = time.perf_counter()
+        rows = points = 0
+        
+        with span('reproject', file=input_file, source=src.name, target=dst.name):
+            if os.path.splitext(input_file)[1].lower() == '.csv':
+                in_cols = ('longitude', 'latitude') if src.geographic else ('x', 'y')
+                out_cols = ('longitude', 'latitude') if dst.geographic else ('x', 'y')
+                project = timed_call('transform', transform)
+                precision = self.precision
+                with open(input_file, 'r', encoding='utf-8', newline='') as f_in, \
+                        open(output_file, 'w', encoding='utf-8', newline='') as f_out:
+                    reader = csv.reader(f_in)
+                    writer = csv.writer(f_out)
+                    header = next(reader, [])
+                    missing = [col for col in in_cols if col not in header]
+                    if missing:
+                        raise ValueError(f"CSV sütunları yok / Missing CSV columns: {missing}")
+                    ix, iy = header.index(in_cols[0]), header.index(in_cols[1])
+                    out_header = header + [col for col in out_cols if col not in header]
+                    ox, oy = out_header.index(out_cols[0]), out_header.index(out_cols[1])
+                    width = len(out_header)
+                    writer.writerow(out_header)
+                    while True:
+                        chunk = list(islice(reader, chunk_size))
+                        if not chunk:
+                            break
+                        xs, ys, valid = [], [], []
+                        for row in chunk:
+                            if len(row) < width:
+                                row.extend([''] * (width - len(row)))
+                            try:
+                                x, y = float(row[ix]), float(row[iy])
+                            except ValueError:
+                                row[ox] = row[oy] = ''
+                                continue
+                            xs.append(x)
+                            ys.append(y)
+                            valid.append(row)
+                        tx, ty = project(xs, ys, src.name, dst.name)
+                        if precision is not None:
+                            tx = [round(v, precision) for v in tx]
+                            ty = [round(v, precision) for v in ty]
+                        for row, x, y in zip(valid, tx, ty):
+                            row[ox] = x
+                            row[oy] = y
+                        writer.writerows(chunk)
+                        rows += len(chunk)
+                        points += len(valid)
+                skipped = rows - points
+            else:
+                def iter_reprojected() -> Iterator[Dict]:
+                    nonlocal rows, points
+                    features = self.iter_geojson(input_file)
+                    while True:
+                        chunk = list(islice(features, chunk_size))
+                        if not chunk:
+                            break
+                        points += reproject_geometries([f.get('geometry') for f in chunk],
+                                                       src.name, dst.name)
+                        rows += len(chunk)
+                        yield from chunk
+                
+                self.write_geojson_stream(iter_reprojected(), output_file, compact,
+                                          self.json_backend, self.precision,
+                                          None if dst.geographic else dst.crs_name)
+                skipped = 0
+            count('rows', rows)
+            count('points', points)
+        
+        elapsed = time.perf_counter() - started
+        stats = {
+            "rows": rows,
+            "points": points,
+            "skipped": skipped,
+            "seconds": round(elapsed, 3),
+            "points_per_sec": round(points / elapsed, 1) if elapsed > 0 else 0.0
+        }
+        print(f"✅ Dönüştürüldü / Reprojected {src.name} -> {dst.name}: {output_file}")
+        print(f"   {points} nokta / points, {stats['points_per_sec']} nokta/sn / points/sec"
+              + (f", {skipped} satır atlandı / rows skipped" if skipped else ""))
+        return stats
+    
+    def annotate_distances(self, input_file: str, output_file: str,
+                           references: Optional[str] = None, reference_name: str = 'name',
+                           band_km: float = 50.0, compact: bool = False,
+                           summary_file: Optional[str] = None,
+                           chunk_size: int = 10000) -> Dict:
+        """
+        Her feature'a merkeze/uç noktalara/referanslara mesafe ekle (tek geçiş)
+        Annotate every feature with distances to the center, extremes and references (one pass)
+        
+        Merkeze mesafe ve kerteriz, en yakın uç nokta ve isteğe bağlı en yakın
+        referans (ör. il merkezleri) eklenir; mesafe bandı histogramları ve
+        referans etki alanları aynı geçişte toplanır. Girdi chunk_size'lık
+        parçalar halinde işlenir; çıktı girişle aynı biçimdedir. Poligonlar
+        centroidleriyle temsil edilir.
+        Adds the distance and bearing to the center, the nearest extreme point
+        and optionally the nearest reference (e.g. province capitals) while
+        collecting distance-band histograms and reference catchments in the
+        same pass. Input is processed in chunks of chunk_size and the output
+        keeps the input format. Polygons are represented by their centroid.
+        
+        Args:
+            input_file (str): Giriş CSV/GeoJSON dosyası
+            output_file (str): Çıkış dosyası (girişle aynı biçim) / Output file (same format)
+            references (str): Referans noktaları CSV/GeoJSON dosyası / Reference points file
+            reference_name (str): Referans adı sütunu/özelliği / Reference name column or property
+            band_km (float): Histogram bant genişliği / Histogram band width (km)
+            compact (bool): Girintisiz GeoJSON / Compact GeoJSON
+            summary_file (str): Özet JSON dosyası / Summary JSON file
+            chunk_size (int): Parça başına feature / Features per chunk
+        
+        Returns:
+            Dict: Özet (histogramlar, etki alanları) ve istatistikler (rows, points,
+                skipped, seconds, points_per_sec) / Summary plus statistics
+        
+        Raises:
+            ValueError: Eksik CSV sütunu veya boş referans dosyası
+                Missing CSV columns or an empty reference file
+        """
+        from distance_table import (DistanceAnnotator, ReferencePoints, in_range,
+                                    representative_point)
+        
+        refs = ReferencePoints.from_file(references, reference_name) if references else None
+        annotator = DistanceAnnotator(references=refs, band_km=band_km)
+        annotate = timed_call('distances', annotator.annotate)
+        names = annotator.property_names()
+        started = time.perf_counter()
+        rows = 0
+        
+        with span('annotate_distances', file=input_file):
+            if os.path.splitext(input_file)[1].lower() == '.csv':
+                with open(input_file, 'r', encoding='utf-8', newline='') as f_in, \
+                        open(output_file, 'w', encoding='utf-8', newline='') as f_out:
+                    reader = csv.reader(f_in)
+                    writer = csv.writer(f_out)
+                    header = next(reader, [])
+                    missing = [col for col in ('latitude', 'longitude') if col not in header]
+                    if missing:
+                        raise ValueError(f"CSV sütunları yok / Missing CSV columns: {missing}")
+                    ilat, ilon = header.index('latitude'), header.index('longitude')
+                    out_header = header + [name for name in names if name not in header]
+                    slots = [out_header.index(name) for name in names]
+                    width = len(out_header)
+                    writer.writerow(out_header)
+                    while True:
+                        chunk = list(islice(reader, chunk_size))
+                        if not chunk:
+                            break
+                        lats, lons, valid = [], [], []
+                        for row in chunk:
+                            if len(row) < width:
+                                row.extend([''] * (width - len(row)))
+                            try:
+                                lat, lon = float(row[ilat]), float(row[ilon])
+                            except ValueError:
+                                lat = lon = float('nan')
+                            if not in_range(lat, lon):
+                                # Boş, NaN/inf veya aralık dışı: sütunlar boş kalır, satır atlanmış sayılır
+                                # Blank, NaN/inf or out of range: columns stay blank, row counts as skipped
+                                for slot in slots:
+                                    row[slot] = ''
+                                continue
+                            lats.append(lat)
+                            lons.append(lon)
+                            valid.append(row)
+                        for row, values in zip(valid, annotate(lats, lons)):
+                            for slot, value in zip(slots, values):
+                                row[slot] = value
+                        writer.writerows(chunk)
+                        rows += len(chunk)
+            else:
+                def iter_annotated() -> Iterator[Dict]:
+                    nonlocal rows
+                    features = self.iter_geojson(input_file)
+                    while True:
+                        chunk = list(islice(features, chunk_size))
+                        if not chunk:
+                            break
+                        lats, lons, valid = [], [], []
+                        for feature in chunk:
+                            point = representative_point(feature.get('geometry'))
+                            if point is not None and in_range(*point):
+                                lats.append(point[0])
+                                lons.append(point[1])
+                                valid.append(feature)
+                        for feature, values in zip(valid, annotate(lats, lons)):
+                            properties = feature.get('properties')
+                            if properties is None:
+                                properties = feature['properties'] = {}
+                            properties.update(zip(names, values))
+                        rows += len(chunk)
+                        yield from chunk
+                
+                self.write_geojson_stream(iter_annotated(), output_file, compact,
+                                          self.json_backend, self.precision)
+            count('rows', rows)
+            count('points', annotator.points)
+        
+        elapsed = time.perf_counter() - started
+        summary = annotator.summary()
+        summary.update({
+            "rows": rows,
+            "skipped": rows - annotator.points,
+            "seconds": round(elapsed, 3),
+            "points_per_sec": round(annotator.points / elapsed, 1) if elapsed > 0 else 0.0
+        })
+        if summary_file:
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"✅ Mesafeler eklendi / Distances annotated: {output_file}")
+        print(f"   {annotator.points} nokta / points, {summary['points_per_sec']} nokta/sn / points/sec"
+              + (f", {summary['skipped']} satır atlandı / rows skipped" if summary['skipped'] else ""))
+        return summary
+    
+    def aggregate_grid(self, input_file: str, output_dir: str, grid: str = 'geohash',
+                       resolutions: Optional[Sequence[int]] = None,
+                       chunk_size: int = 1 << 16) -> Dict:
+        """
+        Noktaları tek akış geçişinde çok çözünürlüklü ızgara hücrelerine say
+        Count points into multi-resolution grid cells in one streaming pass
+        
+        Çözünürlük başına output_dir/<grid>_<res>.geojson (kompakt, hücre
+        poligonları; cell, count, density_km2) ve paralel parçalarla
+        birleştirilebilen output_dir/aggregate.json yazılır. CSV, GeoJSON
+        (Point feature'lar) ve .pts girdileri desteklenir.
+        Writes output_dir/<grid>_<res>.geojson per resolution (compact cell
+        polygons with cell, count, density_km2) plus output_dir/aggregate.json,
+        which merges with the aggregates of parallel shards. Accepts CSV,
+        GeoJSON (Point features) and .pts input.
+        
+        Args:
+            input_file (str): Giriş CSV/GeoJSON/.pts dosyası
+            output_dir (str): Çıkış dizini / Output directory
+            grid (str): 'geohash' veya 'hex' (eş-alan LAEA altıgenleri / equal-area LAEA hexagons)
+            resolutions (Sequence[int]): Çözünürlükler / Resolutions (default: grid-specific)
+            chunk_size (int): Parça başına nokta / Points per chunk
+        
+        Returns:
+            Dict: İstatistikler (points, skipped, cells, files, seconds, points_per_sec)
+        
+        Raises:
+            ValueError: Bilinmeyen ızgara/çözünürlük veya eksik CSV sütunu
+                Unknown grid/resolution or missing CSV columns
+        """
+        from grid_aggregate import GridAggregator
+        
+        aggregator = GridAggregator(grid, resolutions)
+        add = timed_call('aggregate', aggregator.add)
+        started = time.perf_counter()
+        
+        with span('aggregate_grid', file=input_file, grid=grid):
+            file_ext = os.path.splitext(input_file)[1].lower()
+            if file_ext == '.pts':
+                store = self.load_points(input_file)
+                for start in range(0, len(store), chunk_size):
+                    add(store.lats[start:start + chunk_size], store.lons[start:start + chunk_size])
+            elif file_ext == '.csv':
+                with open(input_file, 'r', encoding='utf-8', newline='') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    missing = [col for col in ('latitude', 'longitude') if col not in header]
+                    if missing:
+                        raise ValueError(f"CSV sütunları yok / Missing CSV columns: {missing}")
+                    ilat, ilon = header.index('latitude'), header.index('longitude')
+                    while True:
+                        chunk = list(islice(reader, chunk_size))
+                        if not chunk:
+                            break
+                        lats, lons = [], []
+                        for row in chunk:
+                            try:
+                                lat, lon = float(row[ilat]), float(row[ilon])
+                            except (IndexError, ValueError):
+                                aggregator.skipped += 1
+                                continue
+                            lats.append(lat)
+                            lons.append(lon)
+                        add(lats, lons)
+            else:
+                features = self.iter_geojson(input_file)
+                while True:
+                    chunk = list(islice(features, chunk_size))
+                    if not chunk:
+                        break
+                    lats, lons = [], []
+                    for feature in chunk:
+                        geometry = feature.get('geometry') or {}
+                        coords = geometry.get('coordinates')
+                        if geometry.get('type') != 'Point' or not coords or len(coords) < 2:
+                            aggregator.skipped += 1
+                            continue
+                        lats.append(coords[1])
+                        lons.append(coords[0])
+                    add(lats, lons)
+            count('points', aggregator.points)
+            
+            os.makedirs(output_dir, exist_ok=True)
+            files = []
+            with span('write_cells', 'write'):
+                # Hücre köşeleri üretilirken yuvarlanır / Cell corners are rounded as they are built
+                precision = self.precision if self.precision is not None else 6
+                for res in aggregator.resolutions:
+                    path = os.path.join(output_dir, f"{grid}_{res}.geojson")
+                    self.write_geojson_stream(aggregator.iter_features(res, precision), path, True,
+                                              self.json_backend)
+                    files.append(path)
+                aggregate_file = os.path.join(output_dir, 'aggregate.json')
+                aggregator.save(aggregate_file)
+                files.append(aggregate_file)
+        
+        elapsed = time.perf_counter() - started
+        stats = {
+            "points": aggregator.points,
+            "skipped": aggregator.skipped,
+            "cells": {res: len(aggregator.counters[res]) for res in aggregator.resolutions},
+            "files": files,
+            "seconds": round(elapsed, 3),
+            "points_per_sec": round(aggregator.points / elapsed, 1) if elapsed > 0 else 0.0
+        }
+        print(f"✅ Izgara toplamı kaydedildi / Grid aggregate saved: {output_dir} ({grid})")
+        print(f"   {aggregator.points} nokta / points, {stats['points_per_sec']} nokta/sn / points/sec"
+              + (f", {aggregator.skipped} atlandı / skipped" if aggregator.skipped else ""))
+        for res, cells in stats["cells"].items():
+            print(f"   {grid}_{res}: {cells} hücre / cells")
+        return stats
+    
+    def merge_grid_aggregates(self, aggregate_files: Sequence[str], output_dir: str) -> Dict:
+        """
+        Paralel parçaların aggregate.json dosyalarını birleştir ve GeoJSON yaz
+        Merge the aggregate.json files of parallel shards and write GeoJSON
+        
+        Args:
+            aggregate_files (Sequence[str]): Parça toplam dosyaları / Shard aggregate files
+            output_dir (str): Çıkış dizini / Output directory
+        
+        Returns:
+            Dict: İstatistikler (points, cells, files) / Statistics
+        
+        Raises:
+            ValueError: Uyumsuz ızgara veya çözünürlükler / Incompatible grid or resolutions
+        """
+        from grid_aggregate import merge_aggregates
+        
+        with span('merge_grid_aggregates', shards=len(aggregate_files)):
+            merged = merge_aggregates(aggregate_files)
+            os.makedirs(output_dir, exist_ok=True)
+            precision = self.precision if self.precision is not None else 6
+            files = []
+            for res in merged.resolutions:
+                path = os.path.join(output_dir, f"{merged.grid}_{res}.geojson")
+                self.write_geojson_stream(merged.iter_features(res, precision), path, True,
+                                          self.json_backend)
+                files.append(path)
+            aggregate_file = os.path.join(output_dir, 'aggregate.json')
+            merged.save(aggregate_file)
+            files.append(aggregate_file)
+        stats = {"points": merged.points,
+                 "cells": {res: len(merged.counters[res]) for res in merged.resolutions},
+                 "files": files}
+        print(f"✅ {len(aggregate_files)} parça birleştirildi / shards merged: {output_dir} "
+              f"({merged.points} nokta / points)")
+        return stats
+    
     def print_statistics(self) -> None:
         """
         Veri istatistiklerini yazdır
@@ -319,6 +1786,17 @@ class DataProcessor:
                 print(f"Toplam Features / Total Features: {len(features)}")
                 if features:
                     print(f"İlk Feature Türü / First Feature Type: {features[0].get('geometry', {}).get('type')}")
+        elif hasattr(self.data, 'geometry_column'):
+            print(f"Tablo / Table: {self.data.table} ({'R*Tree' if self.data.has_rtree else 'indekssiz / no index'})")
+            print(f"Toplam Nokta / Total Points: {len(self.data)}")
+            print(f"Sütunlar / Columns: {self.data.columns}")
+            print(f"Sınır Kutusu / Bounding Box: {self.data.bbox()}")
+            print(f"Dosya Boyutu / File Size: {os.path.getsize(self.data.path) / 1e6:.1f} MB")
+        elif hasattr(self.data, 'columns'):
+            print(f"Toplam Nokta / Total Points: {len(self.data)}")
+            print(f"Sütunlar / Columns: {list(self.data.columns)}")
+            print(f"Sınır Kutusu / Bounding Box: {self.data.bbox()}")
+            print(f"Dizi Boyutu / Array Size: {self.data.nbytes() / 1e6:.1f} MB")
 
 
 def main():
@@ -334,12 +1812,61 @@ def main():
   # CSV'den GeoJSON'a dönüştürme
   python data_processor.py --input data.csv --output data.geojson
 
+  # Büyük CSV'yi sabit bellekle akış halinde dönüştürme
+  python data_processor.py --input big.csv --output big.geojson --convert geojson --stream --compact
+
   # GeoJSON'dan CSV'ye dönüştürme
   python data_processor.py --input data.geojson --output data.csv --convert csv
 
+  # Dizin/glob içindeki tüm CSV'leri 8 işçiyle toplu dönüştürme
+  python data_processor.py --batch "districts/*.csv" --convert geojson --output-dir out/ --workers 8
+
+  # Artımlı gece derlemesi: değişmeyenler atlanır, büyüyen CSV'lere yalnızca yeni satırlar eklenir
+  python data_processor.py --batch "districts/*.csv" --convert geojson --output-dir out/ --manifest out/manifest.json
+
+  # Hızlı Point serileştirici ve 6 ondalık koordinat (dosya ~%40 küçülür)
+  python data_processor.py --input big.csv --output big.geojson --convert geojson --json-backend point --precision 6
+
+  # Sütunlu, mmap ile açılan nokta deposuna dönüştürme
+  python data_processor.py --input data.csv --output data.pts --convert points --stream
+  python data_processor.py --input data.pts --stats
+
+  # R*Tree indeksli GeoPackage'a toplu yükleme ve sınır kutusu sorgusu
+  python data_processor.py --input pings.csv --output pings.gpkg --convert gpkg
+  python data_processor.py --input pings.gpkg --bbox 32.5,39.7,33.0,40.1
+
+  # Her noktaya düştüğü ili ekleyerek dönüştürme
+  python data_processor.py --input pings.csv --output pings.geojson --convert geojson --stream --classify iller.geojson
+
+  # Yalnızca adres içeren CSV'yi geocoding servisiyle zenginleştirip dönüştürme
+  python data_processor.py --input adresler.csv --output adresler.geojson --convert geojson --stream \
+      --geocode "https://nominatim.example/search?format=json" --address-columns address,ilce,il
+
+  # İl/ilçe sınırlarından z4-z10 sadeleştirilmiş TopoJSON karoları
+  python data_processor.py --input ilceler.geojson --stream --tiles tiles/ --tile-format topojson
+
+  # WGS84 -> UTM 36K (EPSG:32636) akış dönüşümü; CSV'ye x/y sütunları eklenir
+  python data_processor.py --input pings.csv --output pings_utm.csv --reproject utm36
+  python data_processor.py --input parcels.geojson --output parcels_laea.geojson --reproject laea --precision 2
+
+  # Her noktaya merkeze mesafe/kerteriz, en yakın uç nokta ve il merkezi; 50 km bant histogramı
+  python data_processor.py --input pings.csv --output pings_dist.csv --distances --references il_merkezleri.csv \
+      --distance-summary dist.json
+
+  # Ziyaretleri eş-alan altıgenlere (2, 4, 6) sayıp ısı haritası GeoJSON'u yazma; parçaları birleştirme
+  python data_processor.py --input visits.pts --grid hex --resolutions 2,4,6 --output-dir heat/
+  python data_processor.py --merge-aggregates heat_a/aggregate.json heat_b/aggregate.json --output-dir heat/
+
+  # Zamanlama profili: Chrome trace (chrome://tracing) veya cProfile/tracemalloc özetli JSON
+  python data_processor.py --input data.csv --output data.geojson --profile trace.json --profile-format chrome
+  python data_processor.py --input data.csv --output data.geojson --profile prof.json --profile-mode cprofile
+
   # GeoJSON doğrulama
   python data_processor.py --input data.geojson --validate
 
+  # Merkeze en yakın 3 feature (indeks dosyası tekrar kullanılır)
+  python data_processor.py --input data.geojson --nearest 39.2455,35.4874 --k 3 --index-file data.idx
+
   # İstatistikler gösterme
   python data_processor.py --input data.csv --stats
         '''
@@ -347,33 +1874,200 @@ def main():
     
     parser.add_argument('--input', '-i', help='Giriş dosyası / Input file')
     parser.add_argument('--output', '-o', help='Çıkış dosyası / Output file')
-    parser.add_argument('--convert', '-c', choices=['csv', 'geojson', 'json'], 
+    parser.add_argument('--convert', '-c', choices=['csv', 'geojson', 'json', 'points', 'gpkg'], 
                        help='Dönüştürülecek format / Convert to format')
     parser.add_argument('--validate', '-v', action='store_true', 
                        help='GeoJSON doğrula / Validate GeoJSON')
     parser.add_argument('--stats', '-s', action='store_true', 
                        help='İstatistikleri göster / Show statistics')
+    parser.add_argument('--stream', action='store_true',
+                       help='Sabit bellekle akış dönüştürme / Constant-memory streaming conversion')
+    parser.add_argument('--compact', action='store_true',
+                       help='Girintisiz GeoJSON çıktısı / Compact (no-indent) GeoJSON output')
+    parser.add_argument('--json-backend', choices=list(JSON_BACKENDS), default='stdlib',
+                       help='GeoJSON serileştirici: stdlib, point (hızlı Point yazıcı), orjson, msgspec, auto '
+                            '/ GeoJSON serializer (default: stdlib)')
+    parser.add_argument('--precision', type=int, metavar='N',
+                       help='Koordinatları N ondalığa yuvarla (6 ≈ 11 cm) / Round coordinates to N decimals')
+    parser.add_argument('--columns',
+                       help='CSV sütun şeması (virgülle ayrılmış) / CSV column schema (comma-separated)')
+    parser.add_argument('--batch', nargs='+', metavar='PATH',
+                       help='Toplu mod: dizinler veya glob desenleri / Batch mode: directories or glob patterns')
+    parser.add_argument('--output-dir',
+                       help='Toplu mod çıkış dizini / Batch-mode output directory')
+    parser.add_argument('--manifest', metavar='JSON',
+                       help='Artımlı dönüştürme manifestosu / Incremental conversion manifest')
+    parser.add_argument('--workers', '-w', type=int,
+                       help='Toplu mod, doğrulama, karo ve sınıflandırma işçi sayısı / '
+                            'Worker count for batch mode, validation, tiles and classification '
+                            '(default: CPU count in batch mode and tiles, 1 otherwise)')
+    parser.add_argument('--layer',
+                       help='GeoPackage tablo adı / GeoPackage table name (default: input file name)')
+    parser.add_argument('--nearest', metavar='LAT,LON',
+                       help='Noktaya en yakın feature\'lar / Features nearest to a point')
+    parser.add_argument('--k', type=int, default=5,
+                       help='En yakın komşu sayısı / Number of nearest neighbours (default: 5)')
+    parser.add_argument('--radius', type=float, metavar='KM',
+                       help='--nearest noktası etrafında yarıçap sorgusu / Radius query around --nearest')
+    parser.add_argument('--bbox', metavar='MINLON,MINLAT,MAXLON,MAXLAT',
+                       help='Sınır kutusu sorgusu / Bounding-box query')
+    parser.add_argument('--index-file',
+                       help='Mekansal indeks dosyası (yeniden kullanım) / Spatial index file for reuse')
+    parser.add_argument('--max-errors', type=int, default=100,
+                       help='Raporlanacak en fazla doğrulama hatası / Max validation errors reported (default: 100)')
+    parser.add_argument('--classify', metavar='BOUNDARY',
+                       help='Noktaları il/ilçe sınırlarına göre sınıflandır / Classify points by boundary GeoJSON')
+    parser.add_argument('--classify-by', default='name',
+                       help='Sınır birim adı özelliği / Boundary property holding the unit name (default: name)')
+    parser.add_argument('--region-property', default='region',
+                       help='Eklenecek birim özelliği / Property added to each feature (default: region)')
+    parser.add_argument('--geocode', metavar='URL',
+                       help='Koordinatı eksik satırları adresinden kodla (GET URL?q=adres) '
+                            '/ Geocode rows missing coordinates through this endpoint')
+    parser.add_argument('--address-columns', default='address',
+                       help='Adres sütunları (virgülle) / Address columns, comma-separated (default: address)')
+    parser.add_argument('--geocode-cache', default='',
+                       help='Kodlama önbelleği (JSON Lines) / Geocoding cache file '
+                            '(default: per-endpoint file under $TR_MERKEZ_CACHE)')
+    parser.add_argument('--geocode-concurrency', type=int, default=8,
+                       help='Eşzamanlı kodlama isteği / Concurrent geocoding requests (default: 8)')
+    parser.add_argument('--geocode-retries', type=int, default=4,
+                       help='İstek başına yeniden deneme / Retries per geocoding request (default: 4)')
+    parser.add_argument('--distances', action='store_true',
+                       help='Merkez/uç nokta/referans mesafeleri ve bant histogramları ekle '
+                            '/ Annotate distances to center, extremes and references with band histograms')
+    parser.add_argument('--references', metavar='FILE',
+                       help='Referans noktaları (ör. il merkezleri) CSV/GeoJSON / Reference points file')
+    parser.add_argument('--reference-name', default='name',
+                       help='Referans adı sütunu/özelliği / Reference name column or property (default: name)')
+    parser.add_argument('--band-km', type=float, default=50.0,
+                       help='Mesafe bandı genişliği / Distance band width in km (default: 50)')
+    parser.add_argument('--distance-summary', metavar='JSON',
+                       help='Histogram ve etki alanı özetini yaz / Write the histogram and catchment summary')
+    parser.add_argument('--grid', choices=['geohash', 'hex'],
+                       help='Isı haritası için ızgara toplama / Grid aggregation for heatmaps')
+    parser.add_argument('--resolutions',
+                       help='Izgara çözünürlükleri (virgülle; geohash 1-9, hex 0-12) '
+                            '/ Grid resolutions, comma-separated (default: geohash 4,5,6, hex 2,4,6)')
+    parser.add_argument('--merge-aggregates', nargs='+', metavar='AGG',
+                       help='Parça aggregate.json dosyalarını birleştir (--output-dir) '
+                            '/ Merge shard aggregate.json files into --output-dir')
+    parser.add_argument('--reproject', metavar='CRS',
+                       help='Koordinatları dönüştür: laea, laea-europe, utm35-utm38, webmercator, wgs84 '
+                            'veya EPSG kodu / Reproject coordinates to this system')
+    parser.add_argument('--source-crs', default='wgs84',
+                       help='Girdinin koordinat sistemi / Input coordinate system (default: wgs84)')
+    parser.add_argument('--tiles', metavar='DIR',
+                       help='Sadeleştirilmiş {z}/{x}/{y} karo piramidi yaz / Write a simplified {z}/{x}/{y} tile pyramid')
+    parser.add_argument('--min-zoom', type=int, default=4,
+                       help='Karo piramidi en küçük zoom / Tile pyramid minimum zoom (default: 4)')
+    parser.add_argument('--max-zoom', type=int, default=10,
+                       help='Karo piramidi en büyük zoom / Tile pyramid maximum zoom (default: 10)')
+    parser.add_argument('--simplify', choices=['dp', 'vw'], default='dp',
+                       help='Sadeleştirme: Douglas-Peucker veya Visvalingam / Simplification method (default: dp)')
+    parser.add_argument('--tile-format', choices=['geojson', 'topojson'], default='geojson',
+                       help='Karo biçimi / Tile format (default: geojson)')
+    parser.add_argument('--profile', metavar='FILE',
+                       help='Zamanlama/bellek profilini dosyaya yaz / Write a timing/memory profile')
+    parser.add_argument('--profile-format', choices=['json', 'chrome'], default='json',
+                       help='Profil biçimi: özet JSON veya Chrome trace / Summary JSON or Chrome trace (default: json)')
+    parser.add_argument('--profile-mode', choices=['spans', 'cprofile', 'tracemalloc'], default='spans',
+                       help='Ek profil: cProfile veya tracemalloc / Extra profiling (default: spans only)')
+    parser.add_argument('--scan-limit', type=int, default=1000,
+                       help='Sütun ön tarama feature sayısı / Features pre-scanned for columns (default: 1000)')
     
     args = parser.parse_args()
     
+    if args.profile:
+        PROFILER.start(args.profile_mode)
+        
+        def write_profile() -> None:
+            PROFILER.stop()
+            PROFILER.write(args.profile, args.profile_format)
+            PROFILER.print_report()
+            print(f"⏱️  Profil kaydedildi / Profile saved: {args.profile}")
+        
+        atexit.register(write_profile)
+    
+    try:
+        resolve_backend(args.json_backend)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    
+    if args.batch:
+        if args.convert not in SOURCE_EXTENSIONS:
+            print("❌ Toplu mod --convert csv|geojson gerektirir / Batch mode requires --convert csv|geojson")
+            return
+        processor = DataProcessor(args.json_backend, args.precision)
+        summary = processor.batch_convert(args.batch, args.convert, args.output_dir,
+                                          args.workers, args.compact, args.manifest)
+        sys.exit(1 if summary["failed"] else 0)
+    
+    if args.merge_aggregates:
+        if not args.output_dir:
+            print("❌ Birleştirme --output-dir gerektirir / Merging requires --output-dir")
+            sys.exit(2)
+        try:
+            DataProcessor(args.json_backend, args.precision).merge_grid_aggregates(
+                args.merge_aggregates, args.output_dir)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        return
+    
     if not args.input:
         parser.print_help()
         return
     
-    processor = DataProcessor()
+    if args.distances and args.convert:
+        # İkisi de --output'a yazar; mesafe tablosu dönüşümün üzerine yazardı
+        # Both write --output; the distance table would overwrite the conversion
+        print("❌ --distances ve --convert birlikte kullanılamaz; mesafe tablosu girişle aynı "
+              "biçimde yazılır / --distances cannot be combined with --convert; the distance "
+              "table keeps the input format")
+        sys.exit(2)
+    
+    processor = DataProcessor(args.json_backend, args.precision)
     
     # Dosya türünü belirle
-    input_file = Path(args.input)
-    file_ext = input_file.suffix.lower()
+    input_stem, file_ext = os.path.splitext(args.input)
+    file_ext = file_ext.lower()
     
     print(f"\n📂 Dosya İşleniyor / Processing File: {args.input}")
     print("-" * 70)
     
-    # Dosyayı yükle
-    if file_ext == '.csv':
+    # Artımlı modda girdiyi yalnızca manifesto karşılaştırması okur
+    # In incremental mode only the manifest check reads the input
+    incremental = (args.manifest and args.convert in SOURCE_EXTENSIONS and not args.classify
+                   and not args.geocode and file_ext in SOURCE_EXTENSIONS[args.convert])
+    
+    # Güncel bir indeks dosyası varken yalnızca sorgu yapılıyorsa GeoJSON okunmaz
+    # With an up-to-date index file and only queries to run, the GeoJSON is not read
+    cached_index = False
+    if (args.index_file and (args.nearest or args.bbox) and not (args.convert or args.stats)
+            and file_ext in ['.geojson', '.json'] and os.path.exists(args.index_file)):
+        from spatial_index import SpatialIndex
+        cached_index = SpatialIndex.matches_source(args.index_file, args.input)
+    
+    # Dosyayı yükle (akış modunda tüm dosya belleğe alınmaz)
+    if file_ext in GEOPACKAGE_EXTENSIONS:
+        try:
+            processor.load_geopackage(args.input, args.layer)
+        except (OSError, ValueError) as e:
+            print(f"❌ GeoPackage açılamadı / Cannot open GeoPackage: {e}")
+            return
+    elif (args.stream or incremental or args.reproject or args.distances
+          or (args.grid and file_ext != '.pts') or cached_index):
+        if file_ext not in ['.csv', '.geojson', '.json']:
+            print(f"❌ Desteklenmeyen dosya türü / Unsupported file type: {file_ext}")
+            return
+    elif file_ext == '.csv':
         processor.load_csv(args.input)
     elif file_ext == '.geojson' or file_ext == '.json':
         processor.load_geojson(args.input)
+    elif file_ext == '.pts':
+        processor.load_points(args.input)
     else:
         print(f"❌ Desteklenmeyen dosya türü / Unsupported file type: {file_ext}")
         return
@@ -381,22 +2075,171 @@ def main():
     # Doğrulama
     if args.validate:
         if file_ext in ['.geojson', '.json']:
-            is_valid, messages = processor.validate_geojson(args.input)
+            report = processor.validate_geojson_report(args.input, args.max_errors,
+                                                       args.workers or 1)
             print("\n✅ DOĞRULAMA SONUÇLARI / VALIDATION RESULTS")
-            for msg in messages:
-                print(f"  {msg}")
+            print(f"  Feature: {report['features']}, hata / errors: {report['error_count']}, "
+                  f"uyarı / warnings: {report['warning_count']}")
+            if report["valid"]:
+                print("  ✅ GeoJSON is valid / GeoJSON geçerli")
+            for issue in report["errors"]:
+                print(f"  ❌ {processor._format_issue(issue)}")
+            for issue in report["warnings"]:
+                print(f"  ⚠️  {processor._format_issue(issue)}")
+            if report["truncated"]:
+                print(f"  … ilk {args.max_errors} kayıt gösterildi / first {args.max_errors} "
+                      f"entries shown; {report['counts_by_code']}")
         else:
             print("⚠️  CSV doğrulaması desteklenmiyor / CSV validation not supported")
     
     # Dönüştürme
-    if args.convert:
+    if incremental:
+        if not args.output:
+            print("❌ Artımlı mod çıkış dosyası gerektirir / Incremental mode requires --output")
+        else:
+            processor.convert_incremental(args.input, args.output, args.convert,
+                                          args.manifest, args.compact)
+    elif args.convert:
         if file_ext == '.csv' and args.convert == 'geojson':
-            processor.csv_to_geojson(args.input, args.output)
+            classifier = None
+            if args.classify:
+                classifier = processor.load_classifier(args.classify, args.classify_by)
+            geocoder = None
+            if args.geocode:
+                try:
+                    geocoder = processor.load_geocoder(
+                        args.geocode, args.address_columns.split(','), args.geocode_cache,
+                        args.geocode_concurrency, args.geocode_retries)
+                except ValueError as e:
+                    print(f"❌ {e}")
+                    return
+            try:
+                if args.stream:
+                    if not args.output:
+                        print("❌ Akış modu çıkış dosyası gerektirir / Streaming requires --output")
+                    else:
+                        processor.csv_to_geojson_stream(args.input, args.output, compact=args.compact,
+                                                        classifier=classifier,
+                                                        region_property=args.region_property,
+                                                        geocoder=geocoder,
+                                                        workers=args.workers or 1)
+                else:
+                    processor.csv_to_geojson(args.input, args.output, classifier,
+                                             args.region_property, args.compact, geocoder,
+                                             args.workers or 1)
+            finally:
+                if geocoder is not None:
+                    geocoder.close()
+            if classifier is not None:
+                print(f"   🗺️  {classifier.points} nokta sınıflandırıldı / points classified, "
+                      f"{classifier.points_per_second():.0f} nokta/sn / points/sec")
+            if geocoder is not None:
+                stats = geocoder.stats
+                print(f"   📍 {stats['addresses']} adres / addresses: {stats['found']} bulundu / found, "
+                      f"{stats['not_found']} bulunamadı / not found, {stats['failed']} başarısız / failed, "
+                      f"{stats['cache_hits']} önbellekten / cached; {stats['requests']} istek / requests, "
+                      f"{stats['connections']} bağlantı / connections, "
+                      f"{geocoder.addresses_per_second():.0f} adres/sn / addresses/sec")
         elif file_ext in ['.geojson', '.json'] and args.convert == 'csv':
-            processor.geojson_to_csv(args.input, args.output)
+            if args.stream:
+                if not args.output:
+                    print("❌ Akış modu çıkış dosyası gerektirir / Streaming requires --output")
+                else:
+                    columns = args.columns.split(',') if args.columns else None
+                    try:
+                        processor.geojson_to_csv_stream(args.input, args.output, columns,
+                                                        args.scan_limit)
+                    except ValueError as e:
+                        print(f"❌ GeoJSON yükleme hatası / GeoJSON loading error: {e}")
+            else:
+                processor.geojson_to_csv(args.input, args.output)
+        elif file_ext in ['.csv', '.geojson', '.json'] and args.convert == 'points':
+            processor.to_point_store(args.input, args.output or input_stem + '.pts')
+        elif file_ext in ['.csv', '.geojson', '.json'] and args.convert == 'gpkg':
+            processor.to_geopackage(args.input, args.output or input_stem + '.gpkg',
+                                    args.layer)
+        elif ((file_ext == '.pts' or file_ext in GEOPACKAGE_EXTENSIONS)
+              and args.convert in ['geojson', 'csv'] and args.output):
+            if args.convert == 'geojson':
+                processor.points_to_geojson(processor.data, args.output, compact=args.compact)
+            else:
+                processor.points_to_csv(processor.data, args.output)
         else:
             print(f"❌ Dönüştürme desteklenmiyor / Conversion not supported: {file_ext} -> {args.convert}")
     
+    # Koordinat dönüşümü
+    if args.reproject:
+        if not args.output:
+            print("❌ Dönüşüm çıkış dosyası gerektirir / Reprojection requires --output")
+        else:
+            try:
+                processor.reproject(args.input, args.output, args.reproject, args.source_crs,
+                                    args.compact)
+            except ValueError as e:
+                print(f"❌ {e}")
+    
+    # Mesafe tablosu
+    if args.distances:
+        if not args.output:
+            print("❌ Mesafe tablosu çıkış dosyası gerektirir / Distance annotation requires --output")
+        else:
+            try:
+                summary = processor.annotate_distances(
+                    args.input, args.output, args.references, args.reference_name, args.band_km,
+                    args.compact, args.distance_summary)
+            except (OSError, ValueError) as e:
+                print(f"❌ {e}")
+            else:
+                from distance_table import print_summary
+                print_summary(summary)
+    
+    # Izgara toplama
+    if args.grid:
+        if not args.output_dir:
+            print("❌ Izgara toplama --output-dir gerektirir / Grid aggregation requires --output-dir")
+        else:
+            try:
+                resolutions = ([int(v) for v in args.resolutions.split(',')]
+                               if args.resolutions else None)
+                processor.aggregate_grid(args.input, args.output_dir, args.grid, resolutions)
+            except ValueError as e:
+                print(f"❌ {e}")
+    
+    # Karo piramidi
+    if args.tiles:
+        if file_ext not in ['.geojson', '.json']:
+            print("❌ Karo üretimi GeoJSON gerektirir / Tiling requires GeoJSON input")
+        else:
+            processor.build_tiles(args.input, args.tiles, args.min_zoom, args.max_zoom,
+                                  args.simplify, args.tile_format, args.workers)
+    
+    # Mekansal sorgular
+    if args.nearest or args.bbox:
+        if (file_ext not in ['.geojson', '.json'] and file_ext not in GEOPACKAGE_EXTENSIONS
+                and not args.index_file):
+            print("❌ Mekansal sorgu GeoJSON gerektirir / Spatial queries require GeoJSON input")
+        else:
+            # GeoPackage sorguları doğrudan dosyadaki R-ağacını kullanır
+            # GeoPackage queries go straight through the file's R-tree
+            if file_ext in GEOPACKAGE_EXTENSIONS:
+                index = processor.data
+            else:
+                index = processor.build_spatial_index(args.index_file, args.input)
+            print(f"\n🔎 MEKANSAL SORGU / SPATIAL QUERY ({len(index)} feature)")
+            print("-" * 70)
+            if args.nearest:
+                lat, lon = (float(v) for v in args.nearest.split(','))
+                if args.radius is not None:
+                    matches = index.query_radius(lat, lon, args.radius)
+                else:
+                    matches = index.nearest(lat, lon, args.k)
+                for dist, feature in matches:
+                    print(f"  {dist} km  {json.dumps(feature.get('properties'), ensure_ascii=False)}")
+            if args.bbox:
+                min_lon, min_lat, max_lon, max_lat = (float(v) for v in args.bbox.split(','))
+                for feature in index.query_bbox(min_lon, min_lat, max_lon, max_lat):
+                    print(f"  {json.dumps(feature.get('properties'), ensure_ascii=False)}")
+    
     # İstatistikler
     if args.stats:
         processor.print_statistics()
@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Mesafe Tablosu ve Etki Alanları
+Turkey's Geographic Center - Distance Table and Catchments
+
+Her feature'a tek geçişte şunları ekler:
+- Merkeze mesafe (km) ve merkeze doğru başlangıç kerterizi (derece)
+- En yakın uç nokta ve mesafesi
+- İsteğe bağlı referans noktaları (ör. 81 il merkezi) arasında en yakını
+  ve mesafesi; her referansın etki alanı (sayı, ortalama, en büyük mesafe)
+- Aynı geçişte merkez ve referans mesafeleri için mesafe bandı
+  histogramları (0-50 km, 50-100 km, ...)
+
+Referans noktaları bir kez birim vektöre çevrilir; noktalar parça
+halinde işlenir ve en yakın referans nokta çarpımının en büyüğüyle
+sütun sütun bulunur, mesafe yalnızca kazanan için (kiriş formülüyle,
+Haversine ile özdeş) hesaplanır.
+
+Annotates every feature in one pass with its distance and bearing to the
+center, its nearest extreme point and, optionally, its nearest reference
+point (e.g. the 81 province capitals) with per-reference catchment
+statistics, while accumulating distance-band histograms. Reference points
+are turned into unit vectors once; points are processed in chunks, the
+nearest reference is found column by column as the largest dot product
+and the distance is computed only for the winner via the chord formula,
+which is identical to Haversine.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import sys
+import time
+from itertools import compress
+from operator import gt
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from geographic_center import EARTH_RADIUS_KM, GeographicCenter, haversine_many, polygon_centroid
+
+DEFAULT_BAND_KM = 50.0
+DEFAULT_CHUNK_SIZE = 10000
+
+# Bu sayıdan fazla referansta en yakın arama ızgara adaylarıyla yapılır
+# Above this many references the nearest search goes through grid candidates
+GRID_MIN_REFERENCES = 8
+GRID_CELL_DEG = 0.5
+
+# Eklenen özellikler / Added properties
+CENTER_KM = 'center_km'
+CENTER_BEARING = 'center_bearing_deg'
+EXTREME_NAME = 'nearest_extreme'
+EXTREME_KM = 'nearest_extreme_km'
+REF_NAME = 'nearest_ref'
+REF_KM = 'nearest_ref_km'
+
+
+def unit_vectors(lats: Sequence[float],
+                 lons: Sequence[float]) -> Tuple[List[float], List[float], List[float]]:
+    """
+    Enlem/boylamları birim küre vektörlerine çevir
+    Convert latitudes/longitudes to unit-sphere vectors
+
+    Returns:
+        Tuple: (xs, ys, zs)
+    """
+    rad, sin, cos = math.radians, math.sin, math.cos
+    phis = list(map(rad, lats))
+    lams = list(map(rad, lons))
+    cos_phis = list(map(cos, phis))
+    xs = [c * cos(lam) for c, lam in zip(cos_phis, lams)]
+    ys = [c * sin(lam) for c, lam in zip(cos_phis, lams)]
+    zs = list(map(sin, phis))
+    return xs, ys, zs
+
+
+def in_range(lat: float, lon: float) -> bool:
+    """
+    Koordinat sonlu ve geçerli aralıkta mı (NaN/inf ve sayı olmayanlar elenir)
+    Whether a coordinate is finite and within range (NaN/inf and non-numbers fail)
+    """
+    try:
+        return -90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0
+    except TypeError:
+        return False
+
+
+def representative_point(geometry: Optional[Dict]) -> Optional[Tuple[float, float]]:
+    """
+    Feature'ı temsil eden nokta (lat, lon)
+    Point (lat, lon) standing for a feature
+
+    Point kendisi, Polygon/MultiPolygon alan-ağırlıklı centroid, diğer
+    geometriler köşelerin ortalamasıdır.
+    A Point is itself, a Polygon/MultiPolygon its area-weighted centroid
+    and any other geometry the mean of its vertices.
+    """
+    if not geometry:
+        return None
+    gtype = geometry.get('type')
+    if gtype == 'Point':
+        coords = geometry.get('coordinates') or []
+        return (coords[1], coords[0]) if len(coords) >= 2 else None
+    if gtype in ('Polygon', 'MultiPolygon'):
+        centroid = polygon_centroid(geometry)
+        if centroid is not None:
+            return centroid["lat"], centroid["lon"]
+    total_lon = total_lat = 0.0
+    n = 0
+    stack = [geometry.get('coordinates')] if gtype != 'GeometryCollection' else [
+        g.get('coordinates') for g in geometry.get('geometries') or []]
+    while stack:
+        item = stack.pop()
+        if not item:
+            continue
+        if isinstance(item[0], (int, float)):
+            total_lon += item[0]
+            total_lat += item[1]
+            n += 1
+        else:
+            stack.extend(item)
+    return (total_lat / n, total_lon / n) if n else None
+
+
+class ReferencePoints:
+    """
+    Önceden birim vektöre çevrilmiş adlandırılmış referans noktaları
+    Named reference points pre-converted to unit vectors
+    """
+
+    __slots__ = ('names', 'lats', 'lons', 'xs', 'ys', 'zs', '_cells')
+
+    def __init__(self, points: Iterable[Tuple[str, float, float]]):
+        """
+        Args:
+            points (Iterable): (ad, enlem, boylam) üçlüleri / (name, lat, lon) triples
+        """
+        points = list(points)
+        if not points:
+            raise ValueError("En az bir referans noktası gerekir / At least one reference point is required")
+        self.names = [str(name) for name, _, _ in points]
+        self.lats = [float(lat) for _, lat, _ in points]
+        self.lons = [float(lon) for _, _, lon in points]
+        self.xs, self.ys, self.zs = unit_vectors(self.lats, self.lons)
+        self._cells: Dict[Tuple[float, float], Tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_file(cls, file_path: str, name_field: str = 'name') -> 'ReferencePoints':
+        """
+        CSV (ad, latitude, longitude) veya GeoJSON Point dosyasından yükle
+        Load from a CSV (name, latitude, longitude) or GeoJSON Point file
+
+        Args:
+            file_path (str): .csv, .geojson veya .json dosyası
+            name_field (str): Adı taşıyan sütun/özellik / Column or property holding the name
+        """
+        points = []
+        if os.path.splitext(file_path)[1].lower() == '.csv':
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                for i, row in enumerate(csv.DictReader(f)):
+                    try:
+                        lat = float(row.get('latitude', row.get('lat')))
+                        lon = float(row.get('longitude', row.get('lon')))
+                    except (TypeError, ValueError):
+                        continue
+                    points.append((row.get(name_field) or f"#{i + 1}", lat, lon))
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            features = data.get('features', []) if data.get('type') == 'FeatureCollection' else [data]
+            for i, feature in enumerate(features):
+                point = representative_point(feature.get('geometry'))
+                if point is not None:
+                    name = (feature.get('properties') or {}).get(name_field) or f"#{i + 1}"
+                    points.append((name, point[0], point[1]))
+        return cls(points)
+
+    def _cell_candidates(self, key: Tuple[float, float]) -> Tuple:
+        """
+        Izgara hücresindeki bir noktaya en yakın olabilecek referanslar
+        References that can be nearest to some point of a grid cell
+
+        Hücre merkezinden en uzak köşeye r dersek, üçgen eşitsizliğiyle
+        d(c, j) - r > min_k d(c, k) + r olan j hiçbir noktada kazanamaz.
+        With r the distance from the cell center to its farthest corner, the
+        triangle inequality rules out every j with d(c, j) - r > min_k d(c, k) + r.
+        """
+        lat0, lon0 = key[0] * GRID_CELL_DEG, key[1] * GRID_CELL_DEG
+        lat1, lon1 = min(90.0, lat0 + GRID_CELL_DEG), lon0 + GRID_CELL_DEG
+        lat0 = max(-90.0, lat0)
+        clat, clon = (lat0 + lat1) / 2, (lon0 + lon1) / 2
+        radius = max(haversine_many(clat, clon, [lat0, lat0, lat1, lat1], [lon0, lon1, lon0, lon1]))
+        distances = haversine_many(clat, clon, self.lats, self.lons)
+        bound = min(distances) + 2 * radius + 1e-6
+        candidates = tuple((j, self.xs[j], self.ys[j], self.zs[j])
+                           for j, d in enumerate(distances) if d <= bound)
+        self._cells[key] = candidates
+        return candidates
+
+    def nearest(self, lats: Sequence[float], lons: Sequence[float], xs: Sequence[float],
+                ys: Sequence[float], zs: Sequence[float]) -> Tuple[List[int], List[float]]:
+        """
+        Her nokta için en yakın referans ve mesafesi
+        Nearest reference and its distance for every point
+
+        Az referansta döngü referanslar üzerinde kurulur ve her biri için
+        parçanın tüm nokta çarpımları tek liste üreteciyle hesaplanır. Çok
+        referansta (ör. 81 il) her nokta yalnızca 0,5°'lik hücresinin bir kez
+        hesaplanıp saklanan adaylarıyla karşılaştırılır. Eşitlikte küçük
+        indeks kazanır; iki yol aynı sonucu verir.
+        With few references the loop runs over the references, computing the
+        dot products of the whole chunk in one comprehension each. With many
+        (e.g. 81 provinces) every point is compared only with the candidates
+        of its 0.5° cell, computed once and kept. Ties go to the lower index,
+        so both paths give the same result.
+
+        Returns:
+            Tuple: (referans indeksleri, mesafeler km) / (reference indices, distances in km)
+        """
+        n = len(xs)
+        if len(self.names) <= GRID_MIN_REFERENCES:
+            best = [-2.0] * n
+            index = [0] * n
+            for j, (rx, ry, rz) in enumerate(zip(self.xs, self.ys, self.zs)):
+                dots = [x * rx + y * ry + z * rz for x, y, z in zip(xs, ys, zs)]
+                for i in compress(range(n), map(gt, dots, best)):
+                    best[i] = dots[i]
+                    index[i] = j
+        else:
+            cells = self._cells
+            cell_candidates = self._cell_candidates
+            index = []
+            append = index.append
+            for lat, lon, x, y, z in zip(lats, lons, xs, ys, zs):
+                key = (lat // GRID_CELL_DEG, lon // GRID_CELL_DEG)
+                candidates = cells.get(key) or cell_candidates(key)
+                best_dot = -2.0
+                best_j = 0
+                for j, rx, ry, rz in candidates:
+                    dot = x * rx + y * ry + z * rz
+                    if dot > best_dot:
+                        best_dot = dot
+                        best_j = j
+                append(best_j)
+        rxs, rys, rzs = self.xs, self.ys, self.zs
+        two_r = 2 * EARTH_RADIUS_KM
+        asin, sqrt = math.asin, math.sqrt
+        # NaN'ı koruyan kırpma / NaN-preserving clamp
+        hs = [0.5 * sqrt((x - rxs[j]) ** 2 + (y - rys[j]) ** 2 + (z - rzs[j]) ** 2)
+              for x, y, z, j in zip(xs, ys, zs, index)]
+        km = [two_r * asin(1.0 if h > 1.0 else h) for h in hs]
+        return index, km
+
+
+class BandHistogram:
+    """
+    Sabit genişlikli mesafe bandı histogramı
+    Fixed-width distance band histogram
+    """
+
+    __slots__ = ('band_km', 'counts', 'total', 'total_km', 'min_km', 'max_km')
+
+    def __init__(self, band_km: float = DEFAULT_BAND_KM):
+        if band_km <= 0:
+            raise ValueError("band_km must be positive")
+        self.band_km = band_km
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.total_km = 0.0
+        self.min_km = math.inf
+        self.max_km = 0.0
+
+    def add_many(self, distances: Sequence[float]) -> None:
+        if not distances:
+            return
+        counts = self.counts
+        width = self.band_km
+        for distance in distances:
+            band = int(distance // width)
+            counts[band] = counts.get(band, 0) + 1
+        self.total += len(distances)
+        self.total_km += sum(distances)
+        self.min_km = min(self.min_km, min(distances))
+        self.max_km = max(self.max_km, max(distances))
+
+    def to_dict(self) -> Dict:
+        """Boş bantlar dahil sıralı bantlar / Ordered bands, empty ones included"""
+        top = max(self.counts) + 1 if self.counts else 0
+        return {
+            "count": self.total,
+            "min_km": round(self.min_km, 3) if self.total else None,
+            "mean_km": round(self.total_km / self.total, 3) if self.total else None,
+            "max_km": round(self.max_km, 3) if self.total else None,
+            "bands": [{"from_km": band * self.band_km, "to_km": (band + 1) * self.band_km,
+                       "count": self.counts.get(band, 0)} for band in range(top)],
+        }
+
+
+class DistanceAnnotator:
+    """
+    Parça parça mesafe/kerteriz hesaplayıcı ve tek geçişte özet
+    Chunked distance/bearing annotator with a single-pass summary
+
+    Attributes:
+        points (int): İşlenen nokta sayısı / Points processed
+    """
+
+    def __init__(self, center: Optional[GeographicCenter] = None,
+                 references: Optional[ReferencePoints] = None,
+                 band_km: float = DEFAULT_BAND_KM):
+        """
+        Args:
+            center (GeographicCenter): Merkez ve uç noktalar (varsayılan: yerleşik)
+                Center and extreme points (default: built-in)
+            references (ReferencePoints): İsteğe bağlı referans noktaları / Optional references
+            band_km (float): Histogram bant genişliği / Histogram band width
+        """
+        center = center or GeographicCenter()
+        self.center_lat = center.center_lat
+        self.center_lon = center.center_lon
+        (self._cx,), (self._cy,), (self._cz,) = unit_vectors([self.center_lat], [self.center_lon])
+        phi_c = math.radians(self.center_lat)
+        self._sin_c = math.sin(phi_c)
+        self._cos_c = math.cos(phi_c)
+        self._lam_c = math.radians(self.center_lon)
+        extremes = center.get_extreme_points()
+        self.extremes = ReferencePoints((direction, point["lat"], point["lon"])
+                                        for direction, point in extremes.items())
+        self.references = references
+        self.center_histogram = BandHistogram(band_km)
+        self.reference_histogram = BandHistogram(band_km) if references is not None else None
+        self.extreme_counts = [0] * len(self.extremes)
+        if references is not None:
+            self.catchment_counts = [0] * len(references)
+            self.catchment_km = [0.0] * len(references)
+            self.catchment_max = [0.0] * len(references)
+        self.points = 0
+
+    def property_names(self) -> List[str]:
+        """Eklenen sütunlar, sırayla / Added columns, in order"""
+        names = [CENTER_KM, CENTER_BEARING, EXTREME_NAME, EXTREME_KM]
+        if self.references is not None:
+            names += [REF_NAME, REF_KM]
+        return names
+
+    def annotate(self, lats: Sequence[float], lons: Sequence[float]) -> List[Tuple]:
+        """
+        Bir parçayı işle ve özet sayaçlarını güncelle
+        Process one chunk and update the summary counters
+
+        Returns:
+            List[Tuple]: Nokta başına property_names() sırasında değerler
+                Per-point values in property_names() order
+        """
+        if not lats:
+            return []
+        xs, ys, zs = unit_vectors(lats, lons)
+        cx, cy, cz = self._cx, self._cy, self._cz
+        two_r = 2 * EARTH_RADIUS_KM
+        asin, sqrt, sin, cos, atan2 = math.asin, math.sqrt, math.sin, math.cos, math.atan2
+        hs = [0.5 * sqrt((x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2)
+              for x, y, z in zip(xs, ys, zs)]
+        center_km = [two_r * asin(1.0 if h > 1.0 else h) for h in hs]
+        # Noktadan merkeze başlangıç kerterizi / Initial bearing from the point to the center
+        sin_c, cos_c, lam_c = self._sin_c, self._cos_c, self._lam_c
+        rad, deg = math.radians, math.degrees
+        bearings = []
+        for lat, lon, z in zip(lats, lons, zs):
+            d_lam = lam_c - rad(lon)
+            cos_p = cos(rad(lat))
+            bearings.append(round(deg(atan2(sin(d_lam) * cos_c,
+                                            cos_p * sin_c - z * cos_c * cos(d_lam))) % 360.0, 1))
+        self.center_histogram.add_many(center_km)
+
+        ext_index, ext_km = self.extremes.nearest(lats, lons, xs, ys, zs)
+        counts = self.extreme_counts
+        for j in ext_index:
+            counts[j] += 1
+        ext_names = self.extremes.names
+        columns = [[round(d, 3) for d in center_km], bearings,
+                   [ext_names[j] for j in ext_index], [round(d, 3) for d in ext_km]]
+
+        if self.references is not None:
+            ref_index, ref_km = self.references.nearest(lats, lons, xs, ys, zs)
+            self.reference_histogram.add_many(ref_km)
+            counts, totals, maxima = self.catchment_counts, self.catchment_km, self.catchment_max
+            for j, d in zip(ref_index, ref_km):
+                counts[j] += 1
+                totals[j] += d
+                if d > maxima[j]:
+                    maxima[j] = d
+            ref_names = self.references.names
+            columns += [[ref_names[j] for j in ref_index], [round(d, 3) for d in ref_km]]
+        self.points += len(lats)
+        return list(zip(*columns))
+
+    def summary(self) -> Dict:
+        """
+        Histogramlar, uç nokta sayıları ve etki alanları
+        Histograms, extreme point counts and catchments
+        """
+        result = {
+            "center": {"lat": self.center_lat, "lon": self.center_lon},
+            "points": self.points,
+            "band_km": self.center_histogram.band_km,
+            "center_distance": self.center_histogram.to_dict(),
+            "nearest_extreme": dict(zip(self.extremes.names, self.extreme_counts)),
+        }
+        if self.references is not None:
+            result["reference_distance"] = self.reference_histogram.to_dict()
+            result["catchments"] = {
+                name: {"count": n,
+                       "mean_km": round(total / n, 3) if n else None,
+                       "max_km": round(peak, 3) if n else None}
+                for name, n, total, peak in zip(self.references.names, self.catchment_counts,
+                                                 self.catchment_km, self.catchment_max)
+            }
+        return result
+
+
+def print_summary(summary: Dict, top: int = 10) -> None:
+    """Özeti tablo olarak yazdır / Print the summary as tables"""
+    def print_bands(title: str, histogram: Dict) -> None:
+        print(f"\n📏 {title} (ort. / mean {histogram['mean_km']} km, "
+              f"en fazla / max {histogram['max_km']} km)")
+        peak = max((band["count"] for band in histogram["bands"]), default=0)
+        for band in histogram["bands"]:
+            bar = '█' * (round(30 * band["count"] / peak) if peak else 0)
+            label = f"{band['from_km']:g}-{band['to_km']:g} km"
+            print(f"  {label:>14} {band['count']:>9}  {bar}")
+
+    if not summary["points"]:
+        print("⚠️  Nokta yok / No points")
+        return
+    print_bands("MERKEZE MESAFE / DISTANCE TO CENTER", summary["center_distance"])
+    print("\n🧭 EN YAKIN UÇ NOKTA / NEAREST EXTREME POINT")
+    for name, n in summary["nearest_extreme"].items():
+        print(f"  {name:<8} {n:>9}")
+    if "catchments" in summary:
+        print_bands("EN YAKIN REFERANSA MESAFE / DISTANCE TO NEAREST REFERENCE",
+                    summary["reference_distance"])
+        ranked = sorted(summary["catchments"].items(), key=lambda item: -item[1]["count"])
+        print(f"\n🏙️  ETKİ ALANLARI / CATCHMENTS (ilk / top {min(top, len(ranked))} / {len(ranked)})")
+        for name, stats in ranked[:top]:
+            print(f"  {name:<20} {stats['count']:>9}  ort. / mean {stats['mean_km']} km, "
+                  f"en fazla / max {stats['max_km']} km")
+
+
+def self_check(samples: int = 20000, references: int = 81, seed: int = 81) -> Dict[str, Dict]:
+    """
+    Parçalı hesabın kaba kuvvet Haversine ile öz denetimi
+    Self-check of the chunked computation against brute-force Haversine
+
+    Returns:
+        Dict: Denetim adı -> {"value", "limit", "ok"} / Check name -> {"value", "limit", "ok"}
+    """
+    rng = random.Random(seed)
+    results: Dict[str, Dict] = {}
+
+    def record(name: str, value: float, limit: float) -> None:
+        results[name] = {"value": value, "limit": limit, "ok": value <= limit}
+
+    lats = [rng.uniform(35.8, 42.1) for _ in range(samples)]
+    lons = [rng.uniform(25.6, 44.8) for _ in range(samples)]
+    refs = ReferencePoints((f"r{i}", rng.uniform(36.0, 42.0), rng.uniform(26.0, 44.5))
+                           for i in range(references))
+    annotator = DistanceAnnotator(references=refs, band_km=50.0)
+    rows = []
+    for start in range(0, samples, 3000):
+        rows += annotator.annotate(lats[start:start + 3000], lons[start:start + 3000])
+
+    center_ref = haversine_many(annotator.center_lat, annotator.center_lon, lats, lons)
+    record('center_km_error', max(abs(row[0] - d) for row, d in zip(rows, center_ref)), 1e-3)
+    brute = [haversine_many(lat, lon, lats, lons) for lat, lon in zip(refs.lats, refs.lons)]
+    ref_err = max(abs(row[5] - min(column[i] for column in brute)) for i, row in enumerate(rows))
+    record('nearest_ref_km_error', ref_err, 1e-3)
+    mismatches = sum(row[4] != refs.names[min(range(references), key=lambda j: brute[j][i])]
+                     for i, row in enumerate(rows))
+    record('nearest_ref_mismatches', mismatches, 0)
+    catchment_total = sum(stats["count"] for stats in annotator.summary()["catchments"].values())
+    record('catchment_count_mismatch', abs(catchment_total - samples), 0)
+    band_total = sum(band["count"] for band in annotator.summary()["center_distance"]["bands"])
+    record('band_count_mismatch', abs(band_total - samples), 0)
+
+    # Kerteriz boyunca 1 km ilerlemek merkeze mesafeyi 1 km azaltmalı
+    # Stepping 1 km along the bearing must bring the point 1 km closer to the center
+    step = 1.0 / EARTH_RADIUS_KM
+    moved_lats, moved_lons = [], []
+    for lat, lon, row in zip(lats[:1000], lons[:1000], rows):
+        phi, lam, theta = math.radians(lat), math.radians(lon), math.radians(row[1])
+        phi2 = math.asin(math.sin(phi) * math.cos(step) +
+                         math.cos(phi) * math.sin(step) * math.cos(theta))
+        lam2 = lam + math.atan2(math.sin(theta) * math.sin(step) * math.cos(phi),
+                                math.cos(step) - math.sin(phi) * math.sin(phi2))
+        moved_lats.append(math.degrees(phi2))
+        moved_lons.append(math.degrees(lam2))
+    moved = haversine_many(annotator.center_lat, annotator.center_lon, moved_lats, moved_lons)
+    record('bearing_step_error_km', max(abs(center_ref[i] - moved[i] - 1.0)
+                                        for i in range(len(moved)) if center_ref[i] > 5), 2e-3)
+    north = DistanceAnnotator().annotate([annotator.center_lat + 1.0], [annotator.center_lon])
+    record('bearing_north_error_deg', abs(north[0][1] - 180.0), 0.05)
+    return results
+
+
+def benchmark(n: int = 200000, references: int = 81) -> Dict[str, float]:
+    """Parça başına işlem hızı / Annotation throughput (points/sec)"""
+    rng = random.Random(1)
+    lats = [rng.uniform(35.8, 42.1) for _ in range(n)]
+    lons = [rng.uniform(25.6, 44.8) for _ in range(n)]
+    refs = ReferencePoints((f"r{i}", rng.uniform(36.0, 42.0), rng.uniform(26.0, 44.5))
+                           for i in range(references))
+    rates = {}
+    for name, annotator in (('center+extremes', DistanceAnnotator()),
+                            (f'+{references} references', DistanceAnnotator(references=refs))):
+        started = time.perf_counter()
+        for start in range(0, n, DEFAULT_CHUNK_SIZE):
+            annotator.annotate(lats[start:start + DEFAULT_CHUNK_SIZE],
+                               lons[start:start + DEFAULT_CHUNK_SIZE])
+        rates[name] = n / (time.perf_counter() - started)
+    return rates
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description='Mesafe tablosu ve etki alanları / Distance table and catchments')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Kaba kuvvet Haversine ile denetim / Check against brute-force Haversine')
+    parser.add_argument('--bench', type=int, metavar='N',
+                        help='N noktada hız ölçümü / Throughput benchmark on N points')
+    args = parser.parse_args()
+
+    if not (args.self_check or args.bench):
+        parser.print_help()
+        return
+    if args.self_check:
+        print("\n🧪 MESAFE TABLOSU ÖZ DENETİMİ / DISTANCE TABLE SELF-CHECK")
+        print("-" * 70)
+        results = self_check()
+        for name, result in results.items():
+            mark = '✅' if result['ok'] else '❌'
+            print(f"  {mark} {name:<28} {result['value']:.3e}  (≤ {result['limit']:g})")
+        if not all(result['ok'] for result in results.values()):
+            sys.exit(1)
+    if args.bench:
+        print(f"\n⏱️  HIZ / THROUGHPUT ({args.bench} nokta / points)")
+        print("-" * 70)
+        for name, rate in benchmark(args.bench).items():
+            print(f"  {name:<24} {rate:>12,.0f} nokta/sn / points/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,795 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Toplu Adres Kodlama (Geocoding)
+Turkey's Geographic Center - Bulk Geocoding Enrichment
+
+Yalnızca metin adresi olan CSV satırlarını yapılandırılabilir bir geocoding
+HTTP uç noktasıyla zenginleştirir:
+- Satırlar partiler halinde okunur; koordinatı eksik satırların benzersiz
+  adresleri asyncio ile sınırlı eşzamanlılıkla sorgulanır, sıra korunur
+- Kalıcı (keep-alive) HTTP/1.1 bağlantı havuzu; bağlantılar partiler
+  arasında yeniden kullanılır
+- Bağlantı hatası, zaman aşımı, 429 ve 5xx yanıtlarında üstel geri
+  çekilmeli yeniden deneme (Retry-After dikkate alınır)
+- Sonuçlar (bulunamayanlar dahil) JSON Lines disk önbelleğine eklenir
+
+Enriches address-only CSV rows through a configurable geocoding HTTP
+endpoint. Rows are read in batches and the unique addresses of rows
+missing coordinates are looked up with bounded asyncio concurrency over a
+pooled keep-alive HTTP/1.1 session that survives across batches. Connection
+errors, timeouts, 429 and 5xx responses are retried with exponential
+backoff (honouring Retry-After), and every definitive answer, including
+"not found", is appended to a JSON Lines cache on disk.
+
+Uç nokta sözleşmesi / Endpoint contract:
+    GET <url>?q=<adres>  ->  [{"lat": .., "lon": ..}, ...]   (Nominatim)
+    {"lat"/"latitude": .., "lon"/"lng"/"longitude": ..}, {"results": [...]}
+    veya GeoJSON FeatureCollection da kabul edilir / are accepted as well.
+    Boş liste veya 404 "bulunamadı" sayılır / An empty list or 404 means not found.
+
+Yerel sahte servis / Local stub:
+    python geocoder.py --stub --port 8089
+    python geocoder.py --self-check
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_RETRIES = 4
+DEFAULT_TIMEOUT_S = 10.0
+BACKOFF_BASE_S = 0.25
+BACKOFF_MAX_S = 8.0
+
+# Yeniden denenen HTTP durumları / HTTP statuses that are retried
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Kodlama önbelleği (geographic_center ile aynı dizin)
+# Geocoding cache (same directory as geographic_center)
+CACHE_DIR = os.environ.get(
+    'TR_MERKEZ_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'turkiye-merkez'))
+
+USER_AGENT = 'turkiye-merkez-geocoder/1'
+
+Location = Tuple[float, float]
+
+
+def normalize_address(address: str) -> str:
+    """Önbellek anahtarı: boşlukları sadeleştirilmiş, küçük harfli adres / Cache key"""
+    return ' '.join(address.split()).casefold()
+
+
+def default_cache_file(url: str) -> str:
+    """Uç noktaya özgü önbellek dosyası / Endpoint-specific cache file"""
+    digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"geocode-{digest}.jsonl")
+
+
+def parse_location(payload) -> Optional[Location]:
+    """
+    Yaygın geocoding yanıtlarından ilk konumu çıkar
+    Extract the first location from common geocoding responses
+
+    Returns:
+        Tuple: (lat, lon) veya bulunamadıysa None / or None when not found
+    """
+    if isinstance(payload, dict):
+        if payload.get('type') == 'FeatureCollection':
+            for feature in payload.get('features') or []:
+                coords = (feature.get('geometry') or {}).get('coordinates')
+                if coords and len(coords) >= 2:
+                    payload = {'lat': coords[1], 'lon': coords[0]}
+                    break
+            else:
+                return None
+        elif 'results' in payload:
+            payload = payload['results']
+    if isinstance(payload, list):
+        if not payload:
+            return None
+        payload = payload[0]
+    if not isinstance(payload, dict):
+        return None
+    lat = payload.get('lat', payload.get('latitude'))
+    lon = payload.get('lon', payload.get('lng', payload.get('longitude')))
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
+
+
+class GeocodeCache:
+    """
+    Ekleme yapılan JSON Lines sonuç önbelleği
+    Append-only JSON Lines result cache
+
+    Her satır {"q": anahtar, "lat": .., "lon": ..}; bulunamayanlarda lat/lon
+    null. Yarım kalmış son satır (kesilen çalıştırma) yok sayılır.
+    Each line is {"q": key, "lat": .., "lon": ..} with null lat/lon for
+    addresses that were not found. A truncated last line left by an
+    interrupted run is ignored.
+    """
+
+    def __init__(self, file_path: Optional[str]):
+        self.file_path = file_path
+        self.entries: Dict[str, Optional[Location]] = {}
+        self._pending: List[str] = []
+        if file_path and os.path.exists(file_path):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        lat, lon = entry['lat'], entry['lon']
+                        self.entries[entry['q']] = None if lat is None else (lat, lon)
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[Location]:
+        return self.entries.get(key)
+
+    def put(self, key: str, location: Optional[Location]) -> None:
+        self.entries[key] = location
+        lat, lon = location if location is not None else (None, None)
+        self._pending.append(json.dumps({"q": key, "lat": lat, "lon": lon},
+                                        ensure_ascii=False, separators=(',', ':')))
+
+    def flush(self) -> None:
+        """Yeni kayıtları dosyaya ekle / Append new entries to the file"""
+        if not self.file_path or not self._pending:
+            self._pending.clear()
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.file_path)), exist_ok=True)
+        with open(self.file_path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(self._pending) + '\n')
+        self._pending.clear()
+
+
+class _HTTPError(Exception):
+    """Yeniden denenebilir HTTP durumu / Retryable HTTP status"""
+
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class _Connection:
+    """Havuzdaki tek keep-alive bağlantısı / One pooled keep-alive connection"""
+
+    __slots__ = ('reader', 'writer', 'requests')
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.requests = 0
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _ConnectionPool:
+    """
+    Tek bir sunucuya keep-alive HTTP/1.1 bağlantı havuzu
+    Keep-alive HTTP/1.1 connection pool to a single host
+
+    Boşta bağlantılar LIFO tutulur; sıcak bağlantı önce kullanılır.
+    Idle connections are kept LIFO so the warmest one is reused first.
+    """
+
+    def __init__(self, scheme: str, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._ssl = None
+        if scheme == 'https':
+            import ssl
+            self._ssl = ssl.create_default_context()
+        self._idle: List[_Connection] = []
+        self.opened = 0
+
+    async def acquire(self) -> Tuple[_Connection, bool]:
+        """
+        Boştaki bir bağlantıyı al ya da yenisini aç
+        Take an idle connection or open a new one
+
+        Returns:
+            Tuple: (bağlantı, yeniden kullanıldı mı) / (connection, reused)
+        """
+        while self._idle:
+            conn = self._idle.pop()
+            if not conn.reader.at_eof():
+                return conn, True
+            conn.close()
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self._ssl,
+                                                       limit=1 << 20)
+        self.opened += 1
+        return _Connection(reader, writer), False
+
+    def release(self, conn: _Connection, reusable: bool) -> None:
+        if reusable:
+            self._idle.append(conn)
+        else:
+            conn.close()
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+        for conn in idle:
+            try:
+                await conn.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes, bool]:
+    """
+    Bir HTTP/1.1 yanıtını oku (Content-Length, chunked veya kapanışa kadar)
+    Read one HTTP/1.1 response (Content-Length, chunked or until close)
+
+    Returns:
+        Tuple: (durum, başlıklar, gövde, bağlantı yeniden kullanılabilir mi)
+            (status, headers, body, connection reusable)
+    """
+    status_line = await reader.readuntil(b'\r\n')
+    parts = status_line.decode('latin-1').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise ConnectionError(f"Malformed status line: {status_line[:80]!r}")
+    version, status = parts[0], int(parts[1])
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readuntil(b'\r\n')
+        if line == b'\r\n':
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    connection = headers.get('connection', '').lower()
+    reusable = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+            if size == 0:
+                while await reader.readuntil(b'\r\n') != b'\r\n':
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b''.join(chunks)
+    elif 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    else:
+        body = await reader.read()
+        reusable = False
+    return status, headers, body, reusable
+
+
+class Geocoder:
+    """
+    Havuzlu asyncio istemcisi ve disk önbellekli toplu adres kodlayıcı
+    Bulk geocoder with a pooled asyncio client and an on-disk cache
+
+    Eşzamanlı (senkron) akış hatlarından çağrılır: kendi olay döngüsünü
+    tutar ve her partiyi o döngüde çalıştırır, böylece bağlantılar partiler
+    arasında açık kalır. Kullanım sonunda close() çağrılmalıdır.
+    Called from synchronous streaming pipelines: it owns an event loop and
+    runs every batch on it, so connections stay open between batches. Call
+    close() when done.
+
+    Attributes:
+        stats (Dict): addresses, cache_hits, requests, found, not_found,
+            failed, retries, connections, seconds
+    """
+
+    def __init__(self, url: str, cache_file: Optional[str] = '',
+                 address_columns: Sequence[str] = ('address',),
+                 concurrency: int = DEFAULT_CONCURRENCY, batch_size: int = DEFAULT_BATCH_SIZE,
+                 retries: int = DEFAULT_RETRIES, timeout: float = DEFAULT_TIMEOUT_S,
+                 query_param: str = 'q', headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            url (str): Geocoding uç noktası (sabit sorgu parametreleri dahil olabilir)
+                Geocoding endpoint, may carry fixed query parameters
+            cache_file (str): JSON Lines önbelleği; '' uç noktaya özgü varsayılan,
+                None yalnızca bellek / '' picks the endpoint default, None keeps it in memory
+            address_columns (Sequence[str]): Adresi oluşturan CSV sütunları
+                CSV columns joined into the address
+            concurrency (int): En fazla eşzamanlı istek (ve bağlantı)
+                Maximum concurrent requests (and connections)
+            batch_size (int): Parti başına satır / Rows per batch
+            retries (int): İstek başına yeniden deneme / Retries per request
+            timeout (float): İstek zaman aşımı (sn) / Per-attempt timeout in seconds
+            query_param (str): Adres sorgu parametresi / Address query parameter
+            headers (Dict): Ek istek başlıkları (ör. API anahtarı) / Extra request headers
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        url_parts = urlsplit(url)
+        if url_parts.scheme not in ('http', 'https') or not url_parts.hostname:
+            raise ValueError(f"Geçersiz uç nokta / Invalid endpoint URL: {url}")
+        self.url = url
+        self.address_columns = tuple(address_columns)
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.retries = retries
+        self.timeout = timeout
+        self.query_param = query_param
+        self.cache = GeocodeCache(default_cache_file(url) if cache_file == '' else cache_file)
+
+        port = url_parts.port or (443 if url_parts.scheme == 'https' else 80)
+        host_header = url_parts.hostname if url_parts.port is None else f"{url_parts.hostname}:{port}"
+        self._path = url_parts.path or '/'
+        self._base_query = parse_qs(url_parts.query, keep_blank_values=True)
+        self._header_block = ''.join(
+            f"{name}: {value}\r\n"
+            for name, value in {'Host': host_header, 'User-Agent': USER_AGENT,
+                                'Accept': 'application/json', 'Connection': 'keep-alive',
+                                **(headers or {})}.items())
+        self._pool = _ConnectionPool(url_parts.scheme, url_parts.hostname, port)
+        self._loop = asyncio.new_event_loop()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.stats = {"addresses": 0, "cache_hits": 0, "requests": 0, "found": 0,
+                      "not_found": 0, "failed": 0, "retries": 0, "connections": 0,
+                      "seconds": 0.0}
+
+    def __enter__(self) -> 'Geocoder':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _request_bytes(self, address: str) -> bytes:
+        query = urlencode({**self._base_query, self.query_param: address}, doseq=True)
+        return f"GET {self._path}?{query} HTTP/1.1\r\n{self._header_block}\r\n".encode('utf-8')
+
+    async def _fetch(self, request: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        İsteği havuzdaki bir bağlantıdan gönder
+        Send the request over a pooled connection
+
+        Sunucunun kapattığı bayat bir bağlantı hemen yenisiyle denenir.
+        A stale connection closed by the server is retried at once on a
+        fresh one.
+        """
+        while True:
+            conn, reused = await self._pool.acquire()
+            try:
+                conn.writer.write(request)
+                await conn.writer.drain()
+                status, headers, body, reusable = await _read_response(conn.reader)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                conn.close()
+                if reused and (not isinstance(e, asyncio.IncompleteReadError) or not e.partial):
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            conn.requests += 1
+            self._pool.release(conn, reusable)
+            return status, headers, body
+
+    async def _lookup(self, key: str, address: str) -> None:
+        """Tek adresi yeniden denemelerle sorgula / Look up one address with retries"""
+        request = self._request_bytes(address)
+        async with self._semaphore:
+            for attempt in range(self.retries + 1):
+                self.stats["requests"] += 1
+                try:
+                    status, headers, body = await asyncio.wait_for(self._fetch(request),
+                                                                   self.timeout)
+                    if status in RETRY_STATUSES:
+                        retry_after = headers.get('retry-after')
+                        raise _HTTPError(status, float(retry_after)
+                                         if retry_after and retry_after.replace('.', '', 1).isdigit()
+                                         else None)
+                    if status == 404:
+                        location = None
+                    elif status == 200:
+                        location = parse_location(json.loads(body))
+                    else:
+                        print(f"⚠️  Kodlama hatası / Geocoding error HTTP {status}: {address}")
+                        break
+                except (_HTTPError, OSError, asyncio.TimeoutError,
+                        asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+                    if attempt == self.retries:
+                        print(f"⚠️  Kodlama başarısız / Geocoding failed ({e or type(e).__name__}): "
+                              f"{address}")
+                        break
+                    self.stats["retries"] += 1
+                    delay = min(BACKOFF_MAX_S, BACKOFF_BASE_S * 2 ** attempt)
+                    delay *= 0.5 + random.random() / 2
+                    if isinstance(e, _HTTPError) and e.retry_after is not None:
+                        delay = min(BACKOFF_MAX_S, e.retry_after)
+                    await asyncio.sleep(delay)
+                    continue
+                except ValueError:
+                    print(f"⚠️  Geçersiz JSON yanıtı / Invalid JSON response: {address}")
+                    break
+                self.cache.put(key, location)
+                self.stats["found" if location is not None else "not_found"] += 1
+                return
+        self.stats["failed"] += 1
+
+    async def _lookup_all(self, addresses: Dict[str, str]) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(self._lookup(key, address) for key, address in addresses.items()))
+
+    def geocode_many(self, addresses: Sequence[str]) -> List[Optional[Location]]:
+        """
+        Adres listesini kodla (önbellek, tekilleştirme, eşzamanlı sorgu)
+        Geocode a list of addresses (cache, de-duplication, concurrent lookups)
+
+        Returns:
+            List: Her adres için (lat, lon) ya da None (bulunamadı/başarısız)
+                (lat, lon) or None (not found / failed) per address
+        """
+        started = time.perf_counter()
+        keys = [normalize_address(address) for address in addresses]
+        misses: Dict[str, str] = {}
+        for key, address in zip(keys, addresses):
+            if key in self.cache:
+                self.stats["cache_hits"] += 1
+            elif key not in misses:
+                misses[key] = address
+        if misses:
+            self._loop.run_until_complete(self._lookup_all(misses))
+            self.cache.flush()
+        self.stats["addresses"] += len(keys)
+        self.stats["connections"] = self._pool.opened
+        self.stats["seconds"] += time.perf_counter() - started
+        return [self.cache.get(key) for key in keys]
+
+    def geocode(self, address: str) -> Optional[Location]:
+        """Tek adres / Single address"""
+        return self.geocode_many([address])[0]
+
+    @staticmethod
+    def has_coordinates(row: Dict) -> bool:
+        """Satırda dolu latitude/longitude var mı / Row has non-blank latitude/longitude"""
+        lat, lon = row.get('latitude'), row.get('longitude')
+        return (lat is not None and lon is not None
+                and str(lat).strip() != '' and str(lon).strip() != '')
+
+    def _address_of(self, row: Dict) -> str:
+        return ', '.join(value.strip() for value in (row.get(column) or ''
+                                                     for column in self.address_columns)
+                         if value.strip())
+
+    def _enrich_batch(self, batch: List[Dict]) -> List[Dict]:
+        pending = [(row, self._address_of(row)) for row in batch if not self.has_coordinates(row)]
+        pending = [(row, address) for row, address in pending if address]
+        if pending:
+            locations = self.geocode_many([address for _, address in pending])
+            for (row, _), location in zip(pending, locations):
+                # Kodlanamayan satır 0,0'a düşmesin, atlansın
+                # Rows that could not be geocoded are skipped rather than placed at 0,0
+                row['latitude'], row['longitude'] = location if location is not None else ('', '')
+        return batch
+
+    def enrich(self, rows: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Koordinatı eksik satırlara adresinden latitude/longitude ekle
+        Fill latitude/longitude of rows missing coordinates from their address
+
+        Satırlar batch_size'lık partilerle işlenir ve aynı sırayla üretilir;
+        koordinatı olan satırlara dokunulmaz.
+        Rows are processed in batches of batch_size and yielded in order;
+        rows that already have coordinates are left untouched.
+        """
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield from self._enrich_batch(batch)
+                batch = []
+        if batch:
+            yield from self._enrich_batch(batch)
+
+    def addresses_per_second(self) -> float:
+        return self.stats["addresses"] / self.stats["seconds"] if self.stats["seconds"] else 0.0
+
+    def close(self) -> None:
+        """Bağlantıları ve olay döngüsünü kapat / Close connections and the event loop"""
+        if self._loop.is_closed():
+            return
+        self.cache.flush()
+        self._loop.run_until_complete(self._pool.close())
+        self._loop.close()
+
+
+def stub_location(address: str) -> Optional[Location]:
+    """
+    Sahte servisin deterministik yanıtı: adres özetinden Türkiye içinde bir nokta
+    Deterministic stub answer: a point inside Turkey derived from the address hash
+
+    "bilinmeyen"/"unknown" ile başlayan adresler bulunamaz.
+    Addresses starting with "bilinmeyen"/"unknown" are not found.
+    """
+    key = normalize_address(address)
+    if key.startswith(('bilinmeyen', 'unknown')):
+        return None
+    digest = hashlib.md5(key.encode('utf-8')).digest()
+    lat = 36.0 + int.from_bytes(digest[:4], 'big') / 2 ** 32 * 6.0
+    lon = 26.0 + int.from_bytes(digest[4:8], 'big') / 2 ** 32 * 19.0
+    return round(lat, 6), round(lon, 6)
+
+
+class StubGeocodingServer:
+    """
+    Test ve öz denetim için yerel sahte geocoding servisi (Nominatim biçimi)
+    Local stub geocoding service (Nominatim format) for tests and self-checks
+
+    fail_every > 0 ise adreslerin yaklaşık 1/n'i ilk denemede 503 + Retry-After,
+    drop_every > 0 ise yaklaşık 1/n'i ilk denemede yanıtsız bağlantı kapatma
+    alır; seçim adres özetine bağlıdır, yani tekrarlanabilirdir. latency_ms
+    her yanıtı geciktirir.
+    With fail_every > 0 about 1/n of the addresses get a 503 with Retry-After
+    on their first attempt, with drop_every > 0 about 1/n have the connection
+    dropped without a response; the choice depends on the address hash, so
+    it is repeatable. latency_ms delays every answer.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, fail_every: int = 0,
+                 drop_every: int = 0, latency_ms: float = 0.0):
+        self.host = host
+        self.port = port
+        self.fail_every = fail_every
+        self.drop_every = drop_every
+        self.latency_ms = latency_ms
+        self.requests = 0
+        self.connections = 0
+        self.dropped = 0
+        self._attempts: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/search"
+
+    def _answer(self, target: str) -> Tuple[Optional[int], bytes, Dict[str, str]]:
+        """Yanıt (durum, gövde, ek başlıklar); durum None ise bağlantı koparılır"""
+        url = urlsplit(target)
+        if url.path == '/health':
+            return 200, b'{"status":"ok"}', {}
+        if url.path != '/search':
+            return 404, b'{"error":"Not found"}', {}
+        self.requests += 1
+        query = parse_qs(url.query).get('q', [''])[0]
+        key = normalize_address(query)
+        attempt = self._attempts[key] = self._attempts.get(key, 0) + 1
+        if attempt == 1:
+            bucket = int.from_bytes(hashlib.md5(key.encode('utf-8')).digest()[8:12], 'big')
+            if self.fail_every and bucket % self.fail_every == 0:
+                return 503, b'{"error":"Busy"}', {'Retry-After': '0'}
+            if self.drop_every and bucket % self.drop_every == 1:
+                self.dropped += 1
+                return None, b'', {}
+        location = stub_location(query)
+        payload = [] if location is None else [
+            {"lat": f"{location[0]:.6f}", "lon": f"{location[1]:.6f}", "display_name": query}]
+        return 200, json.dumps(payload, ensure_ascii=False).encode('utf-8'), {}
+
+    async def _serve_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    request_line = await reader.readuntil(b'\r\n')
+                    while await reader.readuntil(b'\r\n') != b'\r\n':
+                        pass
+                except asyncio.IncompleteReadError:
+                    break
+                parts = request_line.decode('latin-1').split()
+                if len(parts) != 3:
+                    break
+                if self.latency_ms:
+                    await asyncio.sleep(self.latency_ms / 1000)
+                status, body, extra = self._answer(parts[1])
+                if status is None:
+                    break
+                head = [f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}",
+                        "Content-Type: application/json; charset=utf-8",
+                        f"Content-Length: {len(body)}", "Connection: keep-alive"]
+                head.extend(f"{name}: {value}" for name, value in extra.items())
+                writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _start(self) -> None:
+        self._server = await asyncio.start_server(self._serve_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def start(self) -> str:
+        """
+        Servisi arka plan iş parçacığında başlat
+        Start the service on a background thread
+
+        Returns:
+            str: Arama uç noktası URL'si / Search endpoint URL
+        """
+        ready = threading.Event()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._start())
+            ready.set()
+            self._loop.run_forever()
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.url
+
+    def stop(self) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'StubGeocodingServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """Ön planda çalış (Ctrl+C ile durur) / Run in the foreground until Ctrl+C"""
+        async def run() -> None:
+            await self._start()
+            print(f"🌐 Sahte geocoding servisi / Stub geocoding service: {self.url}?q=...")
+            async with self._server:
+                await self._server.serve_forever()
+
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            pass
+
+
+def self_check(addresses: int = 400, concurrency: int = DEFAULT_CONCURRENCY,
+               latency_ms: float = 5.0) -> Tuple[Dict[str, Dict], Dict]:
+    """
+    Sahte servise karşı uçtan uca öz denetim
+    End-to-end self-check against the stub service
+
+    Hata ve bağlantı kopması enjekte edilen servise karşı: sonuçların
+    doğruluğu, bağlantı sayısının eşzamanlılıkla sınırlı kalması, yeniden
+    denemelerin başarıya ulaşması, ikinci çalıştırmanın yalnızca önbellekten
+    yanıtlanması ve satır sırasının korunması denetlenir.
+    Against a stub that injects errors and dropped connections it checks
+    result correctness, that connections stay bounded by the concurrency,
+    that retries succeed, that a second run is served from the cache alone
+    and that row order is preserved.
+
+    Returns:
+        Tuple: (denetim adı -> {"value", "limit", "ok"}, ilk çalıştırma istatistikleri)
+            (check name -> {"value", "limit", "ok"}, first-run statistics)
+    """
+    import tempfile
+
+    results: Dict[str, Dict] = {}
+
+    def record(name: str, value: float, limit: float, ok: bool) -> None:
+        results[name] = {"value": value, "limit": limit, "ok": ok}
+
+    names = [f"Atatürk Cad. No:{i}, Kırşehir" if i % 10 else f"Bilinmeyen Sokak {i}"
+             for i in range(addresses)]
+    rows = [{"id": str(i), "address": names[i % addresses] if i % 3 else '  ' + names[i % addresses],
+             "latitude": '', "longitude": ''} for i in range(addresses * 2)]
+    rows[1].update(latitude='39.2455', longitude='35.4874')
+    expected = {i: stub_location(row["address"]) for i, row in enumerate(rows)}
+    expected[1] = (39.2455, 35.4874)
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            StubGeocodingServer(fail_every=7, drop_every=11, latency_ms=latency_ms) as stub:
+        cache_file = os.path.join(tmp, 'geocode.jsonl')
+        with Geocoder(stub.url, cache_file, concurrency=concurrency, batch_size=300,
+                      retries=6) as geocoder:
+            enriched = list(geocoder.enrich(dict(row) for row in rows))
+        first = dict(geocoder.stats)
+        wrong = 0
+        for i, row in enumerate(enriched):
+            want = expected[i]
+            got = (float(row['latitude']), float(row['longitude'])) if row['latitude'] != '' else None
+            wrong += got != want or row['id'] != str(i)
+        record('rows_wrong_or_reordered', wrong, 0, wrong == 0)
+        record('failed_lookups', first["failed"], 0, first["failed"] == 0)
+        record('retries_exercised', first["retries"], 1, first["retries"] >= 1)
+        # Kopan her bağlantı bir yenisini gerektirir / Every dropped connection needs a new one
+        limit = concurrency + stub.dropped
+        record('connections_opened', first["connections"], limit, first["connections"] <= limit)
+        record('lookups_per_address', first["requests"] - first["retries"], addresses,
+               first["requests"] - first["retries"] == addresses)
+
+        served = stub.requests
+        with Geocoder(stub.url, cache_file, concurrency=concurrency) as geocoder:
+            again = list(geocoder.enrich(dict(row) for row in rows))
+        record('cached_run_requests', stub.requests - served, 0, stub.requests == served)
+        record('cached_run_identical', sum(a != b for a, b in zip(enriched, again)), 0,
+               enriched == again)
+    return results, first
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description='Toplu adres kodlama / Bulk geocoding enrichment')
+    parser.add_argument('--url', help='Geocoding uç noktası / Geocoding endpoint URL')
+    parser.add_argument('--address', nargs='+', help='Kodlanacak adres(ler) / Address(es) to geocode')
+    parser.add_argument('--cache', default='',
+                        help='JSON Lines önbellek dosyası / JSON Lines cache file '
+                             '(default: per-endpoint file under $TR_MERKEZ_CACHE)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Eşzamanlı istek / Concurrent requests (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--stub', action='store_true',
+                        help='Yerel sahte servisi başlat / Run the local stub service')
+    parser.add_argument('--port', type=int, default=8089,
+                        help='Sahte servis portu / Stub service port (default: 8089)')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='Sahte servis gecikmesi / Stub response latency in ms')
+    parser.add_argument('--fail-every', type=int, default=0,
+                        help='Sahte serviste her n. istek 503 / Stub answers every n-th request with 503')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Sahte servise karşı öz denetim / Self-check against the stub')
+    args = parser.parse_args()
+
+    if args.stub:
+        StubGeocodingServer('127.0.0.1', args.port, args.fail_every,
+                            latency_ms=args.latency_ms).serve_forever()
+        return
+    if args.self_check:
+        print("\n🧪 KODLAMA ÖZ DENETİMİ / GEOCODING SELF-CHECK")
+        print("-" * 70)
+        results, stats = self_check(concurrency=args.concurrency)
+        for name, result in results.items():
+            mark = '✅' if result['ok'] else '❌'
+            print(f"  {mark} {name:<28} {result['value']:>8}  (hedef / target {result['limit']})")
+        print(f"  ⏱️  {stats['addresses']} adres / addresses, {stats['requests']} istek / requests, "
+              f"{stats['connections']} bağlantı / connections, "
+              f"{stats['addresses'] / stats['seconds']:.0f} adres/sn / addresses/sec")
+        if not all(result['ok'] for result in results.values()):
+            sys.exit(1)
+        return
+    if not (args.url and args.address):
+        parser.print_help()
+        return
+    with Geocoder(args.url, args.cache, concurrency=args.concurrency) as geocoder:
+        for address, location in zip(args.address, geocoder.geocode_many(args.address)):
+            print(f"  {address}: {'-' if location is None else f'{location[0]}, {location[1]}'}")
+
+
+if __name__ == "__main__":
+    main()
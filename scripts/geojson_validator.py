@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - GeoJSON Doğrulayıcı
+Turkey's Geographic Center - GeoJSON Validator
+
+RFC 7946 kapsamında akış halinde GeoJSON doğrulama:
+- Tüm geometri türleri (GeometryCollection dahil)
+- Halka kapanışı, sarım yönü ve koordinat aralıkları
+- Büyük dosyalar için çok çekirdekli parça doğrulama
+- Hata sayısı sınırlı yapılandırılmış rapor
+
+Streaming RFC 7946 validation covering every geometry type, ring
+closure, winding order and coordinate ranges, with multi-core chunked
+validation and a structured report capped at N errors.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import mul, sub
+from typing import Dict, Iterable, List, Optional, Tuple
+
+GEOMETRY_TYPES = (
+    'Point', 'MultiPoint', 'LineString', 'MultiLineString',
+    'Polygon', 'MultiPolygon', 'GeometryCollection'
+)
+
+# Sarım yönü RFC 7946'da "SHOULD" düzeyindedir; uyarı olarak raporlanır
+# Winding order is a SHOULD in RFC 7946, so it is reported as a warning
+WARNING_CODES = {'winding_exterior', 'winding_hole'}
+
+Issue = Tuple[str, str]  # (kod, mesaj) / (code, message)
+
+_POINT = '{"type":"Feature","properties":{},"geometry":{"type":"Point","coordinates":[32.8,39.9]}}'
+
+# Öz denetim belgeleri: ad -> (metin, geçerli mi) / Self-check documents: name -> (text, valid?)
+CHECK_DOCUMENTS = {
+    'collection': ('{"type":"FeatureCollection","features":[%s,%s]}' % (_POINT, _POINT), True),
+    'empty_collection': ('{"type":"FeatureCollection","features":[]}', True),
+    'bare_feature': (_POINT, True),
+    'bare_geometry': ('{"type":"Point","coordinates":[32.8,39.9]}', True),
+    'missing_element_comma': ('{"type":"FeatureCollection","features":[%s %s]}' % (_POINT, _POINT), False),
+    'missing_member_comma': ('{"type":"FeatureCollection" "features":[%s]}' % _POINT, False),
+    'trailing_comma': ('{"type":"FeatureCollection","features":[%s,]}' % _POINT, False),
+    'trailing_data': ('{"type":"FeatureCollection","features":[%s]} trailing' % _POINT, False),
+    'truncated': ('{"type":"FeatureCollection","features":[%s' % _POINT, False),
+    'empty_file': ('', False),
+    'features_number': ('{"type":"FeatureCollection","features":5}', False),
+    'features_object': ('{"type":"FeatureCollection","features":%s}' % _POINT, False),
+    'feature_not_object': ('{"type":"FeatureCollection","features":[5]}', False),
+    'missing_features': ('{"type":"FeatureCollection"}', False),
+}
+
+
+def _check_positions(positions, issues: List[Issue], where: str) -> bool:
+    """
+    Konum dizisinin yapısını ve aralıklarını toplu kontrol et
+    Check structure and ranges of a position array in bulk
+
+    Aralık kontrolü min/max ile tek geçişte yapılır; yalnızca sınır dışı
+    değer varsa tek tek konum aranır.
+    Ranges are checked with a single min/max pass; individual positions
+    are only located when something is out of range.
+    """
+    if not isinstance(positions, list):
+        issues.append(('bad_coordinates', f"{where}: coordinates must be an array"))
+        return False
+    try:
+        lons = [p[0] for p in positions]
+        lats = [p[1] for p in positions]
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool)
+                   for v in lons + lats):
+            raise TypeError
+    except (TypeError, IndexError, KeyError):
+        issues.append(('bad_position', f"{where}: positions must be [lon, lat(, alt)] numbers"))
+        return False
+    if lons and (min(lons) < -180 or max(lons) > 180):
+        index = next(i for i, v in enumerate(lons) if not -180 <= v <= 180)
+        issues.append(('lon_range', f"{where}[{index}]: longitude {lons[index]} out of range"))
+    if lats and (min(lats) < -90 or max(lats) > 90):
+        index = next(i for i, v in enumerate(lats) if not -90 <= v <= 90)
+        issues.append(('lat_range', f"{where}[{index}]: latitude {lats[index]} out of range"))
+    return True
+
+
+def _signed_area2(ring: List[List[float]]) -> float:
+    """Halkanın iki kat işaretli alanı (CCW > 0) / Twice the signed ring area (CCW > 0)"""
+    xs = [p[0] for p in ring]
+    ys = [p[1] for p in ring]
+    return sum(map(sub, map(mul, xs, ys[1:] + ys[:1]), map(mul, xs[1:] + xs[:1], ys)))
+
+
+def _check_polygon(rings, issues: List[Issue], where: str) -> None:
+    """Polygon halkalarını kontrol et / Check the rings of a Polygon"""
+    if not isinstance(rings, list):
+        issues.append(('bad_coordinates', f"{where}: polygon must be an array of rings"))
+        return
+    for ring_index, ring in enumerate(rings):
+        ring_where = f"{where}[{ring_index}]"
+        if not _check_positions(ring, issues, ring_where):
+            continue
+        if len(ring) < 4:
+            issues.append(('ring_too_short', f"{ring_where}: linear ring needs at least 4 positions"))
+            continue
+        if ring[0][:2] != ring[-1][:2]:
+            issues.append(('ring_not_closed', f"{ring_where}: first and last positions differ"))
+            continue
+        area2 = _signed_area2(ring)
+        if ring_index == 0 and area2 < 0:
+            issues.append(('winding_exterior', f"{ring_where}: exterior ring should be counterclockwise"))
+        elif ring_index > 0 and area2 > 0:
+            issues.append(('winding_hole', f"{ring_where}: hole should be clockwise"))
+
+
+def validate_geometry(geometry, issues: List[Issue], where: str = "geometry") -> None:
+    """
+    Tek bir GeoJSON geometrisini doğrula, sorunları listeye ekle
+    Validate a single GeoJSON geometry, appending issues to the list
+    """
+    if not isinstance(geometry, dict):
+        issues.append(('bad_geometry', f"{where}: geometry must be an object or null"))
+        return
+    geom_type = geometry.get('type')
+    if geom_type not in GEOMETRY_TYPES:
+        issues.append(('geometry_type', f"{where}: invalid geometry type {geom_type}"))
+        return
+
+    if geom_type == 'GeometryCollection':
+        children = geometry.get('geometries')
+        if not isinstance(children, list):
+            issues.append(('bad_geometry', f"{where}: GeometryCollection needs 'geometries' array"))
+            return
+        for i, child in enumerate(children):
+            validate_geometry(child, issues, f"{where}.geometries[{i}]")
+        return
+
+    coords = geometry.get('coordinates')
+    if coords is None:
+        issues.append(('bad_coordinates', f"{where}: missing 'coordinates'"))
+        return
+    where = f"{where}.coordinates"
+
+    if geom_type == 'Point':
+        _check_positions([coords], issues, where)
+    elif geom_type in ('MultiPoint', 'LineString'):
+        if _check_positions(coords, issues, where) and geom_type == 'LineString' and len(coords) < 2:
+            issues.append(('line_too_short', f"{where}: LineString needs at least 2 positions"))
+    elif geom_type == 'MultiLineString':
+        if not isinstance(coords, list):
+            issues.append(('bad_coordinates', f"{where}: must be an array of lines"))
+            return
+        for i, line in enumerate(coords):
+            if _check_positions(line, issues, f"{where}[{i}]") and len(line) < 2:
+                issues.append(('line_too_short', f"{where}[{i}]: LineString needs at least 2 positions"))
+    elif geom_type == 'Polygon':
+        _check_polygon(coords, issues, where)
+    else:  # MultiPolygon
+        if not isinstance(coords, list):
+            issues.append(('bad_coordinates', f"{where}: must be an array of polygons"))
+            return
+        for i, polygon in enumerate(coords):
+            _check_polygon(polygon, issues, f"{where}[{i}]")
+
+
+def validate_feature(feature, issues: List[Issue]) -> None:
+    """
+    Tek bir Feature nesnesini doğrula
+    Validate a single Feature object
+    """
+    if not isinstance(feature, dict) or feature.get('type') != 'Feature':
+        issues.append(('feature_type', "Invalid feature type"))
+        return
+    if 'geometry' not in feature:
+        issues.append(('missing_geometry', "Feature must have a 'geometry' member"))
+    elif feature['geometry'] is not None:
+        validate_geometry(feature['geometry'], issues)
+    props = feature.get('properties')
+    if props is not None and not isinstance(props, dict):
+        issues.append(('bad_properties', "'properties' must be an object or null"))
+
+
+def validate_chunk(offset: int, features: List[Dict], max_errors: int) -> Dict:
+    """
+    Feature parçasını doğrula (işçi süreçlerinde de çalışır)
+    Validate a chunk of features (also runs in worker processes)
+
+    Returns:
+        Dict: counts (kod sayıları), errors/warnings (en fazla max_errors)
+    """
+    counts = Counter()
+    errors = []
+    warnings = []
+    for i, feature in enumerate(features, offset):
+        issues = []
+        validate_feature(feature, issues)
+        for code, message in issues:
+            counts[code] += 1
+            target = warnings if code in WARNING_CODES else errors
+            if len(target) < max_errors:
+                target.append({"feature": i, "code": code, "message": message})
+    return {"counts": counts, "errors": errors, "warnings": warnings}
+
+
+def _chunks(features: Iterable[Dict], chunk_size: int):
+    """Feature akışını (offset, liste) parçalarına böl / Split into (offset, list) chunks"""
+    iterator = iter(features)
+    offset = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
+
+
+def validate_file(file_path: str, max_errors: int = 100, workers: Optional[int] = 1,
+                  chunk_size: int = 5000) -> Dict:
+    """
+    GeoJSON dosyasını akış halinde doğrula ve yapılandırılmış rapor döndür
+    Stream-validate a GeoJSON file and return a structured report
+
+    Args:
+        file_path (str): GeoJSON dosyasının yolu
+        max_errors (int): Rapordaki en fazla hata/uyarı / Max errors (and warnings) listed
+        workers (int): İşçi süreç sayısı; 1 ise tek süreç / Worker processes (1 = in-process)
+        chunk_size (int): Parça başına feature / Features per chunk
+
+    Returns:
+        Dict: valid, features, error_count, warning_count, counts_by_code,
+            errors, warnings, truncated
+    """
+    from data_processor import iter_geojson_features
+
+    root = {}
+    counts = Counter()
+    errors = []
+    warnings = []
+    total = 0
+
+    def merge(result: Dict) -> None:
+        counts.update(result["counts"])
+        errors.extend(result["errors"][:max_errors - len(errors)])
+        warnings.extend(result["warnings"][:max_errors - len(warnings)])
+
+    try:
+        chunks = _chunks(iter_geojson_features(file_path, root=root), chunk_size)
+        if workers == 1:
+            for offset, chunk in chunks:
+                total += len(chunk)
+                merge(validate_chunk(offset, chunk, max_errors))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = []
+                limit = 2 * (workers or os.cpu_count() or 1)
+                for offset, chunk in chunks:
+                    total += len(chunk)
+                    pending.append(pool.submit(validate_chunk, offset, chunk, max_errors))
+                    if len(pending) >= limit:
+                        merge(pending.pop(0).result())
+                for future in pending:
+                    merge(future.result())
+    except ValueError as e:
+        # JSONDecodeError da ValueError'dır / JSONDecodeError is a ValueError too
+        counts['parse_error'] += 1
+        errors.append({"feature": None, "code": 'parse_error', "message": str(e)})
+
+    root_type = root.get('type')
+    if 'parse_error' not in counts:
+        if root_type == 'FeatureCollection':
+            if 'features' not in root:
+                counts['missing_features'] += 1
+                errors.append({"feature": None, "code": 'missing_features',
+                               "message": "FeatureCollection must have 'features' property"})
+        elif root_type in GEOMETRY_TYPES:
+            issues = []
+            validate_geometry(root, issues)
+            for code, message in issues:
+                counts[code] += 1
+                if len(errors) < max_errors:
+                    errors.append({"feature": None, "code": code, "message": message})
+        elif root_type != 'Feature':
+            counts['root_type'] += 1
+            errors.append({"feature": None, "code": 'root_type',
+                           "message": f"Invalid GeoJSON type: {root_type}"})
+
+    error_count = sum(n for code, n in counts.items() if code not in WARNING_CODES)
+    warning_count = sum(n for code, n in counts.items() if code in WARNING_CODES)
+    return {
+        "valid": error_count == 0,
+        "features": total,
+        "error_count": error_count,
+        "warning_count": warning_count,
+        "counts_by_code": dict(counts),
+        "errors": errors,
+        "warnings": warnings,
+        "truncated": error_count > len(errors) or warning_count > len(warnings)
+    }
+
+
+def self_check() -> Dict[str, Dict]:
+    """
+    Geçerli ve bozuk örnek belgelerle doğrulayıcı öz denetimi
+    Self-check of the validator against valid and malformed sample documents
+
+    Returns:
+        Dict: Belge adı -> {"expected", "valid", "codes", "ok"}
+            Document name -> {"expected", "valid", "codes", "ok"}
+    """
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, (text, expected) in CHECK_DOCUMENTS.items():
+            path = os.path.join(workdir, f"{name}.geojson")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            report = validate_file(path)
+            results[name] = {"expected": expected, "valid": report["valid"],
+                             "codes": sorted(report["counts_by_code"]),
+                             "ok": report["valid"] == expected}
+    return results
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(description='RFC 7946 GeoJSON doğrulama / GeoJSON validation')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Geçerli/bozuk örnek belgeler denetimi / Valid and malformed sample check')
+    args = parser.parse_args()
+
+    if not args.self_check:
+        parser.print_help()
+        return
+    print("\n🧪 DOĞRULAYICI ÖZ DENETİMİ / VALIDATOR SELF-CHECK")
+    print("-" * 70)
+    results = self_check()
+    for name, result in results.items():
+        mark = '✅' if result['ok'] else '❌'
+        verdict = 'geçerli / valid' if result['valid'] else 'geçersiz / invalid'
+        print(f"  {mark} {name:<24} {verdict:<20} {', '.join(result['codes']) or '-'}")
+    if not all(result['ok'] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - GeoJSON Serileştirme Arka Uçları
+Turkey's Geographic Center - GeoJSON Serialization Backends
+
+Girintili json.dump, saf Python kodlayıcısına düştüğü için büyük
+FeatureCollection'larda dönüştürme süresinin çoğunu alır. Bu modül
+seçilebilir arka uçlar sunar:
+- stdlib:  json.dumps (girintili çıktı önceki sürümle bayt bayt aynı)
+- point:   Point feature'ları için elle yazılmış, stdlib ile aynı baytları
+           üreten hızlı yol; diğer feature'lar stdlib'e düşer
+- orjson / msgspec: kuruluysa kullanılır
+- auto:    kurulu olan en hızlısı (orjson > msgspec > point)
+
+Koordinatlar isteğe bağlı olarak N ondalığa yuvarlanır (17 anlamlı basamak
+dosyayı yaklaşık iki katına çıkarır) ve çıktı büyük parçalar halinde yazılır.
+
+Pretty-printed json.dump falls back to the pure-Python encoder and takes
+most of the conversion time on large FeatureCollections. This module
+offers selectable backends (stdlib, a hand-rolled Point writer producing
+the same bytes as stdlib, orjson/msgspec when installed, and auto), an
+optional coordinate precision, and writes through large buffered chunks.
+"""
+
+import json
+import math
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+BACKENDS = ('stdlib', 'point', 'orjson', 'msgspec', 'auto')
+OPTIONAL_BACKENDS = ('orjson', 'msgspec')
+WRITE_BUFFER_SIZE = 1 << 20
+
+_FEATURE_KEYS = ('type', 'properties', 'geometry')
+_NESTED_INDENT = '    '
+
+
+class Layout(NamedTuple):
+    """
+    Akışla yazılan FeatureCollection'ın biçimi
+    Layout of a streamed FeatureCollection
+
+    dumps(feature) ve head/sep/tail/empty aynı türdedir: binary ise bytes,
+    değilse str. empty, hiç feature yazılmadığında tail yerine kullanılır.
+    dumps(feature) and head/sep/tail/empty share one type: bytes when
+    binary, str otherwise. empty replaces tail when no feature was written.
+    """
+    dumps: Callable[[Dict], Union[str, bytes]]
+    head: Union[str, bytes]
+    sep: Union[str, bytes]
+    tail: Union[str, bytes]
+    empty: Union[str, bytes]
+    binary: bool
+
+
+def available_backends() -> List[str]:
+    """
+    Bu ortamda kullanılabilen arka uçlar
+    Backends usable in this environment
+    """
+    backends = ['stdlib', 'point']
+    for name in OPTIONAL_BACKENDS:
+        try:
+            __import__(name)
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    'auto'yu çöz ve isteğe bağlı paketin kurulu olduğunu doğrula
+    Resolve 'auto' and check that an optional package is installed
+
+    Raises:
+        ValueError: Bilinmeyen ya da kurulu olmayan arka uç
+            Unknown or not installed backend
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    available = available_backends()
+    if backend == 'auto':
+        for name in OPTIONAL_BACKENDS:
+            if name in available:
+                return name
+        return 'point'
+    if backend not in available:
+        raise ValueError(f"JSON backend '{backend}' is not installed")
+    return backend
+
+
+def round_coordinates(coordinates: Any, precision: int) -> Any:
+    """
+    İç içe koordinat dizilerini ondalık basamağa yuvarla
+    Round nested coordinate arrays to a number of decimals
+    """
+    if isinstance(coordinates, float):
+        return round(coordinates, precision)
+    if isinstance(coordinates, (list, tuple)):
+        return [round_coordinates(c, precision) for c in coordinates]
+    return coordinates
+
+
+def round_geometry(geometry: Optional[Dict], precision: int) -> Optional[Dict]:
+    """Geometrinin yuvarlanmış kopyası / Rounded copy of a geometry"""
+    if not isinstance(geometry, dict):
+        return geometry
+    rounded = dict(geometry)
+    if 'coordinates' in geometry:
+        rounded['coordinates'] = round_coordinates(geometry['coordinates'], precision)
+    if 'geometries' in geometry:
+        rounded['geometries'] = [round_geometry(g, precision) for g in geometry['geometries']]
+    return rounded
+
+
+def round_object(obj: Any, precision: int) -> Any:
+    """
+    Feature, FeatureCollection veya geometrinin yuvarlanmış kopyası
+    Rounded copy of a Feature, FeatureCollection or geometry
+    """
+    if not isinstance(obj, dict):
+        return obj
+    kind = obj.get('type')
+    if kind == 'FeatureCollection':
+        rounded = dict(obj)
+        rounded['features'] = [round_object(f, precision) for f in obj.get('features', ())]
+        return rounded
+    if kind == 'Feature':
+        rounded = dict(obj)
+        rounded['geometry'] = round_geometry(obj.get('geometry'), precision)
+        return rounded
+    return round_geometry(obj, precision)
+
+
+def _stdlib_dumps(compact: bool) -> Callable[[Any], str]:
+    if compact:
+        return lambda obj: json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+    return lambda obj: json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _orjson_dumps(compact: bool) -> Callable[[Any], bytes]:
+    import orjson
+
+    option = 0 if compact else orjson.OPT_INDENT_2
+    return lambda obj: orjson.dumps(obj, option=option)
+
+
+def _msgspec_dumps(compact: bool) -> Callable[[Any], bytes]:
+    import msgspec
+
+    encode = msgspec.json.encode
+    if compact:
+        return encode
+    return lambda obj: msgspec.json.format(encode(obj), indent=2)
+
+
+def _number(value: Any, precision: Optional[int]) -> Optional[str]:
+    """JSON sayı metni; desteklenmiyorsa None / JSON number text, None if unsupported"""
+    kind = type(value)
+    if kind is float:
+        if not math.isfinite(value):
+            return None
+        return float.__repr__(value if precision is None else round(value, precision))
+    if kind is int:
+        return int.__repr__(value)
+    return None
+
+
+def _scalar(value: Any) -> Optional[str]:
+    """Özellik değerinin JSON metni; iç içe yapılar için None / None for nested values"""
+    kind = type(value)
+    if kind is str:
+        return encode_basestring(value)
+    if value is None:
+        return 'null'
+    if kind is bool:
+        return 'true' if value else 'false'
+    if kind is int:
+        return int.__repr__(value)
+    if kind is float and math.isfinite(value):
+        return float.__repr__(value)
+    return None
+
+
+def _point_parts(feature: Any, precision: Optional[int]) -> Optional[Tuple]:
+    """
+    Feature elle yazılabilecek bir Point ise (özellik çiftleri, lon, lat)
+    (property pairs, lon, lat) when the feature is a plain Point
+    """
+    if type(feature) is not dict or tuple(feature) != _FEATURE_KEYS or feature['type'] != 'Feature':
+        return None
+    geometry = feature['geometry']
+    properties = feature['properties']
+    if (type(geometry) is not dict or len(geometry) != 2 or geometry.get('type') != 'Point'
+            or type(properties) is not dict):
+        return None
+    coordinates = geometry.get('coordinates')
+    if type(coordinates) is not list or len(coordinates) != 2:
+        return None
+    lon = _number(coordinates[0], precision)
+    lat = _number(coordinates[1], precision)
+    if lon is None or lat is None:
+        return None
+    pairs = []
+    for key, value in properties.items():
+        text = _scalar(value)
+        if type(key) is not str or text is None:
+            return None
+        pairs.append((encode_basestring(key), text))
+    return pairs, lon, lat
+
+
+def _point_dumps(compact: bool, precision: Optional[int],
+                 indent: str = '') -> Callable[[Any], str]:
+    """
+    Point feature'ları için stdlib ile aynı baytları üreten kodlayıcı
+    Encoder producing stdlib's bytes for Point features
+
+    indent, girintili çıktıda her satırın önüne eklenir (koleksiyon içi).
+    indent prefixes every line of indented output (inside a collection).
+    """
+    fallback = _stdlib_dumps(compact)
+    if precision is not None:
+        base_fallback = fallback
+        fallback = lambda obj: base_fallback(round_object(obj, precision))
+    if not compact and indent:
+        plain_fallback = fallback
+        fallback = lambda obj: indent + plain_fallback(obj).replace('\n', '\n' + indent)
+
+    if compact:
+        def dumps(feature: Any) -> str:
+            parts = _point_parts(feature, precision)
+            if parts is None:
+                return fallback(feature)
+            pairs, lon, lat = parts
+            return ('{"type":"Feature","properties":{'
+                    + ','.join([k + ':' + v for k, v in pairs])
+                    + '},"geometry":{"type":"Point","coordinates":['
+                    + lon + ',' + lat + ']}}')
+        return dumps
+
+    i1, i2, i3 = indent + '  ', indent + '    ', indent + '      '
+    open_feature = indent + '{\n' + i1 + '"type": "Feature",\n' + i1 + '"properties": '
+    prop_sep = ',\n' + i2
+    geometry_head = (',\n' + i1 + '"geometry": {\n' + i2 + '"type": "Point",\n'
+                     + i2 + '"coordinates": [\n' + i3)
+    geometry_tail = '\n' + i2 + ']\n' + i1 + '}\n' + indent + '}'
+    coordinate_sep = ',\n' + i3
+    properties_tail = '\n' + i1 + '}'
+
+    def dumps(feature: Any) -> str:
+        parts = _point_parts(feature, precision)
+        if parts is None:
+            return fallback(feature)
+        pairs, lon, lat = parts
+        if pairs:
+            properties = ('{\n' + i2 + prop_sep.join([k + ': ' + v for k, v in pairs])
+                          + properties_tail)
+        else:
+            properties = '{}'
+        return (open_feature + properties + geometry_head
+                + lon + coordinate_sep + lat + geometry_tail)
+    return dumps
+
+
+def encoder(backend: str = 'stdlib', compact: bool = False,
+            precision: Optional[int] = None) -> Tuple[Callable[[Any], Union[str, bytes]], bool]:
+    """
+    Tek bir JSON nesnesi için kodlayıcı
+    Encoder for a single JSON object
+
+    Args:
+        backend (str): BACKENDS içinden / One of BACKENDS
+        compact (bool): Girintisiz çıktı / Without indentation
+        precision (int): Koordinat ondalık sayısı; None ise dokunulmaz
+            Coordinate decimals; None leaves them untouched
+
+    Returns:
+        (dumps, binary): binary ise dumps bytes döndürür / dumps returns bytes when binary
+    """
+    backend = resolve_backend(backend)
+    if backend == 'point':
+        return _point_dumps(compact, precision), False
+    if backend == 'stdlib':
+        dumps, binary = _stdlib_dumps(compact), False
+    elif backend == 'orjson':
+        dumps, binary = _orjson_dumps(compact), True
+    else:
+        dumps, binary = _msgspec_dumps(compact), True
+    if precision is not None:
+        plain = dumps
+        dumps = lambda obj: plain(round_object(obj, precision))
+    return dumps, binary
+
+
+def collection_layout(backend: str = 'stdlib', compact: bool = False,
+                      precision: Optional[int] = None, crs: Optional[str] = None) -> Layout:
+    """
+    Akışla yazılan FeatureCollection'ın biçimi
+    Layout of a streamed FeatureCollection
+
+    stdlib ve point arka uçlarında girintili çıktı, tüm koleksiyonun
+    json.dumps(indent=2) çıktısıyla bayt bayt aynıdır. crs verilirse
+    (ör. "urn:ogc:def:crs:EPSG::32636") GDAL'ın okuduğu eski "crs" üyesi eklenir.
+    With the stdlib and point backends, indented output is byte-identical
+    to json.dumps(indent=2) of the whole collection. A crs name adds the
+    legacy "crs" member that GDAL reads for non-WGS84 coordinates.
+    """
+    member = {"type": "name", "properties": {"name": crs}} if crs else None
+    if compact:
+        head, sep, tail = '{"type":"FeatureCollection","features":[', ',', ']}'
+        if member:
+            head = ('{"type":"FeatureCollection","crs":'
+                    + json.dumps(member, ensure_ascii=False, separators=(',', ':'))
+                    + ',"features":[')
+        empty = tail
+    else:
+        head, sep, tail = '{\n  "type": "FeatureCollection",\n  "features": [\n', ',\n', '\n  ]\n}'
+        if member:
+            head = ('{\n  "type": "FeatureCollection",\n  "crs": '
+                    + json.dumps(member, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+                    + ',\n  "features": [\n')
+        empty = '  ]\n}'
+    if resolve_backend(backend) == 'point':
+        dumps, binary = _point_dumps(compact, precision, '' if compact else _NESTED_INDENT), False
+    else:
+        plain, binary = encoder(backend, compact, precision)
+        if compact:
+            dumps = plain
+        elif binary:
+            dumps = lambda obj: b'    ' + plain(obj).replace(b'\n', b'\n    ')
+        else:
+            dumps = lambda obj: '    ' + plain(obj).replace('\n', '\n    ')
+    if binary:
+        head, sep, tail, empty = (s.encode('utf-8') for s in (head, sep, tail, empty))
+    return Layout(dumps, head, sep, tail, empty, binary)
+
+
+class ChunkedWriter:
+    """
+    Küçük parçaları biriktirip büyük bloklar halinde yazan tampon
+    Buffer collecting small pieces and writing them in large blocks
+
+    Metin parçaları blok başına bir kez UTF-8'e kodlanır.
+    Text pieces are encoded to UTF-8 once per block.
+
+    Attributes:
+        written (int): Hedefe yazılan bayt / Bytes handed to the sink
+    """
+
+    def __init__(self, sink: Callable[[bytes], Any], binary: bool = False,
+                 buffer_size: int = WRITE_BUFFER_SIZE):
+        self.sink = sink
+        self.binary = binary
+        self.buffer_size = buffer_size
+        self.parts = []
+        self.pending = 0
+        self.written = 0
+
+    def write(self, data: Union[str, bytes]) -> None:
+        self.parts.append(data)
+        self.pending += len(data)
+        if self.pending >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.parts:
+            return
+        if self.binary:
+            block = b''.join(self.parts)
+        else:
+            block = ''.join(self.parts).encode('utf-8')
+        self.sink(block)
+        self.written += len(block)
+        self.parts = []
+        self.pending = 0
+
+    def __enter__(self) -> 'ChunkedWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
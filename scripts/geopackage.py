@@ -0,0 +1,747 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - GeoPackage/SQLite Nokta Deposu
+Turkey's Geographic Center - GeoPackage/SQLite Point Store
+
+Nokta veri kümelerini tekrar tekrar sorgulanabilen, indeksli bir yerel
+veritabanına yükler:
+- OGC GeoPackage düzeni (gpkg_contents, gpkg_geometry_columns, GP başlıklı
+  WKB Point geometrileri) - GDAL/QGIS dosyayı doğrudan açar
+- gpkg_rtree_index uzantısı: SQLite R*Tree sanal tablosu
+- Toplu yükleme: tek işlem, WAL, hazırlanmış ifadeyle parti halinde executemany
+- Sınır kutusu, yarıçap ve en yakın komşu sorguları R-ağacı üzerinden
+
+Loads point datasets into an indexed local database for repeated
+querying: OGC GeoPackage layout (readable by GDAL/QGIS), the
+gpkg_rtree_index extension on an SQLite R*Tree virtual table, bulk loads
+through batched executemany on one prepared statement inside a single
+WAL transaction, and bbox/radius/nearest queries through the R-tree
+instead of rescanning text files.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sqlite3
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from itertools import chain, repeat
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from geographic_center import EARTH_RADIUS_KM, haversine_many
+
+APPLICATION_ID = 0x47504B47  # 'GPKG'
+USER_VERSION = 10300         # GeoPackage 1.3
+SRS_ID = 4326
+BATCH_SIZE = 50000
+
+# GP başlığı (zarfsız, little-endian) + WKB Point / GP header (no envelope, LE) + WKB Point
+_POINT = struct.Struct('<2sBBiBIdd')
+_ENVELOPE_BYTES = (0, 32, 48, 48, 64)
+_NATIVE_TYPES = (str, int, float, bool, type(None))
+_KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+_SCHEMA = """
+CREATE TABLE gpkg_spatial_ref_sys (
+    srs_name TEXT NOT NULL, srs_id INTEGER PRIMARY KEY, organization TEXT NOT NULL,
+    organization_coordsys_id INTEGER NOT NULL, definition TEXT NOT NULL, description TEXT);
+CREATE TABLE gpkg_contents (
+    table_name TEXT NOT NULL PRIMARY KEY, data_type TEXT NOT NULL, identifier TEXT UNIQUE,
+    description TEXT DEFAULT '',
+    last_change DATETIME NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+    min_x DOUBLE, min_y DOUBLE, max_x DOUBLE, max_y DOUBLE,
+    srs_id INTEGER, CONSTRAINT fk_gc_r_srs_id FOREIGN KEY (srs_id) REFERENCES gpkg_spatial_ref_sys(srs_id));
+CREATE TABLE gpkg_geometry_columns (
+    table_name TEXT NOT NULL, column_name TEXT NOT NULL, geometry_type_name TEXT NOT NULL,
+    srs_id INTEGER NOT NULL, z TINYINT NOT NULL, m TINYINT NOT NULL,
+    CONSTRAINT pk_geom_cols PRIMARY KEY (table_name, column_name),
+    CONSTRAINT fk_gc_tn FOREIGN KEY (table_name) REFERENCES gpkg_contents(table_name),
+    CONSTRAINT fk_gc_srs FOREIGN KEY (srs_id) REFERENCES gpkg_spatial_ref_sys (srs_id));
+CREATE TABLE gpkg_extensions (
+    table_name TEXT, column_name TEXT, extension_name TEXT NOT NULL,
+    definition TEXT NOT NULL, scope TEXT NOT NULL,
+    CONSTRAINT ge_tce UNIQUE (table_name, column_name, extension_name));
+INSERT INTO gpkg_spatial_ref_sys VALUES
+    ('Undefined cartesian SRS', -1, 'NONE', -1, 'undefined', 'undefined cartesian coordinate reference system'),
+    ('Undefined geographic SRS', 0, 'NONE', 0, 'undefined', 'undefined geographic coordinate reference system'),
+    ('WGS 84 geodetic', 4326, 'EPSG', 4326,
+     'GEOGCS["WGS 84",DATUM["WGS_1984",SPHEROID["WGS 84",6378137,298.257223563,AUTHORITY["EPSG","7030"]],AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,AUTHORITY["EPSG","8901"]],UNIT["degree",0.0174532925199433,AUTHORITY["EPSG","9122"]],AUTHORITY["EPSG","4326"]]',
+     'longitude/latitude coordinates in decimal degrees on the WGS 84 spheroid');
+"""
+
+_TRIGGER_SUFFIXES = ('insert', 'update1', 'update2', 'update3', 'update4', 'delete')
+
+# GeoPackage 1.3 R-ağacı tetikleyicileri / GeoPackage 1.3 R-tree triggers
+_RTREE_TRIGGERS = """
+CREATE TRIGGER "{r}_insert" AFTER INSERT ON "{t}"
+  WHEN (new."{c}" NOT NULL AND NOT ST_IsEmpty(NEW."{c}"))
+BEGIN
+  INSERT OR REPLACE INTO "{r}" VALUES (NEW."{i}", ST_MinX(NEW."{c}"), ST_MaxX(NEW."{c}"),
+                                       ST_MinY(NEW."{c}"), ST_MaxY(NEW."{c}"));
+END;
+CREATE TRIGGER "{r}_update1" AFTER UPDATE OF "{c}" ON "{t}"
+  WHEN OLD."{i}" = NEW."{i}" AND (NEW."{c}" NOTNULL AND NOT ST_IsEmpty(NEW."{c}"))
+BEGIN
+  INSERT OR REPLACE INTO "{r}" VALUES (NEW."{i}", ST_MinX(NEW."{c}"), ST_MaxX(NEW."{c}"),
+                                       ST_MinY(NEW."{c}"), ST_MaxY(NEW."{c}"));
+END;
+CREATE TRIGGER "{r}_update2" AFTER UPDATE OF "{c}" ON "{t}"
+  WHEN OLD."{i}" = NEW."{i}" AND (NEW."{c}" IS NULL OR ST_IsEmpty(NEW."{c}"))
+BEGIN
+  DELETE FROM "{r}" WHERE id = OLD."{i}";
+END;
+CREATE TRIGGER "{r}_update3" AFTER UPDATE ON "{t}"
+  WHEN OLD."{i}" != NEW."{i}" AND (NEW."{c}" NOTNULL AND NOT ST_IsEmpty(NEW."{c}"))
+BEGIN
+  DELETE FROM "{r}" WHERE id = OLD."{i}";
+  INSERT OR REPLACE INTO "{r}" VALUES (NEW."{i}", ST_MinX(NEW."{c}"), ST_MaxX(NEW."{c}"),
+                                       ST_MinY(NEW."{c}"), ST_MaxY(NEW."{c}"));
+END;
+CREATE TRIGGER "{r}_update4" AFTER UPDATE ON "{t}"
+  WHEN OLD."{i}" != NEW."{i}" AND (NEW."{c}" IS NULL OR ST_IsEmpty(NEW."{c}"))
+BEGIN
+  DELETE FROM "{r}" WHERE id IN (OLD."{i}", NEW."{i}");
+END;
+CREATE TRIGGER "{r}_delete" AFTER DELETE ON "{t}"
+  WHEN old."{c}" NOT NULL
+BEGIN
+  DELETE FROM "{r}" WHERE id = OLD."{i}";
+END;
+"""
+
+
+def _quote(name: str) -> str:
+    """SQL tanımlayıcısını tırnakla / Quote an SQL identifier"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def table_name_for(file_path: str) -> str:
+    """Dosya adından geçerli bir tablo adı türet / Derive a table name from a file name"""
+    name = re.sub(r'\W', '_', os.path.splitext(os.path.basename(file_path))[0]) or 'points'
+    return name if not name[0].isdigit() else f"t_{name}"
+
+
+def encode_point(lon: float, lat: float, srs_id: int = SRS_ID) -> bytes:
+    """GeoPackage Point geometri blob'u / GeoPackage Point geometry blob"""
+    return _POINT.pack(b'GP', 0, 1, srs_id, 1, 1, lon, lat)
+
+
+def decode_point(blob: Optional[bytes]) -> Optional[Tuple[float, float]]:
+    """
+    GeoPackage geometri blob'undan (lon, lat); boş ya da Point değilse None
+    (lon, lat) from a GeoPackage geometry blob; None if empty or not a Point
+    """
+    if blob is None:
+        return None
+    if len(blob) == _POINT.size and blob[3] == 1 and blob[8] == 1:
+        values = _POINT.unpack(blob)
+        if values[0] != b'GP' or values[5] != 1:
+            return None
+        return values[6], values[7]
+    if blob[:2] != b'GP' or blob[3] & 0x10:
+        return None
+    offset = 8 + _ENVELOPE_BYTES[(blob[3] >> 1) & 7]
+    order = '<' if blob[offset] == 1 else '>'
+    (geometry_type,) = struct.unpack_from(order + 'I', blob, offset + 1)
+    if geometry_type % 1000 != 1:
+        return None
+    x, y = struct.unpack_from(order + 'dd', blob, offset + 5)
+    if math.isnan(x) and math.isnan(y):
+        return None
+    return x, y
+
+
+def _float32_bounds(values: array) -> Tuple[array, array]:
+    """
+    float32'ye aşağı ve yukarı yuvarlanmış kopyalar (R-ağacı kutuları için)
+    Copies rounded down and up to float32 (for R-tree boxes)
+
+    SQLite R*Tree koordinatları float32 saklar; kutunun gerçek noktayı
+    kapsaması için alt sınır aşağı, üst sınır yukarı yuvarlanır (bit
+    düzeyinde bir adım; sıfırda en küçük alt-normal değer).
+    SQLite's R*Tree stores float32 coordinates; lower bounds are rounded
+    down and upper bounds up so the box still contains the exact point
+    (one step at the bit level; the smallest subnormal around zero).
+    """
+    nearest = array('f', values)
+    bits = array('i', nearest.tobytes())
+    down = array('i', [b if r <= e else b - 1 if r > 0 else b + 1 if r < 0 else -0x7fffffff
+                       for e, r, b in zip(values, nearest, bits)])
+    up = array('i', [b if r >= e else b + 1 if r > 0 else b - 1 if r < 0 else 1
+                     for e, r, b in zip(values, nearest, bits)])
+    return array('f', down.tobytes()), array('f', up.tobytes())
+
+
+def bulk_build_rtree(conn: sqlite3.Connection, rtree: str, ids: array,
+                     xs: array, ys: array) -> None:
+    """
+    Boş bir R*Tree'yi noktalardan STR (Sort-Tile-Recursive) ile toplu kur
+    Bulk-build an empty R*Tree from points with Sort-Tile-Recursive packing
+
+    Sanal tabloya satır satır eklemek (düğüm bölme, yeniden ekleme) yerine
+    gölge tablolar (_node, _rowid, _parent) doğrudan yazılır; sanal tablo
+    bu bağlantıda henüz açılmamış olmalıdır.
+    Instead of row-by-row inserts into the virtual table (node splits,
+    forced reinserts) the shadow tables (_node, _rowid, _parent) are written
+    directly; the virtual table must not have been opened on this connection.
+    """
+    n = len(ids)
+    if not n:
+        return
+    node_size = conn.execute(f"SELECT length(data) FROM {_quote(rtree + '_node')} "
+                             f"WHERE nodeno = 1").fetchone()[0]
+    capacity = (node_size - 4) // 24
+    min_x, max_x = _float32_bounds(xs)
+    min_y, max_y = _float32_bounds(ys)
+
+    def str_tiles(items: List, count: int, x_key, y_key) -> List[List]:
+        """x'e göre dilimle, her dilimi y'ye göre sırala / Slice by x, sort slices by y"""
+        items = sorted(items, key=x_key)
+        slice_size = math.ceil(math.sqrt(math.ceil(count / capacity))) * capacity
+        tiles = []
+        for start in range(0, count, slice_size):
+            strip = sorted(items[start:start + slice_size], key=y_key)
+            tiles.extend(strip[offset:offset + capacity]
+                         for offset in range(0, len(strip), capacity))
+        return tiles
+
+    node_sql = f"INSERT OR REPLACE INTO {_quote(rtree + '_node')} VALUES (?, ?)"
+    rowid_sql = f"INSERT INTO {_quote(rtree + '_rowid')} (rowid, nodeno) VALUES (?, ?)"
+    parent_sql = f"INSERT INTO {_quote(rtree + '_parent')} VALUES (?, ?)"
+    columns = (ids, min_x, max_x, min_y, max_y)
+    level = str_tiles(range(n), n, xs.__getitem__, ys.__getitem__)
+    next_nodeno = 2
+    depth = 0
+    while True:
+        is_root = len(level) == 1
+        boxes = []
+        # Düğümler paketlenip hemen yazılır; bellekte yalnızca kutular kalır
+        # Nodes are packed and written at once; only their boxes stay in memory
+        for group in level:
+            if depth == 0:
+                cells = list(zip(*(map(column.__getitem__, group) for column in columns)))
+            else:
+                cells = group
+            if is_root:
+                nodeno = 1
+            else:
+                nodeno = next_nodeno
+                next_nodeno += 1
+            data = struct.pack(f'>HH{len(cells) * "q4f"}', depth if is_root else 0,
+                               len(cells), *chain.from_iterable(cells))
+            conn.execute(node_sql, (nodeno, data + bytes(node_size - len(data))))
+            conn.executemany(parent_sql if depth else rowid_sql,
+                             zip(map(itemgetter(0), cells), repeat(nodeno)))
+            boxes.append((nodeno, min(map(itemgetter(1), cells)), max(map(itemgetter(2), cells)),
+                          min(map(itemgetter(3), cells)), max(map(itemgetter(4), cells))))
+        if is_root:
+            break
+        # Üst düzey: kutu merkezleriyle aynı paketleme / Same packing on box centres
+        level = str_tiles(boxes, len(boxes), lambda b: b[1] + b[2], lambda b: b[3] + b[4])
+        depth += 1
+
+
+def _sql_type(value) -> str:
+    """Değerin sütun türü / Column type for a value"""
+    if isinstance(value, (bool, int)):
+        return 'INTEGER'
+    if isinstance(value, float):
+        return 'REAL'
+    return 'TEXT'
+
+
+def _adapt(value):
+    """SQLite'ın saklayamadığı değerleri JSON metnine çevir / JSON-encode unsupported values"""
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _st_functions(conn: sqlite3.Connection) -> None:
+    """
+    R-ağacı tetikleyicilerinin kullandığı ST_* işlevlerini kaydet
+    Register the ST_* functions used by the R-tree triggers
+    """
+    def coordinate(index: int):
+        def func(blob):
+            point = decode_point(blob)
+            return None if point is None else point[index]
+        return func
+
+    conn.create_function('ST_IsEmpty', 1, lambda blob: int(decode_point(blob) is None),
+                         deterministic=True)
+    for name, index in (('ST_MinX', 0), ('ST_MaxX', 0), ('ST_MinY', 1), ('ST_MaxY', 1)):
+        conn.create_function(name, 1, coordinate(index), deterministic=True)
+
+
+class GeoPackage:
+    """
+    GeoPackage içindeki tek bir nokta tablosu
+    A single point table inside a GeoPackage
+
+    Attributes:
+        path (str): Veritabanı dosyası / Database file
+        table (str): Feature tablosu / Feature table
+        geometry_column (str): Geometri sütunu / Geometry column
+        columns (List[str]): Özellik sütunları / Property columns
+    """
+
+    def __init__(self, path: str, table: Optional[str] = None):
+        """
+        Var olan bir GeoPackage/SQLite dosyasını aç
+        Open an existing GeoPackage/SQLite file
+
+        Raises:
+            ValueError: Dosyada nokta tablosu yoksa / If no feature table is found
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        _st_functions(self.conn)
+        try:
+            rows = self.conn.execute(
+                "SELECT table_name, column_name FROM gpkg_geometry_columns ORDER BY table_name"
+            ).fetchall()
+        except sqlite3.DatabaseError as e:
+            self.conn.close()
+            raise ValueError(f"Not a GeoPackage: {path} ({e})")
+        if table is not None:
+            rows = [row for row in rows if row[0] == table]
+        if not rows:
+            self.conn.close()
+            raise ValueError(f"No feature table {table!r} in {path}" if table
+                             else f"No feature table in {path}")
+        self.table, self.geometry_column = rows[0]
+        self._load_columns()
+
+    def _load_columns(self) -> None:
+        info = self.conn.execute(f"PRAGMA table_info({_quote(self.table)})").fetchall()
+        self.fid_column = next((row[1] for row in info if row[5]), 'fid')
+        self.columns = [row[1] for row in info
+                        if row[1] not in (self.fid_column, self.geometry_column)]
+        self.rtree = f"rtree_{self.table}_{self.geometry_column}"
+        self.has_rtree = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.rtree,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute(f"SELECT count(*) FROM {_quote(self.table)}").fetchone()[0]
+
+    def __enter__(self) -> 'GeoPackage':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Bağlantıyı kapat / Close the connection"""
+        self.conn.close()
+
+    @classmethod
+    def create(cls, path: str, table: str, columns: Optional[Dict[str, str]] = None,
+               srs_id: int = SRS_ID) -> 'GeoPackage':
+        """
+        Yeni GeoPackage oluştur (var olan dosyanın üzerine yazılır)
+        Create a new GeoPackage (an existing file is replaced)
+
+        Args:
+            path (str): Çıkış dosyası / Output file
+            table (str): Feature tablosu / Feature table
+            columns (Dict[str, str]): Sütun adı -> SQL türü / Column name -> SQL type
+            srs_id (int): Koordinat sistemi / Spatial reference system id
+        """
+        for suffix in ('', '-wal', '-shm', '-journal'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        conn = sqlite3.connect(path, isolation_level=None)
+        conn.execute(f"PRAGMA application_id = {APPLICATION_ID}")
+        conn.execute(f"PRAGMA user_version = {USER_VERSION}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(_SCHEMA)
+        column_sql = ''.join(f", {_quote(name)} {sql_type}"
+                             for name, sql_type in (columns or {}).items())
+        rtree = f"rtree_{table}_geom"
+        conn.executescript(f"""
+            CREATE TABLE {_quote(table)} (fid INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+                                          geom POINT{column_sql});
+            CREATE VIRTUAL TABLE {_quote(rtree)} USING rtree(id, minx, maxx, miny, maxy);
+        """)
+        conn.execute("INSERT INTO gpkg_contents (table_name, data_type, identifier, srs_id) "
+                     "VALUES (?, 'features', ?, ?)", (table, table, srs_id))
+        conn.execute("INSERT INTO gpkg_geometry_columns VALUES (?, 'geom', 'POINT', ?, 0, 0)",
+                     (table, srs_id))
+        conn.execute("INSERT INTO gpkg_extensions VALUES (?, 'geom', 'gpkg_rtree_index', "
+                     "'http://www.geopackage.org/spec120/#extension_rtree', 'write-only')",
+                     (table,))
+        conn.close()
+        return cls(path, table)
+
+    def _add_column(self, name: str, sample) -> None:
+        self.conn.execute(f"ALTER TABLE {_quote(self.table)} "
+                          f"ADD COLUMN {_quote(name)} {_sql_type(sample)}")
+        self.columns.append(name)
+
+    def bulk_load(self, records: Iterable[Tuple[float, float, Dict]],
+                  batch_size: int = BATCH_SIZE) -> int:
+        """
+        (lon, lat, özellikler) kayıtlarını tek işlemde toplu yükle
+        Bulk-load (lon, lat, properties) records in one transaction
+
+        Özellik değerleri str, int, float, bool veya None olmalıdır.
+        Property values must be str, int, float, bool or None.
+
+        Tablo partiler halinde hazırlanmış ifadeyle executemany ile doldurulur.
+        R-ağacı boşsa sonunda STR ile toplu kurulur, değilse aynı partilerle
+        eklenir; tetikleyiciler yükleme bittikten sonra kurulur. Yeni özellik
+        anahtarları görüldükçe sütun eklenir; sonlu olmayan koordinatlar atlanır.
+        The table is filled batch by batch through executemany on a prepared
+        statement. An empty R-tree is bulk-built with STR at the end, otherwise
+        it gets the same batches; the triggers are created after the load. New
+        property keys add columns as they appear; non-finite coordinates are
+        skipped.
+
+        Returns:
+            int: Yüklenen nokta sayısı / Number of points loaded
+        """
+        conn = self.conn
+        table, rtree = _quote(self.table), _quote(self.rtree)
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA cache_size = -131072")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        fid = conn.execute(f"SELECT coalesce(max({_quote(self.fid_column)}), 0) "
+                           f"FROM {table}").fetchone()[0]
+        start_fid = fid
+        pack = _POINT.pack
+        isfinite = math.isfinite
+        srs_id = conn.execute("SELECT srs_id FROM gpkg_geometry_columns WHERE table_name = ?",
+                              (self.table,)).fetchone()[0]
+        rtree_sql = f"INSERT INTO {rtree} VALUES (?, ?, ?, ?, ?)"
+        bulk = not conn.execute(f"SELECT EXISTS (SELECT 1 FROM {_quote(self.rtree + '_rowid')})"
+                                ).fetchone()[0]
+        triggers = [f"{self.rtree}_{suffix}" for suffix in _TRIGGER_SUFFIXES]
+        has_triggers = conn.execute("SELECT EXISTS (SELECT 1 FROM sqlite_master WHERE "
+                                    "type = 'trigger' AND name = ?)", (triggers[0],)).fetchone()[0]
+        # Toplu kurulumda tetikleyiciler kaldırılıp sonra yeniden kurulur; aksi
+        # halde varsa R-ağacını onlar günceller
+        # The bulk path drops the triggers and recreates them afterwards;
+        # otherwise existing triggers keep the R-tree up to date
+        manual_boxes = not bulk and not has_triggers
+        xs, ys = array('d'), array('d')
+        known = set(self.columns)
+        rows, boxes = [], []
+
+        def insert_sql() -> str:
+            names = ''.join(', ' + _quote(name) for name in self.columns)
+            marks = ', ?' * len(self.columns)
+            return (f"INSERT INTO {table} ({_quote(self.fid_column)}, "
+                    f"{_quote(self.geometry_column)}{names}) VALUES (?, ?{marks})")
+
+        def flush() -> None:
+            if rows:
+                conn.executemany(sql, rows)
+                rows.clear()
+            if boxes:
+                conn.executemany(rtree_sql, boxes)
+                boxes.clear()
+
+        sql = insert_sql()
+        columns = self.columns
+        conn.execute("BEGIN")
+        try:
+            if bulk:
+                for name in triggers:
+                    conn.execute(f"DROP TRIGGER IF EXISTS {_quote(name)}")
+            for lon, lat, properties in records:
+                if not (isfinite(lon) and isfinite(lat)):
+                    continue
+                if not known.issuperset(properties):
+                    flush()
+                    for key, value in properties.items():
+                        if key not in known:
+                            self._add_column(key, value)
+                            known.add(key)
+                    sql = insert_sql()
+                fid += 1
+                rows.append((fid, pack(b'GP', 0, 1, srs_id, 1, 1, lon, lat),
+                             *map(properties.get, columns)))
+                if bulk:
+                    xs.append(lon)
+                    ys.append(lat)
+                elif manual_boxes:
+                    boxes.append((fid, lon, lon, lat, lat))
+                if len(rows) >= batch_size:
+                    flush()
+            flush()
+            if bulk:
+                bulk_build_rtree(conn, self.rtree, array('q', range(start_fid + 1, fid + 1)),
+                                 xs, ys)
+            self._finish_load()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return fid - start_fid
+
+    def _finish_load(self) -> None:
+        """Tetikleyicileri kur ve kapsam kutusunu güncelle / Add triggers, update extent"""
+        conn = self.conn
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+                              (f"{self.rtree}_insert",)).fetchone()
+        if not exists:
+            script = _RTREE_TRIGGERS.format(r=self.rtree, t=self.table,
+                                            c=self.geometry_column, i=self.fid_column)
+            # executescript açık işlemi işlerdi; tetikleyiciler tek tek kurulur
+            # executescript would commit the open transaction; run one by one
+            for statement in script.split('\nEND;')[:-1]:
+                conn.execute(statement + '\nEND;')
+        extent = conn.execute(f"SELECT min(minx), min(miny), max(maxx), max(maxy) "
+                              f"FROM {_quote(self.rtree)}").fetchone()
+        conn.execute("UPDATE gpkg_contents SET min_x = ?, min_y = ?, max_x = ?, max_y = ?, "
+                     "last_change = ? WHERE table_name = ?",
+                     (*extent, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()), self.table))
+
+    @classmethod
+    def from_rows(cls, path: str, rows: Iterable[Dict], table: str,
+                  lat_key: str = 'latitude', lon_key: str = 'longitude',
+                  batch_size: int = BATCH_SIZE) -> 'GeoPackage':
+        """
+        CSV benzeri satırlardan GeoPackage kur (hatalı koordinatlı satırlar atlanır)
+        Build a GeoPackage from CSV-like rows (rows with bad coordinates are skipped)
+        """
+        def records() -> Iterator[Tuple[float, float, Dict]]:
+            for row in rows:
+                try:
+                    lat = float(row.pop(lat_key, 0))
+                    lon = float(row.pop(lon_key, 0))
+                except (TypeError, ValueError):
+                    continue
+                yield lon, lat, row
+
+        package = cls.create(path, table)
+        package.bulk_load(records(), batch_size)
+        return package
+
+    @classmethod
+    def from_features(cls, path: str, features: Iterable[Dict], table: str,
+                      batch_size: int = BATCH_SIZE) -> 'GeoPackage':
+        """
+        Point feature'larından GeoPackage kur (diğer geometriler atlanır)
+        Build a GeoPackage from Point features (other geometries are skipped)
+        """
+        def records() -> Iterator[Tuple[float, float, Dict]]:
+            for feature in features:
+                geometry = feature.get('geometry') or {}
+                if geometry.get('type') != 'Point':
+                    continue
+                coords = geometry.get('coordinates')
+                properties = feature.get('properties') or {}
+                if not all(isinstance(v, _NATIVE_TYPES) for v in properties.values()):
+                    properties = {k: v if isinstance(v, _NATIVE_TYPES) else _adapt(v)
+                                  for k, v in properties.items()}
+                yield float(coords[0]), float(coords[1]), properties
+
+        package = cls.create(path, table)
+        package.bulk_load(records(), batch_size)
+        return package
+
+    def bbox(self) -> Optional[Tuple[float, float, float, float]]:
+        """(min_lon, min_lat, max_lon, max_lat) veya boşsa None"""
+        extent = self.conn.execute(
+            "SELECT min_x, min_y, max_x, max_y FROM gpkg_contents WHERE table_name = ?",
+            (self.table,)
+        ).fetchone()
+        return tuple(extent) if extent and extent[0] is not None else None
+
+    def _select(self, where: str = '', params: Tuple = ()) -> Iterator[Tuple]:
+        """(lon, lat, özellikler) üret / Yield (lon, lat, properties)"""
+        names = self.columns
+        select = ', '.join(['t.' + _quote(self.geometry_column)]
+                           + ['t.' + _quote(name) for name in names])
+        if where:
+            if not self.has_rtree:
+                raise ValueError(f"No R-tree index on {self.table}")
+            sql = (f"SELECT {select} FROM {_quote(self.table)} t JOIN {_quote(self.rtree)} r "
+                   f"ON t.{_quote(self.fid_column)} = r.id WHERE {where} "
+                   f"ORDER BY t.{_quote(self.fid_column)}")
+        else:
+            sql = f"SELECT {select} FROM {_quote(self.table)} t"
+        for row in self.conn.execute(sql, params):
+            point = decode_point(row[0])
+            if point is None:
+                continue
+            yield point[0], point[1], {name: value for name, value in zip(names, row[1:])
+                                       if value is not None}
+
+    def _bbox_where(self, min_lon: float, min_lat: float,
+                    max_lon: float, max_lat: float) -> Tuple[str, Tuple]:
+        return ("r.minx <= ? AND r.maxx >= ? AND r.miny <= ? AND r.maxy >= ?",
+                (max_lon, min_lon, max_lat, min_lat))
+
+    def iter_rows(self, lat_key: str = 'latitude', lon_key: str = 'longitude') -> Iterator[Dict]:
+        """
+        Noktaları satır sözlükleri olarak üret (boş değerler atlanır)
+        Yield points as row dicts (null values are omitted)
+        """
+        for lon, lat, row in self._select():
+            row[lat_key] = lat
+            row[lon_key] = lon
+            yield row
+
+    @staticmethod
+    def _feature(lon: float, lat: float, properties: Dict) -> Dict:
+        return {
+            "type": "Feature",
+            "properties": properties,
+            "geometry": {"type": "Point", "coordinates": [lon, lat]}
+        }
+
+    def iter_features(self) -> Iterator[Dict]:
+        """Noktaları GeoJSON Point feature'ları olarak üret / Yield GeoJSON Point features"""
+        for lon, lat, properties in self._select():
+            yield self._feature(lon, lat, properties)
+
+    def query_bbox(self, min_lon: float, min_lat: float,
+                   max_lon: float, max_lat: float) -> List[Dict]:
+        """
+        Sınır kutusundaki noktalar (R-ağacı üzerinden)
+        Points inside a bounding box (through the R-tree)
+
+        Returns:
+            List[Dict]: Eşleşen feature'lar / Matching features
+        """
+        where, params = self._bbox_where(min_lon, min_lat, max_lon, max_lat)
+        return [self._feature(*record) for record in self._select(where, params)]
+
+    def query_radius(self, lat: float, lon: float, radius_km: float) -> List[Tuple[float, Dict]]:
+        """
+        Noktaya radius_km içindeki noktalar (mesafeye göre sıralı)
+        Points within radius_km of a point, sorted by distance
+
+        Aday noktalar yarıçapı kapsayan kutuyla R-ağacından alınır.
+        Candidates come from the R-tree with a box enclosing the radius.
+
+        Returns:
+            List[Tuple]: (mesafe km, feature) çiftleri / (distance km, feature) pairs
+        """
+        dlat = radius_km / _KM_PER_DEGREE
+        edge = min(89.9, abs(lat) + dlat)
+        dlon = min(180.0, dlat / math.cos(math.radians(edge)))
+        where, params = self._bbox_where(lon - dlon, lat - dlat, lon + dlon, lat + dlat)
+        candidates = list(self._select(where, params))
+        distances = haversine_many(lat, lon, [c[1] for c in candidates],
+                                   [c[0] for c in candidates])
+        matches = sorted((dist, i) for i, dist in enumerate(distances) if dist <= radius_km)
+        return [(round(dist, 3), self._feature(*candidates[i])) for dist, i in matches]
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> List[Tuple[float, Dict]]:
+        """
+        En yakın k nokta: arama yarıçapı k aday bulunana kadar büyütülür
+        The k nearest points: the search radius grows until k are found
+
+        Returns:
+            List[Tuple]: (mesafe km, feature) çiftleri / (distance km, feature) pairs
+        """
+        radius = 10.0
+        half_circumference = math.pi * EARTH_RADIUS_KM
+        while True:
+            matches = self.query_radius(lat, lon, radius)
+            if len(matches) >= k or radius >= half_circumference:
+                return matches[:k]
+            radius = min(radius * 4, half_circumference)
+
+
+def self_check(points: int = 3000, seed: int = 19) -> Dict[str, Dict]:
+    """
+    Boş tabloya, dolu tabloya (tetikleyicili ve tetikleyicisiz) yükleme öz denetimi
+    Self-check of loading into an empty table and appending to a filled one
+    (with and without R-tree triggers)
+
+    Returns:
+        Dict: Denetim adı -> {"value", "limit", "ok"} / Check name -> {"value", "limit", "ok"}
+    """
+    rng = random.Random(seed)
+    results: Dict[str, Dict] = {}
+
+    def record(name: str, value: float, limit: float) -> None:
+        results[name] = {"value": value, "limit": limit, "ok": value <= limit}
+
+    def batch(count: int, extra: Optional[str] = None) -> List[Tuple[float, float, Dict]]:
+        rows = []
+        for i in range(count):
+            properties = {"name": f"p{len(loaded) + i}"}
+            if extra:
+                properties[extra] = i
+            rows.append((rng.uniform(25.6, 44.8), rng.uniform(35.8, 42.1), properties))
+        loaded.extend(rows)
+        return rows
+
+    def verify(stage: str) -> None:
+        rtree_rows = package.conn.execute(
+            f"SELECT count(*) FROM {_quote(package.rtree)}").fetchone()[0]
+        record(f'{stage}.row_count_error', abs(len(package) - len(loaded)), 0)
+        record(f'{stage}.rtree_count_error', abs(rtree_rows - len(loaded)), 0)
+        box = (30.0, 37.0, 36.0, 40.0)
+        expected = sorted(p["name"] for lon, lat, p in loaded
+                          if box[0] <= lon <= box[2] and box[1] <= lat <= box[3])
+        got = sorted(f["properties"]["name"] for f in package.query_bbox(*box))
+        record(f'{stage}.bbox_mismatches', len(set(expected) ^ set(got)), 0)
+
+    loaded: List[Tuple[float, float, Dict]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'check.gpkg')
+        package = GeoPackage.create(path, 'points')
+        try:
+            package.bulk_load(batch(points), batch_size=700)
+            verify('empty')
+            package.bulk_load(batch(points // 2, 'extra'), batch_size=700)
+            verify('append_triggers')
+        finally:
+            package.close()
+        package = GeoPackage(path)
+        try:
+            for suffix in _TRIGGER_SUFFIXES:
+                package.conn.execute(
+                    f"DROP TRIGGER IF EXISTS {_quote(f'{package.rtree}_{suffix}')}")
+            package.bulk_load(batch(points // 3), batch_size=700)
+            verify('append_manual')
+        finally:
+            package.close()
+    return results
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description='GeoPackage nokta deposu / GeoPackage point store')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Yükleme ve ekleme denetimi / Load and append check')
+    args = parser.parse_args()
+
+    if not args.self_check:
+        parser.print_help()
+        return
+    print("\n🧪 GEOPACKAGE ÖZ DENETİMİ / GEOPACKAGE SELF-CHECK")
+    print("-" * 70)
+    results = self_check()
+    for name, result in results.items():
+        mark = '✅' if result['ok'] else '❌'
+        print(f"  {mark} {name:<34} {result['value']:>6}  (≤ {result['limit']})")
+    if not all(result['ok'] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,563 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Geohash/Altıgen Izgara Toplama
+Turkey's Geographic Center - Geohash/Hexagonal Grid Aggregation
+
+Milyonlarca noktayı tek akış geçişinde birden çok çözünürlükte ızgara
+hücrelerine sayar ve ısı haritaları için çözünürlük başına kompakt GeoJSON
+yazar:
+- geohash: hücre kimliği, bitleri iç içe geçirilmiş tamsayıdır (Morton);
+  yalnızca en ince çözünürlük hesaplanır, kaba çözünürlükler bit kaydırmayla
+  elde edilir (geohash önek özelliği)
+- hex: Türkiye merkezli eş-alan LAEA düzleminde sivri tepeli altıgenler;
+  çözünürlük r'de kenar HEX_BASE_KM / 2^r, (q, r) eksen koordinatları tek
+  64 bitlik tamsayıya paketlenir; tüm hücreler gerçekten eşit alanlıdır
+- Sayaçlar çözünürlük başına düz, tamsayı anahtarlı Counter'lardır (iç içe
+  sözlük yok); kalıcı biçim sıralı kimlik/sayı dizileridir ve paralel
+  parçaların (shard) çıktıları toplanarak birleştirilebilir
+
+Counts millions of points into grid cells at several resolutions in one
+streaming pass and writes a compact GeoJSON per resolution for heatmaps.
+Geohash cells are bit-interleaved (Morton) integers; only the finest
+resolution is computed and coarser ones are plain bit shifts thanks to the
+geohash prefix property. Hex cells are pointy-top hexagons on the
+Turkey-centred equal-area LAEA plane with an edge of HEX_BASE_KM / 2^r at
+resolution r, their axial (q, r) coordinates packed into one 64-bit
+integer, so every cell has the same true area. Counters are flat
+integer-keyed Counters per resolution rather than nested dicts; the
+persisted form is sorted id/count arrays, and aggregates of parallel
+shards merge by adding counts.
+
+H3 bağımlılığı gerektirmez / Needs no H3 dependency.
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from array import array
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from geographic_center import AUTHALIC_RADIUS_M
+from projections import transform
+
+GRIDS = ('geohash', 'hex')
+DEFAULT_RESOLUTIONS = {'geohash': (4, 5, 6), 'hex': (2, 4, 6)}
+MAX_RESOLUTION = {'geohash': 9, 'hex': 12}
+
+GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+# Çözünürlük 0 altıgen kenarı; her çözünürlükte yarıya iner (6: 1 km, 12: 15.6 m)
+# Resolution 0 hexagon edge; halves at every resolution (6: 1 km, 12: 15.6 m)
+HEX_BASE_KM = 64.0
+HEX_PROJECTION = 'laea'
+_HEX_OFFSET = 1 << 31
+_SQRT3 = math.sqrt(3.0)
+
+AGGREGATE_VERSION = 1
+
+
+def _spread_table() -> List[int]:
+    """8 bitlik değerin bitlerini çift konumlara yay / Spread 8-bit values onto even bit positions"""
+    table = []
+    for value in range(256):
+        spread = 0
+        for bit in range(8):
+            if value >> bit & 1:
+                spread |= 1 << (2 * bit)
+        table.append(spread)
+    return table
+
+
+_SPREAD = _spread_table()
+# Bayttaki çift konumlu 4 bit / The 4 even-position bits of a byte
+_GATHER = [sum((value >> (2 * bit) & 1) << bit for bit in range(4)) for value in range(256)]
+
+
+def _compact(value: int) -> int:
+    """Çift konumlu bitleri topla (_SPREAD tersi) / Gather even-position bits (inverse of _SPREAD)"""
+    g = _GATHER
+    return (g[value & 255] | g[value >> 8 & 255] << 4 | g[value >> 16 & 255] << 8 |
+            g[value >> 24 & 255] << 12 | g[value >> 32 & 255] << 16 | g[value >> 40 & 255] << 20)
+
+
+def geohash_ids(lats: Sequence[float], lons: Sequence[float], precision: int) -> List[int]:
+    """
+    Noktaların tamsayı geohash kimlikleri (5 × precision bit)
+    Integer geohash ids of points (5 × precision bits)
+
+    Bitler en anlamlıdan başlayarak boylam, enlem, boylam... sırasıyla iç içe
+    geçer; dolayısıyla kimlik geohash metninin base32 çözümüdür.
+    Bits interleave longitude, latitude, longitude... from the most
+    significant end, so the id is the base32 decoding of the geohash text.
+    """
+    bits = 5 * precision
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    lon_scale, lat_scale = (1 << lon_bits) / 360.0, (1 << lat_bits) / 180.0
+    lon_max, lat_max = (1 << lon_bits) - 1, (1 << lat_bits) - 1
+    # Tek bit sayısında son bit boylamdır / With an odd bit count the last bit is longitude
+    lon_shift, lat_shift = (0, 1) if bits % 2 else (1, 0)
+    s = _SPREAD
+    ids = []
+    append = ids.append
+    for lat, lon in zip(lats, lons):
+        x = int((lon + 180.0) * lon_scale)
+        y = int((lat + 90.0) * lat_scale)
+        if x > lon_max:
+            x = lon_max
+        if y > lat_max:
+            y = lat_max
+        append(((s[x & 255] | s[x >> 8 & 255] << 16 | s[x >> 16 & 255] << 32) << lon_shift) |
+               ((s[y & 255] | s[y >> 8 & 255] << 16 | s[y >> 16 & 255] << 32) << lat_shift))
+    return ids
+
+
+def geohash_text(cell: int, precision: int) -> str:
+    """Tamsayı kimliğin geohash metni / Geohash text of an integer id"""
+    return ''.join(GEOHASH_BASE32[cell >> (5 * (precision - 1 - k)) & 31] for k in range(precision))
+
+
+def geohash_bbox(cell: int, precision: int) -> Tuple[float, float, float, float]:
+    """
+    Geohash hücresinin sınır kutusu
+    Bounding box of a geohash cell
+
+    Returns:
+        Tuple: (min_lon, min_lat, max_lon, max_lat)
+    """
+    bits = 5 * precision
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    if bits % 2:
+        x, y = _compact(cell), _compact(cell >> 1)
+    else:
+        x, y = _compact(cell >> 1), _compact(cell)
+    lon_step, lat_step = 360.0 / (1 << lon_bits), 180.0 / (1 << lat_bits)
+    return (-180.0 + x * lon_step, -90.0 + y * lat_step,
+            -180.0 + (x + 1) * lon_step, -90.0 + (y + 1) * lat_step)
+
+
+def hex_edge_m(resolution: int) -> float:
+    """Çözünürlükteki altıgen kenarı (m) / Hexagon edge at a resolution (m)"""
+    return HEX_BASE_KM * 1000.0 / (1 << resolution)
+
+
+def hex_ids(xs: Sequence[float], ys: Sequence[float], edge_m: float) -> List[int]:
+    """
+    LAEA düzlemindeki noktaların paketlenmiş altıgen kimlikleri
+    Packed hexagon ids of points on the LAEA plane
+
+    Eksen koordinatları küp yuvarlamayla bulunur ve
+    ((q + 2^31) << 32) | (r + 2^31) olarak paketlenir.
+    Axial coordinates come from cube rounding and are packed as
+    ((q + 2^31) << 32) | (r + 2^31).
+    """
+    kq = _SQRT3 / 3.0 / edge_m
+    kr = 1.0 / 3.0 / edge_m
+    offset = _HEX_OFFSET
+    ids = []
+    append = ids.append
+    for x, y in zip(xs, ys):
+        qf = kq * x - kr * y
+        rf = 2.0 * kr * y
+        sf = -qf - rf
+        q, r, s = round(qf), round(rf), round(sf)
+        dq, dr, ds = abs(q - qf), abs(r - rf), abs(s - sf)
+        if dq > dr and dq > ds:
+            q = -r - s
+        elif dr > ds:
+            r = -q - s
+        append((q + offset) << 32 | (r + offset))
+    return ids
+
+
+def hex_axial(cell: int) -> Tuple[int, int]:
+    """Paketlenmiş kimlikten (q, r) / (q, r) from a packed id"""
+    return (cell >> 32) - _HEX_OFFSET, (cell & 0xFFFFFFFF) - _HEX_OFFSET
+
+
+def hex_center(q: int, r: int, edge_m: float) -> Tuple[float, float]:
+    """Altıgen merkezi (LAEA x, y) / Hexagon center (LAEA x, y)"""
+    return edge_m * _SQRT3 * (q + r / 2.0), edge_m * 1.5 * r
+
+
+class GridAggregator:
+    """
+    Çok çözünürlüklü ızgara sayacı
+    Multi-resolution grid counter
+
+    Attributes:
+        grid (str): 'geohash' veya 'hex'
+        resolutions (Tuple[int]): Artan çözünürlükler / Ascending resolutions
+        counters (Dict[int, Counter]): Çözünürlük -> hücre kimliği -> sayı
+            Resolution -> cell id -> count
+        points (int): Sayılan nokta / Points counted
+        skipped (int): Geçersiz koordinatlı nokta / Points with invalid coordinates
+    """
+
+    def __init__(self, grid: str = 'geohash', resolutions: Optional[Sequence[int]] = None):
+        if grid not in GRIDS:
+            raise ValueError(f"Bilinmeyen ızgara / Unknown grid: {grid} ({', '.join(GRIDS)})")
+        resolutions = tuple(sorted(set(resolutions or DEFAULT_RESOLUTIONS[grid])))
+        low = 1 if grid == 'geohash' else 0
+        if resolutions[0] < low or resolutions[-1] > MAX_RESOLUTION[grid]:
+            raise ValueError(f"{grid} çözünürlüğü / resolution must be in "
+                             f"{low}..{MAX_RESOLUTION[grid]}: {resolutions}")
+        self.grid = grid
+        self.resolutions = resolutions
+        self.counters: Dict[int, Counter] = {res: Counter() for res in resolutions}
+        self.points = 0
+        self.skipped = 0
+
+    def add(self, lats: Sequence[float], lons: Sequence[float]) -> int:
+        """
+        Bir nokta parçasını tüm çözünürlüklerde say
+        Count a chunk of points at every resolution
+
+        Returns:
+            int: Sayılan nokta / Points counted
+        """
+        valid = [(lat, lon) for lat, lon in zip(lats, lons)
+                 if -90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0]
+        self.skipped += len(lats) - len(valid)
+        if not valid:
+            return 0
+        lats, lons = zip(*valid)
+        if self.grid == 'geohash':
+            finest = self.resolutions[-1]
+            ids = geohash_ids(lats, lons, finest)
+            for res, counter in self.counters.items():
+                shift = 5 * (finest - res)
+                counter.update([cell >> shift for cell in ids] if shift else ids)
+            counted = len(ids)
+        else:
+            xs, ys = transform(lons, lats, 'wgs84', HEX_PROJECTION)
+            # LAEA antipodunda izdüşüm tanımsızdır (NaN/inf); toplam sonluysa tüm değerler sonludur
+            # The projection is undefined at the LAEA antipode (NaN/inf); a finite sum means all are finite
+            if not math.isfinite(sum(xs) + sum(ys)):
+                finite = [(x, y) for x, y in zip(xs, ys) if math.isfinite(x) and math.isfinite(y)]
+                self.skipped += len(xs) - len(finite)
+                if not finite:
+                    return 0
+                xs, ys = zip(*finite)
+            for res, counter in self.counters.items():
+                counter.update(hex_ids(xs, ys, hex_edge_m(res)))
+            counted = len(xs)
+        self.points += counted
+        return counted
+
+    def cells(self, resolution: int) -> Tuple[array, array]:
+        """
+        Sıralı hücre kimlikleri ve sayıları
+        Sorted cell ids and counts
+
+        Returns:
+            Tuple: (array('Q') kimlikler / ids, array('Q') sayılar / counts)
+        """
+        counter = self.counters[resolution]
+        ids = array('Q', sorted(counter))
+        return ids, array('Q', map(counter.__getitem__, ids))
+
+    def cell_code(self, resolution: int, cell: int) -> str:
+        """Okunabilir hücre kodu (geohash metni veya r/q/r) / Readable cell code"""
+        if self.grid == 'geohash':
+            return geohash_text(cell, resolution)
+        q, r = hex_axial(cell)
+        return f"{resolution}/{q}/{r}"
+
+    def merge(self, other: 'GridAggregator') -> 'GridAggregator':
+        """
+        Başka bir parçanın sayılarını ekle
+        Add the counts of another shard
+
+        Raises:
+            ValueError: Izgara veya çözünürlükler farklı / Grid or resolutions differ
+        """
+        if other.grid != self.grid or other.resolutions != self.resolutions:
+            raise ValueError(f"Uyumsuz toplamlar / Incompatible aggregates: "
+                             f"{self.grid}{list(self.resolutions)} vs {other.grid}{list(other.resolutions)}")
+        for res, counter in self.counters.items():
+            counter.update(other.counters[res])
+        self.points += other.points
+        self.skipped += other.skipped
+        return self
+
+    def to_dict(self) -> Dict:
+        """Birleştirilebilir kalıcı biçim / Mergeable persisted form"""
+        cells = {}
+        for res in self.resolutions:
+            ids, counts = self.cells(res)
+            cells[str(res)] = {"ids": ids.tolist(), "counts": counts.tolist()}
+        params = {"hex_base_km": HEX_BASE_KM, "projection": HEX_PROJECTION} if self.grid == 'hex' else {}
+        return {"version": AGGREGATE_VERSION, "grid": self.grid,
+                "resolutions": list(self.resolutions), "params": params,
+                "points": self.points, "skipped": self.skipped, "cells": cells}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GridAggregator':
+        if data.get("version") != AGGREGATE_VERSION:
+            raise ValueError(f"Desteklenmeyen toplam sürümü / Unsupported aggregate version: "
+                             f"{data.get('version')}")
+        if data["grid"] == 'hex' and data.get("params", {}).get("hex_base_km") != HEX_BASE_KM:
+            raise ValueError("Farklı altıgen tabanı / Different hexagon base size")
+        aggregator = cls(data["grid"], data["resolutions"])
+        for res in aggregator.resolutions:
+            column = data["cells"][str(res)]
+            aggregator.counters[res].update(dict(zip(column["ids"], column["counts"])))
+        aggregator.points = data.get("points", 0)
+        aggregator.skipped = data.get("skipped", 0)
+        return aggregator
+
+    def save(self, file_path: str) -> None:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, file_path: str) -> 'GridAggregator':
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def cell_area_km2(self, resolution: int, cell: int) -> float:
+        """Hücrenin gerçek alanı (km²) / True cell area (km²)"""
+        if self.grid == 'hex':
+            edge_km = hex_edge_m(resolution) / 1000.0
+            return 1.5 * _SQRT3 * edge_km * edge_km
+        min_lon, min_lat, max_lon, max_lat = geohash_bbox(cell, resolution)
+        return _band_area_km2(min_lon, min_lat, max_lon, max_lat)
+
+    def iter_features(self, resolution: int, precision: Optional[int] = None,
+                      chunk_size: int = 10000) -> Iterator[Dict]:
+        """
+        Çözünürlüğün hücrelerini Polygon feature olarak üret
+        Yield the cells of a resolution as Polygon features
+
+        Özellikler: cell, count, density_km2. Altıgen köşeleri parça başına
+        tek toplu ters LAEA dönüşümüyle hesaplanır; koordinatlar burada
+        yuvarlanır, böylece yazıcının feature'ları yeniden gezmesi gerekmez.
+        Properties: cell, count, density_km2. Hexagon corners go through one
+        bulk inverse LAEA transform per chunk; coordinates are rounded here so
+        the writer does not have to walk the features again.
+
+        Args:
+            resolution (int): Çözünürlük / Resolution
+            precision (int): Koordinat ondalık sayısı / Coordinate decimals (None: full)
+            chunk_size (int): Dönüşüm parçası / Cells per transform chunk
+        """
+        ids, counts = self.cells(resolution)
+        if precision is None:
+            def rounded(values):
+                return values
+        else:
+            def rounded(values):
+                return [round(v, precision) for v in values]
+        if self.grid == 'hex':
+            edge = hex_edge_m(resolution)
+            area = self.cell_area_km2(resolution, 0)
+            corners = [(edge * math.cos(math.radians(30 + 60 * k)),
+                        edge * math.sin(math.radians(30 + 60 * k))) for k in range(6)]
+        for start in range(0, len(ids), chunk_size):
+            chunk_ids = ids[start:start + chunk_size]
+            chunk_counts = counts[start:start + chunk_size]
+            if self.grid == 'hex':
+                xs, ys = [], []
+                for cell in chunk_ids:
+                    cx, cy = hex_center(*hex_axial(cell), edge)
+                    for dx, dy in corners:
+                        xs.append(cx + dx)
+                        ys.append(cy + dy)
+                lons, lats = transform(xs, ys, HEX_PROJECTION, 'wgs84')
+                lons, lats = rounded(lons), rounded(lats)
+                for i, (cell, n) in enumerate(zip(chunk_ids, chunk_counts)):
+                    ring = [[lons[j], lats[j]] for j in range(6 * i, 6 * i + 6)]
+                    ring.append(ring[0])
+                    yield _cell_feature(self.cell_code(resolution, cell), n, area, ring)
+            else:
+                for cell, n in zip(chunk_ids, chunk_counts):
+                    box = geohash_bbox(cell, resolution)
+                    min_lon, min_lat, max_lon, max_lat = rounded(box)
+                    ring = [[min_lon, min_lat], [max_lon, min_lat], [max_lon, max_lat],
+                            [min_lon, max_lat], [min_lon, min_lat]]
+                    yield _cell_feature(geohash_text(cell, resolution), n,
+                                        _band_area_km2(*box), ring)
+
+
+def _band_area_km2(min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> float:
+    """Enlem/boylam dikdörtgeninin küre üzerindeki alanı (km²) / Spherical area of a lat/lon box"""
+    radius_km = AUTHALIC_RADIUS_M / 1000.0
+    return (radius_km * radius_km * math.radians(max_lon - min_lon) *
+            (math.sin(math.radians(max_lat)) - math.sin(math.radians(min_lat))))
+
+
+def _cell_feature(code: str, n: int, area_km2: float, ring: List[List[float]]) -> Dict:
+    """Hücre Polygon feature'ı / Cell Polygon feature"""
+    return {
+        "type": "Feature",
+        "properties": {"cell": code, "count": n, "density_km2": round(n / area_km2, 4)},
+        "geometry": {"type": "Polygon", "coordinates": [ring]}
+    }
+
+
+def merge_aggregates(file_paths: Sequence[str]) -> GridAggregator:
+    """
+    Parça toplam dosyalarını birleştir
+    Merge shard aggregate files
+
+    Raises:
+        ValueError: Dosya yok veya uyumsuz toplamlar / No files or incompatible aggregates
+    """
+    if not file_paths:
+        raise ValueError("Toplam dosyası gerekli / At least one aggregate file is required")
+    merged = GridAggregator.load(file_paths[0])
+    for path in file_paths[1:]:
+        merged.merge(GridAggregator.load(path))
+    return merged
+
+
+def _geohash_reference(lat: float, lon: float, precision: int) -> str:
+    """Klasik ikiye bölme kodlayıcısı (öz denetim için) / Classic bisection encoder (for the self-check)"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    text, bit, ch, even = [], 0, 0, True
+    while len(text) < precision:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            ch = ch << 1 | 1
+            rng[0] = mid
+        else:
+            ch <<= 1
+            rng[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            text.append(GEOHASH_BASE32[ch])
+            bit, ch = 0, 0
+    return ''.join(text)
+
+
+def self_check(samples: int = 5000, seed: int = 25) -> Dict[str, Dict]:
+    """
+    Geohash, altıgen atama, birleştirme ve kalıcılık öz denetimi
+    Self-check of geohash encoding, hexagon assignment, merging and persistence
+
+    Returns:
+        Dict: Denetim adı -> {"value", "limit", "ok"} / Check name -> {"value", "limit", "ok"}
+    """
+    rng = random.Random(seed)
+    results: Dict[str, Dict] = {}
+
+    def record(name: str, value: float, limit: float) -> None:
+        results[name] = {"value": value, "limit": limit, "ok": value <= limit}
+
+    lats = [rng.uniform(35.8, 42.1) for _ in range(samples)]
+    lons = [rng.uniform(25.6, 44.8) for _ in range(samples)]
+    lats[:4] = [90.0, -90.0, 0.0, 39.245472]
+    lons[:4] = [180.0, -180.0, 0.0, 35.487361]
+
+    text_errors = bbox_errors = 0
+    for precision in range(1, MAX_RESOLUTION['geohash'] + 1):
+        for lat, lon, cell in zip(lats, lons, geohash_ids(lats, lons, precision)):
+            text_errors += geohash_text(cell, precision) != _geohash_reference(lat, lon, precision)
+            min_lon, min_lat, max_lon, max_lat = geohash_bbox(cell, precision)
+            bbox_errors += not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat)
+    record('geohash_text_mismatches', text_errors, 0)
+    record('geohash_bbox_misses', bbox_errors, 0)
+
+    # Atanan altıgen merkezi, komşu merkezlerden daha yakın olmalı
+    # The assigned hexagon center must be closer than any neighbour's center
+    xs, ys = transform(lons, lats, 'wgs84', HEX_PROJECTION)
+    neighbours = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, -1), (-1, 1))
+    hex_errors = 0
+    for res in (0, 6, 12):
+        edge = hex_edge_m(res)
+        for x, y, cell in zip(xs, ys, hex_ids(xs, ys, edge)):
+            q, r = hex_axial(cell)
+            cx, cy = hex_center(q, r, edge)
+            own = math.hypot(x - cx, y - cy)
+            hex_errors += own > edge + 1e-6 or any(
+                math.hypot(x - nx, y - ny) < own - 1e-9
+                for nx, ny in (hex_center(q + dq, r + dr, edge) for dq, dr in neighbours))
+    record('hex_assignment_errors', hex_errors, 0)
+
+    for grid in GRIDS:
+        whole = GridAggregator(grid)
+        whole.add(lats, lons)
+        half = samples // 2
+        left, right = GridAggregator(grid), GridAggregator(grid)
+        left.add(lats[:half], lons[:half])
+        right.add(lats[half:], lons[half:])
+        merged = GridAggregator.from_dict(json.loads(json.dumps(left.to_dict())))
+        merged.merge(GridAggregator.from_dict(json.loads(json.dumps(right.to_dict()))))
+        record(f'{grid}.merge_mismatches',
+               sum(merged.counters[res] != whole.counters[res] for res in whole.resolutions), 0)
+        record(f'{grid}.count_mismatches',
+               sum(sum(whole.counters[res].values()) != whole.points for res in whole.resolutions), 0)
+    return results
+
+
+def benchmark(points: int = 1_000_000, seed: int = 25) -> Dict[str, float]:
+    """Izgara başına toplama hızı (nokta/sn) / Aggregation throughput per grid (points/sec)"""
+    rng = random.Random(seed)
+    lats = [rng.uniform(35.8, 42.1) for _ in range(points)]
+    lons = [rng.uniform(25.6, 44.8) for _ in range(points)]
+    rates = {}
+    for grid in GRIDS:
+        aggregator = GridAggregator(grid)
+        started = time.perf_counter()
+        for start in range(0, points, 65536):
+            aggregator.add(lats[start:start + 65536], lons[start:start + 65536])
+        label = f"{grid} {','.join(map(str, aggregator.resolutions))}"
+        rates[label] = points / (time.perf_counter() - started)
+    return rates
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description='Geohash/altıgen ızgara toplama / Geohash/hexagonal grid aggregation')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Kodlama ve birleştirme denetimi / Encoding and merge check')
+    parser.add_argument('--bench', type=int, metavar='N',
+                        help='N noktada hız ölçümü / Throughput benchmark on N points')
+    parser.add_argument('--merge', nargs='+', metavar='AGG',
+                        help='Parça toplamlarını birleştir / Merge shard aggregates')
+    parser.add_argument('--output', '-o', help='Birleşik toplam dosyası / Merged aggregate file')
+    args = parser.parse_args()
+
+    if not (args.self_check or args.bench or args.merge):
+        parser.print_help()
+        return
+    if args.self_check:
+        print("\n🧪 IZGARA ÖZ DENETİMİ / GRID SELF-CHECK")
+        print("-" * 70)
+        results = self_check()
+        for name, result in results.items():
+            mark = '✅' if result['ok'] else '❌'
+            print(f"  {mark} {name:<28} {result['value']:>6}  (≤ {result['limit']})")
+        if not all(result['ok'] for result in results.values()):
+            sys.exit(1)
+    if args.bench:
+        print(f"\n⏱️  HIZ / THROUGHPUT ({args.bench} nokta / points)")
+        print("-" * 70)
+        for name, rate in benchmark(args.bench).items():
+            print(f"  {name:<24} {rate:>12,.0f} nokta/sn / points/sec")
+    if args.merge:
+        if not args.output:
+            print("❌ Birleştirme --output gerektirir / Merging requires --output")
+            sys.exit(2)
+        try:
+            merged = merge_aggregates(args.merge)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        merged.save(args.output)
+        print(f"✅ {len(args.merge)} toplam birleştirildi / aggregates merged: {args.output} "
+              f"({merged.points} nokta / points)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Ölçüm ve Profil Katmanı
+Turkey's Geographic Center - Instrumentation and Profiling Layer
+
+DataProcessor işlemleri için yapılandırılmış zamanlama:
+- İç içe zaman aralıkları (span): load/parse/transform/serialize/write
+- Sayaçlar: satır, feature, okunan/yazılan bayt
+- Her span sonunda en yüksek bellek (RSS, isteğe bağlı tracemalloc) örneği
+- Akış döngüleri için düşük maliyetli birikimli aşama süreleri
+- JSON özet ya da Chrome trace (chrome://tracing, Perfetto) çıktısı
+- İsteğe bağlı cProfile ve tracemalloc modları
+
+Structured timing for DataProcessor operations: nested spans, counters,
+peak-memory samples at every span end, cheap accumulated phase timings
+for streaming loops, JSON summary or Chrome trace output, and optional
+cProfile and tracemalloc modes.
+
+Profil kapalıyken span() paylaşılan boş bir bağlam, timed_*() ise
+verilen nesnenin kendisini döndürür; ölçüm maliyeti yoktur.
+With profiling off, span() returns a shared no-op context and timed_*()
+return their argument unchanged, so instrumentation costs nothing.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+PROFILE_FORMATS = ('json', 'chrome')
+PROFILE_MODES = ('spans', 'cprofile', 'tracemalloc')
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def _peak_rss_mb() -> float:
+    """
+    Sürecin en yüksek RSS'i (MB); resource modülü olmayan platformlarda (Windows) 0
+    Peak resident set size of the process (MB); 0 where there is no resource module (Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class Profiler:
+    """
+    Span, sayaç ve bellek örneklerini toplayan profilci
+    Profiler collecting spans, counters and memory samples
+
+    Attributes:
+        enabled (bool): Ölçüm açık mı / Whether recording is on
+        spans (List[Dict]): Tamamlanan span'lar / Finished spans
+        counters (Dict[str, int]): Sayaçlar / Counters
+        phases (Dict[str, List]): Birikimli aşamalar: ad -> [saniye, çağrı]
+            Accumulated phases: name -> [seconds, calls]
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.mode = 'spans'
+        self.spans = []
+        self.counters = {}
+        self.phases = {}
+        self.memory = []
+        self._cprofile = None
+        self._tracemalloc = None
+        self._origin = time.perf_counter()
+        self._origin_epoch = time.time()
+        self._depth = 0
+
+    def start(self, mode: str = 'spans') -> None:
+        """
+        Ölçümü başlat
+        Start recording
+
+        Args:
+            mode (str): "spans", "cprofile" (fonksiyon profili de alınır) veya
+                "tracemalloc" (Python ayırmaları da izlenir)
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.__init__()
+        self.enabled = True
+        self.mode = mode
+        if mode == 'tracemalloc':
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            tracemalloc.start(10)
+        elif mode == 'cprofile':
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Ölçümü durdur / Stop recording"""
+        if not self.enabled:
+            return
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self.enabled = False
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _sample_memory(self, ts_us: float) -> Dict[str, float]:
+        sample = {"peak_rss_mb": round(_peak_rss_mb(), 2)}
+        if self._tracemalloc is not None and self._tracemalloc.is_tracing():
+            current, peak = self._tracemalloc.get_traced_memory()
+            sample["traced_mb"] = round(current / 1e6, 2)
+            sample["traced_peak_mb"] = round(peak / 1e6, 2)
+        self.memory.append((ts_us, sample))
+        return sample
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = 'op', **args: Any) -> Iterator[Dict]:
+        """
+        Bir işlem aralığını ölç; verilen sözlüğe ek argümanlar yazılabilir
+        Time a span; the yielded dict takes extra args for the trace
+
+        İçinde birikmiş aşama süreleri span'ın "phases" argümanına eklenir.
+        Phase time accumulated inside is attached as the span's "phases".
+        """
+        before = {key: list(value) for key, value in self.phases.items()}
+        start = self._now_us()
+        self._depth += 1
+        try:
+            yield args
+        finally:
+            self._depth -= 1
+            end = self._now_us()
+            phases = {}
+            for key, (seconds, calls) in self.phases.items():
+                prev_seconds, prev_calls = before.get(key, (0.0, 0))
+                if calls > prev_calls:
+                    phases[key] = {"seconds": round(seconds - prev_seconds, 6),
+                                   "calls": calls - prev_calls}
+            if phases:
+                args["phases"] = phases
+            args.update(self._sample_memory(end))
+            self.spans.append({"name": name, "cat": category, "ts": start,
+                               "dur": end - start, "depth": self._depth,
+                               "pid": os.getpid(), "tid": threading.get_ident(),
+                               "args": args})
+
+    def add_span(self, name: str, category: str, started_epoch: float, seconds: float,
+                 pid: int, **args: Any) -> None:
+        """
+        Başka süreçte ölçülmüş bir span ekle (ör. toplu mod işçileri)
+        Add a span measured in another process (e.g. batch-mode workers)
+        """
+        self.spans.append({"name": name, "cat": category,
+                           "ts": (started_epoch - self._origin_epoch) * 1e6,
+                           "dur": seconds * 1e6, "depth": 0, "pid": pid, "tid": pid,
+                           "args": args})
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Sayacı artır / Increment a counter"""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_phase(self, name: str, seconds: float, calls: int = 1) -> None:
+        """Birikimli aşama süresi ekle / Add accumulated phase time"""
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [seconds, calls]
+        else:
+            entry[0] += seconds
+            entry[1] += calls
+
+    def summary(self, top: int = 25) -> Dict:
+        """
+        Span'ları ada göre topla, sayaç/bellek/profil bilgisini ekle
+        Aggregate spans by name and add counters, memory and profile data
+        """
+        by_name = {}
+        for span in self.spans:
+            item = by_name.setdefault(span["name"], {"category": span["cat"], "calls": 0,
+                                                     "seconds": 0.0, "max_seconds": 0.0})
+            seconds = span["dur"] / 1e6
+            item["calls"] += 1
+            item["seconds"] += seconds
+            item["max_seconds"] = max(item["max_seconds"], seconds)
+        for item in by_name.values():
+            item["seconds"] = round(item["seconds"], 6)
+            item["max_seconds"] = round(item["max_seconds"], 6)
+        result = {
+            "mode": self.mode,
+            "wall_seconds": round((time.perf_counter() - self._origin), 6),
+            "spans": dict(sorted(by_name.items(), key=lambda kv: -kv[1]["seconds"])),
+            "phases": {key: {"seconds": round(seconds, 6), "calls": calls}
+                       for key, (seconds, calls) in sorted(self.phases.items(),
+                                                           key=lambda kv: -kv[1][0])},
+            "counters": dict(self.counters),
+            "memory": {"peak_rss_mb": round(_peak_rss_mb(), 2)},
+        }
+        if self._tracemalloc is not None and self._tracemalloc.is_tracing():
+            current, peak = self._tracemalloc.get_traced_memory()
+            result["memory"].update(traced_mb=round(current / 1e6, 2),
+                                    traced_peak_mb=round(peak / 1e6, 2))
+            stats = self._tracemalloc.take_snapshot().statistics('lineno')[:top]
+            result["allocations"] = [{"site": str(stat.traceback), "kb": round(stat.size / 1e3, 1),
+                                      "count": stat.count} for stat in stats]
+        if self._cprofile is not None:
+            import pstats
+            stats = pstats.Stats(self._cprofile)
+            rows = sorted(stats.stats.items(), key=lambda kv: -kv[1][3])[:top]
+            result["functions"] = [
+                {"function": f"{func[0]}:{func[1]}({func[2]})", "calls": calls,
+                 "tottime": round(tottime, 6), "cumtime": round(cumtime, 6)}
+                for func, (_, calls, tottime, cumtime, _) in rows
+            ]
+        return result
+
+    def chrome_trace(self) -> Dict:
+        """
+        Chrome trace olay biçimi (chrome://tracing, ui.perfetto.dev)
+        Chrome trace event format (chrome://tracing, ui.perfetto.dev)
+        """
+        events = [{"name": span["name"], "cat": span["cat"], "ph": "X",
+                   "ts": round(span["ts"], 3), "dur": round(span["dur"], 3),
+                   "pid": span["pid"], "tid": span["tid"], "args": span["args"]}
+                  for span in self.spans]
+        pid = os.getpid()
+        for ts, sample in self.memory:
+            events.append({"name": "memory", "ph": "C", "ts": round(ts, 3), "pid": pid,
+                           "args": sample})
+        events.append({"name": "counters", "ph": "C", "ts": round(self._now_us(), 3),
+                       "pid": pid, "args": dict(self.counters)})
+        return {"traceEvents": sorted(events, key=lambda e: e["ts"]),
+                "displayTimeUnit": "ms", "otherData": {"mode": self.mode}}
+
+    def write(self, file_path: str, fmt: str = 'json') -> None:
+        """
+        Profili dosyaya yaz; cProfile modunda yanına .prof da yazılır
+        Write the profile; in cprofile mode a .prof file is written alongside
+        """
+        if fmt not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format: {fmt}")
+        data = self.chrome_trace() if fmt == 'chrome' else self.summary()
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(os.path.splitext(file_path)[0] + '.prof')
+
+    def print_report(self, top: int = 10) -> None:
+        """Kısa süre tablosu yazdır / Print a short timing table"""
+        summary = self.summary(top)
+        print("\n⏱️  PROFİL / PROFILE")
+        print("-" * 70)
+        print(f"{'span / phase':<40} {'calls':>8} {'seconds':>10}")
+        for name, item in list(summary["spans"].items())[:top]:
+            print(f"{name:<40} {item['calls']:>8} {item['seconds']:>10.4f}")
+        for name, item in list(summary["phases"].items())[:top]:
+            print(f"{'~' + name:<40} {item['calls']:>8} {item['seconds']:>10.4f}")
+        if summary["counters"]:
+            print(f"Sayaçlar / Counters: {summary['counters']}")
+        print(f"En yüksek RSS / Peak RSS: {summary['memory']['peak_rss_mb']} MB")
+
+
+PROFILER = Profiler()
+
+
+def span(name: str, category: str = 'op', **args: Any):
+    """Etkin profilcide span aç; kapalıysa boş bağlam / Open a span, or a no-op context"""
+    if not PROFILER.enabled:
+        return _NULL_CONTEXT
+    return PROFILER.span(name, category, **args)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Profil açıksa sayacı artır / Increment a counter when profiling"""
+    if PROFILER.enabled:
+        PROFILER.count(name, value)
+
+
+def timed_call(name: str, func: Callable) -> Callable:
+    """
+    Çağrı sürelerini birikimli aşamaya ekleyen sarmalayıcı (kapalıysa func)
+    Wrapper accumulating call time into a phase (func itself when off)
+    """
+    if not PROFILER.enabled:
+        return func
+    clock = time.perf_counter
+    add = PROFILER.add_phase
+
+    def wrapper(*args, **kwargs):
+        started = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            add(name, clock() - started)
+    return wrapper
+
+
+def timed_iter(name: str, iterable: Iterable) -> Iterable:
+    """
+    Öğe üretme süresini birikimli aşamaya ekleyen üreteç (kapalıysa iterable)
+    Generator accumulating per-item production time (iterable itself when off)
+    """
+    if not PROFILER.enabled:
+        return iterable
+
+    def generate():
+        clock = time.perf_counter
+        add = PROFILER.add_phase
+        iterator = iter(iterable)
+        while True:
+            started = clock()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                add(name, clock() - started, 0)
+                return
+            add(name, clock() - started)
+            yield item
+    return generate()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Artımlı Dönüştürme Manifestosu
+Turkey's Geographic Center - Incremental Conversion Manifest
+
+Her giriş dosyası için içerik özeti (SHA-256), boyut, mtime ve
+dönüştürme seçeneklerini JSON yan dosyasında tutar:
+- Boyutu ve mtime'ı değişmemiş dosyalar okunmadan atlanır
+- mtime değişse de içeriği aynı kalan dosyalar özetle yakalanır
+- Sonuna satır eklenmiş CSV'lerde yalnızca yeni satırlar dönüştürülür
+
+Keeps a JSON sidecar with the content hash (SHA-256), size, mtime and
+conversion options of every input. Files whose size and mtime are
+unchanged are skipped without being read, touched-but-identical files
+are caught by the hash, and CSVs that only grew at the end have just
+their new rows converted.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+MANIFEST_VERSION = 1
+
+
+def file_digests(file_path: str, prefix_size: Optional[int] = None,
+                 chunk_size: int = 1 << 20) -> Tuple[str, Optional[str]]:
+    """
+    Dosyanın ve ilk prefix_size baytının SHA-256 özeti (tek okumada)
+    SHA-256 of a file and of its first prefix_size bytes, in one read
+
+    Returns:
+        (full, prefix): prefix dosya daha kısaysa None / None if the file is shorter
+    """
+    digest = hashlib.sha256()
+    prefix = None
+    position = 0
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            if prefix_size is not None and prefix is None and position + len(chunk) >= prefix_size:
+                cut = prefix_size - position
+                digest.update(chunk[:cut])
+                prefix = digest.hexdigest()
+                digest.update(chunk[cut:])
+            else:
+                digest.update(chunk)
+            position += len(chunk)
+    if prefix_size == 0:
+        prefix = hashlib.sha256().hexdigest()
+    return digest.hexdigest(), prefix
+
+
+class ConversionManifest:
+    """
+    Girdi başına dönüştürme kayıtları (JSON yan dosyası)
+    Per-input conversion records (JSON sidecar)
+
+    Attributes:
+        path (str): Manifesto dosyası / Manifest file
+        entries (Dict): Mutlak giriş yolu -> kayıt / Absolute input path -> entry
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            pass  # Yok ya da bozuk: baştan başla / Missing or corrupt: start over
+
+    @staticmethod
+    def _key(input_path: str) -> str:
+        return os.path.abspath(input_path)
+
+    def lookup(self, input_path: str, output_path: str,
+               options: Dict) -> Tuple[str, Optional[Dict]]:
+        """
+        Girdinin durumunu sınıflandır
+        Classify an input against its recorded entry
+
+        Returns:
+            ("fresh", kayıt): Boyut, mtime ve çıktı aynı; okumadan atla
+                Size, mtime and output unchanged; skip without reading
+            ("stale", kayıt): Aynı seçenekler, dosya değişmiş olabilir;
+                özetle karşılaştır / Same options, file may have changed
+            ("new", None): Kayıt yok ya da seçenekler/çıktı farklı
+                No entry, or options/output differ
+        """
+        entry = self.entries.get(self._key(input_path))
+        if (entry is None or entry.get("options") != options
+                or entry.get("output") != os.path.abspath(output_path)):
+            return "new", None
+        try:
+            stat = os.stat(input_path)
+            output_size = os.path.getsize(output_path)
+        except OSError:
+            return "new", None
+        if output_size != entry.get("output_size"):
+            return "new", None
+        if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+            return "fresh", entry
+        return "stale", entry
+
+    def record(self, input_path: str, entry: Dict) -> None:
+        """Girdinin kaydını güncelle / Update an input's entry"""
+        self.entries[self._key(input_path)] = entry
+
+    def save(self) -> None:
+        """Manifestoyu atomik olarak yaz / Write the manifest atomically"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": MANIFEST_VERSION, "entries": self.entries},
+                      f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Tek Giriş Noktası
+Turkey's Geographic Center - Single Entry Point
+
+Tüm araçlar alt komut olarak çalışır; her alt komut yalnızca kendi
+modülünü (ve onun bağımlılıklarını) çağrıldığında içe aktarır. Böylece
+cron ve kabuk hatlarındaki `--help`/`--stats` çağrıları kullanılmayan
+arka uçların (orjson, sqlite3, çoklu işlem, asyncio...) yükleme
+maliyetini ödemez.
+
+Every tool runs as a subcommand, and each subcommand imports its module
+(and that module's dependencies) only when invoked, so `--help`/`--stats`
+calls from cron and shell pipelines never pay for unused backends.
+
+Kullanım / Usage:
+    python merkez.py center [--boundary F] [--uncertainty] ...
+    python merkez.py process --input data.csv --output data.geojson ...
+    python merkez.py project --self-check
+    python merkez.py geocode --self-check
+    python merkez.py serve --port 8080
+    python merkez.py bench --cases load_csv
+    python merkez.py startup --budget-ms 60
+"""
+
+import os
+import sys
+
+# Alt komut -> (modül, açıklama) / Subcommand -> (module, description)
+COMMANDS = {
+    'center': ('geographic_center',
+               'Merkez bilgisi, sınırdan centroid, yöntem karşılaştırması, belirsizlik / '
+               'Center info, boundary centroid, method comparison, uncertainty'),
+    'process': ('data_processor',
+                'CSV/GeoJSON/GeoPackage dönüştürme, doğrulama, sorgu, karo / '
+                'Conversion, validation, queries, tiles'),
+    'project': ('projections', 'Koordinat dönüşümü öz denetimi ve hız / Reprojection self-check and speed'),
+    'geocode': ('geocoder', 'Adres kodlama, sahte servis ve öz denetim / Geocoding, stub service, self-check'),
+    'grid': ('grid_aggregate',
+             'Izgara toplama öz denetimi, hız ve parça birleştirme / '
+             'Grid aggregation self-check, speed, shard merge'),
+    'serve': ('center_server', 'Merkez/mesafe HTTP servisi / Center/distance HTTP service'),
+    'bench': ('benchmark', 'Performans ölçümü / Performance benchmark'),
+    'startup': ('startup_budget', 'Soğuk başlangıç bütçesi denetimi / Cold-start budget check'),
+}
+
+
+def usage() -> str:
+    """Alt komut listesi / Subcommand listing"""
+    lines = ["Kullanım / Usage: merkez.py <komut/command> [seçenekler/options]", "",
+             "Komutlar / Commands:"]
+    lines.extend(f"  {name:<9} {description}" for name, (_, description) in COMMANDS.items())
+    lines.append("")
+    lines.append("Komut yardımı / Command help: merkez.py <command> --help")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> None:
+    """
+    Alt komutu çöz, modülünü içe aktar ve main() fonksiyonunu çalıştır
+    Resolve the subcommand, import its module and run its main()
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        sys.exit(0 if argv else 2)
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"❌ Bilinmeyen komut / Unknown command: {command}\n", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        sys.exit(2)
+    module = __import__(COMMANDS[command][0])
+    sys.argv = [f"{os.path.basename(sys.argv[0])} {command}"] + rest
+    module.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Sütunlu Nokta Deposu
+Turkey's Geographic Center - Columnar Point Store
+
+Noktaları sözlük listesi yerine sütunlar halinde tutar:
+- float64 enlem/boylam dizileri
+- Sözlükle kodlanmış (dictionary-encoded) özellik sütunları
+- mmap ile sıfır kopyayla açılabilen ikili dosya biçimi (.pts)
+
+Holds points as columns instead of lists of dicts: float64 lat/lon
+arrays, dictionary-encoded property columns and a binary on-disk format
+(.pts) that is opened zero-copy through mmap.
+
+Dosya düzeni / File layout:
+    MAGIC (8 bayt) | başlık uzunluğu (uint64 LE) | JSON başlık | dolgu
+    | lats float64[n] | lons float64[n] | her sütun için uint32 kodlar[n]
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from geographic_center import haversine_many
+
+MAGIC = b'TRPTS\x00\x01\x00'
+FORMAT_VERSION = 1
+_CODE_TYPE = 'I' if array('I').itemsize == 4 else 'L'
+
+
+def _align(offset: int, size: int = 8) -> int:
+    """Ofseti size katına yuvarla / Round an offset up to a multiple of size"""
+    return (offset + size - 1) // size * size
+
+
+class _Column:
+    """
+    Sözlükle kodlanmış tek bir özellik sütunu
+    A single dictionary-encoded property column
+    """
+
+    def __init__(self, values: Optional[List] = None, codes=None):
+        self.values = values if values is not None else []
+        self.codes = codes if codes is not None else array(_CODE_TYPE)
+        self._lookup = None
+
+    @staticmethod
+    def _key(value):
+        # 1, 1.0 ve True sözlükte çakışmasın / keep 1, 1.0 and True apart
+        return value if isinstance(value, str) else (type(value).__name__, repr(value))
+
+    def encode(self, value) -> int:
+        """Değerin kodunu döndür, gerekirse sözlüğe ekle / Code for a value"""
+        if self._lookup is None:
+            self._lookup = {self._key(v): i for i, v in enumerate(self.values)}
+        key = self._key(value)
+        code = self._lookup.get(key)
+        if code is None:
+            code = len(self.values)
+            self._lookup[key] = code
+            self.values.append(value)
+        return code
+
+
+class PointStore:
+    """
+    Sütunlu nokta deposu
+    Columnar point store
+
+    Attributes:
+        lats (array|memoryview): float64 enlemler / float64 latitudes
+        lons (array|memoryview): float64 boylamlar / float64 longitudes
+        columns (Dict[str, _Column]): Kodlanmış özellik sütunları / Encoded property columns
+    """
+
+    def __init__(self):
+        """Boş depo oluştur / Create an empty store"""
+        self.lats = array('d')
+        self.lons = array('d')
+        self.columns = {}
+        self._mmap = None
+        self._file = None
+        self._views = []
+
+    def __len__(self) -> int:
+        return len(self.lats)
+
+    def __enter__(self) -> 'PointStore':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append(self, lat: float, lon: float, properties: Dict) -> None:
+        """
+        Tek nokta ekle; yeni sütunlar geriye doğru boş değerle doldurulur
+        Append one point; new columns are back-filled with nulls
+        """
+        if self._mmap is not None:
+            raise ValueError("Memory-mapped stores are read-only")
+        index = len(self.lats)
+        for key in properties:
+            if key not in self.columns:
+                column = _Column()
+                column.codes.extend([column.encode(None)] * index)
+                self.columns[key] = column
+        for key, column in self.columns.items():
+            column.codes.append(column.encode(properties.get(key)))
+        self.lats.append(lat)
+        self.lons.append(lon)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict], lat_key: str = 'latitude',
+                  lon_key: str = 'longitude') -> 'PointStore':
+        """
+        CSV benzeri satırlardan depo kur (hatalı koordinatlı satırlar atlanır)
+        Build a store from CSV-like rows (rows with bad coordinates are skipped)
+        """
+        store = cls()
+        for row in rows:
+            try:
+                lat = float(row.get(lat_key, 0))
+                lon = float(row.get(lon_key, 0))
+            except (TypeError, ValueError):
+                continue
+            store.append(lat, lon, {k: v for k, v in row.items()
+                                    if k not in (lat_key, lon_key)})
+        return store
+
+    @classmethod
+    def from_features(cls, features: Iterable[Dict]) -> 'PointStore':
+        """
+        Point feature'larından depo kur (diğer geometriler atlanır)
+        Build a store from Point features (other geometries are skipped)
+        """
+        store = cls()
+        for feature in features:
+            geometry = feature.get('geometry') or {}
+            if geometry.get('type') != 'Point':
+                continue
+            coords = geometry.get('coordinates')
+            store.append(float(coords[1]), float(coords[0]), feature.get('properties') or {})
+        return store
+
+    def column(self, name: str) -> Iterator:
+        """Sütun değerlerini sırayla üret / Yield a column's decoded values"""
+        column = self.columns[name]
+        values = column.values
+        return (values[code] for code in column.codes)
+
+    def iter_rows(self, lat_key: str = 'latitude', lon_key: str = 'longitude') -> Iterator[Dict]:
+        """
+        Noktaları satır sözlükleri olarak üret (boş değerler atlanır)
+        Yield points as row dicts (null values are omitted)
+        """
+        names = list(self.columns)
+        decoded = [(name, self.columns[name].values, self.columns[name].codes) for name in names]
+        for i in range(len(self.lats)):
+            row = {}
+            for name, values, codes in decoded:
+                value = values[codes[i]]
+                if value is not None:
+                    row[name] = value
+            row[lat_key] = self.lats[i]
+            row[lon_key] = self.lons[i]
+            yield row
+
+    def iter_features(self) -> Iterator[Dict]:
+        """Noktaları GeoJSON Point feature'ları olarak üret / Yield GeoJSON Point features"""
+        for row in self.iter_rows():
+            lat = row.pop('latitude')
+            lon = row.pop('longitude')
+            yield {
+                "type": "Feature",
+                "properties": row,
+                "geometry": {"type": "Point", "coordinates": [lon, lat]}
+            }
+
+    def bbox(self) -> Optional[Tuple[float, float, float, float]]:
+        """(min_lon, min_lat, max_lon, max_lat) veya boşsa None"""
+        if not len(self.lats):
+            return None
+        return min(self.lons), min(self.lats), max(self.lons), max(self.lats)
+
+    def distances_from(self, lat: float, lon: float) -> array:
+        """Noktadan tüm noktalara Haversine mesafeleri (km) / Haversine distances (km)"""
+        return haversine_many(lat, lon, self.lats, self.lons)
+
+    def nbytes(self) -> int:
+        """Sayısal dizilerin bayt boyutu / Size of the numeric arrays in bytes"""
+        total = 16 * len(self.lats)
+        return total + sum(4 * len(c.codes) for c in self.columns.values())
+
+    def save(self, file_path: str) -> None:
+        """
+        Depoyu .pts ikili biçiminde kaydet
+        Save the store in the binary .pts format
+        """
+        n = len(self.lats)
+        names = list(self.columns)
+        header = {
+            "version": FORMAT_VERSION,
+            "count": n,
+            "byteorder": sys.byteorder,
+            "columns": [{"name": name, "values": self.columns[name].values} for name in names]
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        data_start = _align(len(MAGIC) + 8 + len(header_bytes))
+        with open(file_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<Q', len(header_bytes)))
+            f.write(header_bytes)
+            f.write(b'\0' * (data_start - f.tell()))
+            array('d', self.lats).tofile(f)
+            array('d', self.lons).tofile(f)
+            for name in names:
+                array(_CODE_TYPE, self.columns[name].codes).tofile(f)
+
+    @classmethod
+    def open(cls, file_path: str) -> 'PointStore':
+        """
+        .pts dosyasını mmap ile aç; diziler dosyaya doğrudan bakar
+        Open a .pts file through mmap; arrays are zero-copy views of the file
+
+        Farklı bayt sıralı bir makinede yazılmışsa diziler belleğe kopyalanır.
+        If written on a machine with a different byte order the arrays are
+        copied into memory instead.
+        """
+        store = cls()
+        f = open(file_path, 'rb')
+        try:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a point store file: {file_path}")
+            (header_len,) = struct.unpack('<Q', f.read(8))
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            if header.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported point store version: {header.get('version')}")
+            n = header["count"]
+            offset = _align(len(MAGIC) + 8 + header_len)
+            native = header["byteorder"] == sys.byteorder
+
+            if n == 0:
+                sections = [b''] * (2 + len(header["columns"]))
+                f.close()
+            else:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(mm)
+                store._views.append(view)
+                sections = []
+                for size in [8 * n, 8 * n] + [4 * n] * len(header["columns"]):
+                    sections.append(view[offset:offset + size])
+                    offset += size
+                store._views.extend(sections)
+                store._mmap = mm
+                store._file = f
+
+            def as_array(buf, typecode):
+                if native and len(buf):
+                    cast = buf.cast(typecode)
+                    store._views.append(cast)
+                    return cast
+                arr = array(typecode, bytes(buf))
+                if not native:
+                    arr.byteswap()
+                return arr
+
+            store.lats = as_array(sections[0], 'd')
+            store.lons = as_array(sections[1], 'd')
+            for column, buf in zip(header["columns"], sections[2:]):
+                store.columns[column["name"]] = _Column(column["values"], as_array(buf, _CODE_TYPE))
+        except Exception:
+            store._release_views()
+            if store._mmap is not None:
+                store._mmap.close()
+            f.close()
+            raise
+        return store
+
+    def _release_views(self) -> None:
+        """
+        Depoya ait memoryview'ları bırak, önce türetilenleri
+        Release the store's memoryviews, derived ones first
+        """
+        while self._views:
+            self._views.pop().release()
+
+    def close(self) -> None:
+        """
+        mmap ve dosyayı kapat / Release the mmap and file
+
+        Sütunlar mmap'e bakan görünümler olduğundan kapatıldıktan sonra boşalır;
+        daha önce alınmış lats/lons/codes referansları kullanılamaz. Bu
+        dizilerden kullanıcının türettiği memoryview'lar kapatmadan önce
+        bırakılmalıdır, aksi halde BufferError yükselir ve close() daha sonra
+        yeniden çağrılabilir.
+        The columns are views of the mmap, so they are emptied on close and
+        references to lats/lons/codes taken earlier become unusable.
+        Memoryviews the caller derived from them must be released first;
+        otherwise BufferError is raised and close() can be called again later.
+
+        Raises:
+            BufferError: Depo dışında hâlâ canlı görünümler var
+                Views derived outside the store are still alive
+        """
+        if self._mmap is None:
+            return
+        self._release_views()
+        self.lats = array('d')
+        self.lons = array('d')
+        for column in self.columns.values():
+            column.codes = array(_CODE_TYPE)
+        try:
+            self._mmap.close()
+        except BufferError:
+            raise BufferError("Release memoryviews derived from the point store "
+                              "before closing it") from None
+        self._file.close()
+        self._mmap = None
+        self._file = None
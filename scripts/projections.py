@@ -0,0 +1,639 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Koordinat Dönüşüm Motoru
+Turkey's Geographic Center - Coordinate Reprojection Engine
+
+PROJ kurmadan dizi üzerinde toplu ileri/ters dönüşümler:
+- wgs84:        EPSG:4326 coğrafi koordinatlar (boylam, enlem)
+- laea:         Türkiye merkezli elipsoidal Lambert Eş-Alan Azimutal (39°K, 35°D)
+- laea-europe:  EPSG:3035 (ETRS89-LAEA Avrupa)
+- utm35..utm38: EPSG:32635-32638, UTM 35-38K (Krüger n-serisi, 6. derece)
+- webmercator:  EPSG:3857
+
+Her projeksiyonun trigonometrik sabitleri ve seri katsayıları nesne
+oluşturulurken bir kez hesaplanır; döngüler yalnızca nokta başına işi yapar.
+Gidiş-dönüş doğruluğu `--self-check` ile ölçülür.
+
+Bulk forward/inverse transforms over arrays without installing PROJ:
+WGS84, Turkey-centred ellipsoidal LAEA, EPSG:3035, UTM 35-38N (6th-order
+Krüger series) and Web Mercator. Trigonometric constants and series
+coefficients are computed once per projection; round-trip accuracy is
+measured with `--self-check`.
+"""
+
+import argparse
+import cmath
+import math
+import random
+import sys
+import time
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from geographic_center import LAEA_LAT0, LAEA_LON0, WGS84_A, WGS84_F
+
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+
+UTM_K0 = 0.9996
+UTM_FALSE_EASTING = 500000.0
+UTM_ZONES = (35, 36, 37, 38)
+
+# Web Mercator'ün kare dünya sınırı / Latitude bound of the square Web Mercator world
+WEB_MERCATOR_MAX_LAT = 85.05112877980659
+
+# Türkiye sınır kutusu (self-check örneklemesi) / Turkey bbox used for self-check samples
+TURKEY_BBOX = (25.5, 35.8, 45.0, 42.2)
+
+Coordinates = Tuple[array, array]
+
+
+class Projection:
+    """
+    Projeksiyon temel sınıfı; kendisi WGS84 coğrafi (birim) dönüşümdür
+    Projection base class; on its own it is the WGS84 geographic identity
+
+    Attributes:
+        name (str): Kayıt adı / Registry name
+        epsg (int): EPSG kodu ya da None / EPSG code or None
+        proj4 (str): Eşdeğer PROJ tanımı / Equivalent PROJ definition
+        geographic (bool): Koordinatlar derece mi / Coordinates are degrees
+    """
+    name = 'wgs84'
+    epsg: Optional[int] = 4326
+    proj4 = '+proj=longlat +datum=WGS84 +no_defs'
+    geographic = True
+
+    @property
+    def crs_name(self) -> str:
+        """
+        GeoJSON "crs" üyesi için ad (EPSG URN'ü ya da PROJ tanımı)
+        Name for a GeoJSON "crs" member (EPSG URN or PROJ definition)
+        """
+        if self.epsg is not None:
+            return f'urn:ogc:def:crs:EPSG::{self.epsg}'
+        return self.proj4
+
+    def forward(self, lons: Sequence[float], lats: Sequence[float]) -> Coordinates:
+        """
+        Boylam/enlem dizilerini düzlem koordinatlarına dönüştür
+        Project lon/lat arrays (degrees) to plane coordinates
+
+        Returns:
+            Tuple: (x dizisi, y dizisi) / (x array, y array)
+        """
+        return array('d', lons), array('d', lats)
+
+    def inverse(self, xs: Sequence[float], ys: Sequence[float]) -> Coordinates:
+        """
+        Düzlem koordinatlarını boylam/enleme geri dönüştür
+        Convert plane coordinates back to lon/lat arrays (degrees)
+
+        Returns:
+            Tuple: (boylam dizisi, enlem dizisi) / (lon array, lat array)
+        """
+        return array('d', xs), array('d', ys)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.name}>'
+
+
+class LambertAzimuthalEqualArea(Projection):
+    """
+    Elipsoidal eğik Lambert Eş-Alan Azimutal projeksiyonu (Snyder 1987, s. 187-190)
+    Ellipsoidal oblique Lambert Azimuthal Equal-Area (Snyder 1987, pp. 187-190)
+
+    Ters dönüşümde otalik enlem serisi bir Newton adımıyla düzeltilir.
+    The inverse refines the authalic-latitude series with one Newton step.
+    """
+    geographic = False
+
+    def __init__(self, name: str, lat0: float, lon0: float, false_easting: float = 0.0,
+                 false_northing: float = 0.0, epsg: Optional[int] = None,
+                 a: float = WGS84_A, f: float = WGS84_F):
+        self.name = name
+        self.epsg = epsg
+        self.lat0, self.lon0 = lat0, lon0
+        self.false_easting, self.false_northing = false_easting, false_northing
+        self.proj4 = (f'+proj=laea +lat_0={lat0:g} +lon_0={lon0:g} +x_0={false_easting:.10g} '
+                      f'+y_0={false_northing:.10g} +ellps=WGS84 +units=m +no_defs')
+        e2 = f * (2 - f)
+        e = math.sqrt(e2)
+        self.e, self.e2 = e, e2
+        self.one_e2 = 1 - e2
+        self.qp = self._q(1.0)
+        self.rq = a * math.sqrt(self.qp / 2)
+        phi0 = math.radians(lat0)
+        sin0 = math.sin(phi0)
+        sinb1 = self._q(sin0) / self.qp
+        self.sinb1 = sinb1
+        self.cosb1 = math.sqrt(1 - sinb1 * sinb1)
+        m1 = math.cos(phi0) / math.sqrt(1 - e2 * sin0 * sin0)
+        self.d = a * m1 / (self.rq * self.cosb1)
+        self.lam0 = math.radians(lon0)
+        # Otalik -> jeodezik enlem serisi (Snyder 3-18)
+        # Authalic -> geodetic latitude series (Snyder 3-18)
+        e4, e6 = e2 * e2, e2 * e2 * e2
+        self.apa = (e2 / 3 + 31 * e4 / 180 + 517 * e6 / 5040,
+                    23 * e4 / 360 + 251 * e6 / 3780,
+                    761 * e6 / 45360)
+
+    def _q(self, sin_phi: float) -> float:
+        es = self.e * sin_phi
+        return self.one_e2 * (sin_phi / (1 - es * es) + math.atanh(es) / self.e)
+
+    def forward(self, lons: Sequence[float], lats: Sequence[float]) -> Coordinates:
+        sin, cos, sqrt, atanh = math.sin, math.cos, math.sqrt, math.atanh
+        deg = math.pi / 180
+        e, one_e2, inv_qp = self.e, self.one_e2, 1 / self.qp
+        inv_e = 1 / e
+        sinb1, cosb1, lam0 = self.sinb1, self.cosb1, self.lam0
+        kx, ky = self.rq * self.d, self.rq / self.d
+        x0, y0 = self.false_easting, self.false_northing
+        xs, ys = [], []
+        xappend, yappend = xs.append, ys.append
+        for lon, lat in zip(lons, lats):
+            s = sin(lat * deg)
+            es = e * s
+            sinb = one_e2 * (s / (1 - es * es) + atanh(es) * inv_e) * inv_qp
+            if sinb > 1.0:
+                sinb = 1.0
+            elif sinb < -1.0:
+                sinb = -1.0
+            cosb = sqrt(1 - sinb * sinb)
+            dl = lon * deg - lam0
+            cdl = cos(dl)
+            b = 1 + sinb1 * sinb + cosb1 * cosb * cdl
+            k = sqrt(2 / b) if b > 1e-15 else math.inf
+            xappend(x0 + kx * k * cosb * sin(dl))
+            yappend(y0 + ky * k * (cosb1 * sinb - sinb1 * cosb * cdl))
+        return array('d', xs), array('d', ys)
+
+    def inverse(self, xs: Sequence[float], ys: Sequence[float]) -> Coordinates:
+        sin, cos, asin, atan2, sqrt, atanh = (math.sin, math.cos, math.asin, math.atan2,
+                                               math.sqrt, math.atanh)
+        rad = 180 / math.pi
+        e, e2, one_e2, qp = self.e, self.e2, self.one_e2, self.qp
+        inv_e = 1 / e
+        sinb1, cosb1, lam0 = self.sinb1, self.cosb1, self.lam0
+        d, two_rq = self.d, 2 * self.rq
+        x0, y0 = self.false_easting, self.false_northing
+        c2, c4, c6 = self.apa
+        lons, lats = [], []
+        lon_append, lat_append = lons.append, lats.append
+        for x, y in zip(xs, ys):
+            x = (x - x0) / d
+            y = (y - y0) * d
+            rho = sqrt(x * x + y * y)
+            if rho < 1e-9:
+                lon_append(self.lon0)
+                lat_append(self.lat0)
+                continue
+            r = rho / two_rq
+            ce = 2 * asin(r if r < 1.0 else 1.0)
+            sce, cce = sin(ce), cos(ce)
+            sinb = cce * sinb1 + y * sce * cosb1 / rho
+            if sinb > 1.0:
+                sinb = 1.0
+            elif sinb < -1.0:
+                sinb = -1.0
+            beta = asin(sinb)
+            phi = beta + c2 * sin(2 * beta) + c4 * sin(4 * beta) + c6 * sin(6 * beta)
+            cphi = cos(phi)
+            if cphi > 1e-10:
+                s = sin(phi)
+                es2 = 1 - e2 * s * s
+                phi += es2 * es2 / (2 * cphi) * (
+                    qp * sinb / one_e2 - s / es2 - atanh(e * s) * inv_e)
+            lon_append((lam0 + atan2(x * sce, rho * cosb1 * cce - y * sinb1 * sce)) * rad)
+            lat_append(phi * rad)
+        return array('d', lons), array('d', lats)
+
+
+class TransverseMercator(Projection):
+    """
+    Krüger n-serisiyle (6. derece) Transverse Mercator; UTM bölgeleri için
+    Transverse Mercator via Krüger's n-series (6th order), used for UTM zones
+
+    Merkez meridyenden ±4° içinde hata nanometre düzeyindedir (Karney 2011).
+    Errors stay at the nanometre level within ±4° of the central meridian
+    (Karney 2011).
+    """
+    geographic = False
+
+    def __init__(self, name: str, lon0: float, k0: float = UTM_K0,
+                 false_easting: float = UTM_FALSE_EASTING, false_northing: float = 0.0,
+                 epsg: Optional[int] = None, a: float = WGS84_A, f: float = WGS84_F):
+        self.name = name
+        self.epsg = epsg
+        self.lon0 = lon0
+        self.false_easting, self.false_northing = false_easting, false_northing
+        self.proj4 = (f'+proj=tmerc +lat_0=0 +lon_0={lon0:g} +k={k0:g} +x_0={false_easting:.10g} '
+                      f'+y_0={false_northing:.10g} +ellps=WGS84 +units=m +no_defs')
+        e2 = f * (2 - f)
+        self.e, self.e2 = math.sqrt(e2), e2
+        self.lam0 = math.radians(lon0)
+        n = f / (2 - f)
+        n2, n3 = n * n, n ** 3
+        n4, n5, n6 = n ** 4, n ** 5, n ** 6
+        # Dikdörtgenleştirici yarıçap / Rectifying radius
+        self.ka = k0 * a / (1 + n) * (1 + n2 / 4 + n4 / 64 + n6 / 256)
+        self.alpha = (
+            n / 2 - 2 * n2 / 3 + 5 * n3 / 16 + 41 * n4 / 180 - 127 * n5 / 288 + 7891 * n6 / 37800,
+            13 * n2 / 48 - 3 * n3 / 5 + 557 * n4 / 1440 + 281 * n5 / 630 - 1983433 * n6 / 1935360,
+            61 * n3 / 240 - 103 * n4 / 140 + 15061 * n5 / 26880 + 167603 * n6 / 181440,
+            49561 * n4 / 161280 - 179 * n5 / 168 + 6601661 * n6 / 7257600,
+            34729 * n5 / 80640 - 3418889 * n6 / 1995840,
+            212378941 * n6 / 319334400,
+        )
+        self.beta = (
+            n / 2 - 2 * n2 / 3 + 37 * n3 / 96 - n4 / 360 - 81 * n5 / 512 + 96199 * n6 / 604800,
+            n2 / 48 + n3 / 15 - 437 * n4 / 1440 + 46 * n5 / 105 - 1118711 * n6 / 3870720,
+            17 * n3 / 480 - 37 * n4 / 840 - 209 * n5 / 4480 + 5569 * n6 / 90720,
+            4397 * n4 / 161280 - 11 * n5 / 504 - 830251 * n6 / 7257600,
+            4583 * n5 / 161280 - 108847 * n6 / 3991680,
+            20648693 * n6 / 638668800,
+        )
+
+    def forward(self, lons: Sequence[float], lats: Sequence[float]) -> Coordinates:
+        sin, cos, sqrt, atan2, asinh, atanh, sinh = (math.sin, math.cos, math.sqrt, math.atan2,
+                                                      math.asinh, math.atanh, math.sinh)
+        deg = math.pi / 180
+        e, lam0, ka = self.e, self.lam0, self.ka
+        a1, a2, a3, a4, a5, a6 = self.alpha
+        ccos, csin = cmath.cos, cmath.sin
+        x0, y0 = self.false_easting, self.false_northing
+        xs, ys = [], []
+        xappend, yappend = xs.append, ys.append
+        for lon, lat in zip(lons, lats):
+            phi = lat * deg
+            dl = lon * deg - lam0
+            s, c = sin(phi), cos(phi)
+            cl = cos(dl)
+            # Konform enlem (cos φ ile ölçeklenmiş τ') / Conformal latitude (τ' scaled by cos φ)
+            sigma = sinh(e * atanh(e * s))
+            tp = s * sqrt(1 + sigma * sigma) - sigma
+            ccl = c * cl
+            xi = atan2(tp, ccl)
+            eta = asinh(c * sin(dl) / sqrt(tp * tp + ccl * ccl))
+            # Clenshaw toplamı (açık yazılmış) / Clenshaw sum, unrolled
+            z2 = complex(2 * xi, 2 * eta)
+            r = 2 * ccos(z2)
+            b = a6
+            b, b_ = a5 + r * b, b
+            b, b_ = a4 + r * b - b_, b
+            b, b_ = a3 + r * b - b_, b
+            b, b_ = a2 + r * b - b_, b
+            b = a1 + r * b - b_
+            dz = b * csin(z2)
+            xappend(x0 + ka * (eta + dz.imag))
+            yappend(y0 + ka * (xi + dz.real))
+        return array('d', xs), array('d', ys)
+
+    def inverse(self, xs: Sequence[float], ys: Sequence[float]) -> Coordinates:
+        sin, cos, sqrt, atan, atan2, atanh, sinh = (math.sin, math.cos, math.sqrt, math.atan,
+                                                     math.atan2, math.atanh, math.sinh)
+        rad = 180 / math.pi
+        e, e2, lam0 = self.e, self.e2, self.lam0
+        one_e2 = 1 - e2
+        inv_ka = 1 / self.ka
+        b1c, b2c, b3c, b4c, b5c, b6c = self.beta
+        ccos, csin = cmath.cos, cmath.sin
+        x0, y0 = self.false_easting, self.false_northing
+        lons, lats = [], []
+        lon_append, lat_append = lons.append, lats.append
+        for x, y in zip(xs, ys):
+            xi = (y - y0) * inv_ka
+            eta = (x - x0) * inv_ka
+            z2 = complex(2 * xi, 2 * eta)
+            r = 2 * ccos(z2)
+            b = b6c
+            b, b_ = b5c + r * b, b
+            b, b_ = b4c + r * b - b_, b
+            b, b_ = b3c + r * b - b_, b
+            b, b_ = b2c + r * b - b_, b
+            b = b1c + r * b - b_
+            dz = b * csin(z2)
+            xi -= dz.real
+            eta -= dz.imag
+            she = sinh(eta)
+            cxi = cos(xi)
+            # Konform enlemden jeodezik enleme Newton (Karney 2011, denk. 19-21)
+            # Newton from conformal to geodetic latitude (Karney 2011, eqs. 19-21)
+            taup = sin(xi) / sqrt(she * she + cxi * cxi)
+            tau = taup / one_e2
+            for _ in range(5):
+                t1 = sqrt(1 + tau * tau)
+                sigma = sinh(e * atanh(e * tau / t1))
+                taui = tau * sqrt(1 + sigma * sigma) - sigma * t1
+                dtau = ((taup - taui) / sqrt(1 + taui * taui)
+                        * (1 + one_e2 * tau * tau) / (one_e2 * t1))
+                tau += dtau
+                if abs(dtau) < 1e-13 * (1 + abs(tau)):
+                    break
+            lon_append((lam0 + atan2(she, cxi)) * rad)
+            lat_append(atan(tau) * rad)
+        return array('d', lons), array('d', lats)
+
+
+class WebMercator(Projection):
+    """
+    Küresel Web Mercator (EPSG:3857); enlemler ±85.0511°'e kırpılır
+    Spherical Web Mercator (EPSG:3857); latitudes are clamped to ±85.0511°
+    """
+    name = 'webmercator'
+    epsg = 3857
+    proj4 = ('+proj=merc +a=6378137 +b=6378137 +lat_ts=0 +lon_0=0 +x_0=0 +y_0=0 +k=1 '
+             '+units=m +nadgrids=@null +wktext +no_defs')
+    geographic = False
+
+    def __init__(self, a: float = WGS84_A):
+        self.a = a
+        self.k = a * math.pi / 180
+
+    def forward(self, lons: Sequence[float], lats: Sequence[float]) -> Coordinates:
+        sin, atanh = math.sin, math.atanh
+        deg, a, k, limit = math.pi / 180, self.a, self.k, WEB_MERCATOR_MAX_LAT
+        xs = array('d', [k * lon for lon in lons])
+        ys = array('d', [a * atanh(sin((limit if lat > limit else -limit if lat < -limit else lat)
+                                       * deg)) for lat in lats])
+        return xs, ys
+
+    def inverse(self, xs: Sequence[float], ys: Sequence[float]) -> Coordinates:
+        atan, sinh = math.atan, math.sinh
+        rad, inv_a, inv_k = 180 / math.pi, 1 / self.a, 1 / self.k
+        lons = array('d', [x * inv_k for x in xs])
+        lats = array('d', [atan(sinh(y * inv_a)) * rad for y in ys])
+        return lons, lats
+
+
+def _build_registry() -> Dict[str, Projection]:
+    registry: Dict[str, Projection] = {
+        'wgs84': Projection(),
+        'laea': LambertAzimuthalEqualArea('laea', LAEA_LAT0, LAEA_LON0),
+        'laea-europe': LambertAzimuthalEqualArea('laea-europe', 52.0, 10.0, 4321000.0,
+                                                 3210000.0, epsg=3035),
+        'webmercator': WebMercator(),
+    }
+    for zone in UTM_ZONES:
+        registry[f'utm{zone}'] = TransverseMercator(f'utm{zone}', zone * 6 - 183,
+                                                    epsg=32600 + zone)
+    return registry
+
+
+PROJECTIONS = _build_registry()
+ALIASES = {f'epsg:{proj.epsg}': name for name, proj in PROJECTIONS.items()
+           if proj.epsg is not None}
+ALIASES.update({'4326': 'wgs84', 'lonlat': 'wgs84', '3857': 'webmercator',
+                'mercator': 'webmercator', '3035': 'laea-europe'})
+ALIASES.update({f'{32600 + zone}': f'utm{zone}' for zone in UTM_ZONES})
+
+
+def get_projection(name: str) -> Projection:
+    """
+    Ada, EPSG koduna ("EPSG:32636", "32636") ya da takma ada göre projeksiyon
+    Projection by name, EPSG code ("EPSG:32636", "32636") or alias
+
+    Raises:
+        ValueError: Bilinmeyen projeksiyon / Unknown projection
+    """
+    key = name.strip().lower()
+    key = ALIASES.get(key, key)
+    try:
+        return PROJECTIONS[key]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen projeksiyon / Unknown projection: {name} "
+                         f"(seçenekler / choices: {', '.join(PROJECTIONS)})") from None
+
+
+def transform(xs: Sequence[float], ys: Sequence[float], source: str = 'wgs84',
+              target: str = 'laea') -> Coordinates:
+    """
+    Koordinat dizilerini kaynak sistemden hedef sisteme dönüştür
+    Transform coordinate arrays from the source to the target system
+
+    Coğrafi olmayan iki sistem arasında dönüşüm WGS84 üzerinden yapılır.
+    Transforms between two projected systems go through WGS84.
+
+    Args:
+        xs, ys: Boylam/enlem ya da x/y dizileri / Lon/lat or x/y arrays
+        source, target: Projeksiyon adları / Projection names
+
+    Returns:
+        Tuple: Hedef sistemde (x, y) dizileri / (x, y) arrays in the target system
+    """
+    src, dst = get_projection(source), get_projection(target)
+    if not src.geographic:
+        xs, ys = src.inverse(xs, ys)
+    return dst.forward(xs, ys)
+
+
+def iter_positions(geometry: Optional[Dict]) -> Iterator[List[float]]:
+    """
+    Herhangi bir GeoJSON geometrisinin konum listelerini üret
+    Yield the position lists of any GeoJSON geometry
+
+    Konumlar yerinde değiştirilebilir listelerdir.
+    Positions are mutable lists that can be rewritten in place.
+    """
+    if not geometry:
+        return
+    if geometry.get('type') == 'GeometryCollection':
+        for member in geometry.get('geometries') or []:
+            yield from iter_positions(member)
+        return
+    stack = [geometry.get('coordinates')]
+    while stack:
+        coords = stack.pop()
+        if not coords:
+            continue
+        if isinstance(coords[0], (int, float)):
+            yield coords
+        else:
+            stack.extend(coords)
+
+
+def reproject_geometries(geometries: Sequence[Optional[Dict]], source: str = 'wgs84',
+                         target: str = 'laea') -> int:
+    """
+    Geometri grubunun tüm konumlarını tek toplu dönüşümle yerinde dönüştür
+    Reproject every position of a batch of geometries in place with one bulk transform
+
+    Returns:
+        int: Dönüştürülen konum sayısı / Number of positions transformed
+    """
+    positions = [pos for geometry in geometries for pos in iter_positions(geometry)]
+    if not positions:
+        return 0
+    xs, ys = transform([p[0] for p in positions], [p[1] for p in positions], source, target)
+    for pos, x, y in zip(positions, xs, ys):
+        pos[0] = x
+        pos[1] = y
+    return len(positions)
+
+
+def _meridian_arc(lat: float, a: float = WGS84_A, e2: float = WGS84_E2,
+                  steps: int = 2000) -> float:
+    """
+    Ekvatordan enleme meridyen yayı (Simpson integrali, bağımsız referans)
+    Meridian arc from the equator to a latitude (Simpson integral, independent reference)
+    """
+    phi = math.radians(lat)
+    h = phi / steps
+    total = 0.0
+    for i in range(steps + 1):
+        s = math.sin(i * h)
+        m = a * (1 - e2) / (1 - e2 * s * s) ** 1.5
+        total += m * (1 if i in (0, steps) else 4 if i % 2 else 2)
+    return total * h / 3
+
+
+def _jacobian(proj: Projection, lon: float, lat: float,
+              h: float = 1e-5) -> Tuple[float, float, float, float]:
+    """
+    Radyan başına sayısal Jacobian (dx/dλ, dy/dλ, dx/dφ, dy/dφ)
+    Numerical Jacobian per radian (dx/dλ, dy/dλ, dx/dφ, dy/dφ)
+    """
+    xs, ys = proj.forward([lon - h, lon + h, lon, lon], [lat, lat, lat - h, lat + h])
+    step = 2 * math.radians(h)
+    return ((xs[1] - xs[0]) / step, (ys[1] - ys[0]) / step,
+            (xs[3] - xs[2]) / step, (ys[3] - ys[2]) / step)
+
+
+def self_check(samples: int = 20000, seed: int = 39) -> Dict[str, Dict]:
+    """
+    Gidiş-dönüş doğruluğu ve bağımsız referanslarla öz denetim
+    Self-check of round-trip accuracy and against independent references
+
+    Her projeksiyon için Türkiye/UTM bölgesi içinde rastgele noktalar ileri ve
+    geri dönüştürülür; en büyük hata metre cinsinden raporlanır. Ayrıca UTM
+    merkez meridyeni sayısal meridyen yayıyla, LAEA eş-alan özelliği Jacobian
+    ile, UTM konformluğu ve Web Mercator/EPSG:3035 bilinen değerlerle denetlenir.
+    Random points inside Turkey / the UTM zone are sent forward and back for
+    every projection and the largest error is reported in metres. The UTM
+    central meridian is checked against a numerically integrated meridian
+    arc, LAEA's equal-area property and UTM conformality through the
+    Jacobian, and Web Mercator / EPSG:3035 against known values.
+
+    Returns:
+        Dict: Denetim adı -> {"value", "limit", "ok"} / Check name -> {"value", "limit", "ok"}
+    """
+    rng = random.Random(seed)
+    results: Dict[str, Dict] = {}
+
+    def record(name: str, value: float, limit: float) -> None:
+        results[name] = {"value": value, "limit": limit, "ok": value <= limit}
+
+    min_lon, min_lat, max_lon, max_lat = TURKEY_BBOX
+    m_per_deg = math.pi * WGS84_A / 180
+    for name, proj in PROJECTIONS.items():
+        if proj.geographic:
+            continue
+        lo, hi = ((proj.lon0 - 3, proj.lon0 + 3) if isinstance(proj, TransverseMercator)
+                  else (min_lon, max_lon))
+        lons = [rng.uniform(lo, hi) for _ in range(samples)]
+        lats = [rng.uniform(min_lat, max_lat) for _ in range(samples)]
+        xs, ys = proj.forward(lons, lats)
+        back_lons, back_lats = proj.inverse(xs, ys)
+        geo_err = max(math.hypot((bl - l) * math.cos(math.radians(p)), bp - p)
+                      for l, p, bl, bp in zip(lons, lats, back_lons, back_lats)) * m_per_deg
+        record(f'{name}.roundtrip_geo_m', geo_err, 1e-6)
+        xs2, ys2 = proj.forward(back_lons, back_lats)
+        plane_err = max(math.hypot(x2 - x, y2 - y) for x, y, x2, y2 in zip(xs, ys, xs2, ys2))
+        record(f'{name}.roundtrip_plane_m', plane_err, 1e-6)
+
+    utm = PROJECTIONS['utm36']
+    arc_err = 0.0
+    conformal_err = 0.0
+    for lat in (1.0, 15.0, 36.0, 39.0, 42.0, 60.0, 80.0):
+        _, northing = utm.forward([utm.lon0], [lat])
+        arc_err = max(arc_err, abs(northing[0] - UTM_K0 * _meridian_arc(lat)))
+        s = math.sin(math.radians(lat))
+        n_radius = WGS84_A / math.sqrt(1 - WGS84_E2 * s * s)
+        m_radius = WGS84_A * (1 - WGS84_E2) / (1 - WGS84_E2 * s * s) ** 1.5
+        dxl, dyl, dxp, dyp = _jacobian(utm, utm.lon0 + 2.5, lat)
+        k_parallel = math.hypot(dxl, dyl) / (n_radius * math.cos(math.radians(lat)))
+        k_meridian = math.hypot(dxp, dyp) / m_radius
+        conformal_err = max(conformal_err, abs(k_parallel / k_meridian - 1))
+    record('utm36.meridian_arc_m', arc_err, 1e-4)
+    record('utm36.conformality', conformal_err, 1e-6)
+
+    laea = PROJECTIONS['laea']
+    area_err = 0.0
+    for _ in range(50):
+        lon, lat = rng.uniform(min_lon, max_lon), rng.uniform(min_lat, max_lat)
+        s = math.sin(math.radians(lat))
+        n_radius = WGS84_A / math.sqrt(1 - WGS84_E2 * s * s)
+        m_radius = WGS84_A * (1 - WGS84_E2) / (1 - WGS84_E2 * s * s) ** 1.5
+        dxl, dyl, dxp, dyp = _jacobian(laea, lon, lat)
+        area_scale = abs(dxl * dyp - dyl * dxp) / (m_radius * n_radius * math.cos(math.radians(lat)))
+        area_err = max(area_err, abs(area_scale - 1))
+    record('laea.equal_area', area_err, 1e-6)
+
+    xs, _ = PROJECTIONS['webmercator'].forward([180.0], [0.0])
+    record('webmercator.half_world_m', abs(xs[0] - 20037508.342789244), 1e-6)
+    xs, ys = PROJECTIONS['laea-europe'].forward([10.0], [52.0])
+    record('laea-europe.origin_m', math.hypot(xs[0] - 4321000.0, ys[0] - 3210000.0), 1e-6)
+    return results
+
+
+def benchmark(points: int = 1_000_000, seed: int = 39) -> Dict[str, float]:
+    """
+    Her projeksiyonun ileri/ters hızını ölç (nokta/sn)
+    Measure forward/inverse throughput of every projection (points/sec)
+    """
+    rng = random.Random(seed)
+    min_lon, min_lat, max_lon, max_lat = TURKEY_BBOX
+    lons = array('d', (rng.uniform(min_lon, max_lon) for _ in range(points)))
+    lats = array('d', (rng.uniform(min_lat, max_lat) for _ in range(points)))
+    rates = {}
+    for name, proj in PROJECTIONS.items():
+        if proj.geographic:
+            continue
+        started = time.perf_counter()
+        xs, ys = proj.forward(lons, lats)
+        rates[f'{name}.forward'] = points / (time.perf_counter() - started)
+        started = time.perf_counter()
+        proj.inverse(xs, ys)
+        rates[f'{name}.inverse'] = points / (time.perf_counter() - started)
+    return rates
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description='Koordinat dönüşüm motoru / Coordinate reprojection engine')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Gidiş-dönüş doğruluk denetimi / Round-trip accuracy check')
+    parser.add_argument('--samples', type=int, default=20000,
+                        help='Projeksiyon başına örnek nokta / Sample points per projection')
+    parser.add_argument('--bench', type=int, metavar='N',
+                        help='N noktada hız ölçümü / Throughput benchmark on N points')
+    parser.add_argument('--list', action='store_true',
+                        help='Projeksiyonları listele / List projections')
+    args = parser.parse_args()
+
+    if args.list or not (args.self_check or args.bench):
+        for name, proj in PROJECTIONS.items():
+            code = f'EPSG:{proj.epsg}' if proj.epsg else '-'
+            print(f"  {name:<12} {code:<11} {proj.proj4}")
+    if args.self_check:
+        print("\n🧪 DÖNÜŞÜM ÖZ DENETİMİ / REPROJECTION SELF-CHECK")
+        print("-" * 70)
+        results = self_check(args.samples)
+        for name, result in results.items():
+            mark = '✅' if result['ok'] else '❌'
+            print(f"  {mark} {name:<32} {result['value']:.3e}  (≤ {result['limit']:.0e})")
+        if not all(result['ok'] for result in results.values()):
+            sys.exit(1)
+    if args.bench:
+        print(f"\n⏱️  HIZ / THROUGHPUT ({args.bench} nokta / points)")
+        print("-" * 70)
+        for name, rate in benchmark(args.bench).items():
+            print(f"  {name:<24} {rate:>12,.0f} nokta/sn / points/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Mekansal İndeks
+Turkey's Geographic Center - Spatial Index
+
+GeoJSON feature'ları için STR ile paketlenmiş R-ağacı:
+- En yakın k komşu (Haversine mesafesi)
+- Sınır kutusu (bbox) ve yarıçap sorguları
+- Yeniden kurmadan kullanmak için diske kaydetme (kaynak dosya
+  değiştiyse kayıt geçersiz sayılır)
+
+STR-packed R-tree over GeoJSON features with k-nearest-neighbour,
+bounding-box and radius queries, plus on-disk serialization that is
+invalidated when the source file changes.
+"""
+
+import heapq
+import math
+import os
+import pickle
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from geographic_center import EARTH_RADIUS_KM
+
+INDEX_FORMAT_VERSION = 2
+
+BBox = Tuple[float, float, float, float]  # (min_lon, min_lat, max_lon, max_lat)
+
+
+def source_fingerprint(file_path: str) -> Dict:
+    """
+    Kaynak dosyanın yolu, boyutu, mtime'ı ve SHA-256 özeti
+    Path, size, mtime and SHA-256 of a source file
+    """
+    from manifest import file_digests
+
+    stat = os.stat(file_path)
+    return {
+        "path": os.path.abspath(file_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": file_digests(file_path)[0]
+    }
+
+
+def iter_coordinates(geometry: Optional[Dict]) -> Iterator[Sequence[float]]:
+    """
+    Herhangi bir GeoJSON geometrisindeki tüm [lon, lat] konumlarını üret
+    Yield every [lon, lat] position of any GeoJSON geometry
+    """
+    if not geometry:
+        return
+    if geometry.get('type') == 'GeometryCollection':
+        for child in geometry.get('geometries', []):
+            yield from iter_coordinates(child)
+        return
+    stack = [geometry.get('coordinates')]
+    while stack:
+        coords = stack.pop()
+        if not isinstance(coords, list) or not coords:
+            continue
+        if isinstance(coords[0], (int, float)):
+            yield coords
+        else:
+            stack.extend(coords)
+
+
+def geometry_bbox(geometry: Optional[Dict]) -> Optional[BBox]:
+    """
+    Geometrinin sınır kutusu; koordinat yoksa None
+    Bounding box of a geometry, or None if it has no coordinates
+    """
+    lons = []
+    lats = []
+    for position in iter_coordinates(geometry):
+        lons.append(position[0])
+        lats.append(position[1])
+    if not lons:
+        return None
+    return min(lons), min(lats), max(lons), max(lats)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """İki nokta arası Haversine mesafesi (km) / Haversine distance (km)"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2 +
+         math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bbox_distance_km(lat: float, lon: float, bbox: BBox) -> float:
+    """
+    Noktadan sınır kutusuna en kısa küresel mesafe (km)
+    Shortest spherical distance (km) from a point to a bounding box
+
+    Kutu dışındaki boylamlar için en yakın meridyen kenarındaki en yakın
+    enlem kullanılır, böylece değer R-ağacı araması için alt sınırdır.
+    For longitudes outside the box the closest latitude on the nearest
+    meridian edge is used, so the value is a valid lower bound for the
+    tree search.
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    if min_lon <= lon <= max_lon:
+        return haversine_km(lat, lon, min(max(lat, min_lat), max_lat), lon)
+    edge_lon = min_lon if (min_lon - lon) % 360 < (lon - max_lon) % 360 else max_lon
+    dlon = math.radians(edge_lon - lon)
+    if math.cos(dlon) <= 0:
+        closest_lat = 90.0 if lat >= 0 else -90.0
+    else:
+        closest_lat = math.degrees(math.atan(math.tan(math.radians(lat)) / math.cos(dlon)))
+    return haversine_km(lat, lon, min(max(closest_lat, min_lat), max_lat), edge_lon)
+
+
+class SpatialIndex:
+    """
+    Feature sınır kutuları üzerinde STR-paketli R-ağacı
+    STR-packed R-tree over feature bounding boxes
+
+    Attributes:
+        features (List[Dict]): İndekslenen feature'lar / Indexed features
+        bboxes (List[BBox]): Feature sınır kutuları / Feature bounding boxes
+        levels (List[List[list]]): Yapraktan köke düğüm seviyeleri; her düğüm
+            [min_lon, min_lat, max_lon, max_lat, çocuk indeksleri]
+    """
+
+    def __init__(self, features: Iterable[Dict], node_capacity: int = 16):
+        """
+        Feature'lardan indeksi kur (geometrisiz olanlar atlanır)
+        Build the index from features (those without geometry are skipped)
+        """
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self.node_capacity = node_capacity
+        self.features = []
+        self.bboxes = []
+        for feature in features:
+            bbox = geometry_bbox(feature.get('geometry'))
+            if bbox is not None:
+                self.features.append(feature)
+                self.bboxes.append(bbox)
+        self.levels = self._build()
+
+    @classmethod
+    def from_geojson(cls, geojson: Dict, node_capacity: int = 16) -> 'SpatialIndex':
+        """
+        Yüklü bir FeatureCollection'dan indeks kur
+        Build an index from a loaded FeatureCollection
+        """
+        if geojson.get('type') == 'Feature':
+            return cls([geojson], node_capacity)
+        return cls(geojson.get('features', []), node_capacity)
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def _pack(self, boxes: List[BBox]) -> List[list]:
+        """
+        Kutuları STR (Sort-Tile-Recursive) ile bir üst seviyeye paketle
+        Pack boxes into the next level up with Sort-Tile-Recursive
+        """
+        cap = self.node_capacity
+        order = sorted(range(len(boxes)), key=lambda i: boxes[i][0] + boxes[i][2])
+        node_count = math.ceil(len(boxes) / cap)
+        slab_size = cap * math.ceil(math.sqrt(node_count))
+        nodes = []
+        for start in range(0, len(order), slab_size):
+            slab = sorted(order[start:start + slab_size],
+                          key=lambda i: boxes[i][1] + boxes[i][3])
+            for node_start in range(0, len(slab), cap):
+                children = slab[node_start:node_start + cap]
+                nodes.append([
+                    min(boxes[i][0] for i in children),
+                    min(boxes[i][1] for i in children),
+                    max(boxes[i][2] for i in children),
+                    max(boxes[i][3] for i in children),
+                    children
+                ])
+        return nodes
+
+    def _build(self) -> List[List[list]]:
+        """Tüm seviyeleri kökte tek düğüm kalana dek kur / Build levels up to a single root"""
+        levels = []
+        boxes = self.bboxes
+        while boxes:
+            nodes = self._pack(boxes)
+            levels.append(nodes)
+            if len(nodes) == 1:
+                break
+            boxes = [tuple(node[:4]) for node in nodes]
+        return levels
+
+    def query_bbox(self, min_lon: float, min_lat: float,
+                   max_lon: float, max_lat: float) -> List[Dict]:
+        """
+        Sınır kutusuyla kesişen feature'ları döndür
+        Return features whose bounding box intersects the query box
+
+        Returns:
+            List[Dict]: Eşleşen feature'lar / Matching features
+        """
+        if not self.levels:
+            return []
+        results = []
+        stack = [(len(self.levels) - 1, 0)]
+        while stack:
+            depth, index = stack.pop()
+            node = self.levels[depth][index]
+            if node[0] > max_lon or node[2] < min_lon or node[1] > max_lat or node[3] < min_lat:
+                continue
+            if depth == 0:
+                for item in node[4]:
+                    b = self.bboxes[item]
+                    if not (b[0] > max_lon or b[2] < min_lon or b[1] > max_lat or b[3] < min_lat):
+                        results.append(self.features[item])
+            else:
+                stack.extend((depth - 1, child) for child in node[4])
+        return results
+
+    def _item_distance(self, lat: float, lon: float, item: int) -> float:
+        """Noktadan feature'a mesafe (nokta değilse kutuya) / Distance to a feature"""
+        bbox = self.bboxes[item]
+        if bbox[0] == bbox[2] and bbox[1] == bbox[3]:
+            return haversine_km(lat, lon, bbox[1], bbox[0])
+        return bbox_distance_km(lat, lon, bbox)
+
+    def _iter_nearest(self, lat: float, lon: float) -> Iterator[Tuple[float, int]]:
+        """
+        Feature'ları artan mesafeye göre üret (en iyi-önce arama)
+        Yield (distance, item) pairs in increasing distance (best-first search)
+        """
+        if not self.levels:
+            return
+        root_depth = len(self.levels) - 1
+        heap = [(0.0, 1, root_depth, 0)]
+        while heap:
+            dist, is_node, depth, index = heapq.heappop(heap)
+            if not is_node:
+                yield dist, index
+                continue
+            node = self.levels[depth][index]
+            for child in node[4]:
+                if depth == 0:
+                    heapq.heappush(heap, (self._item_distance(lat, lon, child), 0, 0, child))
+                else:
+                    child_box = tuple(self.levels[depth - 1][child][:4])
+                    heapq.heappush(heap, (bbox_distance_km(lat, lon, child_box), 1, depth - 1, child))
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> List[Tuple[float, Dict]]:
+        """
+        Noktaya en yakın k feature
+        The k features nearest to a point
+
+        Args:
+            lat, lon: Sorgu noktası / Query point
+            k (int): Komşu sayısı / Number of neighbours
+
+        Returns:
+            List[Tuple]: (mesafe km, feature) çiftleri / (distance km, feature) pairs
+        """
+        results = []
+        for dist, item in self._iter_nearest(lat, lon):
+            if len(results) >= k:
+                break
+            results.append((round(dist, 3), self.features[item]))
+        return results
+
+    def query_radius(self, lat: float, lon: float, radius_km: float) -> List[Tuple[float, Dict]]:
+        """
+        Noktaya radius_km içindeki feature'lar (mesafeye göre sıralı)
+        Features within radius_km of a point, sorted by distance
+
+        Returns:
+            List[Tuple]: (mesafe km, feature) çiftleri / (distance km, feature) pairs
+        """
+        results = []
+        for dist, item in self._iter_nearest(lat, lon):
+            if dist > radius_km:
+                break
+            results.append((round(dist, 3), self.features[item]))
+        return results
+
+    def save(self, file_path: str, source_path: Optional[str] = None) -> None:
+        """
+        İndeksi diske kaydet (pickle)
+        Save the index to disk (pickle)
+
+        Dosya iki pickle içerir: kaynak parmak izli küçük bir başlık ve
+        indeksin kendisi; başlık tek başına okunabilir.
+        The file holds two pickles: a small header with the source
+        fingerprint, then the index itself; the header can be read alone.
+
+        Args:
+            source_path (str): İndeksin kurulduğu dosya / File the index was built from
+        """
+        header = {
+            "version": INDEX_FORMAT_VERSION,
+            "source": source_fingerprint(source_path) if source_path else None
+        }
+        payload = {
+            "node_capacity": self.node_capacity,
+            "features": self.features,
+            "bboxes": self.bboxes,
+            "levels": self.levels
+        }
+        with open(file_path, 'wb') as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def read_header(file_path: str) -> Optional[Dict]:
+        """
+        Yalnızca indeks başlığını oku; okunamıyor ya da sürüm farklıysa None
+        Read only the index header; None if unreadable or of another version
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                header = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            return None
+        if not isinstance(header, dict) or header.get("version") != INDEX_FORMAT_VERSION:
+            return None
+        return header
+
+    @classmethod
+    def matches_source(cls, file_path: str, source_path: str) -> bool:
+        """
+        Kayıtlı indeksin verilen kaynak dosyadan kurulup kurulmadığını denetle
+        Check whether a saved index was built from the given source file
+
+        Yol, boyut ve mtime aynıysa dosya okunmaz; boyut aynı ama yol ya da
+        mtime farklıysa içerik özetleri karşılaştırılır.
+        Same path, size and mtime skip reading the file; with the same size
+        but another path or mtime the content hashes are compared.
+        """
+        header = cls.read_header(file_path)
+        stored = header.get("source") if header else None
+        if not stored:
+            return False
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return False
+        if stored["size"] != stat.st_size:
+            return False
+        if stored["path"] == os.path.abspath(source_path) and stored["mtime_ns"] == stat.st_mtime_ns:
+            return True
+        from manifest import file_digests
+        return file_digests(source_path)[0] == stored["sha256"]
+
+    @classmethod
+    def load(cls, file_path: str) -> 'SpatialIndex':
+        """
+        Kaydedilmiş indeksi yeniden kurmadan yükle
+        Load a saved index without rebuilding it
+
+        Not: pickle kullanır; yalnızca kendi oluşturduğunuz dosyaları yükleyin.
+        Note: uses pickle; only load index files you created yourself.
+        """
+        with open(file_path, 'rb') as f:
+            header = pickle.load(f)
+            if not isinstance(header, dict) or header.get("version") != INDEX_FORMAT_VERSION:
+                version = header.get("version") if isinstance(header, dict) else None
+                raise ValueError(f"Unsupported spatial index version: {version}")
+            payload = pickle.load(f)
+        index = cls.__new__(cls)
+        index.node_capacity = payload["node_capacity"]
+        index.features = payload["features"]
+        index.bboxes = payload["bboxes"]
+        index.levels = payload["levels"]
+        return index
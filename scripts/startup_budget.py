@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Soğuk Başlangıç Bütçesi
+Turkey's Geographic Center - Cold-Start Budget
+
+CLI'ları `python -X importtime` ile yeni süreçlerde çalıştırır ve
+yorumlayıcının kendi açılışı dışında kalan içe aktarma süresini ölçer.
+Süre bütçeyi aşarsa ya da `--help` gibi hafif çağrılar ağır bir arka ucu
+(orjson, sqlite3, multiprocessing, asyncio...) yüklerse 1 koduyla çıkar;
+CI ve cron öncesi kontroller için tasarlanmıştır.
+
+Runs the CLIs in fresh processes under `python -X importtime` and
+measures the import time beyond the interpreter's own startup. Exits
+with status 1 when a case exceeds the budget or a light call such as
+`--help` loads a heavy backend, so it can gate CI or cron deployments.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Sequence, Set, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_BUDGET_MS = 60.0
+DEFAULT_RUNS = 5
+
+# Ölçülen çağrılar / Measured invocations
+CASES = {
+    'geographic_center': ['geographic_center.py'],
+    'geographic_center_help': ['geographic_center.py', '--help'],
+    'data_processor_help': ['data_processor.py', '--help'],
+    'merkez_help': ['merkez.py', '--help'],
+    'merkez_process_help': ['merkez.py', 'process', '--help'],
+}
+
+# Başlangıçta yüklenmemesi gereken modüller / Modules that must not load at startup
+HEAVY_MODULES = ('numpy', 'orjson', 'msgspec', 'sqlite3', 'multiprocessing',
+                 'concurrent.futures', 'asyncio', 'pathlib', 'hashlib', 'cProfile',
+                 'tracemalloc')
+
+
+def parse_importtime(stderr: str) -> Tuple[float, Dict[str, float], Set[str]]:
+    """
+    `-X importtime` çıktısını ayrıştır
+    Parse `-X importtime` output
+
+    Returns:
+        Tuple: (üst düzey toplam µs, üst düzey modül -> kümülatif µs, tüm modüller)
+            (top-level total µs, top-level module -> cumulative µs, all modules)
+    """
+    top: Dict[str, float] = {}
+    modules: Set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        stripped = name.strip()
+        modules.add(stripped)
+        if name.startswith(' ') and not name.startswith('  '):
+            top[stripped] = top.get(stripped, 0.0) + float(parts[1])
+    return sum(top.values()), top, modules
+
+
+def run_once(args: Sequence[str]) -> Tuple[float, Dict[str, float], Set[str]]:
+    """
+    Çağrıyı yeni bir süreçte bir kez çalıştır
+    Run the invocation once in a fresh process
+
+    Returns:
+        Tuple: (duvar saati ms, üst düzey modül -> µs, tüm modüller)
+            (wall-clock ms, top-level module -> µs, all modules)
+    """
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=SCRIPT_DIR,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall_ms = (time.perf_counter() - started) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} çıkış kodu / exited with {proc.returncode}")
+    _, top, modules = parse_importtime(proc.stderr)
+    return wall_ms, top, modules
+
+
+def measure(args: Sequence[str], baseline: Set[str], runs: int) -> Dict:
+    """
+    Çağrının en iyi (en düşük) içe aktarma ve duvar saati sürelerini ölç
+    Measure the best (lowest) import and wall-clock times of an invocation
+
+    Yorumlayıcı açılışında da yüklenen modüller (site, encodings...) sayılmaz;
+    ilk çalıştırma .pyc derlemesini dışarıda bırakmak için atılır.
+    Modules the bare interpreter also loads (site, encodings...) are not
+    counted; a first discarded run keeps .pyc compilation out.
+    """
+    run_once(args)
+    best_import = best_wall = float('inf')
+    modules: Set[str] = set()
+    for _ in range(runs):
+        wall_ms, top, seen = run_once(args)
+        import_ms = sum(us for name, us in top.items() if name not in baseline) / 1000
+        best_import = min(best_import, import_ms)
+        best_wall = min(best_wall, wall_ms)
+        modules |= seen
+    heavy = sorted(name for name in modules
+                   if any(name == h or name.startswith(h + '.') for h in HEAVY_MODULES))
+    return {"import_ms": round(best_import, 2), "wall_ms": round(best_wall, 2), "heavy": heavy}
+
+
+def check(cases: Sequence[str], budget_ms: float, runs: int) -> List[Dict]:
+    """
+    Seçili çağrıları ölç ve bütçeye göre değerlendir
+    Measure the selected invocations and judge them against the budget
+
+    Returns:
+        List[Dict]: case, import_ms, wall_ms, heavy, ok
+    """
+    _, baseline_top, baseline = run_once(['-c', 'pass'])
+    baseline |= set(baseline_top)
+    results = []
+    for name in cases:
+        result = measure(CASES[name], baseline, runs)
+        result["case"] = name
+        result["ok"] = result["import_ms"] <= budget_ms and not result["heavy"]
+        results.append(result)
+    return results
+
+
+def main():
+    """
+    Komut satırı arayüzü
+    Command-line interface
+    """
+    parser = argparse.ArgumentParser(
+        description='Soğuk başlangıç bütçesi denetimi / Cold-start budget check')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'İçe aktarma bütçesi, ms / Import budget in ms (default: {DEFAULT_BUDGET_MS:g})')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS,
+                        help=f'Çağrı başına tekrar / Runs per case (default: {DEFAULT_RUNS})')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES),
+                        help='Ölçülecek çağrılar / Cases to measure')
+    args = parser.parse_args()
+
+    results = check(args.cases, args.budget_ms, args.runs)
+    print(f"\n🚀 SOĞUK BAŞLANGIÇ / COLD START (bütçe / budget: {args.budget_ms:g} ms)")
+    print(f"{'ÇAĞRI / CASE':<26}{'IMPORT MS':>11}{'WALL MS':>10}  AĞIR / HEAVY")
+    print("-" * 70)
+    for result in results:
+        mark = '✅' if result["ok"] else '❌'
+        print(f"{result['case']:<26}{result['import_ms']:>11.2f}{result['wall_ms']:>10.2f}  "
+              f"{mark} {', '.join(result['heavy']) or '-'}")
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,685 @@
+#!/usr/bin/env python3
+"""
+Türkiye'nin Tam Ortası - Sadeleştirilmiş Karo Piramidi
+Turkey's Geographic Center - Simplified Tile Pyramid
+
+Ulusal, il ve ilçe sınırlarını web haritası için küçük parçalara böler:
+- Topoloji korumalı sadeleştirme: ortak sınırlar (arc) bir kez ve aynı
+  biçimde sadeleştirilir, komşu poligonlar arasında boşluk açılmaz
+- Douglas-Peucker veya Visvalingam-Whyatt, zoom başına piksel toleransı
+- Zoom'a göre koordinat nicemleme (GeoJSON ondalık, TopoJSON tamsayı)
+- {z}/{x}/{y} karo piramidi; karolar süreç havuzunda paralel yazılır
+
+Splits national, province and district boundaries into small pieces
+for web maps: topology-preserving simplification (shared arcs are
+simplified once and identically, so neighbours stay gap-free),
+Douglas-Peucker or Visvalingam-Whyatt with a per-zoom pixel tolerance,
+zoom-dependent quantization (GeoJSON decimals or TopoJSON integers) and
+a {z}/{x}/{y} tile pyramid written in parallel across a process pool.
+
+Koordinatlar sadeleştirme ve kırpma için Web Mercator birim karesine
+(0..1) izdüşürülür; çıktı yeniden WGS84'tür.
+Coordinates are projected to the Web Mercator unit square (0..1) for
+simplification and clipping; output is WGS84 again.
+"""
+
+import heapq
+import json
+import math
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from geographic_center import iter_polygons
+
+Point = Tuple[float, float]
+Ring = List[Point]
+
+TILE_SIZE = 256  # Karo kenarı (piksel) / Tile edge (pixels)
+TOPO_EXTENT = 4096  # TopoJSON karo başına nicemleme adımı / Quantization steps per tile
+MAX_LAT = 85.0511287798  # Web Mercator enlem sınırı / Web Mercator latitude limit
+
+TILE_FORMATS = {'geojson': '.geojson', 'topojson': '.topojson'}
+
+
+def mercator(lon: float, lat: float) -> Point:
+    """WGS84 -> Web Mercator birim karesi / WGS84 to the Web Mercator unit square"""
+    lat = max(-MAX_LAT, min(MAX_LAT, lat))
+    s = math.sin(math.radians(lat))
+    return (lon + 180.0) / 360.0, 0.5 - math.log((1 + s) / (1 - s)) / (4 * math.pi)
+
+
+def inverse_mercator(x: float, y: float) -> Point:
+    """Web Mercator birim karesi -> WGS84 (lon, lat) / Unit square back to WGS84"""
+    return x * 360.0 - 180.0, math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y))))
+
+
+def pixel_tolerance(zoom: int, pixels: float = 1.0) -> float:
+    """Zoom düzeyinde piksel sayısının birim karedeki karşılığı / Pixels in unit-square terms"""
+    return pixels / (TILE_SIZE * (1 << zoom))
+
+
+def coordinate_decimals(zoom: int) -> int:
+    """
+    Zoom düzeyinde piksel altı duyarlık için gereken ondalık hane
+    Decimal places giving sub-pixel precision at a zoom level
+    """
+    return max(1, math.ceil(math.log10(TILE_SIZE * (1 << zoom) / 360.0)) + 1)
+
+
+def dp_weights(points: Sequence[Point], floor: float = 0.0) -> array:
+    """
+    Douglas-Peucker önem değerleri (bir kez hesaplanır, her zoom süzer)
+    Douglas-Peucker importance per vertex (computed once, filtered per zoom)
+
+    Tam derinlikte tek DP geçişi yapılır; her köşenin değeri, kendi
+    sapması ile onu doğuran bölmenin değerinin küçüğüdür. Böylece
+    "değer > tolerans" süzgeci, o toleransla çalıştırılmış DP ile aynı
+    köşeleri verir. Uç noktalar sonsuzdur.
+    A single full-depth DP pass; each vertex's weight is the smaller of
+    its own deviation and the weight of the split that produced its
+    segment, so filtering "weight > tolerance" keeps exactly the vertices
+    DP would keep at that tolerance. Endpoints are infinite.
+
+    floor: Bu sapmanın altındaki bölmeler izlenmez (ağırlık 0 kalır); en
+        ince zoom'un toleransı verildiğinde sonuç değişmez, iş azalır
+        Splits at or below this deviation are not followed (weight stays
+        0); passing the finest zoom's tolerance saves work without
+        changing any zoom's result
+    """
+    n = len(points)
+    weights = array('d', bytes(8 * n))
+    if n:
+        weights[0] = weights[-1] = math.inf
+    stack = [(0, n - 1, math.inf)]
+    while stack:
+        first, last, limit = stack.pop()
+        if last - first < 2:
+            continue
+        ax, ay = points[first]
+        dx = points[last][0] - ax
+        dy = points[last][1] - ay
+        seg2 = dx * dx + dy * dy
+        best = -1.0
+        index = first
+        for i in range(first + 1, last):
+            px = points[i][0] - ax
+            py = points[i][1] - ay
+            if seg2 > 0:
+                t = (px * dx + py * dy) / seg2
+                t = 0.0 if t < 0 else (1.0 if t > 1 else t)
+                px -= t * dx
+                py -= t * dy
+            d = px * px + py * py
+            if d > best:
+                best = d
+                index = i
+        weight = min(math.sqrt(best), limit)
+        if weight <= floor:
+            continue
+        weights[index] = weight
+        stack.append((first, index, weight))
+        stack.append((index, last, weight))
+    return weights
+
+
+def vw_weights(points: Sequence[Point], floor: float = 0.0) -> array:
+    """
+    Visvalingam-Whyatt önem değerleri: etkin üçgen alanının karekökü
+    Visvalingam-Whyatt importance: square root of the effective triangle area
+
+    Etkin alan, o ana dek silinen en büyük alanla tekdüze tutulur; böylece
+    "değer > tolerans" süzgeci, alanı tolerance² altındaki üçgenleri silen
+    VW ile aynı köşeleri verir. Uç noktalar sonsuzdur.
+    The effective area is kept monotone with the largest area removed so
+    far, so filtering "weight > tolerance" matches VW removing triangles
+    below tolerance². Endpoints are infinite. floor is accepted for
+    symmetry with dp_weights; the heap order leaves nothing to skip.
+    """
+    n = len(points)
+    weights = array('d', [math.inf] * n)
+    if n < 3:
+        return weights
+    prev = list(range(-1, n - 1))
+    nxt = list(range(1, n + 1))
+    removed = bytearray(n)
+
+    def area(i: int) -> float:
+        ax, ay = points[prev[i]]
+        bx, by = points[i]
+        cx, cy = points[nxt[i]]
+        return abs((bx - ax) * (cy - ay) - (cx - ax) * (by - ay)) / 2
+
+    areas = [0.0] * n
+    heap = []
+    for i in range(1, n - 1):
+        areas[i] = area(i)
+        heap.append((areas[i], i))
+    heapq.heapify(heap)
+    largest = 0.0
+    while heap:
+        a, i = heapq.heappop(heap)
+        if removed[i] or a != areas[i]:
+            continue  # Eskimiş kayıt / Stale entry
+        removed[i] = 1
+        largest = max(largest, a)
+        weights[i] = math.sqrt(largest)
+        p, q = prev[i], nxt[i]
+        nxt[p] = q
+        prev[q] = p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                areas[j] = area(j)
+                heapq.heappush(heap, (areas[j], j))
+    return weights
+
+
+SIMPLIFY_METHODS = {'dp': dp_weights, 'vw': vw_weights}
+
+
+def filter_weights(points: Sequence[Point], weights: Sequence[float],
+                   tolerance: float) -> List[Point]:
+    """Önem değeri toleransı aşan köşeleri tut / Keep vertices whose weight exceeds tolerance"""
+    return [p for p, w in zip(points, weights) if w > tolerance]
+
+
+def douglas_peucker(points: Sequence[Point], tolerance: float) -> List[Point]:
+    """Douglas-Peucker sadeleştirmesi (uç noktalar korunur) / Douglas-Peucker simplification"""
+    return filter_weights(points, dp_weights(points), tolerance)
+
+
+def visvalingam(points: Sequence[Point], tolerance: float) -> List[Point]:
+    """
+    Visvalingam-Whyatt sadeleştirmesi; alanı tolerance² altındaki üçgenler silinir
+    Visvalingam-Whyatt simplification; triangles below tolerance² are removed
+    """
+    return filter_weights(points, vw_weights(points), tolerance)
+
+
+def _open_ring(ring: Sequence) -> list:
+    """Ardışık yinelenen ve kapanış noktalarını at / Drop repeated and closing points"""
+    out = []
+    for p in ring:
+        if not out or p != out[-1]:
+            out.append(p)
+    if len(out) > 1 and out[0] == out[-1]:
+        out.pop()
+    return out
+
+
+def build_arcs(rings: Sequence[Sequence]) -> Tuple[List[list], List[List[int]]]:
+    """
+    Halkaları ortak arc'lara böl (TopoJSON tarzı)
+    Split rings into shared arcs (TopoJSON style)
+
+    Bir nokta, halkalardaki komşuları ikiden fazlaysa kavşaktır; halkalar
+    kavşaklarda kesilir ve aynı (ya da ters) nokta dizisi tek arc olur.
+    Kavşaksız halkalar en küçük noktadan başlayan kapalı arc'lardır.
+    A point is a junction when it has more than two distinct neighbours
+    across all rings; rings are cut at junctions and identical (or
+    reversed) point runs collapse into one arc. Rings without junctions
+    become closed arcs starting at their smallest point.
+
+    Args:
+        rings: Hashlenebilir noktalardan halkalar / Rings of hashable points
+
+    Returns:
+        (arcs, refs): Arc'lar ve halka başına arc referansları (~i = ters)
+            Arcs and per-ring arc references (~i = reversed)
+    """
+    opened = [_open_ring(ring) for ring in rings]
+    neighbours = {}
+    for ring in opened:
+        n = len(ring)
+        for i, p in enumerate(ring):
+            seen = neighbours.get(p)
+            if seen is None:
+                seen = neighbours[p] = set()
+            seen.add(ring[i - 1])
+            seen.add(ring[(i + 1) % n])
+    junctions = {p for p, seen in neighbours.items() if len(seen) > 2}
+
+    arcs = []
+    index = {}
+    refs = []
+    for ring in opened:
+        n = len(ring)
+        if n < 3:
+            refs.append([])
+            continue
+        cuts = [i for i, p in enumerate(ring) if p in junctions]
+        if not cuts:
+            start = ring.index(min(ring))
+            rotated = ring[start:] + ring[:start]
+            pieces = [rotated + rotated[:1]]
+        else:
+            start = cuts[0]
+            rotated = ring[start:] + ring[:start] + ring[start:start + 1]
+            positions = [i - start for i in cuts] + [n]
+            pieces = [rotated[a:b + 1] for a, b in zip(positions, positions[1:])]
+        ring_refs = []
+        for piece in pieces:
+            key = tuple(piece)
+            ref = index.get(key)
+            if ref is None:
+                reverse = index.get(key[::-1])
+                if reverse is not None:
+                    ref = ~reverse
+                else:
+                    ref = index[key] = len(arcs)
+                    arcs.append(piece)
+            ring_refs.append(ref)
+        refs.append(ring_refs)
+    return arcs, refs
+
+
+def assemble_ring(arcs: Sequence[Sequence], refs: Sequence[int]) -> list:
+    """Arc referanslarından kapalı halka kur / Rebuild a closed ring from arc references"""
+    ring = []
+    for ref in refs:
+        arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+        ring.extend(arc[1:] if ring else arc)
+    return ring
+
+
+def _ring_bbox(ring: Sequence[Point]) -> Tuple[float, float, float, float]:
+    xs = [p[0] for p in ring]
+    ys = [p[1] for p in ring]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _clip_edge(points: List[Point], axis: int, bound: float, keep_greater: bool) -> List[Point]:
+    """Sutherland-Hodgman'ın tek kenar adımı / One Sutherland-Hodgman edge pass"""
+    out = []
+    if not points:
+        return out
+    prev = points[-1]
+    prev_in = prev[axis] >= bound if keep_greater else prev[axis] <= bound
+    for cur in points:
+        cur_in = cur[axis] >= bound if keep_greater else cur[axis] <= bound
+        if cur_in != prev_in:
+            t = (bound - prev[axis]) / (cur[axis] - prev[axis])
+            if axis == 0:
+                out.append((bound, prev[1] + t * (cur[1] - prev[1])))
+            else:
+                out.append((prev[0] + t * (cur[0] - prev[0]), bound))
+        if cur_in:
+            out.append(cur)
+        prev, prev_in = cur, cur_in
+    return out
+
+
+def clip_ring(ring: Ring, axis: int, low: float, high: float) -> Ring:
+    """
+    Kapalı halkayı bir eksende [low, high] şeridine kırp
+    Clip a closed ring to the [low, high] band along one axis
+
+    Tamamen içeride ya da dışarıda kalan halkalar taranmadan geçer.
+    Rings fully inside or outside the band short-circuit.
+    """
+    values = [p[axis] for p in ring]
+    lo = min(values)
+    hi = max(values)
+    if lo >= low and hi <= high:
+        return ring
+    if hi < low or lo > high:
+        return []
+    points = ring[:-1]
+    if lo < low:
+        points = _clip_edge(points, axis, low, True)
+    if hi > high:
+        points = _clip_edge(points, axis, high, False)
+    if len(points) < 3:
+        return []
+    return points + points[:1]
+
+
+def tile_bbox(z: int, x: int, y: int, buffer: float = 0.0) -> Tuple[float, float, float, float]:
+    """Karonun birim karedeki kutusu (tampon karo oranı) / Tile box in the unit square"""
+    size = 1.0 / (1 << z)
+    pad = size * buffer
+    return x * size - pad, y * size - pad, (x + 1) * size + pad, (y + 1) * size + pad
+
+
+def _tile_range(bbox: Tuple[float, float, float, float], z: int) -> Tuple[int, int, int, int]:
+    n = 1 << z
+    clamp = lambda v: max(0, min(n - 1, int(v * n)))  # noqa: E731
+    return clamp(bbox[0]), clamp(bbox[1]), clamp(bbox[2]), clamp(bbox[3])
+
+
+# İşçi süreç durumu / Worker process state
+_tile_state = None
+
+
+def _arc_weights(arcs: Sequence[Ring], method: str, floor: float) -> List[array]:
+    """Bir arc grubunun önem değerleri / Importance weights for a group of arcs"""
+    weigh = SIMPLIFY_METHODS[method]
+    return [weigh(arc, floor) for arc in arcs]
+
+
+def _init_tile_worker(features_by_zoom: Dict, output_dir: str, tile_format: str,
+                      buffer: float) -> None:
+    global _tile_state
+    _tile_state = (features_by_zoom, output_dir, tile_format, buffer)
+
+
+def _quantize_geojson(ring: Ring, decimals: int) -> list:
+    out = []
+    for x, y in ring:
+        lon, lat = inverse_mercator(x, y)
+        p = [round(lon, decimals), round(lat, decimals)]
+        if not out or p != out[-1]:
+            out.append(p)
+    return out
+
+
+def _clip_feature(polygons: List[List[Ring]], axis: int, low: float,
+                  high: float) -> List[List[Ring]]:
+    """Feature poligonlarını bir eksende kırp / Clip a feature's polygons along one axis"""
+    clipped = []
+    for polygon in polygons:
+        outer = clip_ring(polygon[0], axis, low, high)
+        if not outer:
+            continue
+        holes = [h for h in (clip_ring(ring, axis, low, high) for ring in polygon[1:]) if h]
+        clipped.append([outer] + holes)
+    return clipped
+
+
+def _geojson_tile(features, z: int) -> Optional[Dict]:
+    decimals = coordinate_decimals(z)
+    out = []
+    for properties, polygons in features:
+        coords = []
+        for polygon in polygons:
+            rings = [_quantize_geojson(ring, decimals) for ring in polygon]
+            if len(rings[0]) < 4:
+                continue
+            coords.append([rings[0]] + [r for r in rings[1:] if len(r) >= 4])
+        if not coords:
+            continue
+        geometry = ({"type": "Polygon", "coordinates": coords[0]} if len(coords) == 1
+                    else {"type": "MultiPolygon", "coordinates": coords})
+        out.append({"type": "Feature", "properties": properties, "geometry": geometry})
+    return {"type": "FeatureCollection", "features": out} if out else None
+
+
+def _topojson_tile(features, bbox) -> Optional[Dict]:
+    west, south = inverse_mercator(bbox[0], bbox[3])
+    east, north = inverse_mercator(bbox[2], bbox[1])
+    sx = (east - west) / TOPO_EXTENT
+    sy = (north - south) / TOPO_EXTENT
+
+    def quantize(ring: Ring) -> list:
+        out = []
+        for x, y in ring:
+            lon, lat = inverse_mercator(x, y)
+            out.append((round((lon - west) / sx), round((lat - south) / sy)))
+        return out
+
+    rings = []
+    shapes = []
+    for properties, polygons in features:
+        polygon_slots = []
+        for polygon in polygons:
+            slots = []
+            for ring in polygon:
+                q = quantize(ring)
+                if len(_open_ring(q)) >= 3:
+                    slots.append(len(rings))
+                    rings.append(q)
+                elif not slots:
+                    break  # Dış halka çöktü / Outer ring collapsed
+            if slots:
+                polygon_slots.append(slots)
+        if polygon_slots:
+            shapes.append((properties, polygon_slots))
+    if not shapes:
+        return None
+
+    arcs, refs = build_arcs(rings)
+    encoded = []
+    for arc in arcs:
+        delta = [list(arc[0])]
+        for (x0, y0), (x1, y1) in zip(arc, arc[1:]):
+            delta.append([x1 - x0, y1 - y0])
+        encoded.append(delta)
+    geometries = []
+    for properties, polygon_slots in shapes:
+        polys = [[refs[slot] for slot in slots] for slots in polygon_slots]
+        if len(polys) == 1:
+            geometries.append({"type": "Polygon", "arcs": polys[0], "properties": properties})
+        else:
+            geometries.append({"type": "MultiPolygon", "arcs": polys, "properties": properties})
+    return {
+        "type": "Topology",
+        "transform": {"scale": [sx, sy], "translate": [west, south]},
+        "objects": {"boundaries": {"type": "GeometryCollection", "geometries": geometries}},
+        "arcs": encoded
+    }
+
+
+def _write_tiles(jobs: Sequence[Tuple[int, int, List[Tuple[int, List[int]]]]]) -> Dict[int, List[int]]:
+    """
+    Karo sütunlarını kırp, nicemle ve yaz
+    Clip, quantize and write columns of tiles
+
+    Her feature önce sütun şeridine bir kez kırpılır; karolar yalnızca
+    bu daha küçük şeritten satır satır kesilir.
+    Each feature is clipped to the column strip once; tiles are then cut
+    row by row from that much smaller strip.
+
+    Returns:
+        Dict: zoom -> [karo, bayt, feature] / zoom -> [tiles, bytes, features]
+    """
+    features_by_zoom, output_dir, tile_format, buffer = _tile_state
+    counts = {}
+    for z, x, rows in jobs:
+        features = features_by_zoom[z]
+        x0, _, x1, _ = tile_bbox(z, x, 0, buffer)
+        strips = {}
+        for _, candidates in rows:
+            for i in candidates:
+                if i not in strips:
+                    properties, polygons, _ = features[i]
+                    strips[i] = _clip_feature(polygons, 0, x0, x1)
+        for y, candidates in rows:
+            bbox = tile_bbox(z, x, y, buffer)
+            clipped = []
+            for i in candidates:
+                fbox = features[i][2]
+                if fbox[3] < bbox[1] or fbox[1] > bbox[3]:
+                    continue
+                parts = _clip_feature(strips[i], 1, bbox[1], bbox[3])
+                if parts:
+                    clipped.append((features[i][0], parts))
+            if not clipped:
+                continue
+            tile = (_geojson_tile(clipped, z) if tile_format == 'geojson'
+                    else _topojson_tile(clipped, bbox))
+            if tile is None:
+                continue
+            data = json.dumps(tile, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            tile_dir = os.path.join(output_dir, str(z), str(x))
+            os.makedirs(tile_dir, exist_ok=True)
+            with open(os.path.join(tile_dir, f"{y}{TILE_FORMATS[tile_format]}"), 'wb') as f:
+                f.write(data)
+            count = counts.setdefault(z, [0, 0, 0])
+            count[0] += 1
+            count[1] += len(data)
+            count[2] += len(clipped)
+    return counts
+
+
+def _zoom_features(arcs: List[Ring], shapes, tolerance: float) -> List[Tuple]:
+    """
+    Sadeleştirilmiş arc'lardan feature'ları yeniden kur; piksel altı parçaları at
+    Rebuild features from simplified arcs, dropping sub-pixel parts
+    """
+    features = []
+    for properties, polygons in shapes:
+        out = []
+        for polygon in polygons:
+            rings = []
+            for refs in polygon:
+                ring = assemble_ring(arcs, refs)
+                if len(ring) < 4:
+                    if not rings:
+                        break
+                    continue
+                bbox = _ring_bbox(ring)
+                if bbox[2] - bbox[0] < tolerance and bbox[3] - bbox[1] < tolerance:
+                    if not rings:
+                        break
+                    continue
+                rings.append(ring)
+            if rings:
+                out.append(rings)
+        if out:
+            boxes = [_ring_bbox(polygon[0]) for polygon in out]
+            bbox = (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                    max(b[2] for b in boxes), max(b[3] for b in boxes))
+            features.append((properties, out, bbox))
+    return features
+
+
+def build_tile_pyramid(features: Iterable[Dict], output_dir: str, min_zoom: int = 4,
+                       max_zoom: int = 10, method: str = 'dp', tile_format: str = 'geojson',
+                       pixels: float = 1.0, buffer: float = 1 / 64,
+                       workers: Optional[int] = None, jobs_per_task: int = 64) -> Dict:
+    """
+    Polygon/MultiPolygon feature'larından sadeleştirilmiş karo piramidi yaz
+    Write a simplified tile pyramid from Polygon/MultiPolygon features
+
+    Args:
+        features (Iterable[Dict]): Sınır feature'ları / Boundary features
+        output_dir (str): {z}/{x}/{y} dizinlerinin kökü / Root of the {z}/{x}/{y} tree
+        min_zoom, max_zoom (int): Zoom aralığı / Zoom range
+        method (str): "dp" (Douglas-Peucker) veya "vw" (Visvalingam-Whyatt)
+        tile_format (str): "geojson" veya "topojson"
+        pixels (float): Sadeleştirme toleransı (piksel) / Simplification tolerance (pixels)
+        buffer (float): Karo kenarı tamponu (karo oranı) / Tile edge buffer (tile fraction)
+        workers (int): İşçi süreç sayısı; 1 ise tek süreç / Processes (1 = in-process)
+        jobs_per_task (int): İşçiye bir seferde verilen yaklaşık karo / Approximate tiles per task
+
+    Returns:
+        Dict: Özet (tiles, bytes, features, arcs, vertices, zooms, seconds)
+    """
+    if method not in SIMPLIFY_METHODS:
+        raise ValueError(f"Unknown simplification method: {method}")
+    if tile_format not in TILE_FORMATS:
+        raise ValueError(f"Unknown tile format: {tile_format}")
+    if not 0 <= min_zoom <= max_zoom:
+        raise ValueError("Zoom range must satisfy 0 <= min_zoom <= max_zoom")
+    started = time.perf_counter()
+
+    # 1) Mercator'a izdüşür ve ortak arc'ları bul / Project and find shared arcs
+    rings = []
+    shapes = []
+    for feature in features:
+        polygons = []
+        for polygon in iter_polygons(feature.get('geometry')):
+            slots = []
+            for ring in polygon:
+                slots.append(len(rings))
+                rings.append([mercator(c[0], c[1]) for c in ring])
+            if slots:
+                polygons.append(slots)
+        if polygons:
+            shapes.append((feature.get('properties') or {}, polygons))
+    vertices = sum(len(ring) for ring in rings)
+    arcs, refs = build_arcs(rings)
+    del rings
+    shapes = [(properties, [[refs[slot] for slot in slots] for slots in polygons])
+              for properties, polygons in shapes]
+
+    # 2) Arc köşelerinin önem değerleri bir kez; her zoom yalnızca süzer
+    #    Vertex weights once per arc; every zoom only filters them
+    chunks = [[]]
+    budget = max(1, vertices // (4 * (workers or os.cpu_count() or 1)))
+    size = 0
+    for arc in arcs:
+        if size >= budget:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(arc)
+        size += len(arc)
+    floor = pixel_tolerance(max_zoom, pixels)
+    if workers == 1 or len(chunks) < 2:
+        weights = [w for chunk in chunks for w in _arc_weights(chunk, method, floor)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            weights = [w for part in pool.map(_arc_weights, chunks, [method] * len(chunks),
+                                              [floor] * len(chunks))
+                       for w in part]
+    del chunks
+    zooms = list(range(min_zoom, max_zoom + 1))
+    features_by_zoom = {}
+    for z in zooms:
+        tolerance = pixel_tolerance(z, pixels)
+        zoom_arcs = [filter_weights(arc, w, tolerance) for arc, w in zip(arcs, weights)]
+        features_by_zoom[z] = _zoom_features(zoom_arcs, shapes, tolerance)
+    del weights
+
+    # 3) Karo sütunlarını işlere dağıt / Distribute tile columns as jobs
+    batches = [[]]
+    size = 0
+    for z, zoom_features in features_by_zoom.items():
+        columns = {}
+        for i, (_, _, bbox) in enumerate(zoom_features):
+            x0, y0, x1, y1 = _tile_range(bbox, z)
+            for x in range(x0, x1 + 1):
+                rows = columns.setdefault(x, {})
+                for y in range(y0, y1 + 1):
+                    rows.setdefault(y, []).append(i)
+        for x, rows in sorted(columns.items()):
+            if size >= jobs_per_task:
+                batches.append([])
+                size = 0
+            batches[-1].append((z, x, sorted(rows.items())))
+            size += len(rows)
+
+    os.makedirs(output_dir, exist_ok=True)
+    if workers == 1 or len(batches) < 2:
+        _init_tile_worker(features_by_zoom, output_dir, tile_format, buffer)
+        results = [_write_tiles(batch) for batch in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_tile_worker,
+                                 initargs=(features_by_zoom, output_dir, tile_format,
+                                           buffer)) as pool:
+            results = list(pool.map(_write_tiles, batches))
+
+    per_zoom = {z: [0, 0, 0] for z in zooms}
+    for counts in results:
+        for z, count in counts.items():
+            per_zoom[z] = [a + b for a, b in zip(per_zoom[z], count)]
+    summary = {
+        "tiles": sum(c[0] for c in per_zoom.values()),
+        "bytes": sum(c[1] for c in per_zoom.values()),
+        "features": sum(c[2] for c in per_zoom.values()),
+        "arcs": len(arcs),
+        "vertices": vertices,
+        "zooms": {z: {"tiles": c[0], "bytes": c[1]} for z, c in per_zoom.items()},
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+    all_boxes = [f[2] for zoom_features in features_by_zoom.values() for f in zoom_features]
+    bounds = None
+    if all_boxes:
+        west, north = inverse_mercator(min(b[0] for b in all_boxes), min(b[1] for b in all_boxes))
+        east, south = inverse_mercator(max(b[2] for b in all_boxes), max(b[3] for b in all_boxes))
+        bounds = [round(west, 6), round(south, 6), round(east, 6), round(north, 6)]
+    manifest = {
+        "format": tile_format,
+        "tiles": "{z}/{x}/{y}" + TILE_FORMATS[tile_format],
+        "minzoom": min_zoom,
+        "maxzoom": max_zoom,
+        "bounds": bounds,
+        "simplification": {"method": method, "pixels": pixels},
+        "summary": summary,
+    }
+    with open(os.path.join(output_dir, 'tiles.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return summary